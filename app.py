@@ -4,42 +4,55 @@ New Streamlit App - Refactored with Modular Services
 High-performance song contest judging application
 """
 
+import time
+_imports_started = time.perf_counter()
+
 import streamlit as st
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Optional, Any
 import logging
-import time
 import json
 import io
 import base64
+import importlib.util
 from datetime import datetime
 
 # Import modular services
+from services.service_registry import registry, startup_timer
 from services.database_service import db_service
-from services.file_service import file_service
 from services.cache_service import cache_service
-from services.scoring_service import ScoringService
-from services.analytics_service import analytics_service
-from services.export_service import export_service
+from services.change_feed_service import change_feed
+from services.autosave_service import autosave_service
+from services.play_count_service import play_count_service
+from services.evaluation_scorer import evaluation_scorer
+from services.contest_snapshot import ContestSnapshot
+from services.song_analysis_service import song_analysis_service, DEFAULT_SUGGESTIONS
 from services.auth_service import auth_service
 
-# PDF generation imports
-try:
-    from reportlab.lib.pagesizes import letter, A4
-    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.lib.units import inch
-    from reportlab.lib import colors
-    from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
-    PDF_AVAILABLE = True
-except ImportError:
-    PDF_AVAILABLE = False
+# Loaded on first use: analytics pulls in plotly, export pulls in reportlab
+file_service = registry.lazy('services.file_service', 'file_service')
+analytics_service = registry.lazy('services.analytics_service', 'analytics_service')
+export_service = registry.lazy('services.export_service', 'export_service')
+
+# PDF generation (reportlab is imported inside the PDF functions)
+PDF_AVAILABLE = importlib.util.find_spec("reportlab") is not None
+if not PDF_AVAILABLE:
     st.warning("⚠️ ReportLab not installed. PDF generation will be disabled.")
 
+# Parquet exports (pyarrow is imported by the export writer)
+PARQUET_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+
+# Single-PDF certificates (pymupdf, imported as fitz before 1.24)
+MERGED_CERTIFICATES_AVAILABLE = any(importlib.util.find_spec(name) is not None for name in ("pymupdf", "fitz"))
+
 # Import components
 from components.login_simple_clean import render_login_page
 from components.admin_panel import render_admin_panel
+from components.job_download import render_job_download
+
+# The script body runs on every rerun; only the first import pays the cold start
+startup_timer.record_once("app imports", time.perf_counter() - _imports_started)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -250,8 +263,12 @@ st.markdown("""
 def initialize_app():
     """Initialize application with cache warming"""
     try:
-        # Warm cache for better performance
-        cache_service.warm_cache()
+        # Warm cache for better performance (concurrent, once per process)
+        with startup_timer.measure("initialize_app"):
+            cache_service.warm_cache()
+
+        # Push row changes into the cache (once per process, background thread)
+        change_feed.start()
         
         # Initialize session state
         if "active_judge" not in st.session_state:
@@ -697,9 +714,9 @@ def render_playlist_audio_player(songs_data: list, player_key: str = "main_playl
     col1, col2, col3 = st.columns([2, 1, 1])
 
     with col1:
-        # Get play count from database
+        # Stored play count plus plays not yet flushed
         song_data = current_song.get('song_data', {})
-        play_count = song_data.get('play_count', 0)
+        play_count = play_count_service.display_count(song_data.get('id'), song_data.get('play_count', 0))
 
         st.markdown(f"""
         <div style="
@@ -802,7 +819,7 @@ def render_playlist_audio_player(songs_data: list, player_key: str = "main_playl
                         if hasattr(song_id, 'iloc'):
                             song_id = song_id.iloc[0] if len(song_id) > 0 else None
                         if song_id:
-                            db_service.increment_play_count(int(song_id))
+                            play_count_service.record_play(int(song_id))
             except Exception as e:
                 st.warning(f"Error updating play count: {e}")
 
@@ -829,9 +846,9 @@ def render_playlist_audio_player(songs_data: list, player_key: str = "main_playl
             border = "2px solid #2196F3" if is_current else "1px solid #ddd"
             text_color = "#1976D2" if is_current else "#333"
 
-            # Get play count from database
+            # Stored play count plus plays not yet flushed
             song_data = song.get('song_data', {})
-            play_count = song_data.get('play_count', 0)
+            play_count = play_count_service.display_count(song_data.get('id'), song_data.get('play_count', 0))
 
             # Make entire track clickable with custom styling
             if st.button(f"{'🎵 ' if is_current else '🎶 '}{song.get('title', 'Unknown Title')}\n👤 {song.get('composer', 'Unknown Artist')} • ▶️ {play_count}x",
@@ -920,6 +937,22 @@ def render_user_sidebar(current_user):
             stats = cache_service.get_cache_stats()
             st.json(stats)
 
+        # Display cold-start and rerun timings (for debugging)
+        if st.checkbox("Show Startup Timing", value=False):
+            st.dataframe(pd.DataFrame(startup_timer.report()), hide_index=True)
+            st.json(registry.status())
+
+        # Display request counts and latency per table/bucket (for debugging)
+        if st.checkbox("Show Connection Stats", value=False):
+            from services.connection_service import connection_manager
+            from services.evaluation_sync import evaluation_sync
+            st.dataframe(pd.DataFrame(connection_manager.metrics()), hide_index=True)
+            st.json(evaluation_sync.sync_stats())
+            st.json(change_feed.feed_stats())
+            if connection_manager.backend != 'supabase':
+                st.caption(f"Data backend: {connection_manager.backend} ({connection_manager.mirror_path})")
+                st.dataframe(pd.DataFrame(connection_manager.mirror.snapshot_stats()), hide_index=True)
+
         return user_name
 
 # ==================== MAIN TABS ====================
@@ -974,9 +1007,9 @@ def render_audio_player(song_data, player_id=None):
                 song_id = song_data.get('id')
 
                 if song_id and (last_track_key not in st.session_state or st.session_state[last_track_key] != song_id):
-                    # Update play count in database
+                    # Buffered; flushed as one atomic batched increment
                     try:
-                        db_service.increment_play_count(song_id)
+                        play_count_service.record_play(song_id)
                         st.session_state[last_track_key] = song_id
                     except Exception as e:
                         st.warning(f"Error updating play count: {e}")
@@ -2246,218 +2279,27 @@ def render_lyrics_viewer(song_data):
 # Analysis functions removed - content moved to evaluation tab
 
 def auto_save_score(judge_id: int, song_id: int, rubric_key: str, score: int):
-    """Auto-save individual score when changed - optimized for performance"""
+    """Auto-save individual score when changed - buffered and written behind"""
     try:
-        # Get existing evaluation (use cached data to avoid DB calls)
-        existing_evaluations = cache_service.get_cached_evaluations(judge_id=judge_id, song_id=song_id)
-
-        if not existing_evaluations.empty:
-            # Update existing evaluation
-            existing_eval = existing_evaluations.iloc[0]
-            existing_scores = existing_eval['rubric_scores'] or {}
-
-            # Handle string format
-            if isinstance(existing_scores, str):
-                import json
-                existing_scores = json.loads(existing_scores)
-            elif not isinstance(existing_scores, dict):
-                existing_scores = {}
-
-            # Update the specific rubric score
-            existing_scores[rubric_key] = score
-
-            # Calculate total weighted score in 25-point scale for database storage
-            rubrics_df = cache_service.get_cached_rubrics()
-            total_weighted_score = 0
-            for _, rubric in rubrics_df.iterrows():
-                if rubric['rubric_key'] in existing_scores:
-                    rubric_score = existing_scores[rubric['rubric_key']]
-                    # Calculate weighted score in 25-point scale (not 100-point)
-                    total_weighted_score += (rubric_score / rubric['max_score']) * (rubric['weight'] / 100) * 25
-
-            # Update evaluation (async to avoid blocking UI)
-            success = db_service.update_evaluation(
-                existing_eval['id'],
-                rubric_scores=existing_scores,
-                total_score=total_weighted_score
-            )
-
-            # Only clear cache if update was successful (reduce unnecessary cache clears)
-            if success:
-                # Use selective cache invalidation instead of clearing all
-                cache_service.invalidate_cache('evaluations')
-
-                # Show success message without blocking
-                st.success(f"✅ Nilai {rubric_key} tersimpan: {score}", icon="💾")
-            else:
-                st.error(f"❌ Gagal menyimpan nilai {rubric_key}")
-
-        else:
-            # Create new evaluation
-            rubrics_df = cache_service.get_cached_rubrics()
-            initial_scores = {rubric_key: score}
-
-            # Calculate initial total score in 25-point scale for database storage
-            total_weighted_score = 0
-            for _, rubric in rubrics_df.iterrows():
-                if rubric['rubric_key'] == rubric_key:
-                    total_weighted_score = (score / rubric['max_score']) * (rubric['weight'] / 100) * 25
-                    break
-
-            # Create evaluation
-            success = db_service.create_evaluation(
-                judge_id=judge_id,
-                song_id=song_id,
-                rubric_scores=initial_scores,
-                total_score=total_weighted_score,
-                notes=""
-            )
-
-            # Only clear cache if creation was successful
-            if success:
-                cache_service.invalidate_cache('evaluations')
-                st.success(f"✅ Evaluasi baru dibuat dengan nilai {rubric_key}: {score}", icon="💾")
-            else:
-                st.error(f"❌ Gagal membuat evaluasi baru")
+        # Rapid changes for the same judge/song are coalesced into one upsert
+        autosave_service.queue_score(judge_id, song_id, rubric_key, score)
+        st.caption(f"💾 Nilai {rubric_key}: {score} dicatat, disimpan otomatis dalam beberapa detik")
 
     except Exception as e:
         st.error(f"❌ Error auto-saving score: {str(e)}")
         # Reduced logging to improve performance
         logger.error(f"Auto-save error: {e}")
 
-def auto_save_notes(judge_id: int, song_id: int, notes: str):
-    """Auto-save notes when changed"""
-    try:
-        # Get existing evaluation
-        existing_evaluations = cache_service.get_cached_evaluations(judge_id=judge_id, song_id=song_id)
-
-        if not existing_evaluations.empty:
-            # Update existing evaluation
-            existing_eval = existing_evaluations.iloc[0]
-
-            # Update evaluation with new notes
-            db_service.update_evaluation(
-                existing_eval['id'],
-                notes=notes
-            )
-
-            # Clear cache
-            cache_service.clear_evaluations_cache()
-
-    except Exception as e:
-        st.error(f"Error auto-saving notes: {e}")
-
 def build_suggestions(song_data):
     """Build AI suggestions for scoring based on song analysis"""
     try:
-        # Get song content for analysis
-        title = song_data.get('title', '')
-        lyrics_text = song_data.get('lyrics_text', '')
-        chords_text = song_data.get('chords_list', '')
-        composer = song_data.get('composer', '')
-
-        # Initialize scoring service for advanced analysis
-        scoring_service = ScoringService()
-
-        # Contest theme and verse for reference
-        contest_theme = "WAKTU BERSAMA HARTA BERHARGA"
-        contest_verse = "Efesus 5:15-16 - Karena itu, perhatikanlah dengan saksama, bagaimana kamu hidup, janganlah seperti orang bebal, tetapi seperti orang arif, dan pergunakanlah waktu yang ada, karena hari-hari ini adalah jahat."
-
-        # 1. TEMA - Kesesuaian Tema (Advanced analysis)
-        tema_score = 3  # Default
-        if lyrics_text:
-            # Use scoring service for theme analysis
-            keywords_df = cache_service.get_cached_keywords()
-            if not keywords_df.empty:
-                phrases = [(row['keyword_text'], row['weight']) for _, row in keywords_df.iterrows() if row['keyword_type'] == 'phrase']
-                keywords = [(row['keyword_text'], row['weight']) for _, row in keywords_df.iterrows() if row['keyword_type'] == 'keyword']
-                theme_relevance = scoring_service.score_theme_relevance(lyrics_text, keywords, phrases)
-                # More generous scoring for winning songs: 0-100 -> 1-5 with better distribution
-                if theme_relevance >= 60:
-                    tema_score = 5
-                elif theme_relevance >= 40:
-                    tema_score = 4
-                elif theme_relevance >= 20:
-                    tema_score = 3
-                elif theme_relevance >= 10:
-                    tema_score = 2
-                else:
-                    tema_score = 1
-            else:
-                # Fallback to simple keyword matching
-                theme_keywords = ['waktu', 'bersama', 'harta', 'berharga', 'keluarga', 'kasih', 'berkat']
-                matches = sum(1 for keyword in theme_keywords if keyword.lower() in lyrics_text.lower())
-                tema_score = min(5, max(1, matches + 1))
-        else:
-            # Analyze title only
-            theme_keywords = ['waktu', 'bersama', 'harta', 'berharga', 'keluarga']
-            matches = sum(1 for keyword in theme_keywords if keyword.lower() in title.lower())
-            tema_score = min(5, max(2, matches + 2))
-
-        # 2. LIRIK - Kekuatan Lirik (Advanced analysis)
-        lirik_score = 3  # Default
-        if lyrics_text:
-            # Use scoring service for lyrical quality
-            lirik_quality = scoring_service.score_lyrical_quality(lyrics_text)
-            # More generous scoring for winning songs: 0-100 -> 1-5 with better distribution
-            if lirik_quality >= 60:
-                lirik_score = 5
-            elif lirik_quality >= 40:
-                lirik_score = 4
-            elif lirik_quality >= 25:
-                lirik_score = 3
-            elif lirik_quality >= 15:
-                lirik_score = 2
-            else:
-                lirik_score = 1
-        else:
-            # Analyze title structure and length
-            if len(title) > 15 and any(word in title.lower() for word in ['kasih', 'berkat', 'bersama']):
-                lirik_score = 4
-            elif len(title) > 10:
-                lirik_score = 3
-            else:
-                lirik_score = 2
-
-        # 3. MUSIK - Kekayaan Musik (Advanced analysis)
-        musik_score = 4  # More generous default
-        if chords_text:
-            # Parse chords and analyze
-            chord_list = [chord.strip() for chord in chords_text.split() if chord.strip()]
-            if chord_list:
-                musik_quality = scoring_service.score_harmonic_richness(chord_list)
-                musik_score = musik_quality  # Already 2-5 scale (improved)
-            else:
-                musik_score = 4  # Generous default for empty chord list
-        else:
-            # More generous default - assume good quality if no data
-            musik_score = 4  # Benefit of doubt for missing chord data
-
-        # Return only the 3 AI-analyzable rubrics
-        # kreativ and jemaat require manual assessment
-        suggestions = {
-            'tema': tema_score,
-            'lirik': lirik_score,
-            'musik': musik_score
-        }
-
-        return suggestions
+        # Shared per-song analysis, computed once per song content
+        return dict(song_analysis_service.analyze(song_data)['suggestions'])
 
     except Exception as e:
         # Return safe defaults if analysis fails
-        return {
-            'tema': 3,
-            'lirik': 3,
-            'musik': 3
-        }
-
-    except Exception as e:
-        # Return safe defaults if analysis fails
-        return {
-            'tema': 3,
-            'lirik': 3,
-            'musik': 3
-        }
+        logger.error(f"Song analysis failed: {e}")
+        return dict(DEFAULT_SUGGESTIONS)
 
 def render_music_analysis(chords_text, title):
     """Render detailed music analysis"""
@@ -2465,9 +2307,9 @@ def render_music_analysis(chords_text, title):
         st.warning("Tidak ada data chord untuk dianalisis")
         return
 
-    # Parse chords
-    chord_list = [chord.strip() for chord in chords_text.split() if chord.strip()]
-    unique_chords = list(dict.fromkeys(chord_list))
+    analysis = song_analysis_service.analyze_content(title=title or '', chords_text=chords_text)
+    chord_list = analysis['chord_list']
+    unique_chords = analysis['unique_chords']
 
     col1, col2 = st.columns([1, 1])
 
@@ -2495,13 +2337,13 @@ def render_music_analysis(chords_text, title):
 
         # Key detection (enhanced)
         st.markdown("**🔑 Deteksi Nada Dasar:**")
-        key_analysis = analyze_key_signature(unique_chords)
+        key_analysis = analysis['key']
         st.info(f"🎵 **Nada Dasar**: {key_analysis['key']}")
         st.caption(f"Confidence: {key_analysis['confidence']:.1%}")
 
         # Genre detection (enhanced)
         st.markdown("**🎭 Deteksi Genre:**")
-        genre_analysis = analyze_genre(unique_chords, chord_list)
+        genre_analysis = analysis['genre']
         st.info(f"🎪 **Genre**: {genre_analysis['genre']}")
         st.caption(f"Karakteristik: {genre_analysis['characteristics']}")
 
@@ -2509,10 +2351,11 @@ def render_music_analysis(chords_text, title):
         st.markdown("#### 📈 Kompleksitas Musik")
 
         # Advanced complexity analysis
-        extensions = sum(1 for chord in chord_list if any(ext in chord for ext in ['7', '9', '11', '13', 'sus', 'add']))
-        slash_chords = sum(1 for chord in chord_list if '/' in chord)
-        diminished = sum(1 for chord in chord_list if 'dim' in chord.lower())
-        augmented = sum(1 for chord in chord_list if 'aug' in chord.lower())
+        chord_stats = analysis['chord_stats']
+        extensions = chord_stats['extensions']
+        slash_chords = chord_stats['slash_chords']
+        diminished = chord_stats['diminished']
+        augmented = chord_stats['augmented']
 
         complexity_col1, complexity_col2 = st.columns(2)
         with complexity_col1:
@@ -2554,73 +2397,6 @@ def render_music_analysis(chords_text, title):
         for chord, freq in most_used:
             st.markdown(f"• **{chord}**: {freq}x")
 
-def analyze_key_signature(unique_chords):
-    """Analyze key signature from chord progression"""
-    # Simplified key detection
-    major_keys = {
-        'C': ['C', 'Dm', 'Em', 'F', 'G', 'Am'],
-        'G': ['G', 'Am', 'Bm', 'C', 'D', 'Em'],
-        'D': ['D', 'Em', 'F#m', 'G', 'A', 'Bm'],
-        'A': ['A', 'Bm', 'C#m', 'D', 'E', 'F#m'],
-        'E': ['E', 'F#m', 'G#m', 'A', 'B', 'C#m'],
-        'F': ['F', 'Gm', 'Am', 'Bb', 'C', 'Dm']
-    }
-
-    key_scores = {}
-    for key, expected_chords in major_keys.items():
-        score = 0
-        for chord in unique_chords:
-            # Simple matching (ignoring extensions)
-            base_chord = chord.split('/')[0].replace('7', '').replace('sus', '').replace('add', '')
-            if base_chord in expected_chords:
-                score += 1
-        key_scores[key] = score / max(1, len(unique_chords))
-
-    best_key = max(key_scores, key=key_scores.get)
-    confidence = key_scores[best_key]
-
-    return {
-        'key': best_key,
-        'confidence': confidence
-    }
-
-def analyze_genre(unique_chords, chord_list):
-    """Analyze musical genre from chord characteristics"""
-    # Count characteristics
-    has_7th = any('7' in chord for chord in chord_list)
-    has_sus = any('sus' in chord for chord in chord_list)
-    has_slash = any('/' in chord for chord in chord_list)
-    has_extended = any(ext in chord for chord in chord_list for ext in ['9', '11', '13', 'add'])
-
-    chord_count = len(unique_chords)
-
-    # Genre classification
-    if has_extended and has_7th and chord_count > 6:
-        return {
-            'genre': 'Jazz/Contemporary Gospel',
-            'characteristics': 'Extended chords, complex harmony'
-        }
-    elif has_7th and has_sus:
-        return {
-            'genre': 'Contemporary Christian',
-            'characteristics': 'Modern harmony, worship style'
-        }
-    elif chord_count <= 4 and not has_7th:
-        return {
-            'genre': 'Folk/Traditional',
-            'characteristics': 'Simple, easy to sing'
-        }
-    elif has_slash or has_sus:
-        return {
-            'genre': 'Pop/Contemporary',
-            'characteristics': 'Modern progression, accessible'
-        }
-    else:
-        return {
-            'genre': 'Contemporary',
-            'characteristics': 'Balanced complexity'
-        }
-
 def render_analysis_visualizations(song_data):
     """Render analysis visualizations"""
     st.markdown("#### 📊 Visualisasi Analisis")
@@ -2881,34 +2657,9 @@ def render_key_insights(song_data):
 # Duplicate function removed - using the one above
 
 def auto_save_notes(judge_id: int, song_id: int, notes: str):
-    """Auto-save notes when changed"""
+    """Auto-save notes when changed - buffered and written behind"""
     try:
-        # Get existing evaluation
-        existing_evaluations = cache_service.get_cached_evaluations(judge_id=judge_id, song_id=song_id)
-
-        if not existing_evaluations.empty:
-            # Update existing evaluation
-            existing_eval = existing_evaluations.iloc[0]
-
-            # Update evaluation with new notes
-            db_service.update_evaluation(
-                existing_eval['id'],
-                rubric_scores=existing_eval['rubric_scores'],
-                total_score=existing_eval['total_score'],
-                notes=notes
-            )
-        else:
-            # Create new evaluation with notes only
-            db_service.create_evaluation(
-                judge_id=judge_id,
-                song_id=song_id,
-                rubric_scores={},
-                total_score=0,
-                notes=notes
-            )
-
-        # Clear cache to refresh data
-        cache_service.clear_evaluations_cache()
+        autosave_service.queue_notes(judge_id, song_id, notes)
 
     except Exception as e:
         st.error(f"Error auto-saving notes: {e}")
@@ -2916,100 +2667,10 @@ def auto_save_notes(judge_id: int, song_id: int, notes: str):
 def build_suggestions_with_explanations(song_data):
     """Build AI suggestions with explanations for each rubric"""
     try:
-        # Get basic suggestions (only tema, lirik, musik)
-        suggestions = build_suggestions(song_data)
-
-        # Generate detailed explanations
-        explanations = {}
-        title = song_data.get('title', '')
-        lyrics_text = song_data.get('lyrics_text', '')
-        chords_text = song_data.get('chords_list', '')
-
-        # Tema explanation
-        if 'tema' in suggestions:
-            if lyrics_text:
-                theme_keywords = ['waktu', 'bersama', 'harta', 'berharga', 'keluarga']
-                found_keywords = [kw for kw in theme_keywords if kw.lower() in lyrics_text.lower()]
-                if found_keywords:
-                    explanations['tema'] = f"Skor {suggestions['tema']}: Ditemukan kata kunci tema: {', '.join(found_keywords)}"
-                else:
-                    explanations['tema'] = f"Skor {suggestions['tema']}: Analisis semantik dari teks lirik"
-            else:
-                explanations['tema'] = f"Skor {suggestions['tema']}: Analisis dari judul '{title}'"
-
-        # Lirik explanation
-        if 'lirik' in suggestions:
-            if lyrics_text:
-                word_count = len(lyrics_text.split())
-                explanations['lirik'] = f"Skor {suggestions['lirik']}: Analisis kualitas lirik ({word_count} kata)"
-            else:
-                explanations['lirik'] = f"Skor {suggestions['lirik']}: Analisis dari judul dan struktur"
-
-        # Musik explanation
-        if 'musik' in suggestions:
-            if chords_text:
-                chord_list = [chord.strip() for chord in chords_text.split() if chord.strip()]
-                unique_chords = len(set(chord_list))
-                explanations['musik'] = f"Skor {suggestions['musik']}: Analisis harmoni ({unique_chords} chord unik)"
-            else:
-                explanations['musik'] = f"Skor {suggestions['musik']}: Estimasi berdasarkan informasi lagu"
-
-        return suggestions, explanations
-
-    except Exception as e:
-        # Return safe defaults if analysis fails
-        return {
-            'tema': 3,
-            'lirik': 3,
-            'musik': 3
-        }, {
-            'tema': 'Skor default: Analisis tidak tersedia',
-            'lirik': 'Skor default: Analisis tidak tersedia',
-            'musik': 'Skor default: Analisis tidak tersedia'
-        }
-
-def build_suggestions_with_explanations(song_data):
-    """Build AI suggestions with explanations for each rubric"""
-    try:
-        # Get basic suggestions (only tema, lirik, musik)
-        suggestions = build_suggestions(song_data)
-
-        # Generate detailed explanations
-        explanations = {}
-        title = song_data.get('title', '')
-        lyrics_text = song_data.get('lyrics_text', '')
-        chords_text = song_data.get('chords_list', '')
-
-        # Tema explanation
-        if 'tema' in suggestions:
-            if lyrics_text:
-                theme_keywords = ['waktu', 'bersama', 'harta', 'berharga', 'keluarga']
-                found_keywords = [kw for kw in theme_keywords if kw.lower() in lyrics_text.lower()]
-                if found_keywords:
-                    explanations['tema'] = f"Skor {suggestions['tema']}: Ditemukan kata kunci tema: {', '.join(found_keywords)}"
-                else:
-                    explanations['tema'] = f"Skor {suggestions['tema']}: Analisis semantik dari teks lirik"
-            else:
-                explanations['tema'] = f"Skor {suggestions['tema']}: Analisis dari judul '{title}'"
-
-        # Lirik explanation
-        if 'lirik' in suggestions:
-            if lyrics_text:
-                word_count = len(lyrics_text.split())
-                line_count = len(lyrics_text.split('\n'))
-                explanations['lirik'] = f"Skor {suggestions['lirik']}: Analisis {word_count} kata, {line_count} baris, struktur puitis"
-            else:
-                explanations['lirik'] = f"Skor {suggestions['lirik']}: Analisis dari struktur judul"
-
-        # Musik explanation
-        if 'musik' in suggestions:
-            if chords_text:
-                chord_list = [chord.strip() for chord in chords_text.split() if chord.strip()]
-                unique_chords = list(dict.fromkeys(chord_list))
-                extensions = sum(1 for chord in chord_list if any(ext in chord for ext in ['7', '9', 'sus', 'add']))
-                explanations['musik'] = f"Skor {suggestions['musik']}: {len(unique_chords)} chord unik, {extensions} extended chord"
-            else:
-                explanations['musik'] = f"Skor {suggestions['musik']}: Estimasi berdasarkan informasi lagu"
+        # Suggestions and explanations come from the shared per-song analysis
+        analysis = song_analysis_service.analyze(song_data)
+        suggestions = dict(analysis['suggestions'])
+        explanations = dict(analysis['explanations'])
 
         # Add manual assessment notes for non-AI rubrics
         rubrics_df = cache_service.get_cached_rubrics()
@@ -3336,7 +2997,7 @@ def setup_missing_config():
 
             if added_count > 0:
                 # Clear cache
-                st.cache_data.clear()
+                cache_service.invalidate_tables('configuration')
                 st.success(f"✅ Added {added_count} missing configurations!")
                 st.rerun()
             else:
@@ -3414,73 +3075,42 @@ def render_admin_impersonation_sidebar(current_user):
         # Set session state for consistency with admin impersonation
         st.session_state.impersonate_judge = judge_name
 
-def render_progress_dashboard(judge_id):
+def render_progress_dashboard(judge_id, snapshot=None):
     """Render progress dashboard showing evaluation completion status"""
     st.markdown("### 📊 Progress Penilaian")
+    snapshot = snapshot or ContestSnapshot()
 
-    # Get all songs and evaluations
-    songs_df = cache_service.get_cached_songs()
-    rubrics_df = cache_service.get_cached_rubrics()
-    total_rubrics = len(rubrics_df)
+    # This judge's evaluations from the snapshot, joined against songs and rubrics
+    progress_df = snapshot.judge_progress(judge_id)
 
-    # Sort songs by ID as integer for proper numerical ordering
-    songs_df['id_int'] = pd.to_numeric(songs_df['id'], errors='coerce')
-    songs_df = songs_df.sort_values('id_int')
+    status_labels = {
+        'complete': ("✅ Lengkap", "success"),
+        'partial': (None, "warning"),
+        'not_started': ("⏳ Belum dinilai", "error")
+    }
 
     # Calculate progress for each song
     progress_data = []
-    total_songs = len(songs_df)
-    completed_songs = 0
+    total_songs = len(progress_df)
+    completed_songs = int((progress_df['status'] == 'complete').sum()) if total_songs else 0
 
-    for _, song in songs_df.iterrows():
-        evaluations = cache_service.get_cached_evaluations(judge_id=judge_id, song_id=song['id'])
-
-        if not evaluations.empty:
-            evaluation = evaluations.iloc[0]
-            rubric_scores = evaluation['rubric_scores']
-
-            if isinstance(rubric_scores, str):
-                import json
-                rubric_scores = json.loads(rubric_scores)
-            elif not isinstance(rubric_scores, dict):
-                rubric_scores = {}
-
-            # Count completed rubrics
-            completed_rubrics = len([score for score in rubric_scores.values() if score and score > 0])
-            completion_percentage = (completed_rubrics / total_rubrics) * 100
-            total_score = evaluation['total_score']
-
-            if completed_rubrics == total_rubrics:
-                status = "✅ Lengkap"
-                status_color = "success"
-                completed_songs += 1
-            elif completed_rubrics > 0:
-                status = f"🔄 Parsial ({completed_rubrics}/{total_rubrics})"
-                status_color = "warning"
-            else:
-                status = "⏳ Belum dinilai"
-                status_color = "error"
-                completion_percentage = 0
-                total_score = 0
-        else:
-            completed_rubrics = 0
-            completion_percentage = 0
-            total_score = 0
-            status = "⏳ Belum dinilai"
-            status_color = "error"
+    for item in progress_df.to_dict('records'):
+        status, status_color = status_labels[item['status']]
+        if status is None:
+            status = f"🔄 Parsial ({item['completed_rubrics']}/{item['total_rubrics']})"
 
         progress_data.append({
-            'song': song,
-            'completed_rubrics': completed_rubrics,
-            'total_rubrics': total_rubrics,
-            'completion_percentage': completion_percentage,
-            'total_score': total_score,
+            'song': {'id': item['song_id'], 'title': item['title'], 'composer': item.get('composer')},
+            'completed_rubrics': item['completed_rubrics'],
+            'total_rubrics': item['total_rubrics'],
+            'completion_percentage': item['completion_percentage'],
+            'total_score': item['total_score'],
             'status': status,
             'status_color': status_color
         })
 
     # Overall progress
-    overall_progress = (completed_songs / total_songs) * 100
+    overall_progress = (completed_songs / total_songs) * 100 if total_songs else 0
 
     # Display overall progress
     col1, col2, col3, col4 = st.columns(4)
@@ -3533,7 +3163,7 @@ def render_progress_dashboard(judge_id):
 
     st.markdown("---")
 
-def render_evaluation_tab(current_user):
+def render_evaluation_tab(current_user, snapshot=None):
     """Render evaluation tab - focused on scoring only"""
     st.header("📝 Penilaian Lagu")
 
@@ -3570,11 +3200,19 @@ def render_evaluation_tab(current_user):
         st.json(effective_user)  # Debug info
         return
 
+    # Auto-saves the background writer had to give up on
+    dropped_song_ids = autosave_service.take_dropped(judge_id)
+    if dropped_song_ids:
+        song_list = ", ".join(f"#{song_id}" for song_id in dropped_song_ids)
+        st.warning(f"⚠️ **Beberapa nilai gagal disimpan** untuk lagu {song_list}. "
+                   f"Silakan periksa dan isi ulang nilai lagu tersebut.")
+
     # Render scoring interface directly
-    render_penilaian_tab(judge_id, judge_name, effective_user, can_evaluate)
+    render_penilaian_tab(judge_id, judge_name, effective_user, can_evaluate, snapshot)
 
-def render_penilaian_tab(judge_id, judge_name, effective_user, can_evaluate=True):
+def render_penilaian_tab(judge_id, judge_name, effective_user, can_evaluate=True, snapshot=None):
     """Render the evaluation/scoring tab"""
+    snapshot = snapshot or ContestSnapshot()
 
     # Create judge_info object for compatibility
     judge_info = {
@@ -3583,18 +3221,17 @@ def render_penilaian_tab(judge_id, judge_name, effective_user, can_evaluate=True
     }
 
     # Get songs and sort by song number/ID
-    songs_df = cache_service.get_cached_songs()
+    songs_df = snapshot.songs
 
     if songs_df.empty:
         st.warning("No songs found. Please add songs first.")
         return
 
     # Sort songs by ID as integer for proper numerical ordering
-    songs_df['id_int'] = pd.to_numeric(songs_df['id'], errors='coerce')
-    songs_df = songs_df.sort_values('id_int')
+    songs_df = songs_df.assign(id_int=pd.to_numeric(songs_df['id'], errors='coerce')).sort_values('id_int')
 
     # Show progress dashboard
-    render_progress_dashboard(judge_id)
+    render_progress_dashboard(judge_id, snapshot)
 
     # STEP 1: Song Selection with Status in Dropdown
     st.markdown("### 🎵 Langkah 1: Pilih Lagu")
@@ -3604,28 +3241,26 @@ def render_penilaian_tab(judge_id, judge_name, effective_user, can_evaluate=True
     song_mapping = {}
 
     # Get total rubrics count for completion check
-    rubrics_df = cache_service.get_cached_rubrics()
+    rubrics_df = snapshot.rubrics
     total_rubrics = len(rubrics_df)
 
+    # Completion status of every song (same table as the progress dashboard)
+    progress_df = snapshot.judge_progress(judge_id)
+    progress_by_song = progress_df.set_index('song_id') if not progress_df.empty else pd.DataFrame()
+
     for _, song in songs_df.iterrows():
         # Check if song has been evaluated
-        evaluations = cache_service.get_cached_evaluations(judge_id=judge_id, song_id=song['id'])
+        song_progress = (
+            progress_by_song.loc[song['id_int']]
+            if not progress_by_song.empty and song['id_int'] in progress_by_song.index else None
+        )
 
-        if not evaluations.empty:
+        if song_progress is not None and pd.notna(song_progress['evaluation_id']):
             # Song has been evaluated - check completion status
-            evaluation = evaluations.iloc[0]
-            total_score = evaluation['total_score']
-
-            # Check how many rubrics have been scored
-            rubric_scores = evaluation['rubric_scores']
-            if isinstance(rubric_scores, str):
-                import json
-                rubric_scores = json.loads(rubric_scores)
-            elif not isinstance(rubric_scores, dict):
-                rubric_scores = {}
+            total_score = song_progress['total_score']
 
             # Count non-zero scores
-            completed_rubrics = len([score for score in rubric_scores.values() if score and score > 0])
+            completed_rubrics = int(song_progress['completed_rubrics'])
 
             # Determine status
             if completed_rubrics == total_rubrics:
@@ -3654,7 +3289,7 @@ def render_penilaian_tab(judge_id, judge_name, effective_user, can_evaluate=True
             option_text = f"{status_emoji} {song['id']}. {song['title']} ({status_text})"
 
         # Add author if SHOW_AUTHOR is enabled
-        config = cache_service.get_cached_config()
+        config = snapshot.config
         show_author = config.get('SHOW_AUTHOR', 'False').lower() == 'true'
         if show_author and song.get('author'):
             option_text += f" - {song['author']}"
@@ -3704,7 +3339,7 @@ def render_penilaian_tab(judge_id, judge_name, effective_user, can_evaluate=True
     st.markdown("### 🎼 Langkah 2: Dengarkan & Pelajari Lagu")
 
     # Get configuration
-    config = cache_service.get_cached_config()
+    config = snapshot.config
     show_author = config.get('SHOW_AUTHOR', 'True').lower() == 'true'
 
     # Show song info prominently
@@ -3735,8 +3370,12 @@ def render_penilaian_tab(judge_id, judge_name, effective_user, can_evaluate=True
     # Use accordion mode only (simplified)
     ui_mode = "accordion"
 
-    # Get existing evaluation data first
-    existing_evaluations = cache_service.get_cached_evaluations(judge_id=judge_id, song_id=song_data['id'])
+    # Get existing evaluation data first (including auto-saves not yet written)
+    judge_evaluations = snapshot.evaluations_for_judge(judge_id)
+    existing_evaluations = (
+        judge_evaluations[judge_evaluations['song_id'] == song_data['id']]
+        if not judge_evaluations.empty else judge_evaluations
+    )
     existing_scores = {}
     is_final_submitted = False
     evaluation_id = None
@@ -3755,7 +3394,7 @@ def render_penilaian_tab(judge_id, judge_name, effective_user, can_evaluate=True
             existing_scores = scores_data
 
     # Check if evaluation is locked
-    config = cache_service.get_cached_config()
+    config = snapshot.config
     editing_locked = is_final_submitted and config.get('LOCK_FINAL_EVALUATIONS', 'True').lower() == 'true'
 
     # Get AI suggestions and explanations
@@ -3908,7 +3547,7 @@ def render_penilaian_tab(judge_id, judge_name, effective_user, can_evaluate=True
     """, unsafe_allow_html=True)
 
     # Render each rubric as a card
-    rubrics_df = cache_service.get_cached_rubrics()
+    rubrics_df = snapshot.rubrics
 
     # Define rubric icons
     rubric_icons = {
@@ -3950,28 +3589,29 @@ def render_penilaian_tab(judge_id, judge_name, effective_user, can_evaluate=True
 
     # No additional rendering needed for accordion mode
 
-def render_analisis_tab(judge_id, judge_name):
+def render_analisis_tab(judge_id, judge_name, snapshot=None):
     """Render analysis tab with comprehensive insights"""
     st.markdown("### 📈 Analisis & Insights")
+    snapshot = snapshot or ContestSnapshot()
 
     # Filter options
     col1, col2, col3 = st.columns(3)
 
     with col1:
         # Song filter
-        songs_df = cache_service.get_cached_songs()
+        songs_df = snapshot.songs
         song_options = ["Semua Lagu"] + [f"{row['id']}. {row['title']}" for _, row in songs_df.iterrows()]
         selected_song_filter = st.selectbox("🎵 Filter Lagu:", song_options)
 
     with col2:
         # Judge filter (for admin view)
-        judges_df = cache_service.get_cached_judges()
+        judges_df = snapshot.judges
         judge_options = ["Semua Juri"] + [row['name'] for _, row in judges_df.iterrows()]
         selected_judge_filter = st.selectbox("👥 Filter Juri:", judge_options)
 
     with col3:
         # Rubric filter
-        rubrics_df = cache_service.get_cached_rubrics()
+        rubrics_df = snapshot.rubrics
         rubric_options = ["Semua Kriteria"] + [row['aspect_name'] for _, row in rubrics_df.iterrows()]
         selected_rubric_filter = st.selectbox("📋 Filter Kriteria:", rubric_options)
 
@@ -3981,7 +3621,7 @@ def render_analisis_tab(judge_id, judge_name):
     st.markdown("#### 🎵 Profil Lagu")
 
     # Get evaluations data
-    evaluations_df = cache_service.get_cached_evaluations()
+    evaluations_df = snapshot.evaluations
 
     if not evaluations_df.empty:
         # Create song analysis cards
@@ -4027,34 +3667,24 @@ def render_analisis_tab(judge_id, judge_name):
                     # Action buttons below the score - full width
                     st.markdown("---")
 
-                    # Download Report button - full width
-                    if st.button(f"📄 Download Report", key=f"download_song_{song['id']}", use_container_width=True):
-                        if PDF_AVAILABLE:
-                            try:
-                                with st.spinner(f"🔄 Generating report for {song['title']}..."):
-                                    pdf_bytes = generate_song_report_pdf(song['id'])
-                                    filename = f"laporan_{song['title'].replace(' ', '_')}.pdf"
-
-                                    st.download_button(
-                                        label="📥 Download PDF",
-                                        data=pdf_bytes,
-                                        file_name=filename,
-                                        mime="application/pdf",
-                                        key=f"dl_song_{song['id']}",
-                                        use_container_width=True
-                                    )
-                                    st.success("✅ Report generated!")
-                            except Exception as e:
-                                st.error(f"❌ Error: {str(e)}")
-                        else:
-                            st.error("❌ PDF generation not available")
+                    # Download Report button - full width, built in the background
+                    if PDF_AVAILABLE:
+                        render_job_download(
+                            "📄 Download Report", "song_report", generate_song_report_pdf,
+                            args=(int(song['id']),),
+                            file_name=f"laporan_{song['title'].replace(' ', '_')}.pdf",
+                            key=f"download_song_{song['id']}", download_label="📥 Download PDF",
+                            button_kwargs={'use_container_width': True}
+                        )
+                    elif st.button(f"📄 Download Report", key=f"download_song_{song['id']}", use_container_width=True):
+                        st.error("❌ PDF generation not available")
 
                     # Detail Analysis button - full width, separate
                     if st.button(f"👁️ Detail Analysis", key=f"detail_song_{song['id']}", use_container_width=True):
                         # Show detailed analysis directly in the same expander
                         st.markdown("---")
                         st.markdown("### 🔍 Detailed Analysis")
-                        render_song_detailed_analysis(song, song_evals)
+                        render_song_detailed_analysis(song, song_evals, snapshot)
     else:
         st.info("📋 Belum ada data evaluasi untuk dianalisis")
 
@@ -4069,28 +3699,18 @@ def render_analisis_tab(judge_id, judge_name):
         with col1:
             st.markdown("##### 🎯 Statistik Rubrik")
             # Calculate rubric statistics
-            all_rubric_scores = {}
-            for _, eval_row in evaluations_df.iterrows():
-                rubric_scores = eval_row['rubric_scores']
-                if isinstance(rubric_scores, str):
-                    import json
-                    rubric_scores = json.loads(rubric_scores)
+            rubric_summary = evaluation_scorer.rubric_score_summary(
+                evaluation_scorer.rubric_score_table(evaluations_df)
+            )
 
-                for rubric_key, score in rubric_scores.items():
-                    if rubric_key not in all_rubric_scores:
-                        all_rubric_scores[rubric_key] = []
-                    if score and score > 0:
-                        all_rubric_scores[rubric_key].append(score)
-
-            for rubric_key, scores in all_rubric_scores.items():
-                if scores:
-                    rubric_name = rubrics_df[rubrics_df['rubric_key'] == rubric_key]['aspect_name'].iloc[0]
-                    avg_score = sum(scores) / len(scores)
-                    st.metric(
-                        f"📋 {rubric_name}",
-                        f"{avg_score:.2f}/5",
-                        f"{len(scores)} penilaian"
-                    )
+            for _, rubric_stat in rubric_summary.iterrows():
+                rubric_key = rubric_stat['rubric_key']
+                rubric_name = rubrics_df[rubrics_df['rubric_key'] == rubric_key]['aspect_name'].iloc[0]
+                st.metric(
+                    f"📋 {rubric_name}",
+                    f"{rubric_stat['avg_score']:.2f}/5",
+                    f"{rubric_stat['total_scores']} penilaian"
+                )
 
         with col2:
             st.markdown("##### 👥 Konsistensi Juri")
@@ -4118,12 +3738,13 @@ def render_analisis_tab(judge_id, judge_name):
     else:
         st.info("📋 Belum ada data untuk analisis insight")
 
-def render_song_detailed_analysis(song, song_evals):
+def render_song_detailed_analysis(song, song_evals, snapshot=None):
     """Render comprehensive detailed analysis for a song"""
+    snapshot = snapshot or ContestSnapshot()
     try:
         # Get additional data
-        rubrics_df = cache_service.get_cached_rubrics()
-        judges_df = cache_service.get_cached_judges()
+        rubrics_df = snapshot.rubrics
+        judges_df = snapshot.judges
 
         # Basic song info
         st.markdown(f"### 🎵 {song['title']}")
@@ -4145,8 +3766,7 @@ def render_song_detailed_analysis(song, song_evals):
                 # Get position in leaderboard first
                 song_position = None
                 try:
-                    from services.analytics_service import analytics_service
-                    leaderboard_df = analytics_service.get_global_leaderboard()
+                    leaderboard_df = snapshot.leaderboard
                     if not leaderboard_df.empty:
                         for idx, (_, row) in enumerate(leaderboard_df.iterrows(), 1):
                             if row['song_id'] == song['id']:
@@ -4187,24 +3807,15 @@ def render_song_detailed_analysis(song, song_evals):
         st.markdown("#### 📋 Analisis Rubrik Detail")
 
         if not song_evals.empty:
-            # Create rubric breakdown table
-            rubric_analysis = {}
-
-            for _, eval_row in song_evals.iterrows():
-                rubric_scores = eval_row['rubric_scores']
-                if isinstance(rubric_scores, str):
-                    import json
-                    rubric_scores = json.loads(rubric_scores)
-
-                for rubric_key, score in rubric_scores.items():
-                    if score and score > 0:
-                        if rubric_key not in rubric_analysis:
-                            rubric_analysis[rubric_key] = []
-                        rubric_analysis[rubric_key].append(score)
+            # Create rubric breakdown table from the shared rubric-score table
+            rubric_table = snapshot.rubric_scores
+            rubric_table = rubric_table[rubric_table['evaluation_id'].isin(song_evals['id'])]
+            rubric_summary = evaluation_scorer.rubric_score_summary(rubric_table)
 
             # Display rubric analysis
-            for rubric_key, scores in rubric_analysis.items():
-                if scores:
+            for _, rubric_stat in rubric_summary.iterrows():
+                rubric_key = rubric_stat['rubric_key']
+                if rubric_stat['total_scores']:
                     # Get rubric name
                     rubric_name = rubric_key.title()
                     try:
@@ -4214,9 +3825,9 @@ def render_song_detailed_analysis(song, song_evals):
                     except:
                         pass
 
-                    avg_score = sum(scores) / len(scores)
-                    max_score = max(scores)
-                    min_score = min(scores)
+                    avg_score = rubric_stat['avg_score']
+                    max_score = f"{rubric_stat['max_score']:g}"
+                    min_score = f"{rubric_stat['min_score']:g}"
 
                     with st.expander(f"🎯 {rubric_name} - Rata-rata: {avg_score:.1f}/5"):
                         # Use full width layout instead of columns
@@ -4227,7 +3838,7 @@ def render_song_detailed_analysis(song, song_evals):
                         stat_col1.metric("Rata-rata", f"{avg_score:.1f}/5")
                         stat_col2.metric("Tertinggi", f"{max_score}/5")
                         stat_col3.metric("Terendah", f"{min_score}/5")
-                        stat_col4.metric("Jumlah Penilaian", len(scores))
+                        stat_col4.metric("Jumlah Penilaian", int(rubric_stat['total_scores']))
 
                         st.markdown("**🎯 Analisis:**")
                         if avg_score >= 4.0:
@@ -4285,13 +3896,14 @@ def render_song_detailed_analysis(song, song_evals):
     except Exception as e:
         st.error(f"Error in detailed analysis: {str(e)}")
 
-def render_hasil_tab(judge_id, judge_name):
+def render_hasil_tab(judge_id, judge_name, snapshot=None):
     """Render results tab with winners and rankings"""
     st.markdown("### 🏆 Hasil Lomba")
+    snapshot = snapshot or ContestSnapshot()
 
     # Get data
-    songs_df = cache_service.get_cached_songs()
-    evaluations_df = cache_service.get_cached_evaluations()
+    songs_df = snapshot.songs
+    evaluations_df = snapshot.evaluations
 
     if evaluations_df.empty:
         st.info("📋 Belum ada hasil evaluasi")
@@ -4416,25 +4028,14 @@ def render_hasil_tab(judge_id, judge_name):
     col1, col2, col3 = st.columns(3)
 
     with col1:
-        if st.button("📄 Download Hasil Lengkap", key="download_full_results"):
-            if PDF_AVAILABLE:
-                try:
-                    with st.spinner("🔄 Generating complete results report..."):
-                        pdf_bytes = generate_winner_report_pdf()
-                        filename = f"hasil_lengkap_{datetime.now().strftime('%Y%m%d_%H%M')}.pdf"
-
-                        st.download_button(
-                            label="📥 Download Results PDF",
-                            data=pdf_bytes,
-                            file_name=filename,
-                            mime="application/pdf",
-                            key="dl_full_results"
-                        )
-                        st.success("✅ Results report generated!")
-                except Exception as e:
-                    st.error(f"❌ Error generating report: {str(e)}")
-            else:
-                st.error("❌ PDF generation not available")
+        if PDF_AVAILABLE:
+            render_job_download(
+                "📄 Download Hasil Lengkap", "winner_report", generate_winner_report_pdf,
+                file_name=f"hasil_lengkap_{datetime.now().strftime('%Y%m%d_%H%M')}.pdf",
+                key="download_full_results", download_label="📥 Download Results PDF"
+            )
+        elif st.button("📄 Download Hasil Lengkap", key="download_full_results"):
+            st.error("❌ PDF generation not available")
 
     with col2:
         if st.button("🎖️ Generate Sertifikat", key="generate_certificates_hasil"):
@@ -4456,7 +4057,7 @@ def render_export_tab(judge_id, judge_name):
     # Per Song Reports
     st.markdown("#### 🎵 Laporan Per Lagu")
 
-    songs_df = cache_service.get_cached_songs()
+    songs_df = cache_service.get_cached_song_list()
 
     # Song selector for individual reports
     selected_song = st.selectbox(
@@ -4472,44 +4073,20 @@ def render_export_tab(judge_id, judge_name):
         col1, col2 = st.columns(2)
 
         with col1:
-            if st.button(f"📄 Generate Report: {song_title}", key=f"generate_song_{song_id}"):
-                try:
-                    with st.spinner("🔄 Generating PDF report..."):
-                        pdf_bytes = generate_song_report_pdf(song_id)
-                        filename = f"laporan_lagu_{song_id}_{song_title.replace(' ', '_')}.pdf"
-
-                        # Create download button
-                        st.download_button(
-                            label="📥 Download PDF Report",
-                            data=pdf_bytes,
-                            file_name=filename,
-                            mime="application/pdf",
-                            key=f"download_song_{song_id}"
-                        )
-                        st.success(f"✅ Report generated successfully!")
-
-                except Exception as e:
-                    st.error(f"❌ Error generating report: {str(e)}")
+            render_job_download(
+                f"📄 Generate Report: {song_title}", "song_report", generate_song_report_pdf,
+                args=(song_id,),
+                file_name=f"laporan_lagu_{song_id}_{song_title.replace(' ', '_')}.pdf",
+                key=f"generate_song_{song_id}", download_label="📥 Download PDF Report"
+            )
 
         with col2:
-            if st.button(f"📄 Generate Report (Judge Only)", key=f"generate_song_judge_{song_id}"):
-                try:
-                    with st.spinner("🔄 Generating judge-specific PDF report..."):
-                        pdf_bytes = generate_song_report_pdf(song_id, judge_id)
-                        filename = f"laporan_lagu_{song_id}_{judge_name.replace(' ', '_')}.pdf"
-
-                        # Create download button
-                        st.download_button(
-                            label="📥 Download Judge Report",
-                            data=pdf_bytes,
-                            file_name=filename,
-                            mime="application/pdf",
-                            key=f"download_song_judge_{song_id}"
-                        )
-                        st.success(f"✅ Judge report generated successfully!")
-
-                except Exception as e:
-                    st.error(f"❌ Error generating judge report: {str(e)}")
+            render_job_download(
+                f"📄 Generate Report (Judge Only)", "song_report", generate_song_report_pdf,
+                args=(song_id, judge_id),
+                file_name=f"laporan_lagu_{song_id}_{judge_name.replace(' ', '_')}.pdf",
+                key=f"generate_song_judge_{song_id}", download_label="📥 Download Judge Report"
+            )
 
     st.markdown("---")
 
@@ -4519,24 +4096,11 @@ def render_export_tab(judge_id, judge_name):
     col1, col2, col3 = st.columns(3)
 
     with col1:
-        if st.button("📄 Laporan Pemenang", key="generate_winner_report"):
-            try:
-                with st.spinner("🔄 Generating winner report..."):
-                    pdf_bytes = generate_winner_report_pdf()
-                    filename = f"laporan_pemenang_{datetime.now().strftime('%Y%m%d_%H%M')}.pdf"
-
-                    # Create download button
-                    st.download_button(
-                        label="📥 Download Winner Report",
-                        data=pdf_bytes,
-                        file_name=filename,
-                        mime="application/pdf",
-                        key="download_winner_report"
-                    )
-                    st.success("✅ Winner report generated successfully!")
-
-            except Exception as e:
-                st.error(f"❌ Error generating winner report: {str(e)}")
+        render_job_download(
+            "📄 Laporan Pemenang", "winner_report", generate_winner_report_pdf,
+            file_name=f"laporan_pemenang_{datetime.now().strftime('%Y%m%d_%H%M')}.pdf",
+            key="generate_winner_report", download_label="📥 Download Winner Report"
+        )
 
     with col2:
         if st.button("🎖️ Sertifikat Pemenang", key="generate_certificates"):
@@ -4577,7 +4141,7 @@ def render_export_tab(judge_id, judge_name):
             try:
                 # Get evaluations data
                 evaluations_df = cache_service.get_cached_evaluations()
-                songs_df = cache_service.get_cached_songs()
+                songs_df = cache_service.get_cached_song_list()
                 judges_df = cache_service.get_cached_judges()
 
                 if not evaluations_df.empty:
@@ -4660,23 +4224,62 @@ def render_export_tab(judge_id, judge_name):
 
 # ==================== PDF GENERATION FUNCTIONS ====================
 
-def generate_song_report_pdf(song_id: int, judge_id: int = None) -> bytes:
-    """Generate PDF report for a specific song"""
+def take_song_report_snapshot() -> Dict[str, Any]:
+    """
+    One consistent copy of the data song reports read
+
+    Evaluations and rubric scores are grouped by song once, so a batch of
+    reports does not re-filter the full frames for every song.
+    """
+    songs_df = cache_service.get_cached_songs()
+    evaluations_df = cache_service.get_cached_evaluations()
+    judges_df = cache_service.get_cached_judges()
+    rubric_score_table = evaluation_scorer.rubric_score_table(evaluations_df)
+
+    empty_evals = evaluations_df.iloc[0:0]
+    return {
+        'songs': songs_df.set_index('id', drop=False),
+        'evaluations_by_song': (
+            {} if evaluations_df.empty
+            else {song_id: group for song_id, group in evaluations_df.groupby('song_id')}
+        ),
+        'empty_evaluations': empty_evals,
+        'rubric_scores_by_song': (
+            {} if rubric_score_table.empty
+            else {song_id: group for song_id, group in rubric_score_table.groupby('song_id')}
+        ),
+        'empty_rubric_scores': rubric_score_table.iloc[0:0],
+        'judge_names': dict(zip(judges_df['id'], judges_df['name'])) if not judges_df.empty else {}
+    }
+
+def generate_song_report_pdf(song_id: int, judge_id: int = None,
+                             snapshot: Optional[Dict[str, Any]] = None) -> bytes:
+    """Generate PDF report for a specific song (from ``snapshot`` when batching)"""
     if not PDF_AVAILABLE:
         raise Exception("PDF generation not available. Please install reportlab.")
+    from reportlab.lib.pagesizes import A4
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.units import inch
+    from reportlab.lib import colors
+    from reportlab.lib.enums import TA_CENTER
 
     # Get data
-    songs_df = cache_service.get_cached_songs()
-    song = songs_df[songs_df['id'] == song_id].iloc[0]
+    if snapshot is None:
+        snapshot = take_song_report_snapshot()
+    song = snapshot['songs'].loc[song_id]
 
-    evaluations_df = cache_service.get_cached_evaluations()
-    song_evals = evaluations_df[evaluations_df['song_id'] == song_id]
+    song_evals = snapshot['evaluations_by_song'].get(song_id, snapshot['empty_evaluations'])
+    song_rubric_scores = snapshot['rubric_scores_by_song'].get(song_id, snapshot['empty_rubric_scores'])
 
     if judge_id:
         song_evals = song_evals[song_evals['judge_id'] == judge_id]
+        song_rubric_scores = song_rubric_scores[song_rubric_scores['judge_id'] == judge_id]
 
-    rubrics_df = cache_service.get_cached_rubrics()
-    judges_df = cache_service.get_cached_judges()
+    judge_names = snapshot['judge_names']
+
+    # Per-rubric averages of the selected evaluations from the shared rubric-score table
+    rubric_summary = evaluation_scorer.rubric_score_summary(song_rubric_scores).set_index('rubric_key')
 
     # Create PDF buffer
     buffer = io.BytesIO()
@@ -4730,7 +4333,7 @@ def generate_song_report_pdf(song_id: int, judge_id: int = None) -> bytes:
         eval_data.append(['Juri', 'Tema', 'Lirik', 'Musik', 'Kreativitas', 'Jemaat', 'Total'])
 
         for _, eval_row in song_evals.iterrows():
-            judge_name = judges_df[judges_df['id'] == eval_row['judge_id']]['name'].iloc[0]
+            judge_name = judge_names.get(eval_row['judge_id'], f"Juri {eval_row['judge_id']}")
             rubric_scores = eval_row['rubric_scores']
 
             if isinstance(rubric_scores, str):
@@ -4751,17 +4354,8 @@ def generate_song_report_pdf(song_id: int, judge_id: int = None) -> bytes:
         if len(song_evals) > 1:
             avg_row = ['RATA-RATA']
             for rubric_key in ['tema', 'lirik', 'musik', 'kreativ', 'jemaat']:
-                scores = []
-                for _, eval_row in song_evals.iterrows():
-                    rubric_scores = eval_row['rubric_scores']
-                    if isinstance(rubric_scores, str):
-                        rubric_scores = json.loads(rubric_scores)
-                    score = rubric_scores.get(rubric_key, 0)
-                    if score > 0:
-                        scores.append(score)
-
-                if scores:
-                    avg_score = sum(scores) / len(scores)
+                if rubric_key in rubric_summary.index:
+                    avg_score = rubric_summary.at[rubric_key, 'avg_score']
                     avg_row.append(f"{avg_score:.1f}")
                 else:
                     avg_row.append('-')
@@ -4813,17 +4407,8 @@ def generate_song_report_pdf(song_id: int, judge_id: int = None) -> bytes:
         }
 
         for rubric_key in ['tema', 'lirik', 'musik', 'kreativ', 'jemaat']:
-            scores = []
-            for _, eval_row in song_evals.iterrows():
-                rubric_scores = eval_row['rubric_scores']
-                if isinstance(rubric_scores, str):
-                    rubric_scores = json.loads(rubric_scores)
-                score = rubric_scores.get(rubric_key, 0)
-                if score > 0:
-                    scores.append(score)
-
-            if scores:
-                rubric_averages[rubric_key] = sum(scores) / len(scores)
+            if rubric_key in rubric_summary.index:
+                rubric_averages[rubric_key] = float(rubric_summary.at[rubric_key, 'avg_score'])
             else:
                 rubric_averages[rubric_key] = 0
 
@@ -4888,7 +4473,7 @@ def generate_song_report_pdf(song_id: int, judge_id: int = None) -> bytes:
         if has_comments:
             story.append(Paragraph("📝 Catatan Juri", styles['Heading2']))
             for _, eval_row in song_evals.iterrows():
-                judge_name = judges_df[judges_df['id'] == eval_row['judge_id']]['name'].iloc[0]
+                judge_name = judge_names.get(eval_row['judge_id'], f"Juri {eval_row['judge_id']}")
                 notes = eval_row.get('notes', '')
 
                 if notes and notes.strip():
@@ -4903,10 +4488,96 @@ def generate_song_report_pdf(song_id: int, judge_id: int = None) -> bytes:
     buffer.seek(0)
     return buffer.getvalue()
 
+def generate_song_reports_batch(per_judge: bool = False, output: str = 'zip') -> Dict[str, Any]:
+    """
+    Reports for every song (or every song x judge who evaluated it) from one snapshot
+
+    Reports are built one after another: reportlab layout is CPU-bound and
+    holds the GIL, and a process pool would have to re-import this script.
+    The batch saves the per-report data loading instead (one snapshot).
+
+    Args:
+        per_judge: One report per (song, judge) evaluation instead of per song
+        output: 'zip' (one PDF per report) or 'merged' (one PDF with a bookmark per report)
+
+    Returns:
+        Dict with the file bytes ('data'), 'total_seconds' and one
+        {'name', 'seconds', 'error'} entry per report in 'reports'
+    """
+    import re
+    import zipfile
+
+    if output not in ('zip', 'merged'):
+        raise ValueError(f"Unknown report output: {output}")
+
+    started = time.perf_counter()
+    snapshot = take_song_report_snapshot()
+
+    jobs = []
+    for song_id, song in snapshot['songs'].sort_index().iterrows():
+        safe_title = re.sub(r"[^A-Za-z0-9 _-]+", "", str(song['title'])).strip().replace(' ', '_')[:60] or "Lagu"
+        if per_judge:
+            song_evals = snapshot['evaluations_by_song'].get(song_id, snapshot['empty_evaluations'])
+            for judge_id in sorted(song_evals['judge_id'].unique()):
+                judge_name = str(snapshot['judge_names'].get(judge_id, judge_id))
+                safe_judge = re.sub(r"[^A-Za-z0-9 _-]+", "", judge_name).strip().replace(' ', '_')[:40]
+                jobs.append((song_id, judge_id, f"{song_id:03d}_{safe_title}_{safe_judge}",
+                             f"{song['title']} — {judge_name}"))
+        else:
+            jobs.append((song_id, None, f"{song_id:03d}_{safe_title}", str(song['title'])))
+
+    def build(job):
+        song_id, judge_id, _, _ = job
+        job_started = time.perf_counter()
+        try:
+            return generate_song_report_pdf(song_id, judge_id, snapshot=snapshot), None, time.perf_counter() - job_started
+        except Exception as e:
+            return None, str(e), time.perf_counter() - job_started
+
+    results = [build(job) for job in jobs]
+
+    reports = [{'name': name, 'seconds': round(seconds, 3), 'error': error}
+               for (_, _, name, _), (_, error, seconds) in zip(jobs, results)]
+
+    if output == 'zip':
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w', compression=zipfile.ZIP_DEFLATED) as zip_file:
+            for (_, _, name, _), (pdf_bytes, _, _) in zip(jobs, results):
+                if pdf_bytes is not None:
+                    zip_file.writestr(f"{name}.pdf", pdf_bytes)
+        data = buffer.getvalue()
+    else:
+        try:
+            import pymupdf
+        except ImportError:
+            import fitz as pymupdf
+        with pymupdf.open() as merged:
+            toc = []
+            for (_, _, _, title), (pdf_bytes, _, _) in zip(jobs, results):
+                if pdf_bytes is None:
+                    continue
+                with pymupdf.open("pdf", pdf_bytes) as report:
+                    toc.append([1, title, merged.page_count + 1])
+                    merged.insert_pdf(report)
+            if not toc:
+                raise Exception("No song reports could be generated")
+            merged.set_toc(toc)
+            data = merged.tobytes(garbage=3, deflate=True)
+
+    total_seconds = time.perf_counter() - started
+    logger.info(f"Song report batch: {len(jobs)} reports in {total_seconds:.1f}s")
+    return {'data': data, 'total_seconds': round(total_seconds, 2), 'reports': reports}
+
 def generate_winner_report_pdf() -> bytes:
     """Generate comprehensive PDF report for winners with detailed analysis"""
     if not PDF_AVAILABLE:
         raise Exception("PDF generation not available. Please install reportlab.")
+    from reportlab.lib.pagesizes import A4
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.lib.units import inch
+    from reportlab.lib import colors
+    from reportlab.lib.enums import TA_CENTER
 
     # Get data using analytics service for proper scoring
     from services.analytics_service import analytics_service
@@ -5066,6 +4737,10 @@ def generate_winner_report_pdf() -> bytes:
 
 def _add_winner_rubric_analysis(story, result, evaluations_df, judges_df, rubrics_df, styles):
     """Add detailed rubric analysis for a winner"""
+    from reportlab.platypus import Paragraph, Spacer, Table, TableStyle
+    from reportlab.lib.units import inch
+    from reportlab.lib import colors
+
     song_id = result['id']
     song_evals = evaluations_df[evaluations_df['song_id'] == song_id]
 
@@ -5078,26 +4753,19 @@ def _add_winner_rubric_analysis(story, result, evaluations_df, judges_df, rubric
     # Create rubric analysis table
     rubric_data = [['Aspek Penilaian', 'Rata-rata', 'Tertinggi', 'Terendah', 'Analisis']]
 
-    # Calculate rubric scores
-    rubric_scores = {}
-    for _, eval_row in song_evals.iterrows():
-        rubric_scores_json = eval_row['rubric_scores']
-        if isinstance(rubric_scores_json, str):
-            import json
-            rubric_scores_json = json.loads(rubric_scores_json)
-
-        for rubric_key, score in rubric_scores_json.items():
-            if score and score > 0:
-                if rubric_key not in rubric_scores:
-                    rubric_scores[rubric_key] = []
-                rubric_scores[rubric_key].append(score)
+    # Calculate rubric scores from the shared rubric-score table
+    rubric_score_table = evaluation_scorer.rubric_score_table(evaluations_df)
+    rubric_summary = evaluation_scorer.rubric_score_summary(
+        rubric_score_table[rubric_score_table['song_id'] == song_id]
+    )
 
     # Analyze each rubric
-    for rubric_key, scores in rubric_scores.items():
-        if scores:
-            avg_score = sum(scores) / len(scores)
-            max_score = max(scores)
-            min_score = min(scores)
+    for _, rubric_stat in rubric_summary.iterrows():
+        rubric_key = rubric_stat['rubric_key']
+        if rubric_stat['total_scores']:
+            avg_score = rubric_stat['avg_score']
+            max_score = rubric_stat['max_score']
+            min_score = rubric_stat['min_score']
 
             # Get rubric name
             rubric_name = rubric_key.title()
@@ -5215,6 +4883,8 @@ def _add_winner_rubric_analysis(story, result, evaluations_df, judges_df, rubric
 
 def _add_winner_comparison(story, current_winner, other_winners, styles):
     """Add comparison with other winners"""
+    from reportlab.platypus import Paragraph, Spacer
+
     if not other_winners:
         return
 
@@ -5237,6 +4907,10 @@ def _add_winner_comparison(story, current_winner, other_winners, styles):
 
 def _add_comprehensive_song_analysis(story, song, song_evals, styles):
     """Add comprehensive analysis including AI analysis, charts, and detailed insights"""
+    from reportlab.platypus import Paragraph, Spacer, Table, TableStyle
+    from reportlab.lib.units import inch
+    from reportlab.lib import colors
+
     try:
         story.append(Paragraph("🎯 Analisis Komprehensif Lagu", styles['Heading1']))
         story.append(Spacer(1, 20))
@@ -5291,9 +4965,9 @@ def _add_comprehensive_song_analysis(story, song, song_evals, styles):
         if chords_text:
             story.append(Paragraph("<b>Analisis Chord:</b>", styles['Heading3']))
 
-            # Parse chords
-            chord_list = [chord.strip() for chord in chords_text.split() if chord.strip()]
-            unique_chords = list(dict.fromkeys(chord_list))
+            analysis = song_analysis_service.analyze(song)
+            chord_list = analysis['chord_list']
+            unique_chords = analysis['unique_chords']
 
             # Chord statistics
             chord_stats = [
@@ -5318,8 +4992,7 @@ def _add_comprehensive_song_analysis(story, song, song_evals, styles):
 
             # Chord complexity analysis
             try:
-                from services.scoring_service import scoring_service
-                complexity_score = scoring_service.score_harmonic_richness(chord_list)
+                complexity_score = analysis['harmonic_richness'] or 2
 
                 complexity_text = f"""
                 <b>Tingkat Kompleksitas Harmoni:</b> {complexity_score}/5<br/>
@@ -5416,9 +5089,10 @@ def create_download_link(pdf_bytes: bytes, filename: str) -> str:
     b64 = base64.b64encode(pdf_bytes).decode()
     return f'<a href="data:application/pdf;base64,{b64}" download="{filename}">📄 Download {filename}</a>'
 
-def render_evaluation_history_tab(current_user):
+def render_evaluation_history_tab(current_user, snapshot=None):
     """Render evaluation history tab"""
     st.header("📋 History Penilaian Saya")
+    snapshot = snapshot or ContestSnapshot()
 
     # Get effective user (handles admin impersonation)
     effective_user = get_effective_user(current_user)
@@ -5430,7 +5104,7 @@ def render_evaluation_history_tab(current_user):
         return
 
     # Get all evaluations by this judge
-    evaluations_df = cache_service.get_cached_evaluations(judge_id=judge_id)
+    evaluations_df = snapshot.evaluations_for_judge(judge_id)
 
     if evaluations_df.empty:
         st.info("Anda belum melakukan penilaian apapun.")
@@ -5439,29 +5113,18 @@ def render_evaluation_history_tab(current_user):
     st.success(f"📊 Total penilaian: **{len(evaluations_df)}** lagu")
 
     # Calculate overall completion status
-    songs_df = cache_service.get_cached_songs()
-    rubrics_df = cache_service.get_cached_rubrics()
+    songs_df = snapshot.songs
+    rubrics_df = snapshot.rubrics
     total_songs = len(songs_df)
     total_rubrics = len(rubrics_df)
 
-    completed_songs = 0
-    all_evaluations_final = True
-
-    for _, evaluation in evaluations_df.iterrows():
-        rubric_scores = evaluation['rubric_scores']
-        if isinstance(rubric_scores, str):
-            import json
-            rubric_scores = json.loads(rubric_scores)
-        elif not isinstance(rubric_scores, dict):
-            rubric_scores = {}
-
-        completed_rubrics = len([score for score in rubric_scores.values() if score and score > 0])
-        if completed_rubrics == total_rubrics:
-            completed_songs += 1
-
-        # Check if this evaluation is final
-        if not evaluation.get('is_final_submitted', False):
-            all_evaluations_final = False
+    # Completeness of all evaluations from one score matrix
+    score_frame = evaluation_scorer.score_frame(evaluations_df, rubrics_df)
+    completed_songs = int(score_frame['is_complete'].sum())
+    all_evaluations_final = bool(
+        evaluations_df.get('is_final_submitted', pd.Series(False, index=evaluations_df.index))
+        .fillna(False).astype(bool).all()
+    )
 
     # Show Final Submit section if all songs are complete
     if completed_songs == total_songs and not all_evaluations_final:
@@ -5479,10 +5142,16 @@ def render_evaluation_history_tab(current_user):
                        width='stretch',
                        help="Submit final dan kunci SEMUA penilaian - tidak dapat diedit lagi"):
 
+                # Write pending auto-saves so every evaluation has a stored row to lock
+                autosave_service.flush(judge_id=judge_id)
+                evaluations_df = db_service.get_evaluations(judge_id=judge_id)
+
                 # Final submit all evaluations
                 success_count = 0
                 for _, evaluation in evaluations_df.iterrows():
-                    if db_service.final_submit_evaluation(evaluation['id']):
+                    if db_service.final_submit_evaluation(evaluation['id'],
+                                                          judge_id=judge_id,
+                                                          song_id=evaluation['song_id']):
                         success_count += 1
 
                 if success_count == len(evaluations_df):
@@ -5516,7 +5185,7 @@ def render_evaluation_history_tab(current_user):
         st.success("🔒 **Semua Penilaian Sudah Final** - Terima kasih atas partisipasi Anda!")
 
         # Show final submission timestamp if available
-        final_evaluations = [eval for _, eval in evaluations_df.iterrows() if eval.get('final_submitted_at')]
+        final_evaluations = [eval for _, eval in evaluations_df.iterrows() if pd.notna(eval.get('final_submitted_at'))]
         if final_evaluations:
             latest_final = max(final_evaluations, key=lambda x: x.get('final_submitted_at', ''))
             final_time = latest_final.get('final_submitted_at')
@@ -5548,7 +5217,7 @@ def render_evaluation_history_tab(current_user):
                     rubric_scores = json.loads(rubric_scores)
 
                 # Get rubrics for display names
-                rubrics_df = cache_service.get_cached_rubrics()
+                rubrics_df = snapshot.rubrics
 
                 for _, rubric in rubrics_df.iterrows():
                     if rubric['rubric_key'] in rubric_scores:
@@ -5592,7 +5261,7 @@ def render_evaluation_history_tab(current_user):
                 elif not isinstance(rubric_scores, dict):
                     rubric_scores = {}
 
-                rubrics_df = cache_service.get_cached_rubrics()
+                rubrics_df = snapshot.rubrics
                 total_rubrics = len(rubrics_df)
                 completed_rubrics = len([score for score in rubric_scores.values() if score and score > 0])
 
@@ -5603,9 +5272,10 @@ def render_evaluation_history_tab(current_user):
                 else:
                     st.info(f"⏳ Belum lengkap ({completed_rubrics}/{total_rubrics})")
 
-def render_analytics_tab():
+def render_analytics_tab(snapshot=None):
     """Render analytics tab with comprehensive analysis features"""
     st.header("📊 Hasil & Analitik")
+    snapshot = snapshot or ContestSnapshot()
 
     # Get current user for judge context
     current_user = st.session_state.get('current_user')
@@ -5627,27 +5297,28 @@ def render_analytics_tab():
     with tab_analisis:
         if judge_id:
             # Combined analysis and export in one tab
-            render_combined_analysis_export_tab(judge_id, judge_name)
+            render_combined_analysis_export_tab(judge_id, judge_name, snapshot)
         else:
             st.warning("⚠️ Login sebagai juri untuk melihat analisis detail")
 
     with tab_hasil:
         if judge_id:
-            render_hasil_tab(judge_id, judge_name)
+            render_hasil_tab(judge_id, judge_name, snapshot)
         else:
             st.warning("⚠️ Login sebagai juri untuk melihat hasil detail")
 
     with tab_global:
-        render_global_analytics_tab()
+        render_global_analytics_tab(snapshot)
 
-def render_combined_analysis_export_tab(judge_id, judge_name):
+def render_combined_analysis_export_tab(judge_id, judge_name, snapshot=None):
     """Render combined analysis and export tab with centralized download options"""
+    snapshot = snapshot or ContestSnapshot()
 
     # ==================== ANALYSIS SECTION ====================
     st.markdown("### 📈 Analisis Komprehensif")
 
     # Quick analysis overview
-    render_analisis_tab(judge_id, judge_name)
+    render_analisis_tab(judge_id, judge_name, snapshot)
 
     st.markdown("---")
 
@@ -5670,27 +5341,31 @@ def render_combined_analysis_export_tab(judge_id, judge_name):
     col1, col2, col3, col4 = st.columns(4)
 
     with col1:
-        # Excel comprehensive export
-        if st.button("📊 Excel Lengkap", type="primary", width='stretch', key="quick_excel"):
-            try:
-                excel_data = export_service.export_comprehensive_excel()
-                st.download_button(
-                    "📥 Download Excel",
-                    data=excel_data,
-                    file_name=f"lomba_lengkap_{pd.Timestamp.now().strftime('%Y%m%d_%H%M')}.xlsx",
-                    mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                    key="dl_quick_excel"
-                )
-                st.success("✅ Excel ready!")
-            except Exception as e:
-                st.error(f"❌ Error: {str(e)}")
+        # Comprehensive export, built in the background
+        export_formats = {
+            "Excel": ('xlsx', "xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
+            "CSV (ZIP)": ('csv_zip', "zip", "application/zip"),
+        }
+        if PARQUET_AVAILABLE:
+            export_formats["Parquet (ZIP)"] = ('parquet_zip', "zip", "application/zip")
+        export_choice = st.selectbox("Format", list(export_formats), key="quick_excel_format",
+                                     label_visibility="collapsed")
+        export_format, extension, mime = export_formats[export_choice]
+        render_job_download(
+            "📊 Excel Lengkap", "comprehensive_export",
+            lambda fmt: export_service.export_comprehensive_file(fmt),
+            args=(export_format,),
+            file_name=f"lomba_lengkap_{pd.Timestamp.now().strftime('%Y%m%d_%H%M')}.{extension}",
+            mime=mime, key=f"quick_excel_{export_format}", download_label=f"📥 Download {export_choice}",
+            button_kwargs={'type': 'primary', 'width': 'stretch'}, result_file=True
+        )
 
     with col2:
         # PDF leaderboard
         if st.button("📄 PDF Hasil", type="primary", width='stretch', key="quick_pdf"):
             if PDF_AVAILABLE:
                 try:
-                    leaderboard_df = analytics_service.get_global_leaderboard()
+                    leaderboard_df = snapshot.leaderboard
                     pdf_data = export_service.export_leaderboard_pdf(leaderboard_df)
                     st.download_button(
                         "📥 Download PDF",
@@ -5709,7 +5384,7 @@ def render_combined_analysis_export_tab(judge_id, judge_name):
         # CSV scores export
         if st.button("📊 CSV Skor", type="secondary", width='stretch', key="quick_csv"):
             try:
-                evaluations_df = cache_service.get_cached_evaluations()
+                evaluations_df = snapshot.evaluations
                 if not evaluations_df.empty:
                     csv_data = evaluations_df.to_csv(index=False)
                     st.download_button(
@@ -5729,7 +5404,7 @@ def render_combined_analysis_export_tab(judge_id, judge_name):
         # JSON export
         if st.button("📄 JSON Data", type="secondary", width='stretch', key="quick_json"):
             try:
-                evaluations_df = cache_service.get_cached_evaluations()
+                evaluations_df = snapshot.evaluations
                 if not evaluations_df.empty:
                     json_data = evaluations_df.to_json(orient='records', indent=2)
                     st.download_button(
@@ -5752,7 +5427,7 @@ def render_combined_analysis_export_tab(judge_id, judge_name):
 
     # Per song reports
     with st.expander("🎵 **Per Song Reports**", expanded=False):
-        songs_df = cache_service.get_cached_songs()
+        songs_df = snapshot.songs
 
         col1, col2 = st.columns([2, 1])
 
@@ -5764,27 +5439,53 @@ def render_combined_analysis_export_tab(judge_id, judge_name):
             )
 
         with col2:
-            if st.button("📄 Generate Report", type="primary", width='stretch', key="generate_song_report"):
-                if PDF_AVAILABLE:
-                    try:
-                        song_id = int(selected_song.split('.')[0])
-                        with st.spinner(f"🔄 Generating report..."):
-                            pdf_bytes = generate_song_report_pdf(song_id)
-                            song_title = selected_song.split('. ')[1]
-                            filename = f"laporan_{song_title.replace(' ', '_')}.pdf"
-
-                            st.download_button(
-                                label="📥 Download Song Report",
-                                data=pdf_bytes,
-                                file_name=filename,
-                                mime="application/pdf",
-                                key="dl_song_report"
-                            )
-                            st.success("✅ Song report generated!")
-                    except Exception as e:
-                        st.error(f"❌ Error: {str(e)}")
-                else:
-                    st.error("❌ PDF generation not available")
+            if PDF_AVAILABLE and selected_song:
+                song_id = int(selected_song.split('.')[0])
+                song_title = selected_song.split('. ')[1]
+                render_job_download(
+                    "📄 Generate Report", "song_report", generate_song_report_pdf,
+                    args=(song_id,),
+                    file_name=f"laporan_{song_title.replace(' ', '_')}.pdf",
+                    key=f"generate_song_report_{song_id}", download_label="📥 Download Song Report",
+                    button_kwargs={'type': 'primary', 'width': 'stretch'}
+                )
+            elif st.button("📄 Generate Report", type="primary", width='stretch', key="generate_song_report"):
+                st.error("❌ PDF generation not available")
+
+        # All songs at once, from one data snapshot
+        if PDF_AVAILABLE:
+            st.markdown("---")
+            col1, col2, col3 = st.columns([1, 1, 1])
+            with col1:
+                batch_scope = st.selectbox("Cakupan", ["Per lagu", "Per lagu × juri"],
+                                           key="song_report_batch_scope")
+            with col2:
+                batch_output = st.selectbox("Format", ["ZIP", "PDF gabungan"],
+                                            key="song_report_batch_output")
+            per_judge = batch_scope == "Per lagu × juri"
+            output = 'zip' if batch_output == "ZIP" else 'merged'
+
+            def show_batch_timing(result):
+                timings = pd.DataFrame(result['reports'])
+                failed = timings['error'].notna().sum() if not timings.empty else 0
+                st.caption(f"⏱️ {len(timings)} laporan dalam {result['total_seconds']:.1f} detik"
+                           f"{f', {failed} gagal' if failed else ''}")
+                with st.expander("Waktu per laporan", expanded=False):
+                    st.dataframe(timings, hide_index=True)
+
+            with col3:
+                render_job_download(
+                    "📦 Semua Laporan", "song_report_batch", generate_song_reports_batch,
+                    args=(per_judge, output),
+                    file_name=f"laporan_semua_lagu_{datetime.now().strftime('%Y%m%d_%H%M')}."
+                              f"{'zip' if output == 'zip' else 'pdf'}",
+                    mime="application/zip" if output == 'zip' else "application/pdf",
+                    key=f"song_report_batch_{int(per_judge)}_{output}",
+                    download_label="📥 Download Semua Laporan",
+                    button_kwargs={'width': 'stretch'},
+                    result_data=lambda result: result['data'],
+                    result_details=show_batch_timing
+                )
 
     # Winner reports
     with st.expander("🏆 **Winner Reports**", expanded=False):
@@ -5792,48 +5493,38 @@ def render_combined_analysis_export_tab(judge_id, judge_name):
         col1, col2 = st.columns(2)
 
         with col1:
-            if st.button("🥇 Winner Report", type="primary", use_container_width=True, key="winner_report"):
-                if PDF_AVAILABLE:
-                    try:
-                        with st.spinner("🔄 Generating winner report..."):
-                            pdf_bytes = generate_winner_report_pdf()
-                            filename = f"pemenang_{datetime.now().strftime('%Y%m%d_%H%M')}.pdf"
-
-                            st.download_button(
-                                label="📥 Download Winner Report",
-                                data=pdf_bytes,
-                                file_name=filename,
-                                mime="application/pdf",
-                                key="dl_winner_report"
-                            )
-                            st.success("✅ Winner report generated!")
-                    except Exception as e:
-                        st.error(f"❌ Error: {str(e)}")
-                else:
-                    st.error("❌ PDF generation not available")
+            if PDF_AVAILABLE:
+                render_job_download(
+                    "🥇 Winner Report", "winner_report", generate_winner_report_pdf,
+                    file_name=f"pemenang_{datetime.now().strftime('%Y%m%d_%H%M')}.pdf",
+                    key="winner_report", download_label="📥 Download Winner Report",
+                    button_kwargs={'type': 'primary', 'use_container_width': True}
+                )
+            elif st.button("🥇 Winner Report", type="primary", use_container_width=True, key="winner_report"):
+                st.error("❌ PDF generation not available")
 
         with col2:
             if st.button("🎖️ Certificates", type="secondary", use_container_width=True, key="certificates"):
-                render_certificate_generation()
+                render_certificate_generation(snapshot)
 
         # Second row: Winner Analysis full width
         st.markdown("---")
         if st.button("📊 Winner Analysis", type="secondary", use_container_width=True, key="winner_analysis"):
-            render_winner_analysis()
+            render_winner_analysis(snapshot)
 
     # Judge Analytics - separate section
     with st.expander("🧠 **Judge Analytics**", expanded=False):
-        render_judge_insights()
+        render_judge_insights(snapshot)
 
-def render_judge_insights():
+def render_judge_insights(snapshot=None):
     """Render judge insights and patterns analysis"""
     st.markdown("### 🧠 Judge Insights & Patterns")
+    snapshot = snapshot or ContestSnapshot()
 
     try:
         # Get judge analytics
-        from services.analytics_service import analytics_service
-        judge_analytics_df = analytics_service.get_judge_analytics()
-        evaluations_df = cache_service.get_cached_evaluations()
+        judge_analytics_df = snapshot.judge_analytics
+        evaluations_df = snapshot.evaluations
 
         if judge_analytics_df.empty:
             st.warning("Judge analytics data not available")
@@ -5893,20 +5584,20 @@ def render_judge_insights():
     except Exception as e:
         st.error(f"❌ Error in judge insights: {e}")
 
-def render_certificate_generation():
+def render_certificate_generation(snapshot=None):
     """Generate certificates for participants"""
     st.markdown("### 🎖️ Certificate Generation")
+    snapshot = snapshot or ContestSnapshot()
 
     try:
         # Get songs data
-        songs_df = cache_service.get_cached_songs()
+        songs_df = snapshot.songs
         if songs_df.empty:
             st.warning("📋 No songs found")
             return
 
         # Sort songs by ID for proper ordering
-        songs_df['id_int'] = pd.to_numeric(songs_df['id'], errors='coerce')
-        songs_df = songs_df.sort_values('id_int')
+        songs_df = songs_df.assign(id_int=pd.to_numeric(songs_df['id'], errors='coerce')).sort_values('id_int')
 
         # Certificate generation options
         col1, col2 = st.columns([2, 1])
@@ -5961,20 +5652,20 @@ def render_certificate_generation():
     except Exception as e:
         st.error(f"❌ Error in certificate generation: {e}")
 
-def render_winner_analysis():
+def render_winner_analysis(snapshot=None):
     """Detailed analysis of winners"""
     st.markdown("### 📊 Winner Analysis")
+    snapshot = snapshot or ContestSnapshot()
 
     try:
         # Get leaderboard data (use analytics service for proper 100-point scale)
-        from services.analytics_service import analytics_service
-        leaderboard_df = analytics_service.get_global_leaderboard()
+        leaderboard_df = snapshot.leaderboard
         if leaderboard_df.empty:
             st.warning("📊 No evaluation data available for analysis")
             return
 
         # Get configuration
-        config = cache_service.get_cached_config()
+        config = snapshot.config
         winners_count = int(config.get('WINNERS_TOP_N', 3))
 
         # Get top winners
@@ -6036,11 +5727,14 @@ def render_winner_analysis():
             st.markdown("#### 🎯 Detailed Winner Analysis")
 
             # Get detailed evaluations for winners
-            evaluations_df = cache_service.get_cached_evaluations()
-            rubrics_df = cache_service.get_cached_rubrics()
-            judges_df = cache_service.get_cached_judges()
+            evaluations_df = snapshot.evaluations
+            rubrics_df = snapshot.rubrics
+            judges_df = snapshot.judges
 
             if not evaluations_df.empty and not rubrics_df.empty:
+                # Long rubric-score table shared by all winners (built once per snapshot)
+                rubric_score_table = snapshot.rubric_scores
+
                 for i, (_, winner) in enumerate(winners_df.iterrows(), 1):
                     rank_emoji = "🥇" if i == 1 else "🥈" if i == 2 else "🥉" if i == 3 else "🏆"
 
@@ -6059,9 +5753,6 @@ def render_winner_analysis():
                                 header = ['Juri', 'Tema', 'Lirik', 'Musik', 'Kreativitas', 'Jemaat', 'Total']
                                 rubric_table_data.append(header)
 
-                                # Collect rubric averages for analysis
-                                rubric_totals = {'tema': [], 'lirik': [], 'musik': [], 'kreativ': [], 'jemaat': []}
-
                                 for _, eval_row in song_evals.iterrows():
                                     # Get judge name
                                     judge_name = "Unknown"
@@ -6082,8 +5773,6 @@ def render_winner_analysis():
                                     for rubric_key in ['tema', 'lirik', 'musik', 'kreativ', 'jemaat']:
                                         score = rubric_scores.get(rubric_key, 0)
                                         row.append(f"{score}/5" if score > 0 else "-")
-                                        if score > 0:
-                                            rubric_totals[rubric_key].append(score)
 
                                     # Total score
                                     total_score = eval_row['total_score']
@@ -6105,9 +5794,14 @@ def render_winner_analysis():
                                 good_areas = []
                                 weaknesses = []
 
-                                for rubric_key, scores in rubric_totals.items():
-                                    if scores:
-                                        avg_score = sum(scores) / len(scores)
+                                rubric_summary = evaluation_scorer.rubric_score_summary(
+                                    rubric_score_table[rubric_score_table['song_id'] == winner['song_id']]
+                                )
+
+                                for _, rubric_stat in rubric_summary.iterrows():
+                                    rubric_key = rubric_stat['rubric_key']
+                                    if rubric_key in ('tema', 'lirik', 'musik', 'kreativ', 'jemaat'):
+                                        avg_score = rubric_stat['avg_score']
 
                                         # Get rubric name
                                         rubric_name = rubric_key.title()
@@ -6195,20 +5889,21 @@ def render_winner_analysis():
     except Exception as e:
         st.error(f"❌ Error in winner analysis: {e}")
 
-def render_global_analytics_tab():
+def render_global_analytics_tab(snapshot=None):
     """Render global analytics tab with GLOBAL data (all judges)"""
     st.markdown("### 🌐 Analitik Global")
     st.info("📈 Analitik ini menampilkan data dari SEMUA juri, bukan hanya juri aktif")
+    snapshot = snapshot or ContestSnapshot()
 
     # Get configuration
-    config = cache_service.get_cached_config()
+    config = snapshot.config
     show_author = config.get('SHOW_AUTHOR', 'True').lower() == 'true'
 
-    # Get global analytics
-    leaderboard_df = analytics_service.get_global_leaderboard()
-    judge_analytics_df = analytics_service.get_judge_analytics()
-    rubric_analytics_df = analytics_service.get_rubric_analytics()
-    insights = analytics_service.generate_insights()
+    # Global analytics, derived once per rerun and shared with the other tabs
+    leaderboard_df = snapshot.leaderboard
+    judge_analytics_df = snapshot.judge_analytics
+    rubric_analytics_df = snapshot.rubric_analytics
+    insights = snapshot.insights
 
     # Get winners count from config
     winners_count = int(config.get('WINNERS_TOP_N', 3))
@@ -6271,7 +5966,7 @@ def render_global_analytics_tab():
     
     # Score distribution
     st.subheader("📈 Distribusi Skor")
-    dist_chart = analytics_service.create_score_distribution_chart()
+    dist_chart = analytics_service.create_score_distribution_chart(snapshot.evaluations)
     st.plotly_chart(dist_chart, width='stretch')
     
     # Insights
@@ -6302,7 +5997,7 @@ def render_global_analytics_tab():
     st.subheader("🏆 Download Sertifikat")
 
     # Check certificate mode from configuration
-    config = cache_service.get_cached_config()
+    config = snapshot.config
     certificate_mode = config.get('CERTIFICATE_MODE', 'GENERATE').upper()
 
     if certificate_mode == 'STORAGE':
@@ -6315,8 +6010,7 @@ def render_global_analytics_tab():
 
         # Since we can't list files with anon key, we'll use known filenames from songs data
         try:
-            from services.database_service import db_service
-            songs_df = db_service.get_songs()
+            songs_df = snapshot.songs
 
             if not songs_df.empty:
                 st.success(f"📁 Menggunakan sertifikat pre-generated dari storage")
@@ -6334,60 +6028,51 @@ def render_global_analytics_tab():
                 if st.button("🏆 Download Semua Sertifikat (ZIP)", key="download_all_storage"):
                     with st.spinner("📦 Membuat ZIP dari storage..."):
                         try:
-                            import zipfile
-                            import io
-                            import urllib.parse
-                            import requests
-
-                            # Create ZIP file in memory
-                            zip_buffer = io.BytesIO()
-
-                            with zipfile.ZipFile(zip_buffer, 'w', compression=zipfile.ZIP_DEFLATED) as zip_file:
-                                success_count = 0
+                            files = []
+                            for _, song in songs_df.iterrows():
+                                composer = song.get('composer', 'Unknown')
+                                title = song.get('title', 'Unknown')
+                                certificate_path = song.get('certificate_path')
 
-                                for _, song in songs_df.iterrows():
-                                    composer = song.get('composer', 'Unknown')
-                                    title = song.get('title', 'Unknown')
-                                    certificate_path = song.get('certificate_path')
+                                if not certificate_path:
+                                    st.warning(f"⚠️ Sertifikat tidak tersedia untuk: {composer} - {title}")
+                                    continue
 
-                                    if not certificate_path:
-                                        st.warning(f"⚠️ Sertifikat tidak tersedia untuk: {composer} - {title}")
-                                        continue
+                                files.append((f"{folder_name}/{certificate_path}", certificate_path))
 
-                                    filename = certificate_path
+                            progress_bar = st.progress(0.0)
+                            progress_text = st.empty()
 
-                                    try:
-                                        # Construct direct public URL
-                                        supabase_project_url = st.secrets["supabase_url"]
-                                        encoded_path = urllib.parse.quote(f"{folder_name}/{filename}")
-                                        direct_url = f"{supabase_project_url}/storage/v1/object/public/{bucket_name}/{encoded_path}"
+                            def show_progress(done, total, result):
+                                progress_bar.progress(done / total)
+                                progress_text.caption(f"📄 {done}/{total}: {result['name']}")
 
-                                        # Download PDF using direct URL
-                                        response = requests.get(direct_url, timeout=10)
-
-                                        if response.status_code == 200:
-                                            # Add to ZIP
-                                            zip_file.writestr(filename, response.content)
-                                            success_count += 1
-                                        else:
-                                            st.warning(f"⚠️ File tidak ditemukan: {filename}")
-
-                                    except Exception as file_error:
-                                        st.warning(f"⚠️ Gagal download {filename}: {file_error}")
+                            # Concurrent downloads (reusing unchanged cached files), ZIP in a temp file
+                            zip_archive, results = file_service.bundle_public_files(
+                                files, bucket=bucket_name, on_progress=show_progress
+                            )
+                            progress_text.empty()
 
-                            zip_buffer.seek(0)
+                            for result in results:
+                                if result['error'] == 'not found':
+                                    st.warning(f"⚠️ File tidak ditemukan: {result['name']}")
+                                elif not result['ok']:
+                                    st.warning(f"⚠️ Gagal download {result['name']}: {result['error']}")
+                            success_count = sum(1 for result in results if result['ok'])
 
                             if success_count > 0:
                                 # Provide download button
                                 timestamp = pd.Timestamp.now().strftime('%Y%m%d_%H%M')
-                                st.download_button(
-                                    f"📥 Download ZIP Sertifikat ({success_count} files)",
-                                    data=zip_buffer.getvalue(),
-                                    file_name=f"certificates_storage_{timestamp}.zip",
-                                    mime="application/zip"
-                                )
+                                with zip_archive:
+                                    st.download_button(
+                                        f"📥 Download ZIP Sertifikat ({success_count} files)",
+                                        data=zip_archive,
+                                        file_name=f"certificates_storage_{timestamp}.zip",
+                                        mime="application/zip"
+                                    )
                                 st.success(f"✅ Berhasil mengunduh {success_count} sertifikat")
                             else:
+                                zip_archive.close()
                                 st.error("❌ Tidak ada sertifikat yang berhasil diunduh")
 
                         except Exception as zip_error:
@@ -6407,22 +6092,32 @@ FOR SELECT USING (bucket_id = 'song-contest-files' AND (storage.foldername(name)
             """)
 
             st.info("🔄 Fallback ke generate otomatis...")
-            cert_data = export_service.generate_all_certificates()
-            st.download_button(
-                "🏆 Download Semua Sertifikat (Generated)",
-                data=cert_data,
+            render_job_download(
+                "🏆 Generate Sertifikat", "certificates",
+                lambda: export_service.generate_all_certificates_file(),
                 file_name=f"certificates_{pd.Timestamp.now().strftime('%Y%m%d_%H%M')}.zip",
-                mime="application/zip"
+                mime="application/zip", key="generated_certificates",
+                download_label="🏆 Download Semua Sertifikat (Generated)", auto_start=True,
+                result_file=True
             )
     else:
-        # Generate certificates on-the-fly (original behavior)
-        cert_data = export_service.generate_all_certificates()
-        st.download_button(
-            "🏆 Download Semua Sertifikat",
-            data=cert_data,
+        # Generate certificates on-the-fly (original behavior), in the background
+        render_job_download(
+            "🏆 Generate Sertifikat", "certificates",
+            lambda: export_service.generate_all_certificates_file(),
             file_name=f"certificates_{pd.Timestamp.now().strftime('%Y%m%d_%H%M')}.zip",
-            mime="application/zip"
+            mime="application/zip", key="generated_certificates",
+            download_label="🏆 Download Semua Sertifikat", auto_start=True, result_file=True
         )
+        if MERGED_CERTIFICATES_AVAILABLE:
+            # One PDF for printing: pages share the background, so it is far smaller than the ZIP
+            render_job_download(
+                "📄 Semua Sertifikat dalam Satu PDF", "certificates_merged",
+                lambda: export_service.generate_merged_certificates_file(),
+                file_name=f"certificates_{pd.Timestamp.now().strftime('%Y%m%d_%H%M')}.pdf",
+                mime="application/pdf", key="merged_certificates",
+                download_label="📥 Download PDF Sertifikat", result_file=True
+            )
 
 # ==================== AUTHENTICATION CALLBACKS ====================
 
@@ -6993,8 +6688,8 @@ def render_winners_section():
         config = cache_service.get_cached_config()
         winners_count = int(config.get('WINNERS_TOP_N', 1))  # Default to 1 now
 
-        # Get songs data for audio and lyrics
-        songs_df = db_service.get_songs()
+        # Get songs data for audio and video links (lyrics are fetched per winner below)
+        songs_df = db_service.get_song_list()
 
         # Filter leaderboard to only include songs with lyric_video_url
         if not songs_df.empty:
@@ -7091,7 +6786,7 @@ def render_winners_section():
                 for version in versions:
                     matching_songs = songs_df[songs_df['title'] == version['title']]
                     if not matching_songs.empty:
-                        all_song_data.append(matching_songs.iloc[0])
+                        all_song_data.append(db_service.with_song_texts(matching_songs.iloc[0]))
 
             # Show YouTube video first if available
             if all_song_data:
@@ -7757,11 +7452,10 @@ def render_all_songs_section(view_mode="📋 Semua Lagu"):
             st.markdown(f"<div style='text-align: center;'><h3>🎵 {expander_title}</h3></div>", unsafe_allow_html=True)
             st.markdown(f"<div style='text-align: center; font-style: italic; margin-bottom: 1rem;'>{subtitle}</div>", unsafe_allow_html=True)
 
-            # Prepare songs data for playlist
+            # Prepare songs data for playlist (lyrics are fetched for the current track only)
             playlist_songs = []
+            songs_df = db_service.get_song_list()
             for _, song_row in filtered_df.iterrows():
-                # Get full song data
-                songs_df = db_service.get_songs()
                 matching_songs = songs_df[songs_df['title'] == song_row['title']]
 
                 if not matching_songs.empty:
@@ -7790,6 +7484,7 @@ def render_all_songs_section(view_mode="📋 Semua Lagu"):
                 current_track_idx = st.session_state.get("all_songs_playlist_current_track", 0)
                 if current_track_idx < len(playlist_songs):
                     current_song = playlist_songs[current_track_idx]
+                    current_song['song_data'] = db_service.with_song_texts(current_song['song_data'])
 
                     st.markdown("---")
                     st.markdown(f"### 📋 **Content for: {current_song['title']}**")
@@ -8076,11 +7771,11 @@ def render_all_songs_section(view_mode="📋 Semua Lagu"):
                     #     st.success("🏆 Selamat! Anda memilih lagu pemenang!")
 
                 # Get song data from songs table (same as Winners section)
-                songs_df = db_service.get_songs()
+                songs_df = db_service.get_song_list()
                 matching_songs = songs_df[songs_df['title'] == selected_song['title']]
 
                 if not matching_songs.empty:
-                    song_data = matching_songs.iloc[0]
+                    song_data = db_service.with_song_texts(matching_songs.iloc[0])
                 else:
                     # Fallback to constructed data
                     song_data = get_available_content({
@@ -8108,7 +7803,7 @@ def render_all_songs_section(view_mode="📋 Semua Lagu"):
                     config = db_service.get_config()
                     enable_play_count = config.get('ENABLE_PLAY_COUNT', 'FALSE').upper() == 'TRUE'
                     if enable_play_count:
-                        play_count = song_data.get('play_count', 0)
+                        play_count = play_count_service.display_count(song_data.get('id'), song_data.get('play_count', 0))
                         st.markdown(f"**▶️ Diputar:** {play_count}x")
                 except Exception:
                     pass  # Silently fail if config not available
@@ -8561,7 +8256,7 @@ def render_landing_page():
     with col2:
         # Get winner song with lyric video from database
         try:
-            songs_df = db_service.get_songs()
+            songs_df = db_service.get_song_list()
 
             if not songs_df.empty:
                 # Check if lyric_video_url column exists
@@ -8882,7 +8577,7 @@ def render_certificate_section():
                     participant_mapping = {}
 
                 # Get songs data to show participant's works
-                songs_df = db_service.get_songs()
+                songs_df = db_service.get_song_list()
 
                 # Create participant options with their songs
                 participant_options = []
@@ -8989,7 +8684,7 @@ def render_certificate_section():
 
         else:
             # SONG MODE: Use songs from database (original behavior)
-            songs_df = db_service.get_songs()
+            songs_df = db_service.get_song_list()
 
             if not songs_df.empty:
                 # Create list of "Composer - Title" options
@@ -9333,6 +9028,9 @@ def render_main_app(current_user):
             if st.button("⚙️ Setup Missing Config", help="Add missing configuration keys"):
                 setup_missing_config()
 
+    # One read-only view of the contest data shared by every tab of this rerun
+    snapshot = ContestSnapshot()
+
     # Main navigation with session state support (removed Analisis Lagu tab)
     tab_names = ["📝 Penilaian", "📋 History Penilaian", "📊 Hasil & Analitik"]
 
@@ -9351,13 +9049,14 @@ def render_main_app(current_user):
     tab1, tab2, tab3 = st.tabs(tab_names)
 
     with tab1:
-        render_evaluation_tab(current_user)
+        render_evaluation_tab(current_user, snapshot)
 
     with tab2:
-        render_evaluation_history_tab(current_user)
+        render_evaluation_history_tab(current_user, snapshot)
 
     with tab3:
-        render_analytics_tab()
+        render_analytics_tab(snapshot)
 
 if __name__ == "__main__":
-    main()
+    with startup_timer.rerun():
+        main()
@@ -7,8 +7,10 @@ import streamlit as st
 import pandas as pd
 from services.auth_service import auth_service
 from services.cache_service import cache_service
-import plotly.express as px
-import plotly.graph_objects as go
+from services.contest_snapshot import ContestSnapshot
+from services.job_service import job_runner, QUEUED, RUNNING, DONE, FAILED
+from services.table_schema import table_normalizer
+from components.job_download import render_job_download
 from datetime import datetime, timedelta
 
 def render_admin_panel(admin_user):
@@ -135,13 +137,11 @@ def render_admin_dashboard(admin_user):
         "⚙️ Configuration Management"
     ])
 
-    # Get data for all tabs
-    judges_df = cache_service.get_cached_judges()
-    songs_df = cache_service.get_cached_songs()
-    evaluations_df = cache_service.get_cached_evaluations()
+    # One read-only view of the contest data for all tabs
+    snapshot = ContestSnapshot()
 
     with tab1:
-        render_dashboard_overview_tab(judges_df, songs_df, evaluations_df, admin_user)
+        render_dashboard_overview_tab(snapshot.judges, snapshot.songs, snapshot.evaluations, admin_user)
 
     with tab2:
         render_judge_management_tab()
@@ -207,7 +207,7 @@ def render_dashboard_overview_tab(judges_df, songs_df, evaluations_df, admin_use
     # Admin actions
     st.markdown("### 🔧 Admin Actions")
 
-    col1, col2, col3 = st.columns(3)
+    col1, col2, col3, col4 = st.columns(4)
 
     with col1:
         if st.button("🔄 Clear Cache", key="clear_cache", help="Clear all cached data"):
@@ -216,15 +216,70 @@ def render_dashboard_overview_tab(judges_df, songs_df, evaluations_df, admin_use
             st.rerun()
 
     with col2:
-        if st.button("📊 Export Data", key="export_data", help="Export all evaluation data"):
-            export_all_data()
+        render_job_download(
+            "📊 Export Data", "evaluations_csv", build_evaluations_csv,
+            file_name=f"lomba_evaluations_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+            mime="text/csv", key="export_data", download_label="📥 Download CSV",
+            button_kwargs={'help': "Export all evaluation data"}
+        )
 
     with col3:
+        render_precompute_analysis()
+
+    with col4:
         if st.button("🚪 Logout", key="admin_logout", help="Logout from admin account"):
             auth_service.logout()
 
+    # Reports and exports running in (or finished by) the background job runner
+    with st.expander("⏳ Background Jobs", expanded=False):
+        jobs = job_runner.jobs()
+        if jobs:
+            st.dataframe(pd.DataFrame(jobs), hide_index=True)
+        else:
+            st.caption("No report or export jobs yet")
+
+    # Size of the cached table frames as fetched and after dtype normalization
+    with st.expander("🧮 Cache Memory", expanded=False):
+        report = table_normalizer.memory_report()
+        if report:
+            report_df = pd.DataFrame(report).drop(columns=['measured_at'])
+            st.dataframe(report_df, hide_index=True)
+            fetched, compact = report_df['fetched_bytes'].sum(), report_df['compact_bytes'].sum()
+            st.caption(f"{fetched / 1024:,.0f} KB as fetched → {compact / 1024:,.0f} KB cached")
+        else:
+            st.caption("No tables fetched yet")
+
 
 
+def render_precompute_analysis():
+    """Analyze changed songs in the background job runner and show the outcome"""
+    state_key = "job_id_precompute_analysis"
+
+    if st.button("🧠 Precompute AI", key="precompute_analysis",
+                 help="Analyze all songs whose lyrics or chords changed and store the AI suggestions"):
+        from services.song_analysis_service import song_analysis_service
+        # Writes the song_analysis table, so the summary is not served from the cache
+        st.session_state[state_key] = job_runner.submit(
+            "precompute_analysis", song_analysis_service.precompute_all, cache=False
+        )
+
+    job = job_runner.get(st.session_state.get(state_key))
+    if job is None:
+        return
+
+    if job.status == DONE:
+        summary = job_runner.result(job)
+        if summary['failed'] or not summary['stored']:
+            st.warning(f"⚠️ {summary['computed']} analyzed, {summary['failed']} failed"
+                       f"{'' if summary['stored'] else ', could not save to song_analysis table'}")
+        else:
+            st.success(f"✅ {summary['computed']} analyzed, {summary['unchanged']} unchanged")
+    elif job.status in (QUEUED, RUNNING):
+        st.info(f"⏳ Analyzing songs... ({job.elapsed_seconds:.0f}s)")
+        st.button("🔄 Cek Status", key="refresh_precompute_analysis")
+    elif job.status == FAILED:
+        st.error(f"❌ Error: {job.error}")
+
 def render_judge_management_tab():
     """Render judge management tab"""
     st.markdown("### 👨‍⚖️ Judge Management")
@@ -247,6 +302,7 @@ def calculate_completion_rate(judges_df, songs_df, evaluations_df):
 
 def render_evaluation_progress_chart(judges_df, songs_df, evaluations_df):
     """Render evaluation progress chart"""
+    import plotly.express as px  # loaded on first chart render
     st.markdown("**📊 Evaluation Progress by Judge**")
     
     if not evaluations_df.empty and not judges_df.empty:
@@ -274,6 +330,7 @@ def render_evaluation_progress_chart(judges_df, songs_df, evaluations_df):
 
 def render_judge_activity_chart(judges_df, evaluations_df):
     """Render judge activity chart"""
+    import plotly.express as px  # loaded on first chart render
     st.markdown("**👨‍⚖️ Judge Activity**")
     
     if not evaluations_df.empty and not judges_df.empty:
@@ -324,7 +381,7 @@ def render_judge_management():
                     st.error(f"❌ Email {new_email} already exists for judge: {existing_judge.iloc[0]['name']}")
                 elif auth_service.add_authorized_judge(new_name, new_email, new_role):
                     st.success(f"✅ Judge {new_name} added!")
-                    cache_service.invalidate_cache()  # Clear cache
+                    cache_service.invalidate_tables('judges')
                     st.rerun()
                 else:
                     st.error("❌ Failed to add judge")
@@ -428,7 +485,7 @@ def render_judge_management():
                             if success:
                                 st.success("✅ Updated!")
                                 del st.session_state[f"editing_{judge['id']}"]
-                                cache_service.invalidate_cache()  # Clear cache
+                                cache_service.invalidate_tables('judges')
                                 st.rerun()
                             else:
                                 st.error("❌ Failed to update")
@@ -438,7 +495,7 @@ def render_judge_management():
                             if auth_service.delete_judge(judge['id']):
                                 st.success("✅ Deleted!")
                                 del st.session_state[f"editing_{judge['id']}"]
-                                cache_service.invalidate_cache()  # Clear cache
+                                cache_service.invalidate_tables('judges')
                                 st.rerun()
                             else:
                                 st.error("❌ Failed to delete")
@@ -1191,41 +1248,30 @@ def render_configuration_cleanup_tab(config_df):
                         st.write(f"❌ Failed to add: {key}")
 
                 if added_count > 0:
-                    cache_service.invalidate_cache()
+                    cache_service.invalidate_tables('configuration')
                     st.success(f"Added {added_count} missing configurations!")
                     st.rerun()
         else:
             st.success("✅ All expected configurations exist")
 
-def export_all_data():
-    """Export all evaluation data"""
-    try:
-        # Get all data
-        evaluations_df = cache_service.get_cached_evaluations()
-        judges_df = cache_service.get_cached_judges()
-        songs_df = cache_service.get_cached_songs()
-
-        if not evaluations_df.empty:
-            # Create comprehensive export
-            export_data = evaluations_df.merge(
-                judges_df[['id', 'name']].rename(columns={'name': 'judge_name'}),
-                left_on='judge_id', right_on='id', how='left'
-            ).merge(
-                songs_df[['id', 'title']].rename(columns={'title': 'song_title'}),
-                left_on='song_id', right_on='id', how='left'
-            )
-
-            # Convert to CSV
-            csv = export_data.to_csv(index=False)
-
-            st.download_button(
-                label="📥 Download CSV",
-                data=csv,
-                file_name=f"lomba_evaluations_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                mime="text/csv"
-            )
-            st.success("Export ready for download!")
-        else:
-            st.warning("No data to export")
-    except Exception as e:
-        st.error(f"Export failed: {e}")
+def build_evaluations_csv() -> bytes:
+    """All evaluations joined with judge names and song titles, as CSV (runs as a background job)"""
+    # Get all data
+    evaluations_df = cache_service.get_cached_evaluations()
+    judges_df = cache_service.get_cached_judges()
+    songs_df = cache_service.get_cached_song_list()
+
+    if evaluations_df.empty:
+        raise ValueError("No data to export")
+
+    # Create comprehensive export
+    export_data = evaluations_df.merge(
+        judges_df[['id', 'name']].rename(columns={'name': 'judge_name'}),
+        left_on='judge_id', right_on='id', how='left'
+    ).merge(
+        songs_df[['id', 'title']].rename(columns={'title': 'song_title'}),
+        left_on='song_id', right_on='id', how='left'
+    )
+
+    # Convert to CSV
+    return export_data.to_csv(index=False).encode('utf-8')
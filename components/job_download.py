@@ -0,0 +1,109 @@
+"""
+Background Job Downloads
+Buttons that build reports/exports in the job runner and offer the finished file
+"""
+
+import streamlit as st
+from concurrent.futures import wait
+from typing import Any, Callable, Dict, Optional
+
+from services.job_service import job_runner, remove_file, QUEUED, RUNNING, DONE, FAILED
+
+# Wait this long before showing a status, so quick builds appear in the same rerun
+INLINE_WAIT_SECONDS = 2.0
+
+
+def render_job_download(button_label: str, job_kind: str, build: Callable[..., Any],
+                        args: tuple = (), file_name: str = "download",
+                        mime: str = "application/pdf", key: str = "job",
+                        download_label: str = "📥 Download",
+                        button_kwargs: Optional[Dict[str, Any]] = None,
+                        auto_start: bool = False,
+                        result_data: Optional[Callable[[Any], Any]] = None,
+                        result_details: Optional[Callable[[Any], None]] = None,
+                        result_file: bool = False):
+    """
+    Submit ``build(*args)`` to the background job runner on click and show its state
+
+    The job id is kept in session state, so later reruns show progress and,
+    once done, a download button for the result. Identical requests share one
+    build and finished artifacts are served from the cache. When the build
+    returns more than the file, ``result_data`` picks the file content and
+    ``result_details`` renders the rest.
+
+    With ``result_file`` the build returns the path of a temporary file. It
+    is not cached: the download button reads the open file, and the file is
+    removed once downloaded (or when the job record expires).
+    """
+    state_key = f"job_id_{key}"
+
+    if auto_start and state_key not in st.session_state:
+        clicked = True
+    elif auto_start and job_runner.get(st.session_state[state_key]) is not None:
+        clicked = False
+    else:
+        # Not auto-started, or its file was downloaded: build again on request
+        clicked = st.button(button_label, key=key, **(button_kwargs or {}))
+    if clicked:
+        if result_file:
+            job_id = job_runner.submit(job_kind, build, *args, cache=False, cleanup=remove_file)
+        else:
+            job_id = job_runner.submit(job_kind, build, *args)
+        st.session_state[state_key] = job_id
+        job = job_runner.get(job_id)
+        if job is not None and job.future is not None and not job.finished:
+            wait([job.future], timeout=INLINE_WAIT_SECONDS)
+
+    job = job_runner.get(st.session_state.get(state_key))
+    if job is None:
+        return
+
+    if job.status == DONE:
+        result = job_runner.result(job)
+        if result is None:
+            # The data changed (or the cache was trimmed) since the build
+            st.session_state.pop(state_key, None)
+            st.info("🔄 Data sudah berubah, silakan buat ulang")
+            return
+        if result_file:
+            try:
+                with open(result, 'rb') as f:
+                    st.download_button(download_label, data=f, file_name=file_name,
+                                       mime=mime, key=f"dl_{key}",
+                                       on_click=_downloaded, args=(job.id, state_key))
+            except FileNotFoundError:
+                # Already downloaded from another session
+                st.session_state.pop(state_key, None)
+                st.info("🔄 File sudah diunduh, silakan buat ulang")
+                return
+        else:
+            data = result_data(result) if result_data else result
+            st.download_button(download_label, data=data, file_name=file_name,
+                               mime=mime, key=f"dl_{key}")
+        if job.cached:
+            st.caption("⚡ Dari cache (data belum berubah)")
+        else:
+            st.caption(f"✅ Selesai dalam {job.elapsed_seconds:.1f} detik")
+        if result_details:
+            result_details(result)
+    elif job.status in (QUEUED, RUNNING):
+        status_text = "menunggu antrian" if job.status == QUEUED else "sedang diproses"
+        st.info(f"⏳ {status_text.capitalize()}... ({job.elapsed_seconds:.0f} detik)")
+        col1, col2 = st.columns(2)
+        with col1:
+            st.button("🔄 Cek Status", key=f"refresh_{key}")
+        with col2:
+            if st.button("✖️ Batalkan", key=f"cancel_{key}"):
+                job_runner.cancel(job.id)
+                st.session_state.pop(state_key, None)
+                st.rerun()
+    elif job.status == FAILED:
+        st.error(f"❌ Error: {job.error}")
+    else:
+        st.warning("⚠️ Dibatalkan")
+
+
+def _downloaded(job_id: str, state_key: str):
+    """Remove a downloaded file result; the session remembers it so an auto-start does not rebuild it"""
+    job_runner.discard(job_id)
+    st.session_state[state_key] = None
@@ -7,12 +7,13 @@ Provides global analytics across all judges and comprehensive insights
 import streamlit as st
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional, Any, Tuple
-import plotly.express as px
-import plotly.graph_objects as go
+from typing import Dict, List, Optional, Any, Tuple, TYPE_CHECKING
 from datetime import datetime, timedelta
 import logging
 
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -28,37 +29,30 @@ class AnalyticsService:
     
     def get_global_leaderboard(self) -> pd.DataFrame:
         """Get global leaderboard across ALL judges (not just active judge)"""
-        try:
-            from services.database_service import db_service
+        from services.database_service import db_service
 
-            # Get all evaluations regardless of judge
-            evaluations_df = db_service.get_evaluations()
+        # Per-song aggregates across ALL judges, computed server-side
+        return self.build_global_leaderboard(db_service.get_leaderboard(), db_service.get_song_list())
 
-            if evaluations_df.empty:
+    def build_global_leaderboard(self, leaderboard: pd.DataFrame, songs_df: pd.DataFrame) -> pd.DataFrame:
+        """Global leaderboard (scale 100, ranked) from per-song aggregates and songs"""
+        try:
+            if leaderboard.empty:
                 return pd.DataFrame()
 
-            # Calculate comprehensive statistics
-            leaderboard = evaluations_df.groupby(['song_id']).agg({
-                'total_score': ['mean', 'std', 'count', 'min', 'max'],
-                'judge_id': 'nunique'
-            }).round(2)
-
-            # Flatten column names
-            leaderboard.columns = ['avg_score', 'score_std', 'total_evaluations',
-                                 'min_score', 'max_score', 'unique_judges']
-            leaderboard = leaderboard.reset_index()
+            leaderboard = leaderboard.drop(columns=['title', 'composer']).round(2)
 
             # Convert scores from scale 5 to scale 100 (multiply by 4 since max is 25 -> 100)
             score_columns = ['avg_score', 'score_std', 'min_score', 'max_score']
             for col in score_columns:
                 leaderboard[col] = leaderboard[col] * 4  # Convert 25-point scale to 100-point scale
 
-            # Add song details with all fields needed
-            songs_df = db_service.get_songs()
+            # Add song details with all fields needed (text columns only when songs_df has them)
+            song_columns = [c for c in ('id', 'title', 'composer', 'audio_file_path', 'lyrics_text',
+                                        'full_score', 'chords_list', 'lyrics_with_chords', 'key_signature',
+                                        'notation_file_path', 'lyrics_file_path') if c in songs_df]
             leaderboard = leaderboard.merge(
-                songs_df[['id', 'title', 'composer', 'audio_file_path', 'lyrics_text',
-                         'full_score', 'chords_list', 'lyrics_with_chords', 'key_signature',
-                         'notation_file_path', 'lyrics_file_path']],
+                songs_df[song_columns],
                 left_on='song_id',
                 right_on='id',
                 how='left'
@@ -82,11 +76,13 @@ class AnalyticsService:
     
     def get_judge_analytics(self) -> pd.DataFrame:
         """Get analytics for all judges"""
-        try:
-            from services.database_service import db_service
+        from services.database_service import db_service
 
-            evaluations_df = db_service.get_evaluations()
+        return self.build_judge_analytics(db_service.get_evaluations(), db_service.get_judges())
 
+    def build_judge_analytics(self, evaluations_df: pd.DataFrame, judges_df: pd.DataFrame) -> pd.DataFrame:
+        """Per-judge scoring statistics (scale 100) from evaluations and judges"""
+        try:
             if evaluations_df.empty:
                 return pd.DataFrame()
 
@@ -107,7 +103,6 @@ class AnalyticsService:
                 judge_stats[col] = judge_stats[col] * 4  # Convert 25-point scale to 100-point scale
 
             # Add judge details
-            judges_df = db_service.get_judges()
             judge_stats = judge_stats.merge(
                 judges_df[['id', 'name']],
                 left_on='judge_id',
@@ -132,47 +127,26 @@ class AnalyticsService:
     
     def get_rubric_analytics(self) -> pd.DataFrame:
         """Get analytics for each rubric criterion"""
+        from services.database_service import db_service
+        from services.evaluation_scorer import evaluation_scorer
+
+        evaluations_df = db_service.get_evaluations()
+        # Shared long (song, judge, rubric, score) table for this snapshot
+        rubric_table = evaluation_scorer.rubric_score_table(evaluations_df)
+        return self.build_rubric_analytics(rubric_table, db_service.get_rubrics())
+
+    def build_rubric_analytics(self, rubric_table: pd.DataFrame, rubrics_df: pd.DataFrame) -> pd.DataFrame:
+        """Per-rubric statistics and weighted contribution from the long rubric-score table"""
         try:
-            from services.database_service import db_service
-            
-            evaluations_df = db_service.get_evaluations()
-            rubrics_df = db_service.get_rubrics()
-            
-            if evaluations_df.empty or rubrics_df.empty:
-                return pd.DataFrame()
-            
-            rubric_stats = []
-            
-            for _, evaluation in evaluations_df.iterrows():
-                if evaluation['rubric_scores']:
-                    import json
-                    # Handle both dict and string formats
-                    scores = evaluation['rubric_scores']
-                    if isinstance(scores, str):
-                        scores = json.loads(scores)
-                    elif not isinstance(scores, dict):
-                        continue  # Skip invalid data
-                    
-                    for rubric_key, score in scores.items():
-                        rubric_stats.append({
-                            'rubric_key': rubric_key,
-                            'score': score,
-                            'song_id': evaluation['song_id'],
-                            'judge_id': evaluation['judge_id']
-                        })
-            
-            if not rubric_stats:
+            from services.evaluation_scorer import evaluation_scorer
+
+            if rubric_table.empty or rubrics_df.empty:
                 return pd.DataFrame()
             
-            rubric_df = pd.DataFrame(rubric_stats)
-            
             # Calculate statistics per rubric
-            analytics = rubric_df.groupby('rubric_key').agg({
-                'score': ['mean', 'std', 'count', 'min', 'max']
-            }).round(2)
-            
-            analytics.columns = ['avg_score', 'score_std', 'total_scores', 'min_score', 'max_score']
-            analytics = analytics.reset_index()
+            analytics = evaluation_scorer.rubric_score_summary(
+                rubric_table, positive_only=False
+            ).round(2)
             
             # Add rubric details
             analytics = analytics.merge(
@@ -191,10 +165,90 @@ class AnalyticsService:
             logger.error(f"Error generating rubric analytics: {e}")
             return pd.DataFrame()
     
+    # ==================== JUDGE PROGRESS ====================
+
+    def get_judge_progress(self, judge_id: int) -> pd.DataFrame:
+        """
+        Completion table for one judge: one row per active song (ordered by id)
+
+        Columns: song_id, title, composer, evaluation_id, completed_rubrics,
+        total_rubrics, completion_percentage, total_score, status
+        ('complete' / 'partial' / 'not_started'). Uses a single evaluations
+        query for the judge regardless of the number of songs.
+        """
+        from services.database_service import db_service
+
+        return self.build_judge_progress(db_service.get_song_list(), db_service.get_rubrics(),
+                                         db_service.get_evaluations(judge_id=judge_id))
+
+    def build_judge_progress(self, songs_df: pd.DataFrame, rubrics_df: pd.DataFrame,
+                             evaluations_df: pd.DataFrame) -> pd.DataFrame:
+        """Completion table (see get_judge_progress) from one judge's evaluations"""
+        try:
+            from services.evaluation_scorer import evaluation_scorer
+
+            if songs_df.empty:
+                return pd.DataFrame()
+
+            total_rubrics = len(rubrics_df)
+            song_columns = [c for c in ('id', 'title', 'composer', 'author') if c in songs_df]
+            progress = songs_df[song_columns].rename(columns={'id': 'song_id'})
+            progress['song_id'] = pd.to_numeric(progress['song_id'], errors='coerce')
+            progress = progress.sort_values('song_id').reset_index(drop=True)
+
+            if not evaluations_df.empty:
+                # Count positive scores on active rubrics per song
+                rubric_table = evaluation_scorer.rubric_score_table(evaluations_df)
+                scored = rubric_table[
+                    (rubric_table['score'] > 0)
+                    & rubric_table['rubric_key'].astype(str).isin(rubrics_df.get('rubric_key', pd.Series(dtype=str)))
+                ]
+                completed = scored.groupby('song_id').size().rename('completed_rubrics')
+
+                evaluation_columns = evaluations_df[['song_id', 'id', 'total_score']].rename(
+                    columns={'id': 'evaluation_id'}
+                )
+                evaluation_columns['song_id'] = pd.to_numeric(evaluation_columns['song_id'], errors='coerce')
+                evaluation_columns = evaluation_columns.drop_duplicates('song_id')
+
+                progress = progress.merge(evaluation_columns, on='song_id', how='left')
+                progress = progress.merge(completed, left_on='song_id', right_index=True, how='left')
+            else:
+                progress['evaluation_id'] = pd.NA
+                progress['total_score'] = 0.0
+                progress['completed_rubrics'] = 0
+
+            progress['evaluation_id'] = pd.to_numeric(progress['evaluation_id'], errors='coerce').astype('Int64')
+            progress['completed_rubrics'] = progress['completed_rubrics'].fillna(0).astype(int)
+            progress['total_rubrics'] = total_rubrics
+            progress['total_score'] = pd.to_numeric(progress['total_score'], errors='coerce').fillna(0.0)
+            progress['completion_percentage'] = (
+                progress['completed_rubrics'] / total_rubrics * 100 if total_rubrics else 0.0
+            )
+            progress['status'] = np.select(
+                [
+                    (progress['completed_rubrics'] >= total_rubrics) & (total_rubrics > 0),
+                    progress['completed_rubrics'] > 0
+                ],
+                ['complete', 'partial'],
+                default='not_started'
+            )
+            # Evaluation rows without any score show as not started
+            progress.loc[progress['status'] == 'not_started', 'total_score'] = 0.0
+
+            return progress
+
+        except Exception as e:
+            logger.error(f"Error generating judge progress: {e}")
+            return pd.DataFrame()
+
     # ==================== VISUALIZATION FUNCTIONS ====================
     
-    def create_leaderboard_chart(self, leaderboard_df: pd.DataFrame) -> go.Figure:
+    def create_leaderboard_chart(self, leaderboard_df: pd.DataFrame) -> "go.Figure":
         """Create interactive leaderboard chart"""
+        import plotly.express as px
+        import plotly.graph_objects as go
+
         if leaderboard_df.empty:
             return go.Figure()
         
@@ -223,8 +277,11 @@ class AnalyticsService:
         
         return fig
     
-    def create_judge_comparison_chart(self, judge_stats_df: pd.DataFrame) -> go.Figure:
+    def create_judge_comparison_chart(self, judge_stats_df: pd.DataFrame) -> "go.Figure":
         """Create judge comparison chart"""
+        import plotly.express as px
+        import plotly.graph_objects as go
+
         if judge_stats_df.empty:
             return go.Figure()
         
@@ -253,8 +310,11 @@ class AnalyticsService:
         
         return fig
     
-    def create_rubric_impact_chart(self, rubric_analytics_df: pd.DataFrame) -> go.Figure:
+    def create_rubric_impact_chart(self, rubric_analytics_df: pd.DataFrame) -> "go.Figure":
         """Create rubric impact visualization"""
+        import plotly.express as px
+        import plotly.graph_objects as go
+
         if rubric_analytics_df.empty:
             return go.Figure()
         
@@ -278,12 +338,14 @@ class AnalyticsService:
         
         return fig
     
-    def create_score_distribution_chart(self) -> go.Figure:
+    def create_score_distribution_chart(self, evaluations_df: Optional[pd.DataFrame] = None) -> "go.Figure":
         """Create score distribution chart"""
+        import plotly.express as px
+        import plotly.graph_objects as go
         try:
-            from services.database_service import db_service
-
-            evaluations_df = db_service.get_evaluations()
+            if evaluations_df is None:
+                from services.database_service import db_service
+                evaluations_df = db_service.get_evaluations()
 
             if evaluations_df.empty:
                 return go.Figure()
@@ -330,14 +392,15 @@ class AnalyticsService:
     
     def generate_insights(self) -> Dict[str, Any]:
         """Generate comprehensive insights from all data"""
+        return self.build_insights(self.get_global_leaderboard(), self.get_judge_analytics(),
+                                   self.get_rubric_analytics())
+
+    def build_insights(self, leaderboard: pd.DataFrame, judge_stats: pd.DataFrame,
+                       rubric_analytics: pd.DataFrame) -> Dict[str, Any]:
+        """Competition, judge and rubric insights from already computed analytics"""
         try:
             insights = {}
             
-            # Get data
-            leaderboard = self.get_global_leaderboard()
-            judge_stats = self.get_judge_analytics()
-            rubric_analytics = self.get_rubric_analytics()
-            
             # Competition insights
             if not leaderboard.empty:
                 insights['competition'] = {
@@ -384,16 +447,17 @@ class AnalyticsService:
         if len(leaderboard) < 2:
             return None
         
-        leaderboard['score_diff'] = leaderboard['avg_score'].diff().abs()
-        closest_idx = leaderboard['score_diff'].idxmin()
+        # Kept out of the frame: the leaderboard may be shared by a ContestSnapshot
+        score_diff = leaderboard['avg_score'].diff().abs()
+        closest_idx = score_diff.idxmin()
         
-        if pd.isna(leaderboard.loc[closest_idx, 'score_diff']):
+        if pd.isna(score_diff.loc[closest_idx]):
             return None
         
         return {
             'song1': leaderboard.loc[closest_idx-1, 'title'],
             'song2': leaderboard.loc[closest_idx, 'title'],
-            'difference': leaderboard.loc[closest_idx, 'score_diff']
+            'difference': score_diff.loc[closest_idx]
         }
     
     def _find_most_consistent_song(self, leaderboard: pd.DataFrame) -> Optional[str]:
@@ -5,21 +5,27 @@ Handles Google OAuth, Magic Links, Email/Password, and Admin Impersonation
 
 import streamlit as st
 import pandas as pd
-from supabase import create_client, Client
+from supabase import Client
 from typing import Optional, Dict, Any
 import uuid
 import logging
 from datetime import datetime, timedelta
 
+from services.connection_service import connection_manager
+
 logger = logging.getLogger(__name__)
 
 class AuthService:
     def __init__(self):
-        """Initialize auth service with Supabase client"""
-        self.client: Client = create_client(
-            st.secrets["supabase_url"],
-            st.secrets["supabase_anon_key"]
-        )
+        """Initialize auth service; the Supabase client is created on first use"""
+        self._client: Optional[Client] = None
+
+    @property
+    def client(self) -> Client:
+        """Auth Supabase client from the connection manager, created on first use"""
+        if self._client is None:
+            self._client = connection_manager.auth_client
+        return self._client
     
     # ==================== SESSION MANAGEMENT ====================
     
@@ -0,0 +1,246 @@
+# -*- coding: utf-8 -*-
+"""
+AutoSave Service - Write-behind buffer for rubric scores and notes
+Coalesces rapid radio-button changes per (judge_id, song_id) into one upsert
+"""
+
+import atexit
+import logging
+import threading
+import time
+from typing import Dict, List, Optional, Any, Tuple
+
+from services.evaluation_scorer import evaluation_scorer
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+PendingKey = Tuple[int, int]
+
+
+class AutoSaveService:
+    """
+    Process-wide write-behind queue for evaluation auto-saves
+
+    Changes are buffered per (judge_id, song_id). A background worker flushes a
+    buffer once it has been quiet for ``debounce_seconds`` (or has been pending
+    for ``max_delay_seconds``) as a single upsert. The buffer lives at module
+    level, so it survives Streamlit reruns and is shared by all sessions.
+
+    Only the worker and final submit write; page renders read the buffer
+    through ``pending_changes``. A failed write is retried after an
+    exponential backoff; once it is dropped, the song is reported to the
+    judge through ``take_dropped``.
+    """
+
+    def __init__(self, debounce_seconds: float = 1.5, max_delay_seconds: float = 5.0,
+                 max_retries: int = 3, retry_backoff_seconds: float = 2.0):
+        self.debounce_seconds = debounce_seconds
+        self.max_delay_seconds = max_delay_seconds
+        self.max_retries = max_retries
+        self.retry_backoff_seconds = retry_backoff_seconds
+        self._pending: Dict[PendingKey, Dict[str, Any]] = {}
+        self._dropped: Dict[int, List[int]] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._key_locks: Dict[PendingKey, threading.Lock] = {}
+        self._worker: Optional[threading.Thread] = None
+        self.stats = {
+            'queued': 0,
+            'flushes': 0,
+            'failed_flushes': 0,
+            'dropped': 0
+        }
+
+    # ==================== QUEUEING ====================
+
+    def queue_score(self, judge_id: int, song_id: int, rubric_key: str, score: int):
+        """Buffer a single rubric score change"""
+        self._queue(judge_id, song_id, rubric_scores={rubric_key: score})
+
+    def queue_notes(self, judge_id: int, song_id: int, notes: str):
+        """Buffer a notes change"""
+        self._queue(judge_id, song_id, notes=notes)
+
+    def _queue(self, judge_id: int, song_id: int, rubric_scores: Dict[str, int] = None,
+               notes: str = None):
+        key = (int(judge_id), int(song_id))
+        now = time.time()
+        with self._wakeup:
+            entry = self._pending.setdefault(key, {
+                'rubric_scores': {},
+                'notes': None,
+                'first_queued': now,
+                'retries': 0
+            })
+            if rubric_scores:
+                entry['rubric_scores'].update(rubric_scores)
+            if notes is not None:
+                entry['notes'] = notes
+            entry['last_queued'] = now
+            self.stats['queued'] += 1
+            self._ensure_worker()
+            self._wakeup.notify()
+
+    def pending_changes(self, judge_id: int, song_id: int) -> Dict[str, Any]:
+        """Unflushed changes for a judge/song, to overlay on cached evaluation data"""
+        with self._lock:
+            entry = self._pending.get((int(judge_id), int(song_id)))
+            if entry is None:
+                return {'rubric_scores': {}, 'notes': None}
+            return {'rubric_scores': dict(entry['rubric_scores']), 'notes': entry['notes']}
+
+    def pending_for_judge(self, judge_id: int) -> Dict[int, Dict[str, Any]]:
+        """Unflushed changes of one judge by song_id, to overlay on that judge's evaluations"""
+        with self._lock:
+            return {
+                key[1]: {'rubric_scores': dict(entry['rubric_scores']), 'notes': entry['notes']}
+                for key, entry in self._pending.items() if key[0] == int(judge_id)
+            }
+
+    def has_pending(self, judge_id: int = None) -> bool:
+        """Whether any (or the given judge's) changes are still buffered"""
+        with self._lock:
+            return any(judge_id is None or key[0] == int(judge_id) for key in self._pending)
+
+    def take_dropped(self, judge_id: int) -> List[int]:
+        """Song ids whose auto-saves were given up since the last call, for the judge to redo"""
+        with self._lock:
+            return self._dropped.pop(int(judge_id), [])
+
+    # ==================== FLUSHING ====================
+
+    def flush(self, judge_id: int = None, song_id: int = None) -> bool:
+        """
+        Synchronously write buffered changes (all, one judge's, or one judge/song)
+
+        Waits for an in-flight background write of the same key, so callers such
+        as final submit never race a pending auto-save.
+        """
+        with self._lock:
+            keys = [
+                key for key in self._pending
+                if (judge_id is None or key[0] == int(judge_id))
+                and (song_id is None or key[1] == int(song_id))
+            ]
+            # Include keys currently being written by the worker
+            keys += [
+                key for key in self._key_locks
+                if key not in keys
+                and (judge_id is None or key[0] == int(judge_id))
+                and (song_id is None or key[1] == int(song_id))
+            ]
+
+        return all([self._flush_key(key) for key in keys])
+
+    def _key_lock(self, key: PendingKey) -> threading.Lock:
+        with self._lock:
+            lock = self._key_locks.get(key)
+            if lock is None:
+                lock = self._key_locks[key] = threading.Lock()
+            return lock
+
+    def _flush_key(self, key: PendingKey) -> bool:
+        with self._key_lock(key):
+            with self._lock:
+                entry = self._pending.pop(key, None)
+            if entry is None:
+                return True
+
+            success = self._write(key, entry)
+
+            with self._lock:
+                if success:
+                    self.stats['flushes'] += 1
+                else:
+                    self.stats['failed_flushes'] += 1
+                    if entry['retries'] < self.max_retries:
+                        # Put the changes back underneath anything queued meanwhile
+                        newer = self._pending.get(key)
+                        if newer is not None:
+                            entry['rubric_scores'].update(newer['rubric_scores'])
+                            if newer['notes'] is not None:
+                                entry['notes'] = newer['notes']
+                        # Wait before retrying instead of being due again on the next tick
+                        now = time.time()
+                        entry['first_queued'] = entry['last_queued'] = now
+                        entry['retry_at'] = now + self.retry_backoff_seconds * 2 ** entry['retries']
+                        entry['retries'] += 1
+                        self._pending[key] = entry
+                        self._wakeup.notify()
+                    else:
+                        logger.error(f"Dropping auto-save for judge/song {key} after {entry['retries']} retries")
+                        self.stats['dropped'] += 1
+                        dropped = self._dropped.setdefault(key[0], [])
+                        if key[1] not in dropped:
+                            dropped.append(key[1])
+            return success
+
+    def _write(self, key: PendingKey, entry: Dict[str, Any]) -> bool:
+        """Merge buffered changes with the stored evaluation and upsert once"""
+        from services.database_service import db_service
+
+        judge_id, song_id = key
+        try:
+            existing = db_service.get_evaluations(judge_id=judge_id, song_id=song_id)
+            rubric_scores: Dict[str, Any] = {}
+            notes = ""
+            if not existing.empty:
+                existing_eval = existing.iloc[0]
+                if existing_eval.get('is_final_submitted', False):
+                    logger.warning(f"Skipping auto-save for locked evaluation {key}")
+                    return True
+                rubric_scores = dict(evaluation_scorer.parse_scores(existing_eval.get('rubric_scores')))
+                notes = existing_eval.get('notes') or ""
+
+            rubric_scores.update(entry['rubric_scores'])
+            if entry['notes'] is not None:
+                notes = entry['notes']
+
+            total_score = evaluation_scorer.total_for(rubric_scores, db_service.get_rubrics())
+            return db_service.save_evaluation(
+                judge_id, song_id, rubric_scores, total_score, notes
+            )
+        except Exception as e:
+            logger.error(f"Error flushing auto-save for {key}: {e}")
+            return False
+
+    # ==================== BACKGROUND WORKER ====================
+
+    def _ensure_worker(self):
+        """Start the flush thread on first use (caller holds the lock)"""
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._run, name="autosave-writer", daemon=True)
+            self._worker.start()
+
+    def _due_keys(self, now: float) -> Tuple[list, Optional[float]]:
+        """Keys ready to flush and seconds until the next one is (caller holds the lock)"""
+        due, next_in = [], None
+        for key, entry in self._pending.items():
+            ready_at = min(entry['last_queued'] + self.debounce_seconds,
+                           entry['first_queued'] + self.max_delay_seconds)
+            ready_at = max(ready_at, entry.get('retry_at', 0))
+            if ready_at <= now:
+                due.append(key)
+            else:
+                next_in = ready_at - now if next_in is None else min(next_in, ready_at - now)
+        return due, next_in
+
+    def _run(self):
+        while True:
+            with self._wakeup:
+                due, next_in = self._due_keys(time.time())
+                while not due:
+                    self._wakeup.wait(timeout=next_in)
+                    due, next_in = self._due_keys(time.time())
+
+            for key in due:
+                self._flush_key(key)
+
+
+# Global instance
+autosave_service = AutoSaveService()
+
+# Do not lose buffered scores when the server process stops
+atexit.register(autosave_service.flush)
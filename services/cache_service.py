@@ -6,63 +6,352 @@ Replaces inconsistent caching with unified strategy
 
 import streamlit as st
 import pandas as pd
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable, Iterable, Union
 import hashlib
 import json
 import time
 import logging
+import inspect
+import threading
+from collections import OrderedDict
 from functools import wraps
+from itertools import combinations
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+_MISSING = object()
+
+# Entry lifetime for reads declaring live_ttl while a change feed pushes invalidations
+LIVE_TTL = 24 * 3600
+
+
+def _detach(data: Any) -> Any:
+    """Return a cheap copy so callers adding columns/keys do not mutate the shared entry"""
+    if isinstance(data, pd.DataFrame):
+        return data.copy(deep=False)
+    if isinstance(data, dict):
+        return dict(data)
+    return data
+
+
+def _is_empty(data: Any) -> bool:
+    """Whether a read returned nothing (fetchers return empty frames/dicts on errors)"""
+    if data is None:
+        return True
+    if isinstance(data, pd.DataFrame):
+        return data.empty
+    if isinstance(data, (dict, list, tuple)):
+        return len(data) == 0
+    return False
+
+
+def _estimate_size(data: Any) -> int:
+    """Rough size of a cached value in bytes"""
+    try:
+        if isinstance(data, pd.DataFrame):
+            return int(data.memory_usage(deep=True).sum())
+        if isinstance(data, (bytes, bytearray)):
+            return len(data)
+        return len(str(data))
+    except Exception:
+        return 0
+
+
+class ProcessCache:
+    """
+    Process-wide cache shared by every Streamlit session
+
+    Thread-safe, bounded by entry count (LRU eviction) and with per-entry TTL.
+    Concurrent misses on the same key are serialized through a per-key lock so
+    only one session hits the database while the others wait for its result.
+
+    Every invalidation bumps a generation counter per tag (and a global one
+    for pattern invalidations). A computed value is only stored when the
+    generations of its tags did not move while it was computed, so a read
+    that started before a write never caches what it saw.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        # Set by the change feed while it is subscribed; entries may then use their live_ttl
+        self.push_invalidation = False
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self._tag_index: Dict[str, set] = {}
+        self._generation = 0
+        self._tag_generations: Dict[str, int] = {}
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'invalidations': 0,
+            'evictions': 0,
+            'stale_computes': 0
+        }
+
+    def _key_lock(self, key: str) -> threading.Lock:
+        with self._lock:
+            lock = self._key_locks.get(key)
+            if lock is None:
+                lock = self._key_locks[key] = threading.Lock()
+            return lock
+
+    def _drop(self, key: str):
+        """Remove an entry, its tag references and its compute lock (caller holds the lock)"""
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        # A missing key gets a fresh lock; one without an entry may still be computing
+        self._key_locks.pop(key, None)
+        for tag in entry['tags']:
+            keys = self._tag_index.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tag_index[tag]
+
+    def get(self, key: str, default: Any = _MISSING) -> Any:
+        """Return a fresh entry (marking it recently used) or default"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            if time.time() - entry['timestamp'] >= entry['ttl']:
+                self._drop(key)
+                return default
+            self._entries.move_to_end(key)
+            return entry['data']
+
+    def set(self, key: str, data: Any, ttl: float, tags: Iterable[str] = ()):
+        """Store an entry, evicting least recently used ones above the size bound"""
+        tags = frozenset(tags)
+        with self._lock:
+            self._drop(key)
+            self._entries[key] = {'data': data, 'timestamp': time.time(), 'ttl': ttl, 'tags': tags}
+            for tag in tags:
+                self._tag_index.setdefault(tag, set()).add(key)
+            while len(self._entries) > self.max_entries:
+                evicted_key = next(iter(self._entries))
+                self._drop(evicted_key)
+                self.stats['evictions'] += 1
+
+    def generation(self, tags: Iterable[str] = ()) -> int:
+        """Counter that grows whenever an entry carrying any of the tags is invalidated"""
+        with self._lock:
+            return self._generation + sum(self._tag_generations.get(tag, 0) for tag in tags)
+
+    def _bump(self, tags: Iterable[str] = None):
+        """Record an invalidation of the tags, or of everything when None (caller holds the lock)"""
+        if tags is None:
+            self._generation += 1
+            return
+        for tag in tags:
+            self._tag_generations[tag] = self._tag_generations.get(tag, 0) + 1
+
+    def get_or_compute(self, key: str, ttl: Union[float, Callable[[Any], float]],
+                       compute: Callable[[], Any], tags: Iterable[str] = ()) -> Any:
+        """
+        Return cached value or compute it once, even under concurrent misses
+
+        ``ttl`` may be a callable receiving the computed value. The value is
+        returned but not stored when its tags were invalidated meanwhile.
+        """
+        data = self.get(key)
+        if data is not _MISSING:
+            self.record_hit()
+            return data
+
+        tags = tuple(tags)
+        with self._key_lock(key):
+            # Another session may have filled the entry while we waited
+            data = self.get(key)
+            if data is not _MISSING:
+                self.record_hit()
+                return data
+
+            self.record_miss()
+            started = self.generation(tags)
+            data = compute()
+            self.set_if_current(key, data, ttl, tags, started)
+            return data
+
+    def set_if_current(self, key: str, data: Any, ttl: Union[float, Callable[[Any], float]],
+                       tags: Iterable[str], started: int) -> bool:
+        """
+        Store a value computed since ``generation(tags)`` returned ``started``
+
+        Returns False (storing nothing) when the tags were invalidated meanwhile.
+        """
+        tags = tuple(tags)
+        with self._lock:
+            if self.generation(tags) != started:
+                # A write landed during the read: the value may predate it
+                self.stats['stale_computes'] += 1
+                return False
+            self.set(key, data, ttl(data) if callable(ttl) else ttl, tags)
+            return True
+
+    def invalidate(self, pattern: str = None) -> int:
+        """Drop entries whose key contains pattern (all entries if None)"""
+        with self._lock:
+            if pattern is None:
+                keys_to_remove = list(self._entries.keys())
+            else:
+                keys_to_remove = [k for k in self._entries.keys() if pattern in k]
+            for key in keys_to_remove:
+                self._drop(key)
+            self._bump()
+            self.stats['invalidations'] += len(keys_to_remove)
+            return len(keys_to_remove)
+
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """Drop every entry carrying at least one of the given tags"""
+        with self._lock:
+            keys_to_remove = set()
+            for tag in tags:
+                keys_to_remove |= self._tag_index.get(tag, set())
+            for key in keys_to_remove:
+                self._drop(key)
+            self._bump(tags)
+            self.stats['invalidations'] += len(keys_to_remove)
+            return len(keys_to_remove)
+
+    def patch_tagged(self, tag: str, patch: Callable[[Any], Any]) -> Dict[str, int]:
+        """
+        Replace the data of every entry carrying tag with ``patch(data)``
+
+        Patched entries keep their age and TTL. When ``patch`` returns None
+        the entry is dropped instead.
+        """
+        patched = dropped = 0
+        with self._lock:
+            # Reads in flight saw the data before the patch
+            self._bump([tag])
+            for key in list(self._tag_index.get(tag, ())):
+                data = patch(self._entries[key]['data'])
+                if data is None:
+                    self._drop(key)
+                    dropped += 1
+                else:
+                    self._entries[key]['data'] = data
+                    patched += 1
+            self.stats['invalidations'] += dropped
+        return {'patched': patched, 'dropped': dropped}
+
+    def record_hit(self):
+        with self._lock:
+            self.stats['hits'] += 1
+
+    def record_miss(self):
+        with self._lock:
+            self.stats['misses'] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Entry count, approximate size and hit/miss counters"""
+        with self._lock:
+            entries = list(self._entries.values())
+            stats = dict(self.stats)
+        lookups = stats['hits'] + stats['misses']
+        stats.update({
+            'total_entries': len(entries),
+            'max_entries': self.max_entries,
+            'memory_usage_mb': sum(_estimate_size(e['data']) for e in entries) / (1024 * 1024),
+            'hit_rate': round(stats['hits'] / lookups, 3) if lookups else 0.0
+        })
+        return stats
+
+
+# Shared by all sessions served by this Streamlit process
+process_cache = ProcessCache()
+
+
 class CacheService:
     """Centralized cache service with intelligent invalidation"""
     
     def __init__(self):
         """Initialize cache service"""
-        self.cache_stats = {
-            'hits': 0,
-            'misses': 0,
-            'invalidations': 0
-        }
+        self.backend = process_cache
+
+    @property
+    def cache_stats(self) -> Dict[str, int]:
+        """Hit/miss/invalidation counters of the shared backend"""
+        return self.backend.stats
     
     # ==================== CACHE DECORATORS ====================
     
     @staticmethod
-    def cache_data(ttl: int = 3600, key_prefix: str = None, show_spinner: bool = True):
+    def cache_data(ttl: int = 3600, key_prefix: str = None, show_spinner: bool = True,
+                   scope: str = "process",
+                   tags: Union[Iterable[str], Callable[..., Iterable[str]]] = None,
+                   live_ttl: int = None):
         """
         Enhanced cache decorator with better key generation
         
+        Arguments whose name starts with an underscore (e.g. ``_self``) are
+        left out of the cache key, like with ``st.cache_data``.
+
         Args:
             ttl: Time to live in seconds
             key_prefix: Optional prefix for cache key
             show_spinner: Whether to show loading spinner
+            scope: "process" shares entries across all sessions (default),
+                   "session" keeps them in st.session_state for per-user data
+            tags: Dependency tags of the entry (see ``read_tags``), or a callable
+                  receiving the keyed arguments and returning them
+            live_ttl: Longer time to live used while the change feed is pushing
+                      invalidations for the tagged tables (process scope only).
+                      Empty results (fetchers return them on errors) keep ``ttl``.
         """
+        if scope not in ("process", "session"):
+            raise ValueError(f"Unknown cache scope: {scope}")
+
         def decorator(func):
+            signature = inspect.signature(func)
+
+            def compute(args, kwargs):
+                if show_spinner:
+                    with st.spinner(f"Loading {func.__name__}..."):
+                        return func(*args, **kwargs)
+                return func(*args, **kwargs)
+
             @wraps(func)
             def wrapper(*args, **kwargs):
+                bound = signature.bind(*args, **kwargs)
+                bound.apply_defaults()
+                key_args = {k: v for k, v in bound.arguments.items() if not k.startswith('_')}
+
                 # Generate cache key
-                cache_key = CacheService._generate_cache_key(func, args, kwargs, key_prefix)
-                
-                # Check if cached
+                cache_key = CacheService._generate_cache_key(func, (), key_args, key_prefix)
+                entry_tags = tags(**key_args) if callable(tags) else (tags or ())
+
+                if scope == "process":
+                    def entry_ttl(data):
+                        if live_ttl and process_cache.push_invalidation and not _is_empty(data):
+                            return live_ttl
+                        return ttl
+
+                    result = process_cache.get_or_compute(
+                        cache_key, entry_ttl, lambda: compute(args, kwargs), entry_tags
+                    )
+                    return _detach(result)
+
+                # Session scope: check if cached
                 if cache_key in st.session_state:
                     cached_data = st.session_state[cache_key]
                     if time.time() - cached_data['timestamp'] < ttl:
+                        process_cache.record_hit()
                         return cached_data['data']
-                
-                # Execute function
-                if show_spinner:
-                    with st.spinner(f"Loading {func.__name__}..."):
-                        result = func(*args, **kwargs)
-                else:
-                    result = func(*args, **kwargs)
-                
+
+                process_cache.record_miss()
+                result = compute(args, kwargs)
+
                 # Cache result
                 st.session_state[cache_key] = {
                     'data': result,
-                    'timestamp': time.time()
+                    'timestamp': time.time(),
+                    'tags': frozenset(entry_tags)
                 }
                 
                 return result
@@ -104,24 +393,95 @@ class CacheService:
     
     @staticmethod
     def invalidate_cache(pattern: str = None):
-        """Invalidate cache entries matching pattern"""
+        """Invalidate cache entries matching pattern (shared and session-scoped)"""
+        removed = process_cache.invalidate(pattern)
+
+        try:
+            session_keys = list(st.session_state.keys())
+        except Exception:
+            # No active session (e.g. background thread)
+            session_keys = []
+
         if pattern is None:
             # Clear all cache
-            keys_to_remove = [k for k in st.session_state.keys() if k.startswith('cache_')]
+            keys_to_remove = [k for k in session_keys if k.startswith('cache_')]
         else:
             # Clear specific pattern
-            keys_to_remove = [k for k in st.session_state.keys() if pattern in k]
+            keys_to_remove = [k for k in session_keys if pattern in k]
         
         for key in keys_to_remove:
             del st.session_state[key]
         
-        logger.info(f"Invalidated {len(keys_to_remove)} cache entries")
+        logger.info(f"Invalidated {removed + len(keys_to_remove)} cache entries")
     
+    # ==================== TAGGED INVALIDATION ====================
+    #
+    # Cached reads declare which tables (and which filtered rows) they depend on:
+    #   "<table>"                   - any change to the table invalidates the entry
+    #   "<table>:all"               - unfiltered read of every row
+    #   "<table>:judge_id=3"        - read filtered on the given columns
+    # Writes that know which row they touched invalidate only the scoped tags that
+    # could contain that row; writes of unknown scope invalidate the table tag.
+
+    @staticmethod
+    def scoped_tag(table: str, **filters) -> str:
+        """Tag for a read of table filtered on the given (non-None) columns"""
+        parts = [f"{k}={filters[k]}" for k in sorted(filters) if filters[k] is not None]
+        return f"{table}:{','.join(parts)}" if parts else f"{table}:all"
+
+    @staticmethod
+    def read_tags(table: str, *depends_on: str, **filters) -> List[str]:
+        """Tags for a cached read of table (plus any joined tables it depends on)"""
+        return [table, CacheService.scoped_tag(table, **filters), *depends_on]
+
+    @staticmethod
+    def invalidate_tags(*tags: str) -> int:
+        """Invalidate cached entries carrying any of the tags"""
+        removed = process_cache.invalidate_tags(tags)
+
+        try:
+            session_keys = list(st.session_state.keys())
+        except Exception:
+            session_keys = []
+
+        for key in session_keys:
+            cached = st.session_state[key]
+            if isinstance(cached, dict) and cached.get('tags', frozenset()) & set(tags):
+                del st.session_state[key]
+                removed += 1
+
+        logger.info(f"Invalidated {removed} cache entries for tags {sorted(tags)}")
+        return removed
+
+    @staticmethod
+    def invalidate_tables(*tables: str) -> int:
+        """Invalidate every cached read depending on the given tables"""
+        return CacheService.invalidate_tags(*tables)
+
+    @staticmethod
+    def invalidate_rows(table: str, **filters) -> int:
+        """
+        Invalidate cached reads that may contain the written row
+
+        e.g. invalidate_rows('evaluations', judge_id=3, song_id=7) drops the
+        unfiltered read, the judge 3 read, the song 7 read and the (3, 7) read,
+        but keeps other judges' cached evaluations.
+        """
+        filters = {k: v for k, v in filters.items() if v is not None}
+        if not filters:
+            return CacheService.invalidate_tables(table)
+
+        tags = [
+            CacheService.scoped_tag(table, **{k: filters[k] for k in subset})
+            for size in range(len(filters) + 1)
+            for subset in combinations(sorted(filters), size)
+        ]
+        return CacheService.invalidate_tags(*tags)
+
     @staticmethod
     def invalidate_evaluation_cache():
         """Invalidate evaluation-related cache"""
-        CacheService.invalidate_cache('evaluation')
-        CacheService.invalidate_cache('leaderboard')
+        CacheService.invalidate_tables('evaluations')
         CacheService.invalidate_cache('analytics')
 
     def clear_evaluations_cache(self):
@@ -135,53 +495,64 @@ class CacheService:
         CacheService.invalidate_cache('file')
     
     @staticmethod
-    def get_cache_stats() -> Dict[str, int]:
+    def get_cache_stats() -> Dict[str, Any]:
         """Get cache statistics"""
-        cache_keys = [k for k in st.session_state.keys() if k.startswith('cache_')]
-        return {
-            'total_entries': len(cache_keys),
-            'memory_usage_mb': sum(len(str(st.session_state[k])) for k in cache_keys) / (1024 * 1024)
-        }
+        stats = process_cache.snapshot()
+        try:
+            session_keys = [k for k in st.session_state.keys() if k.startswith('cache_')]
+        except Exception:
+            session_keys = []
+        stats['session_entries'] = len(session_keys)
+        return stats
     
     # ==================== SPECIALIZED CACHE FUNCTIONS ====================
     
+    # The DatabaseService reads are cached (with dependency tags) in the shared
+    # process cache, so these accessors only delegate to them.
+
     @staticmethod
-    @cache_data(ttl=3600, key_prefix="config")
     def get_cached_config():
         """Get cached configuration"""
         from services.database_service import db_service
         return db_service.get_config()
     
     @staticmethod
-    @cache_data(ttl=1800, key_prefix="songs")
     def get_cached_songs():
         """Get cached songs"""
         from services.database_service import db_service
         return db_service.get_songs()
+
+    @staticmethod
+    def get_cached_song_list():
+        """Get cached songs without their large text columns"""
+        from services.database_service import db_service
+        return db_service.get_song_list()
     
     @staticmethod
-    @cache_data(ttl=3600, key_prefix="judges")
     def get_cached_judges():
         """Get cached judges"""
         from services.database_service import db_service
         return db_service.get_judges()
     
     @staticmethod
-    @cache_data(ttl=3600, key_prefix="rubrics")
     def get_cached_rubrics():
         """Get cached rubrics"""
         from services.database_service import db_service
         return db_service.get_rubrics()
+
+    @staticmethod
+    def get_cached_keywords():
+        """Get cached keywords"""
+        from services.database_service import db_service
+        return db_service.get_keywords()
     
     @staticmethod
-    @cache_data(ttl=300, key_prefix="evaluations")
     def get_cached_evaluations(judge_id: int = None, song_id: int = None):
         """Get cached evaluations"""
         from services.database_service import db_service
         return db_service.get_evaluations(judge_id, song_id)
     
     @staticmethod
-    @cache_data(ttl=600, key_prefix="leaderboard")
     def get_cached_leaderboard():
         """Get cached leaderboard"""
         from services.database_service import db_service
@@ -220,25 +591,47 @@ class CacheService:
     
     # ==================== CACHE WARMING ====================
     
+    _warm_lock = threading.Lock()
+    _warmed = False
+
     @staticmethod
     def warm_cache():
-        """Pre-load frequently accessed data"""
-        try:
-            logger.info("Warming cache...")
-            
-            # Load core data
-            CacheService.get_cached_config()
-            CacheService.get_cached_judges()
-            CacheService.get_cached_rubrics()
-            CacheService.get_cached_songs()
-            
-            # Load recent evaluations
-            CacheService.get_cached_evaluations()
-            
-            logger.info("Cache warming completed")
-            
-        except Exception as e:
-            logger.error(f"Error warming cache: {e}")
+        """Pre-load frequently accessed data concurrently, once per process"""
+        from concurrent.futures import ThreadPoolExecutor
+        from services.service_registry import startup_timer
+
+        def load(stage: str, fetch: Callable):
+            with startup_timer.measure(f"warm {stage}", cold=True):
+                fetch()
+
+        loaders = {
+            'config': CacheService.get_cached_config,
+            'judges': CacheService.get_cached_judges,
+            'rubrics': CacheService.get_cached_rubrics,
+            'songs': CacheService.get_cached_songs,
+            'song_list': CacheService.get_cached_song_list,
+            'evaluations': CacheService.get_cached_evaluations
+        }
+        # Held for the whole warm-up: other sessions wait for it instead of fetching too
+        with CacheService._warm_lock:
+            if CacheService._warmed:
+                return
+            try:
+                logger.info("Warming cache...")
+
+                # Independent network round trips: overlap them instead of paying each in turn
+                with startup_timer.measure("warm cache", cold=True):
+                    with ThreadPoolExecutor(max_workers=len(loaders), thread_name_prefix="cache-warm") as pool:
+                        futures = [pool.submit(load, stage, fetch) for stage, fetch in loaders.items()]
+                        for future in futures:
+                            future.result()
+
+                # Only a complete warm-up counts; after a failure the next session tries again
+                CacheService._warmed = True
+                logger.info("Cache warming completed")
+
+            except Exception as e:
+                logger.error(f"Error warming cache: {e}")
 
 # Global instance
 cache_service = CacheService()
@@ -0,0 +1,279 @@
+# -*- coding: utf-8 -*-
+"""
+Change Feed Service - Push-based cache refresh from database row changes
+Subscribes to Supabase Realtime and patches or invalidates the process cache per changed row
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from typing import Dict, Any, Optional
+
+import pandas as pd
+
+from services.cache_service import CacheService, process_cache
+from services.connection_service import connection_manager
+from services.table_schema import table_normalizer
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Tables whose row changes are pushed (sql/12_realtime_publication.sql publishes them).
+# leaderboard_refresh_state changes when the leaderboard view has been refreshed;
+# rubrics and song_analysis are pushed so the local mirror can serve them; judges
+# are pushed because the evaluations reads embed judge names and use a live_ttl.
+FEED_TABLES = ('evaluations', 'songs', 'configuration', 'keywords', 'rubrics', 'song_analysis',
+               'leaderboard_refresh_state', 'judges')
+
+# Set CHANGE_FEED=false to keep TTL-only freshness
+CHANGE_FEED_ENABLED = os.environ.get('CHANGE_FEED', 'true').lower() not in ('0', 'false', 'no')
+
+# Song columns whose changes only affect the row itself, so cached songs frames are patched
+VOLATILE_SONG_COLUMNS = {'play_count', 'updated_at'}
+
+# Wait between reconnect attempts, doubled after each failure up to the maximum
+RECONNECT_SECONDS = 5
+MAX_RECONNECT_SECONDS = 120
+
+
+class ChangeFeed:
+    """
+    Applies pushed row changes to the process cache
+
+    An evaluation insert/update drops only the reads that can contain that
+    row (the evaluations sync then fetches just the changed rows); a songs
+    update that only moves the play counter is patched into the cached songs
+    frames; any other change drops the table's reads. While the feed is
+    live, ``process_cache.push_invalidation`` is set so reads declaring a
+    ``live_ttl`` are kept far longer. When it goes down, every fed table is
+    invalidated because changes may have been missed.
+
+    Subclasses deliver the changes: SupabaseChangeFeed subscribes to
+    Supabase Realtime, LocalChangeFeed is an in-process stand-in for tests.
+    """
+
+    def __init__(self, tables=FEED_TABLES):
+        self.tables = tuple(tables)
+        self._live = False
+        self._lock = threading.Lock()
+        self.stats = {
+            'events': 0,
+            'patched': 0,
+            'invalidated': 0,
+            'disconnects': 0,
+            'last_event_at': None
+        }
+
+    @property
+    def live(self) -> bool:
+        return self._live
+
+    def set_live(self, live: bool):
+        with self._lock:
+            was_live, self._live = self._live, live
+        process_cache.push_invalidation = live
+        if live != was_live:
+            # The local mirror backend depends on the feed to stay current
+            connection_manager.feed_live_changed(live)
+        if was_live and not live:
+            self.stats['disconnects'] += 1
+            # Changes made while the feed was down were never pushed
+            CacheService.invalidate_tables(*self.tables)
+            logger.warning("Change feed down; cache freshness falls back to TTLs")
+        elif live and not was_live:
+            logger.info(f"Change feed live for {', '.join(self.tables)}")
+
+    # ==================== APPLYING CHANGES ====================
+
+    def apply_payload(self, payload: Dict[str, Any]):
+        """Apply one Supabase Realtime postgres_changes payload"""
+        try:
+            data = payload.get('data', payload)
+            self.apply(
+                data.get('table'),
+                data.get('type') or data.get('eventType'),
+                data.get('record') or data.get('new') or {},
+                data.get('old_record') or data.get('old') or {}
+            )
+        except Exception as e:
+            logger.error(f"Error applying change feed payload: {e}")
+
+    def apply(self, table: str, event: str, record: Optional[Dict[str, Any]] = None,
+              old_record: Optional[Dict[str, Any]] = None):
+        """Patch or invalidate the cached reads affected by one row change"""
+        if table not in self.tables:
+            return
+        event = str(event or '').upper()
+        record, old_record = record or {}, old_record or {}
+        self.stats['events'] += 1
+        self.stats['last_event_at'] = time.time()
+        # Mirrored tables are updated first, so the reads dropped below reload fresh rows
+        connection_manager.mirror_change(table, event, record, old_record)
+
+        if table == 'evaluations':
+            self._apply_evaluation(event, record)
+        elif table == 'songs' and event == 'UPDATE' and self._patch_song(record):
+            self.stats['patched'] += 1
+        else:
+            CacheService.invalidate_tables(table)
+            self.stats['invalidated'] += 1
+
+    def _apply_evaluation(self, event: str, record: Dict[str, Any]):
+        judge_id, song_id = record.get('judge_id'), record.get('song_id')
+        if event in ('INSERT', 'UPDATE') and judge_id is not None and song_id is not None:
+            CacheService.invalidate_rows('evaluations', judge_id=judge_id, song_id=song_id)
+        else:
+            # Deletes are not picked up by the updated_at delta sync: reload
+            CacheService.invalidate_tables('evaluations')
+        self.stats['invalidated'] += 1
+
+    def _patch_song(self, record: Dict[str, Any]) -> bool:
+        """Patch a play-counter-only update into cached songs frames; False if it needs a reload"""
+        song_id = record.get('id')
+        if song_id is None:
+            return False
+        # Pushed values as the cached (normalized) frames hold them, e.g. parsed updated_at
+        record = table_normalizer.normalize_record('songs', record)
+
+        def patch(frame):
+            if not isinstance(frame, pd.DataFrame) or 'id' not in frame:
+                return frame
+            rows = frame.index[frame['id'] == song_id]
+            if len(rows) == 0:
+                # Not in this read: fine unless the song just became active
+                return None if record.get('is_active') else frame
+            row = rows[0]
+            changed = [column for column in frame.columns
+                       if column in record and not _same_value(frame.at[row, column], record[column])]
+            if any(column not in VOLATILE_SONG_COLUMNS for column in changed):
+                return None
+            if not changed:
+                return frame
+            patched = frame.copy()
+            for column in changed:
+                patched.at[row, column] = record[column]
+            return patched
+
+        result = process_cache.patch_tagged(CacheService.scoped_tag('songs'), patch)
+        if result['dropped'] or not result['patched']:
+            # Other columns changed (or nothing was cached to compare with):
+            # reads embedding song rows must be reloaded too
+            return False
+        return True
+
+    def feed_stats(self) -> Dict[str, Any]:
+        return {**self.stats, 'live': self._live, 'tables': list(self.tables)}
+
+
+def _same_value(cached: Any, pushed: Any) -> bool:
+    try:
+        if pd.isna(cached) and pushed is None:
+            return True
+    except (TypeError, ValueError):
+        pass
+    try:
+        return bool(cached == pushed)
+    except Exception:
+        return False
+
+
+class SupabaseChangeFeed(ChangeFeed):
+    """Change feed fed by Supabase Realtime, subscribed from a daemon thread"""
+
+    def __init__(self, tables=FEED_TABLES, enabled: bool = CHANGE_FEED_ENABLED,
+                 channel_name: str = 'lomba-cache-feed'):
+        super().__init__(tables)
+        self.enabled = enabled
+        self.channel_name = channel_name
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+
+    def start(self):
+        """Start the subscriber once per process (no-op when disabled, offline or running)"""
+        if not self.enabled or connection_manager.backend == 'sqlite':
+            return
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stopping.clear()
+            self._thread = threading.Thread(target=self._run, name="change-feed", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stopping.set()
+
+    def _run(self):
+        delay = RECONNECT_SECONDS
+        while not self._stopping.is_set():
+            try:
+                asyncio.run(self._listen())
+                delay = RECONNECT_SECONDS
+            except ImportError as e:
+                logger.warning(f"Change feed unavailable ({e}); using TTL freshness only")
+                return
+            except Exception as e:
+                logger.warning(f"Change feed connection failed: {e}")
+                delay = min(delay * 2, MAX_RECONNECT_SECONDS)
+            self.set_live(False)
+            if self._stopping.wait(delay):
+                return
+
+    async def _listen(self):
+        from supabase import acreate_client
+
+        client = await acreate_client(connection_manager.supabase_url, connection_manager.supabase_key)
+        channel = client.channel(self.channel_name)
+        for table in self.tables:
+            channel.on_postgres_changes('*', schema='public', table=table, callback=self.apply_payload)
+
+        closed = asyncio.Event()
+
+        def on_status(status, error=None):
+            state = str(getattr(status, 'value', status)).upper()
+            if state.endswith('SUBSCRIBED'):
+                self.set_live(True)
+            else:
+                logger.warning(f"Change feed channel {state}: {error}")
+                closed.set()
+
+        await channel.subscribe(on_status)
+        try:
+            while not closed.is_set() and not self._stopping.is_set():
+                if not getattr(client.realtime, 'is_connected', True):
+                    break
+                try:
+                    await asyncio.wait_for(closed.wait(), timeout=1)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            try:
+                await client.remove_all_channels()
+            except Exception:
+                pass
+
+
+class LocalChangeFeed(ChangeFeed):
+    """In-process change feed: ``publish`` delivers a Realtime-shaped payload synchronously"""
+
+    def connect(self):
+        self.set_live(True)
+
+    def disconnect(self):
+        self.set_live(False)
+
+    def publish(self, table: str, event: str, record: Optional[Dict[str, Any]] = None,
+                old_record: Optional[Dict[str, Any]] = None):
+        self.apply_payload({'data': {
+            'schema': 'public',
+            'table': table,
+            'type': event,
+            'record': record or {},
+            'old_record': old_record or {}
+        }})
+
+
+# Global instance
+change_feed = SupabaseChangeFeed()
@@ -0,0 +1,402 @@
+# -*- coding: utf-8 -*-
+"""
+Connection Service - One pooled set of connections shared by all services
+Owns the shared Supabase clients and a keep-alive HTTP session for storage downloads
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+import time
+import urllib.parse
+from typing import Dict, List, Any, Optional
+
+import streamlit as st
+
+from services.local_mirror import (DATA_BACKEND, DATA_BACKENDS, MIRROR_PATH, MIRROR_READ_TABLES,
+                                   SQLiteMirror)
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Downloaded storage objects, revalidated by ETag before reuse
+STORAGE_CACHE_DIR = os.environ.get('STORAGE_CACHE_DIR') or os.path.join(
+    tempfile.gettempdir(), 'lomba-storage-cache')
+
+# Storage path segments that come before the bucket name
+_STORAGE_ACCESS_SEGMENTS = {'public', 'sign', 'authenticated', 'info', 'list', 'move', 'copy', 'upload'}
+
+
+class ConnectionManager:
+    """
+    Process-wide owner of the app's network connections
+
+    ``client`` is the one Supabase client used by DatabaseService and
+    FileService; its PostgREST and Storage HTTP clients keep their
+    keep-alive pool, retry failed connects and have per-call timeouts.
+    ``auth_client`` is a second client reserved for AuthService, because a
+    signed-in Supabase client sends the user's token on every table query.
+    ``session`` is a pooled requests session with backoff retries for public
+    storage downloads. Every request is counted and timed per table/bucket.
+
+    ``backend`` (DATA_BACKEND) picks where table reads go: ``sqlite`` makes
+    ``client`` the local SQLite mirror, ``mirror`` serves the public pages'
+    tables from it through ``read_client`` (see services.local_mirror).
+    In the ``mirror`` backend the mirror only learns about Supabase edits
+    from the change feed, so it serves reads only while the feed is live
+    and after it was re-snapshotted on (re)connect; otherwise reads go to
+    Supabase.
+    """
+
+    def __init__(self, pool_size: int = 10, timeout_seconds: float = 10.0,
+                 retries: int = 3, backoff_seconds: float = 0.5,
+                 cache_dir: str = STORAGE_CACHE_DIR, backend: str = DATA_BACKEND,
+                 mirror_path: str = MIRROR_PATH):
+        if backend not in DATA_BACKENDS:
+            raise ValueError(f"Unknown DATA_BACKEND {backend!r}, expected one of {DATA_BACKENDS}")
+        self.backend = backend
+        self.mirror_path = mirror_path
+        self.pool_size = pool_size
+        self.cache_dir = cache_dir
+        self.timeout_seconds = timeout_seconds
+        self.retries = retries
+        self.backoff_seconds = backoff_seconds
+        self._client = None
+        self._auth_client = None
+        self._mirror = None
+        self._mirror_synced = False
+        self._resync_thread: Optional[threading.Thread] = None
+        self._changed_during_resync: Optional[set] = None
+        self._session = None
+        self._lock = threading.Lock()
+        self._metrics_lock = threading.Lock()
+        self._metrics: Dict[tuple, Dict[str, float]] = {}
+
+    @property
+    def supabase_url(self) -> Optional[str]:
+        return self._secret("supabase_url")
+
+    @property
+    def supabase_key(self) -> Optional[str]:
+        return self._secret("supabase_anon_key")
+
+    def _secret(self, name: str) -> Optional[str]:
+        try:
+            return st.secrets.get(name)
+        except Exception:
+            # The offline backend runs without a secrets.toml
+            if self.backend == 'sqlite':
+                return None
+            raise
+
+    # ==================== CLIENTS ====================
+
+    @property
+    def client(self):
+        """Shared data client for table and RPC calls: Supabase, or the mirror when offline"""
+        if self.backend == 'sqlite':
+            return self.mirror
+        return self.supabase_client
+
+    @property
+    def supabase_client(self):
+        """Shared Supabase client for table, RPC and storage calls"""
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    self._client = self._create_client()
+        return self._client
+
+    @property
+    def auth_client(self):
+        """Supabase client that carries the auth session (sign-in, user lookups)"""
+        if self._auth_client is None:
+            with self._lock:
+                if self._auth_client is None:
+                    self._auth_client = self._create_client()
+        return self._auth_client
+
+    @property
+    def mirror(self):
+        """Local SQLite mirror (services.local_mirror), opened on first use"""
+        if self._mirror is None:
+            with self._lock:
+                if self._mirror is None:
+                    self._mirror = SQLiteMirror(self.mirror_path)
+        return self._mirror
+
+    def read_client(self, table: str):
+        """Client to read ``table`` from: the mirror for public-page tables while it is kept current"""
+        if self.backend == 'mirror' and table in MIRROR_READ_TABLES and self._mirror_synced:
+            return self.mirror
+        return self.client
+
+    def feed_live_changed(self, live: bool):
+        """Called by the change feed: stop serving the mirror when down, re-snapshot it when back"""
+        if self.backend != 'mirror':
+            return
+        if not live:
+            self._mirror_synced = False
+            return
+        with self._lock:
+            if self._resync_thread is not None and self._resync_thread.is_alive():
+                return
+            self._resync_thread = threading.Thread(target=self.resync_mirror, name="mirror-resync",
+                                                   daemon=True)
+            self._resync_thread.start()
+
+    def resync_mirror(self, max_rounds: int = 3) -> bool:
+        """
+        Copy MIRROR_READ_TABLES from Supabase, then serve reads from the mirror
+
+        Tables that received pushed changes while they were being copied are
+        copied again, since the copy may predate the change. Returns whether
+        the mirror is serving reads afterwards.
+        """
+        tables = set(MIRROR_READ_TABLES)
+        for _ in range(max_rounds):
+            self._changed_during_resync = set()
+            copied = self.mirror.replicate(self.supabase_client, tables=sorted(tables))
+            tables = self._changed_during_resync | (set(tables) - set(copied))
+            if not tables:
+                break
+        self._changed_during_resync = None
+        self._mirror_synced = not tables
+        if tables:
+            logger.warning(f"Connection: mirror not current for {sorted(tables)}; reading from Supabase")
+        return self._mirror_synced
+
+    def mirror_change(self, table: str, event: str, record: Optional[Dict[str, Any]] = None,
+                      old_record: Optional[Dict[str, Any]] = None):
+        """Copy a Supabase row change into the mirror when it serves reads of ``table``"""
+        if self.backend != 'mirror' or table not in MIRROR_READ_TABLES:
+            return
+        changed = self._changed_during_resync
+        if changed is not None:
+            changed.add(table)
+        try:
+            self.mirror.apply_change(table, event, record, old_record)
+        except Exception as e:
+            logger.warning(f"Connection: could not update mirrored {table}: {e}")
+
+    def _create_client(self):
+        from supabase import create_client
+        try:
+            from supabase.lib.client_options import ClientOptions
+            options = ClientOptions(postgrest_client_timeout=self.timeout_seconds,
+                                    storage_client_timeout=int(self.timeout_seconds))
+        except Exception:
+            options = None
+        if options is not None:
+            client = create_client(self.supabase_url, self.supabase_key, options=options)
+        else:
+            client = create_client(self.supabase_url, self.supabase_key)
+        self._instrument(client)
+        return client
+
+    def _instrument(self, client):
+        """Retry connects and time the httpx clients behind PostgREST and Storage"""
+        try:
+            import httpx
+        except ImportError:
+            return
+
+        retries, backoff_seconds = self.retries, self.backoff_seconds
+
+        class RetryingTransport(httpx.BaseTransport):
+            """Retries failed connects on the client's own transport (keeps http2, verify, proxies)"""
+
+            def __init__(self, transport):
+                self.transport = transport
+
+            def handle_request(self, request):
+                for attempt in range(retries + 1):
+                    try:
+                        return self.transport.handle_request(request)
+                    except (httpx.ConnectError, httpx.ConnectTimeout):
+                        # Nothing was sent yet, so any request can be retried
+                        if attempt == retries:
+                            raise
+                        time.sleep(backoff_seconds * 2 ** attempt)
+
+            def close(self):
+                self.transport.close()
+
+        def on_request(request):
+            request.extensions['lomba_started'] = time.perf_counter()
+
+        def on_response(response):
+            started = response.request.extensions.get('lomba_started')
+            if started is not None:
+                kind, name = self._classify(response.request.url.path)
+                self.record(kind, name, time.perf_counter() - started,
+                            ok=response.status_code < 400)
+
+        for component in ('postgrest', 'storage'):
+            try:
+                owner = getattr(client, component)
+            except Exception as e:
+                logger.warning(f"Connection: cannot instrument {component}: {e}")
+                continue
+            for attribute in ('session', '_client'):
+                http_client = getattr(owner, attribute, None)
+                if not isinstance(http_client, httpx.Client):
+                    continue
+                transport = getattr(http_client, '_transport', None)
+                if isinstance(transport, httpx.BaseTransport) and not isinstance(transport, RetryingTransport):
+                    http_client._transport = RetryingTransport(transport)
+                http_client.event_hooks = {
+                    'request': list(http_client.event_hooks.get('request', [])) + [on_request],
+                    'response': list(http_client.event_hooks.get('response', [])) + [on_response],
+                }
+                break
+
+    # ==================== HTTP SESSION ====================
+
+    @property
+    def session(self):
+        """Keep-alive requests session with a bounded pool and backoff retries"""
+        if self._session is None:
+            with self._lock:
+                if self._session is None:
+                    import requests
+                    from requests.adapters import HTTPAdapter
+                    from urllib3.util.retry import Retry
+
+                    retry = Retry(total=self.retries, backoff_factor=self.backoff_seconds,
+                                  status_forcelist=(429, 500, 502, 503, 504),
+                                  allowed_methods=frozenset({'GET', 'HEAD'}))
+                    adapter = HTTPAdapter(pool_connections=self.pool_size,
+                                          pool_maxsize=self.pool_size, max_retries=retry)
+                    session = requests.Session()
+                    session.mount('https://', adapter)
+                    session.mount('http://', adapter)
+                    self._session = session
+        return self._session
+
+    def public_url(self, bucket: str, path: str) -> str:
+        """Public storage URL of ``path`` in ``bucket``"""
+        encoded_path = urllib.parse.quote(path)
+        return f"{self.supabase_url}/storage/v1/object/public/{bucket}/{encoded_path}"
+
+    def download_public(self, bucket: str, path: str,
+                        timeout_seconds: Optional[float] = None) -> Optional[bytes]:
+        """Content of a public storage object, or None when it is not found"""
+        started = time.perf_counter()
+        ok = False
+        try:
+            response = self.session.get(self.public_url(bucket, path),
+                                        timeout=timeout_seconds or self.timeout_seconds)
+            ok = response.status_code == 200
+            return response.content if ok else None
+        finally:
+            self.record('storage', bucket, time.perf_counter() - started, ok=ok)
+
+    def download_public_cached(self, bucket: str, path: str,
+                               timeout_seconds: Optional[float] = None) -> Optional[str]:
+        """
+        Local copy of a public storage object, or None when it is not found
+
+        Copies are stored under ``cache_dir`` keyed by bucket/path and ETag.
+        A known copy is revalidated with If-None-Match, so an unchanged object
+        costs one 304 response instead of a download. The body is streamed to
+        disk in chunks.
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path_key = hashlib.sha1(f"{bucket}/{path}".encode('utf-8')).hexdigest()
+        etag_file = os.path.join(self.cache_dir, f"{path_key}.etag")
+        known_etag = None
+        if os.path.exists(etag_file):
+            with open(etag_file, 'r', encoding='utf-8') as f:
+                known_etag = f.read().strip() or None
+        known_copy = self._cached_object(path_key, known_etag) if known_etag else None
+        if known_copy and not os.path.exists(known_copy):
+            known_copy = None
+        headers = {'If-None-Match': known_etag} if known_copy else {}
+
+        started = time.perf_counter()
+        ok = False
+        try:
+            with self.session.get(self.public_url(bucket, path), headers=headers, stream=True,
+                                  timeout=timeout_seconds or self.timeout_seconds) as response:
+                if response.status_code == 304 and known_copy:
+                    ok = True
+                    return known_copy
+                if response.status_code != 200:
+                    return None
+                etag = response.headers.get('ETag')
+                target = self._cached_object(path_key, etag)
+                partial = f"{target}.{threading.get_ident()}.part"
+                with open(partial, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=64 * 1024):
+                        f.write(chunk)
+                os.replace(partial, target)
+            if etag:
+                with open(f"{etag_file}.{threading.get_ident()}.part", 'w', encoding='utf-8') as f:
+                    f.write(etag)
+                os.replace(f"{etag_file}.{threading.get_ident()}.part", etag_file)
+            if known_copy and known_copy != target:
+                try:
+                    os.remove(known_copy)
+                except OSError:
+                    pass
+            ok = True
+            return target
+        finally:
+            self.record('storage', bucket, time.perf_counter() - started, ok=ok)
+
+    def _cached_object(self, path_key: str, etag: Optional[str]) -> str:
+        etag_key = hashlib.sha1((etag or '').encode('utf-8')).hexdigest()[:16]
+        return os.path.join(self.cache_dir, f"{path_key}-{etag_key}.bin")
+
+    # ==================== METRICS ====================
+
+    @staticmethod
+    def _classify(path: str):
+        """(kind, name) of a Supabase REST path: table, rpc function or storage bucket"""
+        parts = [part for part in path.split('/') if part]
+        if len(parts) >= 3 and parts[0] == 'rest':
+            if parts[2] == 'rpc' and len(parts) >= 4:
+                return 'rpc', parts[3]
+            return 'table', parts[2]
+        if len(parts) >= 3 and parts[0] == 'storage':
+            rest = parts[3:] if parts[2] == 'object' else parts[2:]
+            while rest and rest[0] in _STORAGE_ACCESS_SEGMENTS:
+                rest = rest[1:]
+            return 'storage', rest[0] if rest else 'storage'
+        return 'other', '/'.join(parts[:2]) or '/'
+
+    def record(self, kind: str, name: str, seconds: float, ok: bool = True):
+        """Count one request against its table/bucket"""
+        with self._metrics_lock:
+            entry = self._metrics.setdefault((kind, name), {
+                'requests': 0, 'errors': 0, 'total_seconds': 0.0, 'max_seconds': 0.0
+            })
+            entry['requests'] += 1
+            entry['errors'] += 0 if ok else 1
+            entry['total_seconds'] += seconds
+            entry['max_seconds'] = max(entry['max_seconds'], seconds)
+
+    def metrics(self) -> List[Dict[str, Any]]:
+        """Rows of request count and latency per table/bucket, busiest first"""
+        with self._metrics_lock:
+            rows = [{
+                'kind': kind,
+                'name': name,
+                'requests': int(entry['requests']),
+                'errors': int(entry['errors']),
+                'avg_ms': round(entry['total_seconds'] / entry['requests'] * 1000, 1),
+                'max_ms': round(entry['max_seconds'] * 1000, 1),
+            } for (kind, name), entry in self._metrics.items()]
+        return sorted(rows, key=lambda row: row['requests'], reverse=True)
+
+    def reset_metrics(self):
+        with self._metrics_lock:
+            self._metrics = {}
+
+
+# Global instance
+connection_manager = ConnectionManager()
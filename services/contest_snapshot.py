@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""
+Contest Snapshot - One read-only view of the contest data per rerun
+Loads each table once and derives leaderboard, judge and rubric analytics on first use
+"""
+
+import logging
+from functools import cached_property
+from typing import Dict, Any
+
+import pandas as pd
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class ContestSnapshot:
+    """
+    Immutable view of songs, judges, rubrics, evaluations and configuration
+
+    Built once at the top of a rerun and passed to every renderer, so the
+    tabs of one page load share the same tables and the same derived
+    frames instead of re-reading the cache and repeating the groupbys and
+    merges. Tables are read from ``loader`` (the DatabaseService, whose
+    reads go through the process cache) on first access; analytics are
+    computed on first access and memoized. The frames are shared: callers
+    that add or change columns must work on a copy.
+
+    A judge's own evaluations (``evaluations_for_judge`` and
+    ``judge_progress``) include the auto-saves still waiting in
+    ``pending`` (the AutoSaveService write-behind buffer), so the page
+    reflects the latest clicks without flushing them on every rerun.
+    """
+
+    def __init__(self, loader=None, pending=None):
+        if loader is None:
+            from services.database_service import db_service
+            loader = db_service
+        if pending is None:
+            from services.autosave_service import autosave_service
+            pending = autosave_service
+        object.__setattr__(self, '_loader', loader)
+        object.__setattr__(self, '_pending', pending)
+        object.__setattr__(self, '_judge_evaluations', {})
+        object.__setattr__(self, '_judge_progress', {})
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ContestSnapshot is read-only")
+
+    def __delattr__(self, name):
+        raise AttributeError("ContestSnapshot is read-only")
+
+    # ==================== TABLES ====================
+
+    @cached_property
+    def config(self) -> Dict[str, str]:
+        return self._loader.get_config()
+
+    @cached_property
+    def songs(self) -> pd.DataFrame:
+        return self._loader.get_songs()
+
+    @cached_property
+    def judges(self) -> pd.DataFrame:
+        return self._loader.get_judges()
+
+    @cached_property
+    def rubrics(self) -> pd.DataFrame:
+        return self._loader.get_rubrics()
+
+    @cached_property
+    def evaluations(self) -> pd.DataFrame:
+        return self._loader.get_evaluations()
+
+    @cached_property
+    def leaderboard_stats(self) -> pd.DataFrame:
+        """Per-song aggregates as returned by the leaderboard view"""
+        return self._loader.get_leaderboard()
+
+    def evaluations_for_judge(self, judge_id) -> pd.DataFrame:
+        """Evaluations of one judge, sliced from the shared evaluations frame, with pending auto-saves"""
+        if judge_id not in self._judge_evaluations:
+            evaluations_df = self.evaluations
+            if evaluations_df.empty or 'judge_id' not in evaluations_df:
+                sliced = evaluations_df.iloc[0:0]
+            else:
+                sliced = evaluations_df[evaluations_df['judge_id'] == judge_id].reset_index(drop=True)
+            self._judge_evaluations[judge_id] = self._with_pending(judge_id, sliced)
+        return self._judge_evaluations[judge_id]
+
+    def _with_pending(self, judge_id, evaluations_df: pd.DataFrame) -> pd.DataFrame:
+        """Overlay the judge's unflushed auto-saves; songs without a stored row get one without an id"""
+        pending = self._pending.pending_for_judge(judge_id)
+        if not pending:
+            return evaluations_df
+
+        from services.evaluation_scorer import evaluation_scorer
+        records = evaluations_df.to_dict('records')
+        by_song = {record.get('song_id'): record for record in records}
+        for song_id, changes in pending.items():
+            record = by_song.get(song_id)
+            if record is None:
+                record = {'id': None, 'judge_id': judge_id, 'song_id': song_id, 'rubric_scores': {},
+                          'notes': '', 'is_final_submitted': False}
+                records.append(record)
+            elif record.get('is_final_submitted') in (True, 1):
+                # Locked evaluations ignore auto-saves, as the writer does
+                continue
+
+            scores = {**evaluation_scorer.parse_scores(record.get('rubric_scores')), **changes['rubric_scores']}
+            record['rubric_scores'] = scores
+            record['total_score'] = evaluation_scorer.total_for(scores, self.rubrics)
+            if changes['notes'] is not None:
+                record['notes'] = changes['notes']
+        return pd.DataFrame(records)
+
+    # ==================== DERIVED ====================
+
+    @cached_property
+    def rubric_scores(self) -> pd.DataFrame:
+        """Long (evaluation, song, judge, rubric, score) table of all evaluations"""
+        from services.evaluation_scorer import evaluation_scorer
+        return evaluation_scorer.rubric_score_table(self.evaluations)
+
+    @cached_property
+    def leaderboard(self) -> pd.DataFrame:
+        """Global leaderboard on the 100-point scale, ranked"""
+        from services.analytics_service import analytics_service
+        return analytics_service.build_global_leaderboard(self.leaderboard_stats, self.songs)
+
+    @cached_property
+    def judge_analytics(self) -> pd.DataFrame:
+        from services.analytics_service import analytics_service
+        return analytics_service.build_judge_analytics(self.evaluations, self.judges)
+
+    @cached_property
+    def rubric_analytics(self) -> pd.DataFrame:
+        from services.analytics_service import analytics_service
+        return analytics_service.build_rubric_analytics(self.rubric_scores, self.rubrics)
+
+    @cached_property
+    def insights(self) -> Dict[str, Any]:
+        from services.analytics_service import analytics_service
+        return analytics_service.build_insights(self.leaderboard, self.judge_analytics,
+                                                self.rubric_analytics)
+
+    def judge_progress(self, judge_id) -> pd.DataFrame:
+        """Completion table of one judge (see AnalyticsService.get_judge_progress)"""
+        if judge_id not in self._judge_progress:
+            from services.analytics_service import analytics_service
+            self._judge_progress[judge_id] = analytics_service.build_judge_progress(
+                self.songs, self.rubrics, self.evaluations_for_judge(judge_id)
+            )
+        return self._judge_progress[judge_id]
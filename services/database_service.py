@@ -11,41 +11,54 @@ from datetime import datetime
 import json
 import logging
 
+from services.cache_service import CacheService, LIVE_TTL
+from services.leaderboard import typed_leaderboard, compute_leaderboard
+from services.connection_service import connection_manager
+from services.evaluation_sync import evaluation_sync
+from services.table_schema import table_normalizer
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Large text columns of songs: list views leave them out, detail views fetch them per song
+SONG_TEXT_COLUMNS = ('lyrics_text', 'chords_list', 'full_score', 'lyrics_with_chords', 'notation_text')
+
 class DatabaseService:
     """Centralized database service for all data operations"""
     
     def __init__(self):
         """Initialize database connection"""
-        self.supabase_url = st.secrets.get("supabase_url")
-        self.supabase_key = st.secrets.get("supabase_anon_key")
+        self.supabase_url = connection_manager.supabase_url
+        self.supabase_key = connection_manager.supabase_key
         self._client = None
         
     @property
     def client(self):
-        """Lazy initialization of Supabase client"""
+        """Shared Supabase client from the connection manager"""
         if self._client is None:
             try:
-                from supabase import create_client
-                self._client = create_client(self.supabase_url, self.supabase_key)
+                self._client = connection_manager.client
             except Exception as e:
                 logger.error(f"Failed to initialize Supabase client: {e}")
                 st.error("Database connection failed. Please check configuration.")
                 return None
         return self._client
+
+    def read_client(self, table: str):
+        """Client for cached reads of ``table``: the local mirror for public-page tables in the mirror backend"""
+        return connection_manager.read_client(table)
     
     # ==================== JUDGES ====================
     
-    @st.cache_data(ttl=3600)
+    @CacheService.cache_data(ttl=3600, key_prefix="judges", show_spinner=False,
+                             tags=CacheService.read_tags('judges'))
     def get_judges(_self) -> pd.DataFrame:
         """Get all active judges"""
         try:
             response = _self.client.table('judges').select('*').eq('is_active', True).execute()
             logger.info(f"Judges query response: {response.data}")
-            df = pd.DataFrame(response.data)
+            df = table_normalizer.normalize('judges', pd.DataFrame(response.data))
             logger.info(f"Judges DataFrame shape: {df.shape}, columns: {list(df.columns) if not df.empty else 'No columns'}")
             return df
         except Exception as e:
@@ -57,7 +70,7 @@ class DatabaseService:
         try:
             data = {"name": name, "email": email, "active": True}
             response = self.client.table('judges').insert(data).execute()
-            st.cache_data.clear()  # Clear cache
+            CacheService.invalidate_tables('judges')
             return True
         except Exception as e:
             logger.error(f"Error adding judge: {e}")
@@ -68,7 +81,7 @@ class DatabaseService:
         try:
             data = {"email": email, "updated_at": datetime.now().isoformat()}
             response = self.client.table('judges').update(data).eq('id', judge_id).execute()
-            st.cache_data.clear()  # Clear cache
+            CacheService.invalidate_tables('judges')
             return True
         except Exception as e:
             logger.error(f"Error updating judge email: {e}")
@@ -79,7 +92,7 @@ class DatabaseService:
         try:
             data = {"role": role, "updated_at": datetime.now().isoformat()}
             response = self.client.table('judges').update(data).eq('id', judge_id).execute()
-            st.cache_data.clear()  # Clear cache
+            CacheService.invalidate_tables('judges')
             return True
         except Exception as e:
             logger.error(f"Error updating judge role: {e}")
@@ -89,40 +102,112 @@ class DatabaseService:
     
     # ==================== SONGS ====================
     
-    @st.cache_data(ttl=1800)  # 30 minutes
+    @CacheService.cache_data(ttl=1800, key_prefix="songs", show_spinner=False,  # 30 minutes
+                             tags=CacheService.read_tags('songs'), live_ttl=LIVE_TTL)
     def get_songs(_self) -> pd.DataFrame:
         """Get all active songs with file metadata"""
         try:
             # Simplified query without foreign key joins for now
-            response = _self.client.table('songs').select('*').eq('is_active', True).execute()
-            return pd.DataFrame(response.data)
+            response = _self.read_client('songs').table('songs').select('*').eq('is_active', True).execute()
+            return table_normalizer.normalize('songs', pd.DataFrame(response.data))
         except Exception as e:
             logger.error(f"Error fetching songs: {e}")
             return pd.DataFrame()
 
+    @CacheService.cache_data(ttl=LIVE_TTL, key_prefix="song_columns", show_spinner=False,
+                             tags=['songs'])
+    def get_song_columns(_self) -> List[str]:
+        """Column names of the songs table, read from one row"""
+        response = _self.read_client('songs').table('songs').select('*').limit(1).execute()
+        return list(response.data[0]) if response.data else []
+
+    @CacheService.cache_data(ttl=1800, key_prefix="song_list", show_spinner=False,
+                             tags=CacheService.read_tags('songs'), live_ttl=LIVE_TTL)
+    def get_song_list(_self) -> pd.DataFrame:
+        """
+        Get all active songs without the large text columns (list views)
+
+        Selects every column except SONG_TEXT_COLUMNS; pages that show one
+        song's lyrics or chords add them with ``with_song_texts``.
+        """
+        try:
+            columns = [c for c in _self.get_song_columns() if c not in SONG_TEXT_COLUMNS]
+            response = _self.read_client('songs').table('songs').select(
+                ', '.join(columns) or '*'
+            ).eq('is_active', True).execute()
+            return table_normalizer.normalize('songs', pd.DataFrame(response.data), label='song_list')
+        except Exception as e:
+            logger.error(f"Error fetching song list: {e}")
+            return pd.DataFrame()
+
+    @CacheService.cache_data(ttl=1800, key_prefix="song_texts", show_spinner=False,
+                             tags=lambda song_id: CacheService.read_tags('songs', id=song_id),
+                             live_ttl=LIVE_TTL)
+    def get_song_texts(_self, song_id: int) -> Dict[str, Any]:
+        """Large text columns (SONG_TEXT_COLUMNS) of one song, cached per song"""
+        try:
+            columns = [c for c in _self.get_song_columns() if c in SONG_TEXT_COLUMNS]
+            if not columns:
+                return {}
+            response = _self.read_client('songs').table('songs').select(
+                ', '.join(columns)
+            ).eq('id', song_id).execute()
+            return dict(response.data[0]) if response.data else {}
+        except Exception as e:
+            logger.error(f"Error fetching texts of song {song_id}: {e}")
+            return {}
+
+    def with_song_texts(self, song_data):
+        """A song row (Series or dict) from get_song_list with its text columns filled in"""
+        song_id = song_data.get('id')
+        if song_id is None or pd.isna(song_id) or all(c in song_data for c in SONG_TEXT_COLUMNS):
+            return song_data
+        texts = {c: v for c, v in self.get_song_texts(int(song_id)).items() if c not in song_data}
+        if isinstance(song_data, pd.Series):
+            return pd.concat([song_data, pd.Series(texts, dtype=object)])
+        return {**song_data, **texts}
+
     def increment_play_count(self, song_id: int) -> bool:
         """Increment play count for a song"""
+        return bool(self.increment_play_counts({song_id: 1}))
+
+    def increment_play_counts(self, counts: Dict[int, int]) -> Dict[int, int]:
+        """
+        Atomically add plays per song; returns the new play_count per song_id
+
+        Uses the increment_play_counts RPC (sql/10_play_count_increment.sql).
+        Song caches are not invalidated: displayed counts are adjusted by
+        PlayCountService instead of reloading the songs table.
+        """
+        counts = {int(song_id): int(delta) for song_id, delta in counts.items() if delta}
+        if not counts:
+            return {}
         try:
-            # Get current play count
-            response = self.client.table('songs').select('play_count').eq('id', song_id).execute()
-            if response.data and len(response.data) > 0:
-                current_count = response.data[0].get('play_count') or 0
-                new_count = current_count + 1
-
-                # Update play count
-                update_response = self.client.table('songs').update({
-                    'play_count': new_count
-                }).eq('id', song_id).execute()
-
-                # Clear cache to refresh data
-                st.cache_data.clear()
-
-                logger.info(f"Incremented play count for song {song_id}: {current_count} -> {new_count}")
-                return True
-            return False
+            response = self.client.rpc(
+                'increment_play_counts', {'p_counts': {str(k): v for k, v in counts.items()}}
+            ).execute()
+            updated = {int(row['song_id']): int(row['play_count']) for row in (response.data or [])}
+            for song_id, play_count in updated.items():
+                connection_manager.mirror_change('songs', 'UPDATE', {'id': song_id, 'play_count': play_count})
+            return updated
         except Exception as e:
-            logger.error(f"Error incrementing play count for song {song_id}: {e}")
-            return False
+            logger.warning(f"increment_play_counts RPC unavailable, updating rows one by one: {e}")
+            return self._increment_play_counts_per_row(counts)
+
+    def _increment_play_counts_per_row(self, counts: Dict[int, int]) -> Dict[int, int]:
+        """Read-then-write fallback when the RPC is not installed (not atomic)"""
+        updated = {}
+        for song_id, delta in counts.items():
+            try:
+                response = self.client.table('songs').select('play_count').eq('id', song_id).execute()
+                if response.data:
+                    new_count = (response.data[0].get('play_count') or 0) + delta
+                    self.client.table('songs').update({'play_count': new_count}).eq('id', song_id).execute()
+                    connection_manager.mirror_change('songs', 'UPDATE', {'id': song_id, 'play_count': new_count})
+                    updated[song_id] = new_count
+            except Exception as e:
+                logger.error(f"Error incrementing play count for song {song_id}: {e}")
+        return updated
 
     def add_minus_one_column(self) -> bool:
         """Add minus_one_file_path column to songs table if it doesn't exist"""
@@ -146,7 +231,9 @@ class DatabaseService:
                 **kwargs
             }
             response = self.client.table('songs').insert(data).execute()
-            st.cache_data.clear()
+            for row in response.data or []:
+                connection_manager.mirror_change('songs', 'INSERT', row)
+            CacheService.invalidate_tables('songs')
             return response.data[0]['id'] if response.data else None
         except Exception as e:
             logger.error(f"Error adding song: {e}")
@@ -154,35 +241,35 @@ class DatabaseService:
     
     # ==================== RUBRICS ====================
     
-    @st.cache_data(ttl=3600)
+    @CacheService.cache_data(ttl=3600, key_prefix="rubrics", show_spinner=False,
+                             tags=CacheService.read_tags('rubrics'))
     def get_rubrics(_self) -> pd.DataFrame:
         """Get all active rubrics"""
         try:
-            response = _self.client.table('rubrics').select('*').eq('is_active', True).execute()
-            return pd.DataFrame(response.data)
+            response = _self.read_client('rubrics').table('rubrics').select('*').eq('is_active', True).execute()
+            return table_normalizer.normalize('rubrics', pd.DataFrame(response.data))
         except Exception as e:
             logger.error(f"Error fetching rubrics: {e}")
             return pd.DataFrame()
     
     # ==================== EVALUATIONS ====================
     
-    @st.cache_data(ttl=300)  # 5 minutes for fresh evaluation data
+    @CacheService.cache_data(
+        ttl=300, key_prefix="evaluations", show_spinner=False,  # 5 minutes for fresh evaluation data
+        tags=lambda judge_id=None, song_id=None: CacheService.read_tags(
+            'evaluations', 'judges', 'songs', judge_id=judge_id, song_id=song_id
+        ),
+        live_ttl=LIVE_TTL
+    )
     def get_evaluations(_self, judge_id: int = None, song_id: int = None) -> pd.DataFrame:
-        """Get evaluations with optional filtering"""
+        """
+        Get evaluations with optional filtering
+
+        Served from the process-wide evaluations frame, which a cache miss
+        refreshes with only the rows changed since the last sync.
+        """
         try:
-            query = _self.client.table('evaluations').select('''
-                *,
-                judge:judges(*),
-                song:songs(*)
-            ''')
-            
-            if judge_id:
-                query = query.eq('judge_id', judge_id)
-            if song_id:
-                query = query.eq('song_id', song_id)
-                
-            response = query.execute()
-            return pd.DataFrame(response.data)
+            return evaluation_sync.evaluations(judge_id=judge_id, song_id=song_id)
         except Exception as e:
             logger.error(f"Error fetching evaluations: {e}")
             return pd.DataFrame()
@@ -210,15 +297,21 @@ class DatabaseService:
                 on_conflict='judge_id,song_id'
             ).execute()
             
-            st.cache_data.clear()  # Clear evaluation cache
+            CacheService.invalidate_rows('evaluations', judge_id=judge_id, song_id=song_id)
             return True
         except Exception as e:
             logger.error(f"Error saving evaluation: {e}")
             return False
 
     def update_evaluation(self, evaluation_id: int, rubric_scores: Dict,
-                         total_score: float, notes: str = None) -> bool:
-        """Update an existing evaluation"""
+                         total_score: float, notes: str = None,
+                         judge_id: int = None, song_id: int = None) -> bool:
+        """
+        Update an existing evaluation
+
+        judge_id/song_id are optional and only narrow the cache invalidation to
+        the affected row; without them every cached evaluation read is dropped.
+        """
         try:
             data = {
                 "rubric_scores": json.dumps(rubric_scores),
@@ -229,7 +322,7 @@ class DatabaseService:
 
             response = self.client.table('evaluations').update(data).eq('id', evaluation_id).execute()
 
-            st.cache_data.clear()  # Clear evaluation cache
+            CacheService.invalidate_rows('evaluations', judge_id=judge_id, song_id=song_id)
             return True
         except Exception as e:
             logger.error(f"Error updating evaluation: {e}")
@@ -251,15 +344,20 @@ class DatabaseService:
 
             response = self.client.table('evaluations').insert(data).execute()
 
-            st.cache_data.clear()  # Clear evaluation cache
+            CacheService.invalidate_rows('evaluations', judge_id=judge_id, song_id=song_id)
             return True
         except Exception as e:
             logger.error(f"Error creating evaluation: {e}")
             return False
 
-    def final_submit_evaluation(self, evaluation_id: int) -> bool:
+    def final_submit_evaluation(self, evaluation_id: int,
+                                judge_id: int = None, song_id: int = None) -> bool:
         """Mark evaluation as final submitted (locked)"""
         try:
+            # Pending auto-saves must land before the evaluation is locked
+            from services.autosave_service import autosave_service
+            autosave_service.flush(judge_id=judge_id, song_id=song_id)
+
             data = {
                 "is_final_submitted": True,
                 "final_submitted_at": datetime.now().isoformat(),
@@ -268,13 +366,14 @@ class DatabaseService:
 
             response = self.client.table('evaluations').update(data).eq('id', evaluation_id).execute()
 
-            st.cache_data.clear()  # Clear evaluation cache
+            CacheService.invalidate_rows('evaluations', judge_id=judge_id, song_id=song_id)
             return True
         except Exception as e:
             logger.error(f"Error final submitting evaluation: {e}")
             return False
 
-    def unlock_evaluation(self, evaluation_id: int) -> bool:
+    def unlock_evaluation(self, evaluation_id: int,
+                          judge_id: int = None, song_id: int = None) -> bool:
         """Unlock evaluation (admin only)"""
         try:
             data = {
@@ -285,7 +384,7 @@ class DatabaseService:
 
             response = self.client.table('evaluations').update(data).eq('id', evaluation_id).execute()
 
-            st.cache_data.clear()  # Clear evaluation cache
+            CacheService.invalidate_rows('evaluations', judge_id=judge_id, song_id=song_id)
             return True
         except Exception as e:
             logger.error(f"Error unlocking evaluation: {e}")
@@ -293,24 +392,26 @@ class DatabaseService:
 
     # ==================== CONFIGURATION ====================
     
-    @st.cache_data(ttl=3600)
+    @CacheService.cache_data(ttl=3600, key_prefix="config", show_spinner=False,
+                             tags=CacheService.read_tags('configuration'), live_ttl=LIVE_TTL)
     def get_config(_self) -> Dict[str, str]:
         """Get all configuration as dictionary"""
         try:
-            response = _self.client.table('configuration').select('*').execute()
+            response = _self.read_client('configuration').table('configuration').select('*').execute()
             # Database uses 'key' and 'value' columns directly
             return {item['key']: item['value'] for item in response.data}
         except Exception as e:
             logger.error(f"Error fetching configuration: {e}")
             return {}
 
-    @st.cache_data(ttl=3600)
+    @CacheService.cache_data(ttl=3600, key_prefix="configuration", show_spinner=False,
+                             tags=CacheService.read_tags('configuration'), live_ttl=LIVE_TTL)
     def get_configuration(_self) -> pd.DataFrame:
         """Get all configuration settings as DataFrame"""
         try:
-            response = _self.client.table('configuration').select('*').execute()
+            response = _self.read_client('configuration').table('configuration').select('*').execute()
             # Database already uses 'key' and 'value' columns
-            df = pd.DataFrame(response.data)
+            df = table_normalizer.normalize('configuration', pd.DataFrame(response.data))
             return df
         except Exception as e:
             logger.error(f"Error fetching configuration: {e}")
@@ -324,7 +425,9 @@ class DatabaseService:
                 data,
                 on_conflict='key'
             ).execute()
-            st.cache_data.clear()
+            for row in response.data or []:
+                connection_manager.mirror_change('configuration', 'UPDATE', row)
+            CacheService.invalidate_tables('configuration')
             return True
         except Exception as e:
             logger.error(f"Error updating configuration: {e}")
@@ -336,67 +439,74 @@ class DatabaseService:
     
     # ==================== KEYWORDS ====================
     
-    @st.cache_data(ttl=3600)
+    @CacheService.cache_data(ttl=3600, key_prefix="keywords", show_spinner=False,
+                             tags=CacheService.read_tags('keywords'), live_ttl=LIVE_TTL)
     def get_keywords(_self) -> pd.DataFrame:
         """Get all active keywords"""
         try:
-            response = _self.client.table('keywords').select('*').eq('is_active', True).execute()
-            return pd.DataFrame(response.data)
+            response = _self.read_client('keywords').table('keywords').select('*').eq('is_active', True).execute()
+            return table_normalizer.normalize('keywords', pd.DataFrame(response.data))
         except Exception as e:
             logger.error(f"Error fetching keywords: {e}")
             return pd.DataFrame()
     
+    # ==================== SONG ANALYSIS ====================
+
+    @CacheService.cache_data(ttl=3600, key_prefix="song_analysis", show_spinner=False,
+                             tags=CacheService.read_tags('song_analysis'))
+    def get_song_analyses(_self) -> pd.DataFrame:
+        """Get precomputed song analyses (song_id, content_hash, analysis_version, analysis)"""
+        try:
+            response = _self.read_client('song_analysis').table('song_analysis').select(
+                'song_id, content_hash, analysis_version, analysis'
+            ).execute()
+            return table_normalizer.normalize('song_analysis', pd.DataFrame(response.data))
+        except Exception as e:
+            logger.error(f"Error fetching song analyses: {e}")
+            return pd.DataFrame()
+
+    def upsert_song_analyses(self, rows: List[Dict[str, Any]]) -> bool:
+        """Insert or replace precomputed analyses, one row per song_id"""
+        if not rows:
+            return True
+        try:
+            now = datetime.now().isoformat()
+            data = [{**row, "updated_at": now} for row in rows]
+            response = self.client.table('song_analysis').upsert(data, on_conflict='song_id').execute()
+            for row in response.data or []:
+                connection_manager.mirror_change('song_analysis', 'UPDATE', row)
+            CacheService.invalidate_tables('song_analysis')
+            return True
+        except Exception as e:
+            logger.error(f"Error saving song analyses: {e}")
+            return False
+
     # ==================== ANALYTICS ====================
     
-    def get_leaderboard(self) -> pd.DataFrame:
-        """Get current leaderboard with rankings"""
+    @CacheService.cache_data(ttl=600, key_prefix="leaderboard", show_spinner=False,
+                             tags=['evaluations', 'evaluations:all', 'songs', 'leaderboard_refresh_state'],
+                             live_ttl=LIVE_TTL)
+    def get_leaderboard(_self) -> pd.DataFrame:
+        """
+        Get per-song leaderboard aggregates (see services.leaderboard.LEADERBOARD_COLUMNS)
+
+        Reads the leaderboard_stats materialized view through the get_leaderboard
+        RPC (sql/08_leaderboard_view.sql); falls back to aggregating evaluations
+        in pandas when the RPC is not installed. The view is refreshed by a
+        scheduled job, so the read is also dropped when the change feed reports
+        a refresh (leaderboard_refresh_state).
+        """
         try:
-            # Complex query for leaderboard - might need raw SQL
-            query = """
-            SELECT 
-                s.title,
-                s.composer,
-                AVG(e.total_score) as avg_score,
-                COUNT(e.id) as judge_count,
-                STDDEV(e.total_score) as score_std
-            FROM songs s
-            LEFT JOIN evaluations e ON s.id = e.song_id
-            WHERE s.is_active = true
-            GROUP BY s.id, s.title, s.composer
-            ORDER BY avg_score DESC NULLS LAST
-            """
-            
-            response = self.client.rpc('execute_sql', {'query': query}).execute()
-            return pd.DataFrame(response.data)
+            response = _self.client.rpc('get_leaderboard').execute()
+            return typed_leaderboard(response.data or [])
         except Exception as e:
             logger.error(f"Error fetching leaderboard: {e}")
             # Fallback to simple query
-            return self._get_simple_leaderboard()
+            return _self._get_simple_leaderboard()
     
     def _get_simple_leaderboard(self) -> pd.DataFrame:
         """Fallback leaderboard calculation"""
-        evaluations = self.get_evaluations()
-        if evaluations.empty:
-            return pd.DataFrame()
-        
-        # Group by song and calculate averages
-        leaderboard = evaluations.groupby(['song_id']).agg({
-            'total_score': ['mean', 'std', 'count']
-        }).round(2)
-        
-        leaderboard.columns = ['avg_score', 'score_std', 'judge_count']
-        leaderboard = leaderboard.reset_index()
-        
-        # Add song details
-        songs = self.get_songs()
-        leaderboard = leaderboard.merge(
-            songs[['id', 'title', 'composer']], 
-            left_on='song_id', 
-            right_on='id', 
-            how='left'
-        )
-        
-        return leaderboard.sort_values('avg_score', ascending=False)
+        return compute_leaderboard(self.get_evaluations(), self.get_song_list())
 
 # Global instance
 db_service = DatabaseService()
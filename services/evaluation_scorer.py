@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+"""
+Evaluation Scorer - Vectorized weighted totals for rubric scores
+Turns the JSONB rubric_scores of many evaluations into one dense score matrix
+"""
+
+import hashlib
+import json
+import logging
+import threading
+from typing import Dict, List, Any
+
+import numpy as np
+import pandas as pd
+
+from services.cache_service import process_cache
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# evaluations.total_score is stored on a 25-point scale
+TOTAL_SCALE = 25
+
+# Same freshness as the cached evaluations the table is derived from
+RUBRIC_TABLE_TTL = 300
+
+
+class RubricWeights:
+    """Rubric keys with the per-point factor of each rubric, for one rubric version"""
+
+    def __init__(self, rubrics_df: pd.DataFrame):
+        if rubrics_df.empty:
+            self.keys: List[str] = []
+            self.max_scores = np.zeros(0)
+            self.weights = np.zeros(0)
+        else:
+            self.keys = rubrics_df['rubric_key'].astype(str).tolist()
+            self.max_scores = pd.to_numeric(rubrics_df['max_score'], errors='coerce').fillna(0).to_numpy(float)
+            self.weights = pd.to_numeric(rubrics_df['weight'], errors='coerce').fillna(0).to_numpy(float)
+
+        # score / max_score * weight/100 * 25 == score * factor
+        with np.errstate(divide='ignore', invalid='ignore'):
+            factors = (self.weights / 100) * TOTAL_SCALE / self.max_scores
+        self.factors = np.where(np.isfinite(factors), factors, 0.0)
+        self.index = {key: i for i, key in enumerate(self.keys)}
+        self.version = self.fingerprint(rubrics_df)
+
+    @staticmethod
+    def fingerprint(rubrics_df: pd.DataFrame) -> str:
+        """Stable hash of the columns that affect scoring"""
+        if rubrics_df.empty:
+            return "empty"
+        columns = [c for c in ('rubric_key', 'max_score', 'weight') if c in rubrics_df]
+        payload = rubrics_df[columns].astype(str).sort_values('rubric_key').to_csv(index=False)
+        return hashlib.md5(payload.encode()).hexdigest()
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+
+class EvaluationScorer:
+    """Computes totals, per-rubric means and completeness from matrix operations"""
+
+    def __init__(self):
+        """Initialize scorer with an empty rubric-version cache"""
+        self._weights: Dict[str, RubricWeights] = {}
+        self._lock = threading.Lock()
+
+    # ==================== RUBRIC WEIGHTS ====================
+
+    def get_weights(self, rubrics_df: pd.DataFrame) -> RubricWeights:
+        """Weight vector for this rubric version, built once and reused"""
+        version = RubricWeights.fingerprint(rubrics_df)
+        with self._lock:
+            weights = self._weights.get(version)
+            if weights is None:
+                weights = self._weights[version] = RubricWeights(rubrics_df)
+        return weights
+
+    # ==================== SCORE MATRIX ====================
+
+    @staticmethod
+    def parse_scores(scores: Any) -> Dict[str, Any]:
+        """rubric_scores arrives as JSON string or dict depending on the client"""
+        if isinstance(scores, dict):
+            return scores
+        if isinstance(scores, str) and scores:
+            try:
+                parsed = json.loads(scores)
+                return parsed if isinstance(parsed, dict) else {}
+            except ValueError:
+                return {}
+        return {}
+
+    def score_matrix(self, evaluations_df: pd.DataFrame, weights: RubricWeights) -> np.ndarray:
+        """Dense (evaluations x rubrics) float matrix; NaN where a rubric is unscored"""
+        if evaluations_df.empty or not len(weights) or 'rubric_scores' not in evaluations_df:
+            return np.full((len(evaluations_df), len(weights)), np.nan)
+
+        records = [self.parse_scores(scores) for scores in evaluations_df['rubric_scores'].tolist()]
+        matrix = pd.DataFrame.from_records(records, columns=weights.keys)
+        return matrix.apply(pd.to_numeric, errors='coerce').to_numpy(dtype=float)
+
+    # ==================== LONG RUBRIC-SCORE TABLE ====================
+
+    @staticmethod
+    def snapshot_fingerprint(evaluations_df: pd.DataFrame) -> str:
+        """Identifies an evaluations snapshot (every write bumps updated_at)"""
+        columns = [c for c in ('id', 'updated_at') if c in evaluations_df]
+        if 'updated_at' not in columns:
+            columns.append('rubric_scores')
+        hashed = pd.util.hash_pandas_object(evaluations_df[columns].astype(str), index=False)
+        return f"{len(evaluations_df)}_{int(hashed.sum()) & 0xFFFFFFFFFFFFFFFF:x}"
+
+    def rubric_score_table(self, evaluations_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Long table with one row per (evaluation, rubric) score
+
+        Columns: evaluation_id, song_id, judge_id (int32), rubric_key (category),
+        score (float32). Built once per evaluations snapshot and shared through
+        the process cache; treat the result as read-only.
+        """
+        if evaluations_df.empty or 'rubric_scores' not in evaluations_df:
+            return self._build_rubric_score_table(evaluations_df.iloc[0:0])
+
+        cache_key = f"rubric_score_table_{self.snapshot_fingerprint(evaluations_df)}"
+        table = process_cache.get_or_compute(
+            cache_key, RUBRIC_TABLE_TTL,
+            lambda: self._build_rubric_score_table(evaluations_df),
+            tags=['evaluations']
+        )
+        return table.copy(deep=False)
+
+    def _build_rubric_score_table(self, evaluations_df: pd.DataFrame) -> pd.DataFrame:
+        """Expand rubric_scores JSON into the long table with array operations"""
+        records = (
+            [self.parse_scores(scores) for scores in evaluations_df['rubric_scores'].tolist()]
+            if 'rubric_scores' in evaluations_df else []
+        )
+        wide = pd.DataFrame.from_records(records, index=pd.RangeIndex(len(records)))
+        values = wide.apply(pd.to_numeric, errors='coerce').to_numpy(dtype=float)
+        rows, cols = np.nonzero(~np.isnan(values)) if values.size else (np.zeros(0, int), np.zeros(0, int))
+
+        def id_column(name: str) -> np.ndarray:
+            if name not in evaluations_df:
+                return np.full(len(evaluations_df), -1, dtype='int32')
+            return pd.to_numeric(evaluations_df[name], errors='coerce').fillna(-1).to_numpy().astype('int32')
+
+        return pd.DataFrame({
+            'evaluation_id': id_column('id')[rows],
+            'song_id': id_column('song_id')[rows],
+            'judge_id': id_column('judge_id')[rows],
+            'rubric_key': pd.Categorical.from_codes(cols, categories=[str(c) for c in wide.columns]),
+            'score': values[rows, cols].astype('float32')
+        })
+
+    @staticmethod
+    def rubric_score_summary(table: pd.DataFrame, positive_only: bool = True) -> pd.DataFrame:
+        """Per-rubric avg/std/count/min/max from a (possibly filtered) rubric-score table"""
+        if positive_only:
+            table = table[table['score'] > 0]
+        if table.empty:
+            return pd.DataFrame(columns=['rubric_key', 'avg_score', 'score_std',
+                                         'total_scores', 'min_score', 'max_score'])
+
+        summary = table.groupby('rubric_key', observed=True)['score'].agg(
+            ['mean', 'std', 'count', 'min', 'max']
+        ).astype(float)
+        summary.columns = ['avg_score', 'score_std', 'total_scores', 'min_score', 'max_score']
+        summary['total_scores'] = summary['total_scores'].astype(int)
+        summary = summary.reset_index()
+        summary['rubric_key'] = summary['rubric_key'].astype(str)
+        return summary
+
+    # ==================== DERIVED METRICS ====================
+
+    @staticmethod
+    def totals(matrix: np.ndarray, weights: RubricWeights) -> np.ndarray:
+        """Weighted totals on the 25-point scale, unscored rubrics counting as 0"""
+        return np.nan_to_num(matrix, nan=0.0) @ weights.factors
+
+    @staticmethod
+    def completed_counts(matrix: np.ndarray) -> np.ndarray:
+        """Number of rubrics with a positive score per evaluation"""
+        return (np.nan_to_num(matrix, nan=0.0) > 0).sum(axis=1)
+
+    @staticmethod
+    def rubric_means(matrix: np.ndarray) -> np.ndarray:
+        """Mean score per rubric over the evaluations that scored it"""
+        if matrix.size == 0:
+            return np.full(matrix.shape[1], np.nan)
+        with np.errstate(invalid='ignore'):
+            scored = np.where(matrix > 0, matrix, np.nan)
+            counts = (~np.isnan(scored)).sum(axis=0)
+            sums = np.nansum(scored, axis=0)
+            return np.where(counts > 0, sums / np.maximum(counts, 1), np.nan)
+
+    def total_for(self, rubric_scores: Dict[str, Any], rubrics_df: pd.DataFrame) -> float:
+        """Weighted total of a single evaluation's rubric scores"""
+        weights = self.get_weights(rubrics_df)
+        vector = np.zeros(len(weights))
+        for key, score in rubric_scores.items():
+            i = weights.index.get(key)
+            if i is not None:
+                try:
+                    vector[i] = float(score or 0)
+                except (TypeError, ValueError):
+                    pass
+        return float(vector @ weights.factors)
+
+    def score_frame(self, evaluations_df: pd.DataFrame, rubrics_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        One row per evaluation with every rubric score as a column plus
+        computed_total, completed_rubrics and is_complete
+        """
+        weights = self.get_weights(rubrics_df)
+        matrix = self.score_matrix(evaluations_df, weights)
+
+        id_columns = [c for c in ('id', 'judge_id', 'song_id', 'total_score', 'is_final_submitted')
+                      if c in evaluations_df]
+        frame = evaluations_df[id_columns].reset_index(drop=True)
+        frame = pd.concat([frame, pd.DataFrame(matrix, columns=weights.keys)], axis=1)
+
+        completed = self.completed_counts(matrix)
+        frame['computed_total'] = self.totals(matrix, weights)
+        frame['completed_rubrics'] = completed
+        frame['is_complete'] = (completed == len(weights)) & (len(weights) > 0)
+        return frame
+
+
+# Global instance
+evaluation_scorer = EvaluationScorer()
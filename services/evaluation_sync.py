@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+"""
+Evaluation Sync - Incremental refresh of the evaluations table
+Keeps one evaluations frame per process and fetches only rows changed since the last sync
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Dict, Any, Optional
+
+import pandas as pd
+
+from services.cache_service import process_cache
+from services.table_schema import table_normalizer
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Evaluations with the joined judge and song rows, as DatabaseService.get_evaluations returns them
+EVALUATION_SELECT = '*, judge:judges(*), song:songs(*)'
+
+# Re-read rows this far behind the watermark: a write that commits late can carry an older updated_at
+SYNC_OVERLAP_SECONDS = float(os.environ.get('EVALUATION_SYNC_OVERLAP_SECONDS', 5))
+
+# Compare row ids with the server this often, to drop deleted rows and fetch any missed ones
+RECONCILE_SECONDS = float(os.environ.get('EVALUATION_RECONCILE_SECONDS', 600))
+
+# Marker entry in the process cache; bulk evaluation writes or judge/song changes drop it,
+# which makes the next sync a full reload (the joined judge/song columns may be stale)
+BASE_MARKER_KEY = 'evaluation_sync_base'
+BASE_MARKER_TAGS = ('evaluations', 'judges', 'songs')
+BASE_MARKER_TTL = 24 * 3600
+
+
+class EvaluationSync:
+    """
+    Process-wide evaluations frame kept fresh by delta queries
+
+    The first ``evaluations()`` call loads the whole table. Later calls only
+    select rows with ``updated_at`` at or after the newest one already held
+    (minus SYNC_OVERLAP_SECONDS) and replace those rows by id, so the cost
+    of staying fresh follows the number of changed rows rather than the
+    table size. Every RECONCILE_SECONDS the row ids are compared with the
+    server to drop deleted rows. Table-wide invalidations of evaluations,
+    judges or songs force a full reload. Merges build a new frame, so frames
+    already handed out (and cached) never change underneath their readers.
+
+    Row writes stamp ``updated_at`` on the server (sql/11_evaluations_sync.sql).
+    """
+
+    def __init__(self, client=None, overlap_seconds: float = SYNC_OVERLAP_SECONDS,
+                 reconcile_seconds: float = RECONCILE_SECONDS):
+        self._client = client
+        self.overlap_seconds = overlap_seconds
+        self.reconcile_seconds = reconcile_seconds
+        self._frame: Optional[pd.DataFrame] = None
+        self._watermark: Optional[pd.Timestamp] = None
+        self._reconciled_at = 0.0
+        self._lock = threading.Lock()
+        self.stats = {
+            'full_loads': 0,
+            'delta_syncs': 0,
+            'rows_fetched': 0,
+            'rows_deleted': 0,
+            'reconciles': 0
+        }
+
+    @property
+    def client(self):
+        if self._client is None:
+            from services.connection_service import connection_manager
+            return connection_manager.client
+        return self._client
+
+    # ==================== READS ====================
+
+    def evaluations(self, judge_id: int = None, song_id: int = None) -> pd.DataFrame:
+        """Current evaluations (optionally for one judge and/or song) after a sync"""
+        with self._lock:
+            self._sync()
+            frame = self._frame
+
+        if judge_id and 'judge_id' in frame:
+            frame = frame[frame['judge_id'] == judge_id]
+        if song_id and 'song_id' in frame:
+            frame = frame[frame['song_id'] == song_id]
+        return frame.reset_index(drop=True)
+
+    def reset(self):
+        """Forget the local frame; the next read is a full reload"""
+        with self._lock:
+            self._frame = None
+            self._watermark = None
+
+    # ==================== SYNC ====================
+
+    def _sync(self):
+        """Bring the frame up to date (caller holds the lock)"""
+        if self._frame is None or process_cache.get(BASE_MARKER_KEY, None) is None:
+            self._full_load()
+            return
+
+        try:
+            self._delta()
+            if time.time() - self._reconciled_at >= self.reconcile_seconds:
+                self._reconcile()
+        except Exception as e:
+            logger.warning(f"Evaluation delta sync failed, reloading: {e}")
+            self._full_load()
+
+    def _full_load(self):
+        response = self.client.table('evaluations').select(EVALUATION_SELECT).execute()
+        self._frame = self._ordered(table_normalizer.normalize('evaluations', pd.DataFrame(response.data or [])))
+        self._watermark = self._max_updated_at(self._frame)
+        self._reconciled_at = time.time()
+        process_cache.set(BASE_MARKER_KEY, True, BASE_MARKER_TTL, BASE_MARKER_TAGS)
+        self.stats['full_loads'] += 1
+        self.stats['rows_fetched'] += len(self._frame)
+
+    def _delta(self):
+        query = self.client.table('evaluations').select(EVALUATION_SELECT)
+        if self._watermark is not None:
+            since = self._watermark - pd.Timedelta(seconds=self.overlap_seconds)
+            query = query.gte('updated_at', since.isoformat())
+        changed = self._changed_rows(query.execute().data)
+        self.stats['delta_syncs'] += 1
+        self.stats['rows_fetched'] += len(changed)
+        self._merge(changed)
+
+    def _reconcile(self):
+        """Drop rows deleted on the server and fetch rows the watermark missed"""
+        response = self.client.table('evaluations').select('id').execute()
+        server_ids = {row['id'] for row in response.data or []}
+        local_ids = set(self._frame['id']) if 'id' in self._frame else set()
+
+        deleted = local_ids - server_ids
+        if deleted:
+            self._frame = self._frame[~self._frame['id'].isin(deleted)].reset_index(drop=True)
+            self.stats['rows_deleted'] += len(deleted)
+
+        missing = server_ids - local_ids
+        if missing:
+            response = (self.client.table('evaluations').select(EVALUATION_SELECT)
+                        .in_('id', sorted(missing)).execute())
+            changed = self._changed_rows(response.data)
+            self.stats['rows_fetched'] += len(changed)
+            self._merge(changed)
+
+        self._reconciled_at = time.time()
+        self.stats['reconciles'] += 1
+
+    @staticmethod
+    def _changed_rows(data) -> pd.DataFrame:
+        """Fetched rows in the frame's compact dtypes (not reported: a delta is not a cached table)"""
+        return table_normalizer.normalize('evaluations', pd.DataFrame(data or []), report=False)
+
+    def _merge(self, changed: pd.DataFrame):
+        """Replace rows by id with their fetched versions and advance the watermark"""
+        if changed.empty:
+            return
+        if self._frame.empty:
+            merged = changed
+        else:
+            kept = self._frame[~self._frame['id'].isin(changed['id'])]
+            merged = pd.concat([kept, changed], ignore_index=True)
+        self._frame = self._ordered(merged)
+
+        changed_max = self._max_updated_at(changed)
+        if changed_max is not None and (self._watermark is None or changed_max > self._watermark):
+            self._watermark = changed_max
+
+    @staticmethod
+    def _ordered(frame: pd.DataFrame) -> pd.DataFrame:
+        if frame.empty or 'id' not in frame:
+            return frame
+        return frame.sort_values('id', kind='stable').reset_index(drop=True)
+
+    @staticmethod
+    def _max_updated_at(frame: pd.DataFrame) -> Optional[pd.Timestamp]:
+        if frame.empty or 'updated_at' not in frame:
+            return None
+        latest = pd.to_datetime(frame['updated_at'], format='ISO8601', errors='coerce').max()
+        return None if pd.isna(latest) else latest
+
+    # ==================== MONITORING ====================
+
+    def sync_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self.stats)
+            stats['rows'] = 0 if self._frame is None else len(self._frame)
+            stats['watermark'] = None if self._watermark is None else self._watermark.isoformat()
+        return stats
+
+
+# Global instance
+evaluation_sync = EvaluationSync()
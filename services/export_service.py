@@ -13,6 +13,14 @@ import base64
 import zipfile
 import os
 import re
+import csv
+import json
+import hashlib
+import tempfile
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
 import logging
 
@@ -29,6 +37,61 @@ from reportlab.lib.utils import ImageReader
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Bump when the certificate layout changes, so stored certificates are re-rendered
+CERTIFICATE_VERSION = 2
+
+# Overlay the text on a pre-rendered background page (needs pymupdf)
+CERTIFICATE_TEMPLATED = os.environ.get('CERTIFICATE_TEMPLATED', 'TRUE').upper() == 'TRUE'
+
+# Rendered certificates by fingerprint, reused by incremental runs
+CERTIFICATE_CACHE_DIR = os.environ.get('CERTIFICATE_CACHE_DIR') or os.path.join(
+    tempfile.gettempdir(), 'lomba-certificates')
+
+# Temporary files of streamed exports
+EXPORT_DIR = os.environ.get('EXPORT_DIR') or os.path.join(tempfile.gettempdir(), 'lomba-exports')
+
+# Rows converted and written per chunk by the streamed exports
+EXPORT_CHUNK_ROWS = 5000
+
+# Below this many certificates to render, process start-up costs more than it saves
+MIN_POOL_JOBS = 8
+
+# Decoded banner/logo images, shared by every certificate rendered in this process
+_image_readers: Dict[str, Optional[ImageReader]] = {}
+_image_readers_lock = threading.Lock()
+
+
+def shared_image(path: str) -> Optional[ImageReader]:
+    """ImageReader for an asset, decoded once per process (None if missing)"""
+    if path not in _image_readers:
+        with _image_readers_lock:
+            if path not in _image_readers:
+                try:
+                    _image_readers[path] = ImageReader(path) if os.path.exists(path) else None
+                except Exception as e:
+                    logger.warning(f"Could not load image {path}: {e}")
+                    _image_readers[path] = None
+    return _image_readers[path]
+
+
+def _load_pymupdf():
+    """The pymupdf module (imported as fitz before 1.24), or None if not installed"""
+    try:
+        import pymupdf
+        return pymupdf
+    except ImportError:
+        try:
+            import fitz
+            return fitz
+        except ImportError:
+            return None
+
+
+def _render_in_worker(job: Dict[str, Any]) -> bytes:
+    """Render one certificate job (runs in a pool worker)"""
+    return export_service.render_certificate(job['name'], job['title'], job['rank'], job['is_winner'])
+
+
 class ExportService:
     """Centralized export service for all document generation"""
     
@@ -38,64 +101,179 @@ class ExportService:
         self.banner_path = f"{self.assets_path}/banner.png"
         self.logo_path = f"{self.assets_path}/logo.png"
         self.watermark_text = "GKI PERUMNAS"
+        self._backgrounds: Dict[bool, Any] = {}
+        self._background_lock = threading.Lock()
     
     # ==================== EXCEL EXPORTS ====================
     
-    @st.cache_data(show_spinner=False)
     def export_comprehensive_excel(_self) -> bytes:
         """Export comprehensive Excel report with all data"""
         try:
-            from services.database_service import db_service
-            from services.analytics_service import analytics_service
-            
-            buffer = io.BytesIO()
-            
-            with pd.ExcelWriter(buffer, engine='xlsxwriter') as writer:
-                # Get all data
-                evaluations_df = db_service.get_evaluations()
-                songs_df = db_service.get_songs()
-                judges_df = db_service.get_judges()
-                leaderboard_df = analytics_service.get_global_leaderboard()
-                judge_analytics_df = analytics_service.get_judge_analytics()
-                rubric_analytics_df = analytics_service.get_rubric_analytics()
-                
-                # Export raw evaluations
-                if not evaluations_df.empty:
-                    evaluations_df.to_excel(writer, sheet_name='Raw_Evaluations', index=False)
-                
-                # Export leaderboard
-                if not leaderboard_df.empty:
-                    leaderboard_df.to_excel(writer, sheet_name='Leaderboard', index=False)
-                
-                # Export judge analytics
-                if not judge_analytics_df.empty:
-                    judge_analytics_df.to_excel(writer, sheet_name='Judge_Analytics', index=False)
-                
-                # Export rubric analytics
-                if not rubric_analytics_df.empty:
-                    rubric_analytics_df.to_excel(writer, sheet_name='Rubric_Analytics', index=False)
-                
-                # Export songs list
-                if not songs_df.empty:
-                    songs_df.to_excel(writer, sheet_name='Songs', index=False)
-                
-                # Export judges list
-                if not judges_df.empty:
-                    judges_df.to_excel(writer, sheet_name='Judges', index=False)
-                
-                # Summary statistics
-                summary_data = _self._create_summary_statistics(
-                    evaluations_df, leaderboard_df, judge_analytics_df
-                )
-                summary_df = pd.DataFrame([summary_data])
-                summary_df.to_excel(writer, sheet_name='Summary', index=False)
-            
-            buffer.seek(0)
-            return buffer.getvalue()
-            
+            path = _self.export_comprehensive_file('xlsx')
         except Exception as e:
             logger.error(f"Error exporting Excel: {e}")
             return b""
+        try:
+            with open(path, 'rb') as f:
+                return f.read()
+        finally:
+            _self.discard_export_file(path)
+
+    def export_comprehensive_file(self, export_format: str = 'xlsx',
+                                  chunk_rows: int = EXPORT_CHUNK_ROWS) -> str:
+        """
+        Write the comprehensive report to a temporary file and return its path
+
+        Args:
+            export_format: 'xlsx' (one sheet per table), 'csv_zip' or
+                'parquet_zip' (one file per table in a ZIP)
+            chunk_rows: Rows converted and written per chunk
+
+        The workbook is written by xlsxwriter in constant_memory mode, so rows
+        are flushed to disk as they are written instead of being kept until
+        the workbook closes. Remove the file with ``discard_export_file``.
+        """
+        writers = {
+            'xlsx': self._write_excel_streaming,
+            'csv_zip': self._write_csv_zip,
+            'parquet_zip': self._write_parquet_zip,
+        }
+        if export_format not in writers:
+            raise ValueError(f"Unknown export format: {export_format}")
+
+        tables = self._comprehensive_tables()
+        os.makedirs(EXPORT_DIR, exist_ok=True)
+        extension = 'xlsx' if export_format == 'xlsx' else 'zip'
+        fd, path = tempfile.mkstemp(suffix=f".{extension}", prefix="lomba_export_", dir=EXPORT_DIR)
+        os.close(fd)
+        try:
+            writers[export_format](path, tables, chunk_rows)
+        except Exception:
+            self.discard_export_file(path)
+            raise
+        return path
+
+    @staticmethod
+    def discard_export_file(path: str):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def _comprehensive_tables(self) -> List[Tuple[str, pd.DataFrame]]:
+        """(sheet name, frame) pairs of the comprehensive report; empty tables are left out"""
+        from services.database_service import db_service
+        from services.analytics_service import analytics_service
+
+        # Get all data
+        evaluations_df = db_service.get_evaluations()
+        songs_df = db_service.get_songs()
+        judges_df = db_service.get_judges()
+        leaderboard_df = analytics_service.get_global_leaderboard()
+        judge_analytics_df = analytics_service.get_judge_analytics()
+        rubric_analytics_df = analytics_service.get_rubric_analytics()
+
+        tables = [
+            ('Raw_Evaluations', evaluations_df),
+            ('Leaderboard', leaderboard_df),
+            ('Judge_Analytics', judge_analytics_df),
+            ('Rubric_Analytics', rubric_analytics_df),
+            ('Songs', songs_df),
+            ('Judges', judges_df),
+        ]
+        tables = [(name, df) for name, df in tables if not df.empty]
+
+        # Summary statistics
+        summary_data = self._create_summary_statistics(
+            evaluations_df, leaderboard_df, judge_analytics_df
+        )
+        tables.append(('Summary', pd.DataFrame([summary_data])))
+        return tables
+
+    @staticmethod
+    def _export_value(value):
+        """Cell value xlsxwriter/CSV/Parquet can store (NaN -> None, JSON for nested values)"""
+        if value is None:
+            return None
+        if isinstance(value, (dict, list, tuple)):
+            return json.dumps(value, ensure_ascii=False, default=str)
+        if isinstance(value, np.generic):
+            value = value.item()
+        try:
+            if pd.isna(value):
+                return None
+        except (TypeError, ValueError):
+            pass
+        if isinstance(value, pd.Timestamp):
+            return value.to_pydatetime()
+        return value
+
+    def _export_chunks(self, df: pd.DataFrame, chunk_rows: int):
+        """Yield the frame as lists of converted row values, ``chunk_rows`` at a time"""
+        for start in range(0, len(df), chunk_rows):
+            chunk = df.iloc[start:start + chunk_rows].to_numpy(dtype=object)
+            yield [[self._export_value(value) for value in row] for row in chunk]
+
+    def _write_excel_streaming(self, path: str, tables: List[Tuple[str, pd.DataFrame]],
+                               chunk_rows: int):
+        import xlsxwriter
+
+        workbook = xlsxwriter.Workbook(path, {
+            'constant_memory': True,
+            'remove_timezone': True,
+            'default_date_format': 'yyyy-mm-dd hh:mm:ss',
+            'strings_to_urls': False,
+        })
+        try:
+            header_format = workbook.add_format({'bold': True})
+            for sheet_name, df in tables:
+                worksheet = workbook.add_worksheet(sheet_name)
+                # constant_memory flushes row by row, so rows must be written in order
+                worksheet.write_row(0, 0, [str(column) for column in df.columns], header_format)
+                row_index = 1
+                for rows in self._export_chunks(df, chunk_rows):
+                    for row in rows:
+                        worksheet.write_row(row_index, 0, row)
+                        row_index += 1
+        finally:
+            workbook.close()
+
+    def _write_csv_zip(self, path: str, tables: List[Tuple[str, pd.DataFrame]], chunk_rows: int):
+        with zipfile.ZipFile(path, 'w', compression=zipfile.ZIP_DEFLATED) as zip_file:
+            for sheet_name, df in tables:
+                with zip_file.open(f"{sheet_name}.csv", 'w') as raw:
+                    with io.TextIOWrapper(raw, encoding='utf-8-sig', newline='') as text:
+                        writer = csv.writer(text)
+                        writer.writerow([str(column) for column in df.columns])
+                        for rows in self._export_chunks(df, chunk_rows):
+                            writer.writerows(rows)
+
+    def _write_parquet_zip(self, path: str, tables: List[Tuple[str, pd.DataFrame]],
+                           chunk_rows: int):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        with zipfile.ZipFile(path, 'w', compression=zipfile.ZIP_STORED) as zip_file:
+            for sheet_name, df in tables:
+                fd, table_path = tempfile.mkstemp(suffix=".parquet", dir=EXPORT_DIR)
+                os.close(fd)
+                try:
+                    # Nested values (JSON columns) become strings so every column has one type
+                    flat = df.copy()
+                    for column in flat.columns[flat.dtypes == object]:
+                        values = [self._export_value(value) for value in flat[column]]
+                        if len({type(value) for value in values if value is not None}) > 1:
+                            values = [None if value is None else str(value) for value in values]
+                        flat[column] = values
+                    schema = pa.Schema.from_pandas(flat, preserve_index=False)
+                    with pq.ParquetWriter(table_path, schema) as writer:
+                        for start in range(0, len(flat), chunk_rows):
+                            writer.write_table(pa.Table.from_pandas(
+                                flat.iloc[start:start + chunk_rows], schema=schema, preserve_index=False
+                            ))
+                    zip_file.write(table_path, arcname=f"{sheet_name}.parquet")
+                finally:
+                    self.discard_export_file(table_path)
     
     def _create_summary_statistics(self, evaluations_df: pd.DataFrame, 
                                  leaderboard_df: pd.DataFrame, 
@@ -188,25 +366,91 @@ class ExportService:
                            is_winner: bool = False) -> bytes:
         """Generate individual certificate"""
         try:
-            buffer = io.BytesIO()
-            c = canvas.Canvas(buffer, pagesize=landscape(A4))
-            width, height = landscape(A4)
-            
-            # Draw certificate
-            _self._draw_certificate_content(c, width, height, name, song_title, rank, is_winner)
-            
-            c.save()
-            buffer.seek(0)
-            return buffer.getvalue()
-            
+            return _self.render_certificate(name, song_title, rank, is_winner)
         except Exception as e:
             logger.error(f"Error generating certificate for {name}: {e}")
             return b""
+
+    def render_certificate(self, name: str, song_title: str, rank: int = None,
+                           is_winner: bool = False, templated: bool = None) -> bytes:
+        """
+        Certificate PDF bytes (uncached; raises on failure)
+
+        With ``templated`` (default CERTIFICATE_TEMPLATED, when pymupdf is
+        installed) only the text is drawn; it is overlaid on a background page
+        rendered once per winner/participant variant. Otherwise the whole page
+        is drawn with reportlab.
+        """
+        if templated is None:
+            templated = CERTIFICATE_TEMPLATED
+        if templated and _load_pymupdf() is not None:
+            return self._render_templated(name, song_title, rank, is_winner)
+        return self._render_direct(name, song_title, rank, is_winner)
+
+    def _render_direct(self, name: str, song_title: str, rank: int = None,
+                       is_winner: bool = False) -> bytes:
+        """Whole certificate drawn with reportlab"""
+        buffer = io.BytesIO()
+        c = canvas.Canvas(buffer, pagesize=landscape(A4))
+        width, height = landscape(A4)
+
+        # Draw certificate
+        self._draw_certificate_content(c, width, height, name, song_title, rank, is_winner)
+
+        c.save()
+        return buffer.getvalue()
     
+    def _render_templated(self, name: str, song_title: str, rank: int = None,
+                          is_winner: bool = False) -> bytes:
+        """Text-only reportlab page overlaid on the cached background page"""
+        pymupdf = _load_pymupdf()
+        with pymupdf.open() as doc:
+            self._add_templated_page(doc, name, song_title, rank, is_winner)
+            return doc.tobytes(garbage=3, deflate=True)
+
+    def _add_templated_page(self, doc, name: str, song_title: str, rank: int = None,
+                            is_winner: bool = False):
+        """Append a certificate page to a pymupdf document; its pages share one background per variant"""
+        pymupdf = _load_pymupdf()
+        width, height = landscape(A4)
+
+        buffer = io.BytesIO()
+        c = canvas.Canvas(buffer, pagesize=(width, height))
+        self._draw_certificate_text(c, width, height, name, song_title, rank, is_winner)
+        c.save()
+
+        background = self._certificate_background(is_winner)
+        # pymupdf documents are not thread-safe; the background is shared
+        with self._background_lock:
+            with pymupdf.open("pdf", buffer.getvalue()) as overlay:
+                page = doc.new_page(width=width, height=height)
+                page.show_pdf_page(page.rect, background, 0)
+                page.show_pdf_page(page.rect, overlay, 0)
+
+    def _certificate_background(self, is_winner: bool):
+        """Static layer (watermark, header, labels) as a pymupdf document, built once per variant"""
+        if is_winner not in self._backgrounds:
+            with self._background_lock:
+                if is_winner not in self._backgrounds:
+                    pymupdf = _load_pymupdf()
+                    width, height = landscape(A4)
+                    buffer = io.BytesIO()
+                    c = canvas.Canvas(buffer, pagesize=(width, height))
+                    self._draw_certificate_background(c, width, height, is_winner)
+                    c.save()
+                    self._backgrounds[is_winner] = pymupdf.open("pdf", buffer.getvalue())
+        return self._backgrounds[is_winner]
+
     def _draw_certificate_content(self, canvas_obj, width: float, height: float, 
                                 name: str, song_title: str, rank: int = None, 
                                 is_winner: bool = False):
         """Draw certificate content on canvas"""
+        self._draw_certificate_background(canvas_obj, width, height, is_winner)
+        self._draw_certificate_text(canvas_obj, width, height, name, song_title, rank, is_winner)
+
+    def _draw_certificate_background(self, canvas_obj, width: float, height: float,
+                                     is_winner: bool):
+        """Draw the parts shared by every certificate of a variant"""
         # Background and watermark
         self._draw_watermark(canvas_obj, width, height)
         
@@ -217,7 +461,20 @@ class ExportService:
         canvas_obj.setFillColor(colors.black)
         canvas_obj.setFont("Helvetica", 12)
         canvas_obj.drawCentredString(width/2, height/2 + 60, "Diberikan kepada")
-        
+
+        # Footer
+        canvas_obj.setFont("Helvetica", 10)
+        canvas_obj.line(60, 120, 260, 120)
+        canvas_obj.drawString(60, 125, "Panitia")
+        canvas_obj.line(width-260, 120, width-60, 120)
+        canvas_obj.drawRightString(width-60, 125, "Ketua Panitia")
+
+    def _draw_certificate_text(self, canvas_obj, width: float, height: float,
+                               name: str, song_title: str, rank: int = None,
+                               is_winner: bool = False):
+        """Draw the per-certificate text (name, award, song title, issue date)"""
+        canvas_obj.setFillColor(colors.black)
+
         # Name (large, bold)
         self._fit_centered_text(canvas_obj, name or "(Nama)", y=height/2 + 20, 
                               max_width=width-180, font="Helvetica-Bold", 
@@ -245,12 +502,9 @@ class ExportService:
                                   font="Helvetica-Oblique", start_size=12, min_size=10)
         
         # Footer
+        canvas_obj.setFillColor(colors.black)
         canvas_obj.setFont("Helvetica", 10)
         canvas_obj.drawString(60, 80, datetime.now().strftime("Diterbitkan: %d %B %Y"))
-        canvas_obj.line(60, 120, 260, 120)
-        canvas_obj.drawString(60, 125, "Panitia")
-        canvas_obj.line(width-260, 120, width-60, 120)
-        canvas_obj.drawRightString(width-60, 125, "Ketua Panitia")
     
     def _draw_watermark(self, canvas_obj, width: float, height: float):
         """Draw watermark on certificate"""
@@ -268,11 +522,12 @@ class ExportService:
     
     def _draw_header(self, canvas_obj, width: float, height: float, is_winner: bool):
         """Draw header with banner and logo"""
-        # Try to load and draw banner
+        # Try to draw banner (decoded once per process)
         try:
-            if os.path.exists(self.banner_path):
+            banner = shared_image(self.banner_path)
+            if banner is not None:
                 banner_height = 150
-                canvas_obj.drawImage(self.banner_path, 0, height-banner_height, 
+                canvas_obj.drawImage(banner, 0, height-banner_height, 
                                    width=width, height=banner_height, 
                                    preserveAspectRatio=True, mask='auto')
             else:
@@ -286,8 +541,9 @@ class ExportService:
         
         # Try to draw logo
         try:
-            if os.path.exists(self.logo_path):
-                canvas_obj.drawImage(self.logo_path, 40, height-100, 
+            logo = shared_image(self.logo_path)
+            if logo is not None:
+                canvas_obj.drawImage(logo, 40, height-100, 
                                    width=90, height=90, 
                                    preserveAspectRatio=True, mask='auto')
         except Exception:
@@ -319,49 +575,165 @@ class ExportService:
     
     # ==================== BATCH OPERATIONS ====================
     
-    @st.cache_data(show_spinner=False)
-    def generate_all_certificates(_self) -> bytes:
-        """Generate certificates for all participants and winners"""
+    def generate_all_certificates_file(self, incremental: bool = True,
+                                       max_workers: Optional[int] = None) -> str:
+        """
+        Write certificates for all participants and winners as one ZIP and return its path
+
+        Certificates are rendered across a process pool and written into the
+        ZIP as they complete. With ``incremental``, a certificate whose name,
+        title and rank match an earlier run is reused from CERTIFICATE_CACHE_DIR
+        (keeping that run's issue date) instead of being re-rendered, so the
+        ZIP itself is not cached. Remove the file with ``discard_export_file``.
+        """
+        jobs = self.certificate_jobs()
+        os.makedirs(CERTIFICATE_CACHE_DIR, exist_ok=True)
+
+        reused, stale = [], []
+        for job in jobs:
+            if incremental and os.path.exists(self._certificate_path(job)):
+                reused.append(job)
+            else:
+                stale.append(job)
+
+        os.makedirs(EXPORT_DIR, exist_ok=True)
+        fd, path = tempfile.mkstemp(suffix=".zip", prefix="lomba_certificates_", dir=EXPORT_DIR)
+        os.close(fd)
         try:
-            from services.database_service import db_service
-            from services.analytics_service import analytics_service
-            
-            # Get data
-            songs_df = db_service.get_songs()
-            leaderboard_df = analytics_service.get_global_leaderboard()
-            
-            # Determine winners (top 3)
-            winners = {}
-            if not leaderboard_df.empty:
-                for i, row in leaderboard_df.head(3).iterrows():
-                    winners[row['title']] = i + 1
-            
-            # Create ZIP file
-            zip_buffer = io.BytesIO()
-            
-            with zipfile.ZipFile(zip_buffer, 'w', compression=zipfile.ZIP_DEFLATED) as zip_file:
-                for _, song in songs_df.iterrows():
-                    title = song['title']
-                    composer = song['composer'] or "Peserta"
-                    rank = winners.get(title)
-                    is_winner = rank is not None
-                    
-                    # Generate certificate
-                    cert_bytes = _self.generate_certificate(composer, title, rank, is_winner)
-                    
-                    # Create safe filename
-                    safe_composer = re.sub(r"[^A-Za-z0-9 _-]+", "", composer)[:60] or "Peserta"
-                    safe_title = re.sub(r"[^A-Za-z0-9 _-]+", "", title)[:60] or "Lagu"
-                    filename = f"certificate/{safe_composer} - {safe_title}.pdf"
-                    
-                    zip_file.writestr(filename, cert_bytes)
-            
-            zip_buffer.seek(0)
-            return zip_buffer.getvalue()
-            
+            with zipfile.ZipFile(path, 'w', compression=zipfile.ZIP_DEFLATED) as zip_file:
+                for job in reused:
+                    zip_file.write(self._certificate_path(job), arcname=job['filename'])
+                for job, cert_bytes in self._render_batch(stale, max_workers):
+                    zip_file.writestr(job['filename'], cert_bytes)
+                    self._store_certificate(job, cert_bytes)
         except Exception as e:
             logger.error(f"Error generating all certificates: {e}")
-            return b""
+            self.discard_export_file(path)
+            raise
+
+        logger.info(f"Certificates: {len(reused)} reused, {len(stale)} rendered")
+        return path
+
+    def generate_merged_certificates_file(self) -> str:
+        """
+        Write every certificate as one page of a single PDF and return its path
+
+        Each page carries a bookmark. The background of each variant is stored
+        once and shared by its pages, so the file is a fraction of the size of
+        the ZIP, where every PDF embeds the banner and logo. Needs pymupdf.
+        Remove the file with ``discard_export_file``.
+        """
+        pymupdf = _load_pymupdf()
+        if pymupdf is None:
+            raise RuntimeError("Merged certificates need pymupdf")
+        jobs = self.certificate_jobs()
+        if not jobs:
+            raise ValueError("No songs to issue certificates for")
+
+        os.makedirs(EXPORT_DIR, exist_ok=True)
+        fd, path = tempfile.mkstemp(suffix=".pdf", prefix="lomba_certificates_", dir=EXPORT_DIR)
+        os.close(fd)
+        try:
+            with pymupdf.open() as doc:
+                toc = []
+                for job in jobs:
+                    self._add_templated_page(doc, job['name'], job['title'], job['rank'], job['is_winner'])
+                    toc.append([1, f"{job['name']} - {job['title']}", doc.page_count])
+                doc.set_toc(toc)
+                doc.save(path, garbage=3, deflate=True)
+        except Exception as e:
+            logger.error(f"Error generating merged certificates: {e}")
+            self.discard_export_file(path)
+            raise
+
+        logger.info(f"Certificates: {len(jobs)} pages merged")
+        return path
+
+    def certificate_jobs(self) -> List[Dict[str, Any]]:
+        """One job (filename, name, title, rank, is_winner, fingerprint) per song"""
+        from services.database_service import db_service
+        from services.analytics_service import analytics_service
+
+        # Get data
+        songs_df = db_service.get_song_list()
+        leaderboard_df = analytics_service.get_global_leaderboard()
+
+        # Determine winners (top 3)
+        winners = {}
+        if not leaderboard_df.empty:
+            for i, row in leaderboard_df.head(3).iterrows():
+                winners[row['title']] = i + 1
+
+        jobs = []
+        for _, song in songs_df.iterrows():
+            title = song['title']
+            composer = song['composer'] or "Peserta"
+            rank = winners.get(title)
+            rank = int(rank) if rank is not None else None
+
+            # Create safe filename
+            safe_composer = re.sub(r"[^A-Za-z0-9 _-]+", "", composer)[:60] or "Peserta"
+            safe_title = re.sub(r"[^A-Za-z0-9 _-]+", "", title)[:60] or "Lagu"
+            payload = "\0".join([str(CERTIFICATE_VERSION), composer, title, str(rank)])
+            jobs.append({
+                'filename': f"certificate/{safe_composer} - {safe_title}.pdf",
+                'name': composer,
+                'title': title,
+                'rank': rank,
+                'is_winner': rank is not None,
+                'fingerprint': hashlib.sha256(payload.encode('utf-8')).hexdigest()
+            })
+        return jobs
+
+    def _render_batch(self, jobs: List[Dict[str, Any]], max_workers: Optional[int]):
+        """Yield (job, pdf bytes) as certificates finish; failed jobs are logged and skipped"""
+        workers = max_workers or min(os.cpu_count() or 1, len(jobs))
+        finished = set()
+
+        if workers > 1 and len(jobs) >= MIN_POOL_JOBS:
+            try:
+                # spawn: the app process runs background threads, which fork does not copy safely
+                with ProcessPoolExecutor(max_workers=workers,
+                                         mp_context=multiprocessing.get_context('spawn')) as pool:
+                    futures = {pool.submit(_render_in_worker, job): index
+                               for index, job in enumerate(jobs)}
+                    for future in as_completed(futures):
+                        index = futures[future]
+                        try:
+                            cert_bytes = future.result()
+                        except Exception as e:
+                            # A broken pool fails every remaining future; those are retried below
+                            if isinstance(e, BrokenProcessPool):
+                                raise
+                            logger.error(f"Error generating certificate for {jobs[index]['name']}: {e}")
+                            finished.add(index)
+                            continue
+                        finished.add(index)
+                        yield jobs[index], cert_bytes
+                return
+            except Exception as e:
+                logger.warning(f"Process pool unavailable, rendering in-process: {e}")
+
+        for index, job in enumerate(jobs):
+            if index in finished:
+                continue
+            try:
+                yield job, _render_in_worker(job)
+            except Exception as e:
+                logger.error(f"Error generating certificate for {job['name']}: {e}")
+
+    def _certificate_path(self, job: Dict[str, Any]) -> str:
+        return os.path.join(CERTIFICATE_CACHE_DIR, f"{job['fingerprint']}.pdf")
+
+    def _store_certificate(self, job: Dict[str, Any], cert_bytes: bytes):
+        path = self._certificate_path(job)
+        try:
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(cert_bytes)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not store certificate {job['filename']}: {e}")
 
 # Global instance
 export_service = ExportService()
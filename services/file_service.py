@@ -6,14 +6,19 @@ Supports both Supabase Storage and legacy Google Drive
 
 import streamlit as st
 import pandas as pd
-from typing import Dict, List, Optional, Any, Tuple, Union
+from typing import Dict, List, Optional, Any, Tuple, Union, Callable, IO
 import os
 import io
 import base64
 import mimetypes
 import logging
+import tempfile
+import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+from services.connection_service import connection_manager
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -23,18 +28,17 @@ class FileService:
     
     def __init__(self):
         """Initialize file service"""
-        self.supabase_url = st.secrets.get("supabase_url")
-        self.supabase_key = st.secrets.get("supabase_anon_key")
+        self.supabase_url = connection_manager.supabase_url
+        self.supabase_key = connection_manager.supabase_key
         self.storage_bucket = "song-contest-files"
         self._client = None
         
     @property
     def client(self):
-        """Lazy initialization of Supabase client"""
+        """Shared Supabase client from the connection manager"""
         if self._client is None:
             try:
-                from supabase import create_client
-                self._client = create_client(self.supabase_url, self.supabase_key)
+                self._client = connection_manager.supabase_client
             except Exception as e:
                 logger.error(f"Failed to initialize Supabase client: {e}")
                 st.error("File service connection failed. Please check configuration.")
@@ -129,6 +133,66 @@ class FileService:
             logger.error(f"Error getting public URL for {file_id}: {e}")
             return None
     
+    def bundle_public_files(self, files: List[Tuple[str, str]], bucket: str = None,
+                            max_workers: int = 8,
+                            on_progress: Callable[[int, int, Dict[str, Any]], None] = None
+                            ) -> Tuple[IO[bytes], List[Dict[str, Any]]]:
+        """
+        ZIP of public storage objects, downloaded concurrently
+
+        Args:
+            files: (storage path, name in the ZIP) pairs
+            bucket: Storage bucket (defaults to the service bucket)
+            max_workers: Concurrent downloads (bounded by the connection pool)
+            on_progress: Called as (done, total, result) after each file
+
+        Returns:
+            The ZIP as a read-only temporary file positioned at 0 (removed
+            once closed), and one result dict (path, name, ok, error) per file
+            in the order of ``files``
+        """
+        bucket = bucket or self.storage_bucket
+        workers = max(1, min(max_workers, connection_manager.pool_size, len(files) or 1))
+        results: List[Dict[str, Any]] = [
+            {'path': path, 'name': name, 'ok': False, 'error': None} for path, name in files
+        ]
+        fd, archive_path = tempfile.mkstemp(suffix=".zip", prefix="lomba_bundle_")
+        os.close(fd)
+
+        try:
+            # Workers stream each object to the local cache; only this thread writes the ZIP
+            with ThreadPoolExecutor(max_workers=workers) as executor, \
+                    zipfile.ZipFile(archive_path, 'w', compression=zipfile.ZIP_DEFLATED) as zip_file:
+                futures = {
+                    executor.submit(connection_manager.download_public_cached, bucket, path): index
+                    for index, (path, _) in enumerate(files)
+                }
+                for done, future in enumerate(as_completed(futures), start=1):
+                    result = results[futures[future]]
+                    try:
+                        local_path = future.result()
+                        if local_path is None:
+                            result['error'] = 'not found'
+                        else:
+                            zip_file.write(local_path, arcname=result['name'])
+                            result['ok'] = True
+                    except Exception as e:
+                        logger.error(f"Error downloading {result['path']}: {e}")
+                        result['error'] = str(e)
+                    if on_progress:
+                        on_progress(done, len(files), result)
+        except Exception:
+            os.remove(archive_path)
+            raise
+
+        # A plain file object st.download_button accepts; unlinked, it goes away once closed
+        archive = open(archive_path, 'rb')
+        try:
+            os.remove(archive_path)
+        except OSError:
+            pass
+        return archive, results
+
     # ==================== LEGACY SUPPORT ====================
     
     def migrate_from_local(self, local_path: str, file_type: str = None) -> Optional[str]:
@@ -205,8 +269,11 @@ class FileService:
             # Skip database deletion since file_metadata table doesn't exist
             logger.info(f"File metadata deletion skipped for {file_id} - table not available")
 
-            # Clear cache
-            st.cache_data.clear()
+            # Clear cached file content/URLs only
+            FileService.get_file_content.clear()
+            FileService.get_file_url.clear()
+            from services.cache_service import CacheService
+            CacheService.invalidate_cache('file_')
 
             return True
             
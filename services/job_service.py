@@ -0,0 +1,258 @@
+# -*- coding: utf-8 -*-
+"""
+Job Service - Background runner for heavy reports and exports
+Runs report/export builds off the Streamlit script thread and caches their artifacts
+"""
+
+import hashlib
+import logging
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Dict, List, Any, Optional, Callable, Iterable
+
+from services.cache_service import CacheService, process_cache
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Tables every contest report reads; a write to any of them drops the cached artifacts
+REPORT_TABLES = ('songs', 'evaluations', 'rubrics', 'judges', 'configuration')
+
+# Table and unfiltered-read tags, so both table writes and row writes (invalidate_rows) apply
+REPORT_TAGS = tuple(tag for table in REPORT_TABLES for tag in CacheService.read_tags(table))
+
+# Finished artifacts stay cached this long unless a tagged table changes first
+JOB_RESULT_TTL = 3600
+
+# Finished job records kept for status polling
+MAX_FINISHED_JOBS = 100
+
+QUEUED, RUNNING, DONE, FAILED, CANCELLED = 'queued', 'running', 'done', 'failed', 'cancelled'
+
+
+class Job:
+    """
+    One submitted build
+
+    Once the status is 'done' the artifact is read with ``JobRunner.result``:
+    it lives in the process cache under ``cache_key``, and ``result`` only
+    holds it when it could not be cached or the job was submitted uncached
+    (file results).
+    """
+
+    def __init__(self, kind: str, fingerprint: str):
+        self.id = uuid.uuid4().hex[:12]
+        self.kind = kind
+        self.fingerprint = fingerprint
+        self.cache_key = f"job_result_{fingerprint}"
+        self.status = QUEUED
+        self.submitted_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self.cached = False
+        self.cleanup: Optional[Callable[[Any], None]] = None
+        self.future: Optional[Future] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (DONE, FAILED, CANCELLED)
+
+    @property
+    def elapsed_seconds(self) -> float:
+        if self.started_at is None:
+            return 0.0
+        return (self.finished_at or time.time()) - self.started_at
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            'id': self.id,
+            'kind': self.kind,
+            'status': self.status,
+            'cached': self.cached,
+            'elapsed_seconds': round(self.elapsed_seconds, 2),
+            'error': self.error
+        }
+
+
+class JobRunner:
+    """
+    Process-wide background job runner
+
+    ``submit`` fingerprints the job kind and its arguments. A finished
+    artifact with that fingerprint is served from the process cache (tagged
+    with the tables the report reads, so writes to them drop it), and a
+    queued or running job with the same fingerprint is shared instead of
+    starting a second build. Queued jobs can be cancelled; a running job
+    cannot be interrupted, but a cancelled one discards its result.
+
+    Builds that return a temporary file path are submitted with
+    ``cache=False`` and a ``cleanup``: the path stays on the job until it is
+    discarded after download, or pruned once older than ``result_ttl``.
+    """
+
+    def __init__(self, max_workers: int = 2, result_ttl: float = JOB_RESULT_TTL):
+        self.max_workers = max_workers
+        self.result_ttl = result_ttl
+        self._jobs: Dict[str, Job] = {}
+        self._active: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def _pool(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                thread_name_prefix="report-job")
+        return self._executor
+
+    @staticmethod
+    def fingerprint(kind: str, args: tuple, kwargs: Dict[str, Any]) -> str:
+        payload = repr((kind, args, sorted(kwargs.items())))
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    # ==================== SUBMISSION ====================
+
+    def submit(self, kind: str, func: Callable[..., Any], *args,
+               tags: Iterable[str] = REPORT_TAGS, cache: bool = True,
+               cleanup: Optional[Callable[[Any], None]] = None, **kwargs) -> str:
+        """Start (or join) the build of ``func(*args, **kwargs)`` and return its job id"""
+        fingerprint = self.fingerprint(kind, args, kwargs)
+        tags = tuple(tags)
+
+        with self._lock:
+            active_id = self._active.get(fingerprint)
+            if active_id is not None:
+                return active_id
+
+            job = Job(kind, fingerprint)
+            job.cleanup = cleanup
+            self._jobs[job.id] = job
+
+            if cache and process_cache.get(job.cache_key, None) is not None:
+                process_cache.record_hit()
+                job.status, job.cached = DONE, True
+                job.started_at = job.finished_at = time.time()
+                self._prune()
+                return job.id
+
+            process_cache.record_miss()
+            self._active[fingerprint] = job.id
+            # Writes from here on may not be in the artifact, which is then not cached
+            started = process_cache.generation(tags)
+            job.future = self._pool().submit(self._run, job, tags if cache else None, started,
+                                             func, args, kwargs)
+            self._prune()
+            return job.id
+
+    def _run(self, job: Job, tags: Optional[tuple], started: int, func: Callable[..., Any],
+             args: tuple, kwargs: Dict[str, Any]):
+        with self._lock:
+            if job.status == CANCELLED:
+                return
+            job.status, job.started_at = RUNNING, time.time()
+
+        try:
+            result = func(*args, **kwargs)
+            error = None
+        except Exception as e:
+            logger.error(f"Job {job.kind} ({job.id}) failed: {e}")
+            result, error = None, str(e)
+
+        with self._lock:
+            if self._active.get(job.fingerprint) == job.id:
+                del self._active[job.fingerprint]
+            job.finished_at = time.time()
+            if job.status == CANCELLED:
+                self._cleanup(job, result)
+                return
+            if error is not None:
+                job.status, job.error = FAILED, error
+                return
+            # Only an artifact that missed a write (or is not cached at all) is kept on the job
+            if tags is None or not process_cache.set_if_current(
+                    job.cache_key, result, self.result_ttl, tags, started):
+                job.result = result
+            job.status = DONE
+
+        logger.info(f"Job {job.kind} ({job.id}) finished in {job.elapsed_seconds:.1f}s")
+
+    # ==================== STATUS ====================
+
+    def get(self, job_id: Optional[str]) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id) if job_id else None
+
+    def result(self, job: Job) -> Any:
+        """Artifact of a finished job, or None once it was dropped from the cache"""
+        if job.result is not None:
+            return job.result
+        return process_cache.get(job.cache_key, None)
+
+    def cancel(self, job_id: str) -> bool:
+        """Cancel a queued or running job; False if it already finished"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.finished:
+                return False
+            if job.future is not None:
+                job.future.cancel()
+            job.status, job.finished_at = CANCELLED, time.time()
+            if self._active.get(job.fingerprint) == job.id:
+                del self._active[job.fingerprint]
+            return True
+
+    def discard(self, job_id: str):
+        """Forget a finished job and clean up its result (e.g. once it was downloaded)"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or not job.finished:
+                return
+            del self._jobs[job_id]
+            self._cleanup(job, job.result)
+
+    def jobs(self, kind: str = None) -> List[Dict[str, Any]]:
+        """Summaries of known jobs, newest first"""
+        with self._lock:
+            jobs = [job for job in self._jobs.values() if kind is None or job.kind == kind]
+        jobs.sort(key=lambda job: job.submitted_at, reverse=True)
+        return [job.summary() for job in jobs]
+
+    def _prune(self):
+        """
+        Forget the oldest finished jobs above MAX_FINISHED_JOBS, and uncached
+        results older than result_ttl (caller holds the lock)
+        """
+        finished = [job for job in self._jobs.values() if job.finished]
+        finished.sort(key=lambda job: job.finished_at or job.submitted_at)
+        expired = time.time() - self.result_ttl
+        for index, job in enumerate(finished):
+            over_limit = index < len(finished) - MAX_FINISHED_JOBS
+            if over_limit or (job.cleanup is not None and (job.finished_at or 0) < expired):
+                del self._jobs[job.id]
+                self._cleanup(job, job.result)
+
+    @staticmethod
+    def _cleanup(job: Job, result: Any):
+        if job.cleanup is None or result is None:
+            return
+        try:
+            job.cleanup(result)
+        except Exception as e:
+            logger.warning(f"Could not clean up job {job.kind} ({job.id}): {e}")
+
+
+def remove_file(path: str):
+    """Cleanup for jobs whose result is a temporary file path"""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+# Global instance
+job_runner = JobRunner()
@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+"""
+Keyword Matcher - Compiled multi-term matcher for lyrics analysis
+Finds every theme keyword, phrase, imagery word and cliché in one pass over the text
+"""
+
+import re
+import logging
+from collections import Counter, defaultdict
+from typing import Callable, Dict, List, Iterable, Tuple, Union
+
+import numpy as np
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Match modes, named after the per-term scans they replace
+SUBSTRING = "substring"      # text.count(term) / term in text
+WORD_PREFIX = "word_prefix"  # re.findall(rf"\b{term}\w*\b", text)
+
+Term = Union[str, Tuple[str, float]]
+
+
+def _self_overlaps(term: str) -> bool:
+    """Whether two occurrences of the term can overlap (a proper prefix is also a suffix)"""
+    return any(term[:k] == term[-k:] for k in range(1, len(term)))
+
+
+def _trie_regex(node: Dict[str, dict]) -> str:
+    branches = [re.escape(char) + _trie_regex(child) for char, child in sorted(node.items()) if char]
+    if "" in node:
+        return f"(?:{'|'.join(branches)})?" if branches else ""
+    return branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+
+
+class KeywordHits:
+    """Per-term hit counts of one text, aggregated by group on demand"""
+
+    def __init__(self, matcher: "KeywordMatcher", counts: np.ndarray):
+        self._matcher = matcher
+        self.counts = counts
+
+    def count(self, group: str) -> int:
+        """Total hits of all terms in the group (like summing text.count)"""
+        return int(self.counts[self._matcher.group_index(group)].sum())
+
+    def distinct(self, group: str) -> int:
+        """Number of terms in the group that occur at least once"""
+        return int((self.counts[self._matcher.group_index(group)] > 0).sum())
+
+    def found(self, group: str) -> bool:
+        """Whether any term of the group occurs"""
+        return self.distinct(group) > 0
+
+    def weighted(self, group: str) -> float:
+        """Sum of hits times term weight"""
+        index = self._matcher.group_index(group)
+        return float(self.counts[index] @ self._matcher.weights[index])
+
+    def terms(self, group: str) -> Dict[str, int]:
+        """Hit count per term of the group, for terms that occur"""
+        return {
+            self._matcher.terms[i]: int(self.counts[i])
+            for i in self._matcher.group_index(group) if self.counts[i] > 0
+        }
+
+
+class KeywordMatcher:
+    """
+    Set of term groups compiled into two combined alternation regexes
+
+    The substring regex is a lookahead tried at every position and the
+    word-prefix regex is anchored at word starts. Both are prefix tries that
+    prefer the longest term, so each hit reports the longest term there and
+    also credits the shorter terms it starts with. Hits are tallied with findall + Counter, which keeps
+    the per-text work in C. The rare terms whose own hits can overlap (or that
+    do not end on a word character) keep their original scan, so counts are
+    exactly those of the scans this replaces. Build once per term set and
+    reuse; matching expects text that is already lowercase.
+    """
+
+    def __init__(self):
+        self.terms: List[str] = []
+        self.groups: List[str] = []
+        self.modes: List[str] = []
+        self._weights: List[float] = []
+        self.weights = np.zeros(0)
+        self._group_index: Dict[str, np.ndarray] = {}
+        self._compiled = False
+
+    def add(self, group: str, terms: Iterable[Term], mode: str = SUBSTRING) -> "KeywordMatcher":
+        """Add terms (plain or (term, weight) tuples) to a group"""
+        if mode not in (SUBSTRING, WORD_PREFIX):
+            raise ValueError(f"Unknown match mode: {mode}")
+        for term in terms:
+            text, weight = term if isinstance(term, tuple) else (term, 1.0)
+            text = str(text or "").lower()
+            if not text:
+                continue
+            self.terms.append(text)
+            self.groups.append(group)
+            self.modes.append(mode)
+            self._weights.append(float(weight or 0))
+        self._compiled = False
+        return self
+
+    def compile(self) -> "KeywordMatcher":
+        """Build the combined regexes and the term -> credited entries tables"""
+        self.weights = np.array(self._weights, dtype=float)
+        self._group_index = {
+            group: np.array([i for i, g in enumerate(self.groups) if g == group], dtype=int)
+            for group in dict.fromkeys(self.groups)
+        }
+
+        substring_terms = {t for t, m in zip(self.terms, self.modes) if m == SUBSTRING}
+        word_terms = {t for t, m in zip(self.terms, self.modes)
+                      if m == WORD_PREFIX and re.fullmatch(r"\w+", t)}
+
+        self._substring_credit: Dict[str, List[int]] = defaultdict(list)
+        self._word_credit: Dict[str, List[int]] = defaultdict(list)
+        self._fallback: List[Tuple[int, Callable[[str], int]]] = []
+        for i, (term, mode) in enumerate(zip(self.terms, self.modes)):
+            if mode == SUBSTRING and not _self_overlaps(term):
+                for reported in substring_terms:
+                    if reported.startswith(term):
+                        self._substring_credit[reported].append(i)
+            elif mode == SUBSTRING:
+                self._fallback.append((i, lambda text, term=term: text.count(term)))
+            elif term in word_terms:
+                for reported in word_terms:
+                    if reported.startswith(term):
+                        self._word_credit[reported].append(i)
+            else:
+                pattern = re.compile(rf"\b{re.escape(term)}\w*\b")
+                self._fallback.append((i, lambda text, pattern=pattern: len(pattern.findall(text))))
+
+        self._substring_pattern = re.compile(f"(?=({self._alternation(substring_terms)}))")
+        self._word_pattern = re.compile(rf"\b({self._alternation(word_terms)})\w*")
+        self._compiled = True
+        return self
+
+    @staticmethod
+    def _alternation(terms: Iterable[str]) -> str:
+        """Terms as a prefix-trie regex; greedy optional tails prefer the longest term"""
+        trie: Dict[str, dict] = {}
+        for term in terms:
+            node = trie
+            for char in term:
+                node = node.setdefault(char, {})
+            node[""] = {}
+        return _trie_regex(trie) if trie else "(?!)"
+
+    def group_index(self, group: str) -> np.ndarray:
+        return self._group_index.get(group, np.zeros(0, dtype=int))
+
+    def match(self, text: str) -> KeywordHits:
+        """Count every term in ``text``"""
+        if not self._compiled:
+            self.compile()
+
+        text = text or ""
+        counts = np.zeros(len(self.terms), dtype=int)
+        for credit, pattern in ((self._substring_credit, self._substring_pattern),
+                                (self._word_credit, self._word_pattern)):
+            if not credit:
+                continue
+            for reported, n in Counter(pattern.findall(text)).items():
+                for i in credit.get(reported, ()):
+                    counts[i] += n
+        for i, scan in self._fallback:
+            counts[i] = scan(text)
+        return KeywordHits(self, counts)
+
+    def __len__(self) -> int:
+        return len(self.terms)
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+"""
+Leaderboard - Typed schema and backends for the per-song leaderboard aggregates
+Mirrors the leaderboard_stats materialized view from sql/08_leaderboard_view.sql
+"""
+
+import math
+import sqlite3
+import logging
+from typing import Dict, List, Any, Iterable, Union
+
+import pandas as pd
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Column -> dtype of the get_leaderboard() RPC result (scores on the 25-point scale)
+LEADERBOARD_COLUMNS: Dict[str, str] = {
+    'song_id': 'int64',
+    'title': 'object',
+    'composer': 'object',
+    'avg_score': 'float64',
+    'score_std': 'float64',
+    'total_evaluations': 'int64',
+    'min_score': 'float64',
+    'max_score': 'float64',
+    'unique_judges': 'int64'
+}
+
+
+def typed_leaderboard(rows: Union[pd.DataFrame, Iterable[Dict[str, Any]]]) -> pd.DataFrame:
+    """Coerce RPC rows (or a frame) to the leaderboard schema, best score first"""
+    df = rows.copy() if isinstance(rows, pd.DataFrame) else pd.DataFrame(list(rows))
+    for column, dtype in LEADERBOARD_COLUMNS.items():
+        if column not in df:
+            df[column] = pd.Series(dtype=dtype)
+        elif dtype == 'int64':
+            df[column] = pd.to_numeric(df[column], errors='coerce').fillna(0).astype('int64')
+        elif dtype == 'float64':
+            df[column] = pd.to_numeric(df[column], errors='coerce').astype('float64')
+
+    df = df[list(LEADERBOARD_COLUMNS)]
+    return df.sort_values(['avg_score', 'song_id'], ascending=[False, True],
+                          na_position='last').reset_index(drop=True)
+
+
+def compute_leaderboard(evaluations_df: pd.DataFrame, songs_df: pd.DataFrame) -> pd.DataFrame:
+    """In-process fallback when the get_leaderboard RPC is not installed"""
+    if evaluations_df.empty:
+        return typed_leaderboard([])
+
+    leaderboard = evaluations_df.groupby('song_id').agg(
+        avg_score=('total_score', 'mean'),
+        score_std=('total_score', 'std'),
+        total_evaluations=('total_score', 'count'),
+        min_score=('total_score', 'min'),
+        max_score=('total_score', 'max'),
+        unique_judges=('judge_id', 'nunique')
+    ).reset_index()
+
+    if not songs_df.empty:
+        leaderboard = leaderboard.merge(
+            songs_df[['id', 'title', 'composer']].rename(columns={'id': 'song_id'}),
+            on='song_id',
+            how='inner'
+        )
+
+    return typed_leaderboard(leaderboard)
+
+
+# ==================== SQLITE STAND-IN ====================
+
+class _SampleStdDev:
+    """STDDEV_SAMP aggregate for SQLite (matches Postgres: NULL below two values)"""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.total_sq = 0.0
+
+    def step(self, value):
+        if value is not None:
+            self.count += 1
+            self.total += value
+            self.total_sq += value * value
+
+    def finalize(self):
+        if self.count < 2:
+            return None
+        variance = (self.total_sq - self.total * self.total / self.count) / (self.count - 1)
+        return math.sqrt(max(variance, 0.0))
+
+
+LEADERBOARD_SQLITE_QUERY = """
+SELECT
+    s.id AS song_id,
+    s.title,
+    s.composer,
+    AVG(e.total_score) AS avg_score,
+    STDDEV_SAMP(e.total_score) AS score_std,
+    COUNT(e.id) AS total_evaluations,
+    MIN(e.total_score) AS min_score,
+    MAX(e.total_score) AS max_score,
+    COUNT(DISTINCT e.judge_id) AS unique_judges
+FROM songs s
+JOIN evaluations e ON e.song_id = s.id
+WHERE s.is_active = 1
+GROUP BY s.id, s.title, s.composer
+ORDER BY avg_score DESC, s.id
+"""
+
+
+class SQLiteLeaderboard:
+    """
+    Local stand-in for the leaderboard_stats view and get_leaderboard RPC
+
+    Loads songs and evaluations frames into an in-memory SQLite database and
+    runs the same aggregate query, so leaderboard code can be exercised and
+    benchmarked without a Supabase project.
+    """
+
+    def __init__(self, songs_df: pd.DataFrame, evaluations_df: pd.DataFrame):
+        self.connection = sqlite3.connect(":memory:", check_same_thread=False)
+        self.connection.create_aggregate("STDDEV_SAMP", 1, _SampleStdDev)
+        self.load(songs_df, evaluations_df)
+
+    def load(self, songs_df: pd.DataFrame, evaluations_df: pd.DataFrame):
+        """(Re)load the source tables, i.e. what REFRESH MATERIALIZED VIEW sees"""
+        songs = songs_df[['id', 'title', 'composer']].copy()
+        songs['is_active'] = (
+            songs_df['is_active'].fillna(True).astype(bool).astype(int)
+            if 'is_active' in songs_df else 1
+        )
+        evaluations = evaluations_df[['id', 'judge_id', 'song_id', 'total_score']].copy()
+
+        songs.to_sql('songs', self.connection, if_exists='replace', index=False)
+        evaluations.to_sql('evaluations', self.connection, if_exists='replace', index=False)
+
+    def get_leaderboard(self) -> List[Dict[str, Any]]:
+        """Rows in the same shape as supabase.rpc('get_leaderboard').execute().data"""
+        cursor = self.connection.execute(LEADERBOARD_SQLITE_QUERY)
+        columns = [description[0] for description in cursor.description]
+        return [dict(zip(columns, row)) for row in cursor.fetchall()]
@@ -0,0 +1,655 @@
+# -*- coding: utf-8 -*-
+"""
+Local Mirror - SQLite copy of the contest tables behind the Supabase query-builder interface
+Built from the sql/ schema, filled by the snapshot command and served as an offline data backend
+"""
+
+import argparse
+import json
+import logging
+import os
+import re
+import sqlite3
+import tempfile
+import threading
+from datetime import datetime, timezone
+from typing import Dict, List, Any, Iterable, Optional
+
+from services.leaderboard import LEADERBOARD_SQLITE_QUERY, _SampleStdDev
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# supabase: every read and write goes to Supabase (default)
+# mirror:   reads of MIRROR_READ_TABLES come from the local mirror, everything else from Supabase
+# sqlite:   the whole app runs on the local mirror (offline development, tests and benchmarks)
+DATA_BACKEND = os.environ.get('DATA_BACKEND', 'supabase').lower()
+DATA_BACKENDS = ('supabase', 'mirror', 'sqlite')
+
+# Mirror database file, written by `python -m services.local_mirror snapshot`
+MIRROR_PATH = os.environ.get('LOCAL_MIRROR_PATH') or os.path.join(
+    tempfile.gettempdir(), 'lomba-mirror.sqlite3')
+
+# Schema files, applied in name order like sql/run_all_setup.sql
+SQL_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'sql')
+
+# Tables copied by the snapshot command (auth_profiles stays in Supabase)
+MIRROR_TABLES = ('songs', 'judges', 'rubrics', 'evaluations', 'keywords', 'configuration', 'song_analysis')
+
+# Slow-changing tables the public pages read; served from the mirror in the "mirror" backend
+MIRROR_READ_TABLES = ('songs', 'rubrics', 'keywords', 'configuration', 'song_analysis')
+
+# Columns the app reads that the sql/ files do not declare (added to the live project by hand)
+SCHEMA_DRIFT = {
+    'songs': {'is_active': 'BOOLEAN DEFAULT TRUE'},
+    'judges': {'is_active': 'BOOLEAN DEFAULT TRUE', 'role': "VARCHAR(50) DEFAULT 'judge'",
+               'auth_user_id': 'UUID'},
+    'rubrics': {'is_active': 'BOOLEAN DEFAULT TRUE'},
+    'keywords': {'is_active': 'BOOLEAN DEFAULT TRUE'},
+    'configuration': {'key': 'VARCHAR(100) UNIQUE', 'value': 'TEXT'},
+}
+
+# Rows per request when copying a table from Supabase
+SNAPSHOT_PAGE_SIZE = 1000
+
+_CREATE_TABLE = re.compile(r'CREATE TABLE IF NOT EXISTS\s+(\w+)\s*\((.*?)\);', re.S | re.I)
+_ADD_COLUMN = re.compile(r'ALTER TABLE\s+(\w+)\s+ADD COLUMN IF NOT EXISTS\s+(\w+)\s+([^;]+);', re.I)
+_EMBED = re.compile(r'^(?:(\w+):)?(\w+)\((.*)\)$')
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec='microseconds')
+
+
+def _split_top_level(text: str) -> List[str]:
+    """Split on commas that are not inside parentheses"""
+    parts, depth, current = [], 0, ''
+    for char in text:
+        if char == ',' and depth == 0:
+            parts.append(current.strip())
+            current = ''
+            continue
+        depth += char == '('
+        depth -= char == ')'
+        current += char
+    if current.strip():
+        parts.append(current.strip())
+    return parts
+
+
+def _strip_comments(sql: str) -> str:
+    return re.sub(r'--[^\n]*', '', sql)
+
+
+def translate_column(definition: str) -> Optional[Dict[str, Any]]:
+    """
+    SQLite version of one Postgres column definition from sql/
+
+    Returns {'sql', 'kind', 'unique', 'primary', 'stamp'} or None for a
+    table constraint. Foreign keys, NOT NULL and UUID defaults are dropped:
+    the mirror holds copies of rows Supabase already validated.
+    """
+    if re.match(r'(UNIQUE|PRIMARY|CONSTRAINT|FOREIGN|CHECK)\b', definition, re.I):
+        return None
+    name, _, rest = definition.partition(' ')
+    upper = rest.upper()
+
+    if upper.startswith('SERIAL'):
+        return {'sql': f'{name} INTEGER PRIMARY KEY AUTOINCREMENT', 'kind': 'int',
+                'unique': False, 'primary': True, 'stamp': False}
+
+    if upper.startswith('BOOLEAN'):
+        kind, sql_type = 'bool', 'INTEGER'
+    elif upper.startswith('JSON'):
+        kind, sql_type = 'json', 'TEXT'
+    elif upper.startswith(('INTEGER', 'BIGINT', 'SMALLINT')):
+        kind, sql_type = 'int', 'INTEGER'
+    elif upper.startswith(('DECIMAL', 'NUMERIC', 'REAL', 'DOUBLE', 'FLOAT')):
+        kind, sql_type = 'real', 'REAL'
+    else:
+        kind, sql_type = 'text', 'TEXT'
+
+    column_sql = f'{name} {sql_type}'
+    primary = 'PRIMARY KEY' in upper
+    if primary:
+        column_sql += ' PRIMARY KEY'
+    unique = 'UNIQUE' in upper and not primary
+    if unique:
+        column_sql += ' UNIQUE'
+
+    default = re.search(r"DEFAULT\s+('[^']*'|[\w.()-]+)", rest, re.I)
+    stamp = False
+    if default:
+        value = default.group(1)
+        if value.upper() in ('NOW()', 'CURRENT_TIMESTAMP'):
+            # Stamped by the mirror in ISO format, so text comparisons match Supabase's timestamps
+            stamp = True
+        elif value.upper() in ('TRUE', 'FALSE'):
+            column_sql += f" DEFAULT {1 if value.upper() == 'TRUE' else 0}"
+        elif '(' not in value:
+            column_sql += f' DEFAULT {value}'
+    return {'sql': column_sql, 'kind': kind, 'unique': unique, 'primary': primary, 'stamp': stamp}
+
+
+def schema_from_sql(sql_dir: str = SQL_DIR) -> Dict[str, Dict[str, Any]]:
+    """
+    Mirror schema from the CREATE TABLE / ADD COLUMN statements in sql/,
+    plus SCHEMA_DRIFT: {table: {'columns': {name: column}, 'unique': [(cols)]}}
+    """
+    tables: Dict[str, Dict[str, Any]] = {}
+    for file_name in sorted(os.listdir(sql_dir)):
+        if not re.match(r'^\d+_.*\.sql$', file_name):
+            continue
+        with open(os.path.join(sql_dir, file_name), 'r', encoding='utf-8') as f:
+            sql = _strip_comments(f.read())
+
+        for table, body in _CREATE_TABLE.findall(sql):
+            if table in tables:
+                continue
+            schema = tables[table] = {'columns': {}, 'unique': []}
+            for definition in _split_top_level(body):
+                column = translate_column(definition)
+                if column is not None:
+                    schema['columns'][definition.split()[0]] = column
+                elif definition.upper().startswith('UNIQUE'):
+                    columns = re.search(r'\((.*?)\)', definition).group(1)
+                    schema['unique'].append(tuple(c.strip() for c in columns.split(',')))
+
+        for table, name, definition in _ADD_COLUMN.findall(sql):
+            if table in tables:
+                tables[table]['columns'].setdefault(name, translate_column(f'{name} {definition}'))
+
+    for table, columns in SCHEMA_DRIFT.items():
+        if table in tables:
+            for name, definition in columns.items():
+                tables[table]['columns'].setdefault(name, translate_column(f'{name} {definition}'))
+    return tables
+
+
+class MirrorResponse:
+    """Same surface as a postgrest APIResponse: ``data`` and ``count``"""
+
+    def __init__(self, data, count: Optional[int] = None):
+        self.data = data
+        self.count = count
+
+
+class MirrorQuery:
+    """
+    The subset of the postgrest query builder the services use
+
+    select (with ``alias:table(*)`` embeds through ``<alias>_id``), insert,
+    upsert, update and delete; eq/neq/gt/gte/lt/lte/in_/is_ filters,
+    order, limit, range and single.
+    """
+
+    def __init__(self, mirror: 'SQLiteMirror', table: str):
+        self.mirror = mirror
+        self.table = table
+        self.action = 'select'
+        self.columns = '*'
+        self.payload = None
+        self.on_conflict = None
+        self.filters: List[tuple] = []
+        self.ordering: List[str] = []
+        self.row_limit: Optional[int] = None
+        self.row_offset = 0
+        self.single_row = False
+
+    # ---- actions ----
+
+    def select(self, columns: str = '*', count: Optional[str] = None):
+        self.action, self.columns = 'select', columns or '*'
+        return self
+
+    def insert(self, data):
+        self.action, self.payload = 'insert', data
+        return self
+
+    def upsert(self, data, on_conflict: str = None):
+        self.action, self.payload, self.on_conflict = 'upsert', data, on_conflict
+        return self
+
+    def update(self, data: Dict[str, Any]):
+        self.action, self.payload = 'update', data
+        return self
+
+    def delete(self):
+        self.action = 'delete'
+        return self
+
+    # ---- filters and modifiers ----
+
+    def _filter(self, column: str, operator: str, value):
+        self.filters.append((f'{column} {operator} ?', [self.mirror.encode(self.table, column, value)]))
+        return self
+
+    def eq(self, column, value):
+        return self._filter(column, '=', value)
+
+    def neq(self, column, value):
+        return self._filter(column, '!=', value)
+
+    def gt(self, column, value):
+        return self._filter(column, '>', value)
+
+    def gte(self, column, value):
+        return self._filter(column, '>=', value)
+
+    def lt(self, column, value):
+        return self._filter(column, '<', value)
+
+    def lte(self, column, value):
+        return self._filter(column, '<=', value)
+
+    def in_(self, column, values):
+        values = [self.mirror.encode(self.table, column, value) for value in values]
+        if not values:
+            self.filters.append(('0', []))
+        else:
+            self.filters.append((f"{column} IN ({', '.join('?' * len(values))})", values))
+        return self
+
+    def is_(self, column, value):
+        if value is None or str(value).lower() == 'null':
+            self.filters.append((f'{column} IS NULL', []))
+            return self
+        return self.eq(column, value)
+
+    def order(self, column: str, desc: bool = False):
+        self.ordering.append(f"{column} {'DESC' if desc else 'ASC'}")
+        return self
+
+    def limit(self, count: int):
+        self.row_limit = count
+        return self
+
+    def range(self, start: int, end: int):
+        self.row_offset, self.row_limit = start, end - start + 1
+        return self
+
+    def single(self):
+        self.single_row = True
+        return self
+
+    def maybe_single(self):
+        return self.single()
+
+    # ---- execution ----
+
+    def _where(self):
+        if not self.filters:
+            return '', []
+        clause = ' WHERE ' + ' AND '.join(sql for sql, _ in self.filters)
+        return clause, [value for _, values in self.filters for value in values]
+
+    def execute(self) -> MirrorResponse:
+        if self.action == 'select':
+            rows = self._execute_select()
+        elif self.action in ('insert', 'upsert'):
+            rows = self.mirror.write_rows(self.table, self.payload, upsert=self.action == 'upsert',
+                                          on_conflict=self.on_conflict)
+        elif self.action == 'update':
+            where, params = self._where()
+            rows = self.mirror.update_rows(self.table, self.payload, where, params)
+        else:
+            where, params = self._where()
+            rows = self.mirror.delete_rows(self.table, where, params)
+
+        if self.single_row:
+            if len(rows) != 1:
+                raise ValueError(f"Expected one {self.table} row, found {len(rows)}")
+            return MirrorResponse(rows[0], 1)
+        return MirrorResponse(rows, len(rows))
+
+    def _execute_select(self) -> List[Dict[str, Any]]:
+        plain, embeds = [], []
+        for item in _split_top_level(self.columns):
+            embed = _EMBED.match(item.replace(' ', ''))
+            if embed:
+                embeds.append(embed.groups())
+            else:
+                plain.append(item)
+
+        where, params = self._where()
+        sql = f'SELECT * FROM {self.table}{where}'
+        if self.ordering:
+            sql += ' ORDER BY ' + ', '.join(self.ordering)
+        if self.row_limit is not None or self.row_offset:
+            sql += f' LIMIT {self.row_limit if self.row_limit is not None else -1} OFFSET {self.row_offset}'
+        rows = self.mirror.query(self.table, sql, params)
+
+        if '*' not in plain:
+            wanted = [column for column in plain if column]
+            rows = [{column: row.get(column) for column in wanted} for row in rows]
+        for alias, foreign_table, _ in embeds:
+            alias = alias or foreign_table
+            key = f'{alias}_id' if alias != foreign_table else f"{foreign_table.rstrip('s')}_id"
+            self._embed(rows, alias, foreign_table, key)
+        return rows
+
+    def _embed(self, rows, alias: str, foreign_table: str, key: str):
+        ids = sorted({row.get(key) for row in rows if row.get(key) is not None})
+        if not ids:
+            related = {}
+        else:
+            related = {row['id']: row for row in self.mirror.query(
+                foreign_table,
+                f"SELECT * FROM {foreign_table} WHERE id IN ({', '.join('?' * len(ids))})", ids)}
+        for row in rows:
+            row[alias] = related.get(row.get(key))
+
+
+class MirrorRPC:
+    """Deferred ``rpc(...)`` call, executed like a postgrest function call"""
+
+    def __init__(self, mirror: 'SQLiteMirror', name: str, params: Optional[Dict[str, Any]]):
+        self.mirror = mirror
+        self.name = name
+        self.params = params or {}
+
+    def execute(self) -> MirrorResponse:
+        handler = getattr(self.mirror, f'_rpc_{self.name}', None)
+        if handler is None:
+            raise NotImplementedError(f"Function {self.name} is not available in the local mirror")
+        rows = handler(**self.params)
+        return MirrorResponse(rows, len(rows))
+
+
+class SQLiteMirror:
+    """
+    Local SQLite copy of the contest tables, used as a data backend
+
+    Exposes ``table(name)`` and ``rpc(name, params)`` like the Supabase
+    client, so DatabaseService, EvaluationSync and the other services run
+    against it unchanged. Booleans and JSONB columns come back as Python
+    bools and dicts; ``updated_at`` is stamped on every write like the
+    server trigger in sql/11_evaluations_sync.sql. Columns found in
+    replicated rows but missing from the schema are added on the fly.
+
+    ``replicate`` copies tables from a Supabase client (the snapshot
+    command); ``apply_change`` keeps a copy current from single-row changes.
+    """
+
+    def __init__(self, path: str = MIRROR_PATH, sql_dir: str = SQL_DIR):
+        self.path = path
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._lock = threading.RLock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.create_aggregate('STDDEV_SAMP', 1, _SampleStdDev)
+        self.kinds: Dict[str, Dict[str, str]] = {}
+        self.stamped: Dict[str, set] = {}
+        self._create_schema(schema_from_sql(sql_dir))
+
+    # ==================== SCHEMA ====================
+
+    def _create_schema(self, schema: Dict[str, Dict[str, Any]]):
+        with self._lock, self.connection:
+            self.connection.execute(
+                'CREATE TABLE IF NOT EXISTS _mirror_columns '
+                '(table_name TEXT, column_name TEXT, kind TEXT, PRIMARY KEY (table_name, column_name))')
+            for table, definition in schema.items():
+                columns = definition['columns']
+                self.connection.execute(
+                    f"CREATE TABLE IF NOT EXISTS {table} ({', '.join(c['sql'] for c in columns.values())})")
+                existing = self._table_columns(table)
+                for name, column in columns.items():
+                    if name not in existing:
+                        self.connection.execute(f"ALTER TABLE {table} ADD COLUMN {column['sql'].replace(' UNIQUE', '')}")
+                    if column['unique']:
+                        self._ensure_unique(table, (name,))
+                for unique in definition['unique']:
+                    self._ensure_unique(table, unique)
+                self.connection.executemany(
+                    'INSERT OR IGNORE INTO _mirror_columns VALUES (?, ?, ?)',
+                    [(table, name, column['kind']) for name, column in columns.items()])
+                self.stamped[table] = {name for name, column in columns.items() if column['stamp']}
+            for table, name, kind in self.connection.execute('SELECT * FROM _mirror_columns'):
+                self.kinds.setdefault(table, {})[name] = kind
+
+    def _table_columns(self, table: str) -> List[str]:
+        return [row[1] for row in self.connection.execute(f'PRAGMA table_info({table})')]
+
+    def _ensure_unique(self, table: str, columns: Iterable[str]):
+        columns = tuple(columns)
+        self.connection.execute(
+            f"CREATE UNIQUE INDEX IF NOT EXISTS ux_{table}_{'_'.join(columns)} "
+            f"ON {table} ({', '.join(columns)})")
+
+    def _widen(self, table: str, rows: List[Dict[str, Any]]):
+        """Add columns present in ``rows`` but not in the table"""
+        known = self.kinds.setdefault(table, {})
+        samples: Dict[str, Any] = {}
+        for row in rows:
+            for name, value in row.items():
+                if name not in known and samples.get(name) is None:
+                    samples[name] = value
+        for name, value in samples.items():
+            kind = ('bool' if isinstance(value, bool) else 'int' if isinstance(value, int)
+                    else 'real' if isinstance(value, float)
+                    else 'json' if isinstance(value, (dict, list)) else 'text')
+            sql_type = {'bool': 'INTEGER', 'int': 'INTEGER', 'real': 'REAL'}.get(kind, 'TEXT')
+            self.connection.execute(f'ALTER TABLE {table} ADD COLUMN {name} {sql_type}')
+            self.connection.execute('INSERT OR REPLACE INTO _mirror_columns VALUES (?, ?, ?)',
+                                    (table, name, kind))
+            known[name] = kind
+            logger.info(f"Local mirror: added {table}.{name} ({kind})")
+
+    def primary_key(self, table: str) -> str:
+        for row in self.connection.execute(f'PRAGMA table_info({table})'):
+            if row[5]:
+                return row[1]
+        return 'id'
+
+    # ==================== VALUES ====================
+
+    def encode(self, table: str, column: str, value):
+        if isinstance(value, (dict, list)) or self.kinds.get(table, {}).get(column) == 'json' \
+                and value is not None and not isinstance(value, str):
+            return json.dumps(value)
+        if isinstance(value, datetime):
+            return value.isoformat()
+        return value
+
+    def decode(self, table: str, row: sqlite3.Row) -> Dict[str, Any]:
+        kinds = self.kinds.get(table, {})
+        decoded = {}
+        for column in row.keys():
+            value, kind = row[column], kinds.get(column)
+            if value is not None and kind == 'bool':
+                value = bool(value)
+            elif isinstance(value, str) and kind == 'json':
+                try:
+                    value = json.loads(value)
+                except ValueError:
+                    pass
+            decoded[column] = value
+        return decoded
+
+    # ==================== CLIENT INTERFACE ====================
+
+    def table(self, name: str) -> MirrorQuery:
+        return MirrorQuery(self, name)
+
+    def from_(self, name: str) -> MirrorQuery:
+        return self.table(name)
+
+    def rpc(self, name: str, params: Optional[Dict[str, Any]] = None) -> MirrorRPC:
+        return MirrorRPC(self, name, params)
+
+    def query(self, table: str, sql: str, params: Iterable = ()) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [self.decode(table, row) for row in self.connection.execute(sql, list(params))]
+
+    def write_rows(self, table: str, data, upsert: bool = False,
+                   on_conflict: Optional[str] = None) -> List[Dict[str, Any]]:
+        rows = [dict(row) for row in (data if isinstance(data, list) else [data])]
+        if not rows:
+            return []
+        now = _now()
+        for row in rows:
+            for column in self.stamped.get(table, ()):
+                if column == 'updated_at' or row.get(column) is None:
+                    row[column] = now
+        conflict = [c.strip() for c in (on_conflict or self.primary_key(table)).split(',')]
+
+        written = []
+        with self._lock, self.connection:
+            self._widen(table, rows)
+            if upsert:
+                self._ensure_unique(table, conflict)
+            for row in rows:
+                columns = list(row)
+                sql = (f"INSERT INTO {table} ({', '.join(columns)}) "
+                       f"VALUES ({', '.join('?' * len(columns))})")
+                updates = [c for c in columns if c not in conflict]
+                if upsert:
+                    sql += f" ON CONFLICT ({', '.join(conflict)}) DO " + (
+                        'UPDATE SET ' + ', '.join(f'{c} = excluded.{c}' for c in updates)
+                        if updates else 'NOTHING')
+                sql += ' RETURNING *'
+                written.extend(self.decode(table, r) for r in self.connection.execute(
+                    sql, [self.encode(table, c, row[c]) for c in columns]).fetchall())
+        return written
+
+    def update_rows(self, table: str, data: Dict[str, Any], where: str,
+                    params: List[Any]) -> List[Dict[str, Any]]:
+        data = dict(data)
+        if 'updated_at' in self.stamped.get(table, ()):
+            data['updated_at'] = _now()
+        with self._lock, self.connection:
+            self._widen(table, [data])
+            assignments = ', '.join(f'{column} = ?' for column in data)
+            values = [self.encode(table, column, value) for column, value in data.items()]
+            cursor = self.connection.execute(
+                f'UPDATE {table} SET {assignments}{where} RETURNING *', values + list(params))
+            return [self.decode(table, row) for row in cursor.fetchall()]
+
+    def delete_rows(self, table: str, where: str, params: List[Any]) -> List[Dict[str, Any]]:
+        with self._lock, self.connection:
+            cursor = self.connection.execute(f'DELETE FROM {table}{where} RETURNING *', list(params))
+            return [self.decode(table, row) for row in cursor.fetchall()]
+
+    # ==================== FUNCTIONS ====================
+
+    def _rpc_get_leaderboard(self) -> List[Dict[str, Any]]:
+        """sql/08_leaderboard_view.sql get_leaderboard(), computed on read"""
+        return self.query('leaderboard_stats', LEADERBOARD_SQLITE_QUERY)
+
+    def _rpc_increment_play_counts(self, p_counts: Dict[str, int]) -> List[Dict[str, Any]]:
+        """sql/10_play_count_increment.sql increment_play_counts(p_counts)"""
+        rows = []
+        with self._lock, self.connection:
+            for song_id, delta in p_counts.items():
+                cursor = self.connection.execute(
+                    'UPDATE songs SET play_count = COALESCE(play_count, 0) + ? WHERE id = ? '
+                    'RETURNING id, play_count', (int(delta), int(song_id)))
+                rows.extend({'song_id': row[0], 'play_count': row[1]} for row in cursor.fetchall())
+        return rows
+
+    # ==================== REPLICATION ====================
+
+    def replicate(self, source, tables: Iterable[str] = MIRROR_TABLES,
+                  page_size: int = SNAPSHOT_PAGE_SIZE) -> Dict[str, int]:
+        """
+        Replace the mirrored tables with the rows of ``source`` (a Supabase client)
+
+        Each table is read page by page and swapped in one transaction, so
+        readers see either the old or the new copy. Tables missing on the
+        source are skipped. Returns the number of rows copied per table.
+        """
+        copied = {}
+        for table in tables:
+            try:
+                rows, start = [], 0
+                while True:
+                    page = (source.table(table).select('*').order(self.primary_key(table))
+                            .range(start, start + page_size - 1).execute().data or [])
+                    rows.extend(page)
+                    if len(page) < page_size:
+                        break
+                    start += page_size
+            except Exception as e:
+                logger.warning(f"Local mirror: skipping {table}: {e}")
+                continue
+            with self._lock, self.connection:
+                self._widen(table, rows)
+                self.connection.execute(f'DELETE FROM {table}')
+                for row in rows:
+                    columns = list(row)
+                    self.connection.execute(
+                        f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+                        [self.encode(table, c, row[c]) for c in columns])
+                self.connection.execute(
+                    'CREATE TABLE IF NOT EXISTS _mirror_snapshots (table_name TEXT PRIMARY KEY, rows INTEGER, taken_at TEXT)')
+                self.connection.execute('INSERT OR REPLACE INTO _mirror_snapshots VALUES (?, ?, ?)',
+                                        (table, len(rows), _now()))
+            copied[table] = len(rows)
+            logger.info(f"Local mirror: copied {len(rows)} {table} rows")
+        return copied
+
+    def apply_change(self, table: str, event: str, record: Optional[Dict[str, Any]] = None,
+                     old_record: Optional[Dict[str, Any]] = None):
+        """Apply one row change (a Realtime payload or a write's returned row)"""
+        key = self.primary_key(table)
+        event = str(event or '').upper()
+        if event == 'DELETE':
+            row_id = (old_record or record or {}).get(key)
+            if row_id is not None:
+                self.delete_rows(table, f' WHERE {key} = ?', [row_id])
+        elif record and record.get(key) is not None:
+            with self._lock, self.connection:
+                self._widen(table, [record])
+                columns = list(record)
+                updates = [c for c in columns if c != key]
+                self.connection.execute(
+                    f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))}) "
+                    f"ON CONFLICT ({key}) DO " + ('UPDATE SET ' + ', '.join(
+                        f'{c} = excluded.{c}' for c in updates) if updates else 'NOTHING'),
+                    [self.encode(table, c, record[c]) for c in columns])
+
+    def snapshot_stats(self) -> List[Dict[str, Any]]:
+        """Rows copied and time taken per table by the last snapshot"""
+        with self._lock:
+            try:
+                cursor = self.connection.execute('SELECT * FROM _mirror_snapshots ORDER BY table_name')
+            except sqlite3.OperationalError:
+                return []
+            return [dict(row) for row in cursor.fetchall()]
+
+    def close(self):
+        with self._lock:
+            self.connection.close()
+
+
+# ==================== SNAPSHOT COMMAND ====================
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(
+        description="Build the local SQLite mirror of the contest tables")
+    parser.add_argument('command', choices=['snapshot', 'init', 'stats'],
+                        help="snapshot: copy tables from Supabase; init: create the empty schema; "
+                             "stats: show the last snapshot")
+    parser.add_argument('--path', default=MIRROR_PATH, help=f"mirror file (default {MIRROR_PATH})")
+    parser.add_argument('--tables', nargs='+', default=list(MIRROR_TABLES), help="tables to copy")
+    args = parser.parse_args(argv)
+
+    mirror = SQLiteMirror(args.path)
+    if args.command == 'snapshot':
+        from services.connection_service import connection_manager
+        copied = mirror.replicate(connection_manager.supabase_client, args.tables)
+        print(f"Copied {sum(copied.values())} rows into {args.path}: {copied}")
+    elif args.command == 'init':
+        print(f"Mirror schema ready in {args.path}")
+    else:
+        for row in mirror.snapshot_stats():
+            print(f"{row['table_name']:<16} {row['rows']:>7} rows  {row['taken_at']}")
+    mirror.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""
+Play Count Service - Coalesced play-count increments for the audio players
+Buffers plays per song in-process and flushes them as one atomic batched increment
+"""
+
+import atexit
+import logging
+import threading
+import time
+from typing import Dict, Optional
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class PlayCountService:
+    """
+    Process-wide play-event accumulator
+
+    ``record_play`` only bumps an in-memory counter. A background worker
+    flushes all pending counts every ``flush_interval_seconds`` through the
+    increment_play_counts RPC, which returns the new server counts. Displayed
+    counts combine the cached songs table, those confirmed counts and the
+    pending plays, so a play never forces a songs reload.
+    """
+
+    def __init__(self, flush_interval_seconds: float = 10.0, max_retries: int = 3):
+        self.flush_interval_seconds = flush_interval_seconds
+        self.max_retries = max_retries
+        self._pending: Dict[int, int] = {}
+        self._in_flight: Dict[int, int] = {}
+        self._retries: Dict[int, int] = {}
+        self._confirmed: Dict[int, int] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._worker: Optional[threading.Thread] = None
+        self.stats = {
+            'plays': 0,
+            'flushes': 0,
+            'failed_songs': 0
+        }
+
+    # ==================== RECORDING ====================
+
+    def record_play(self, song_id: int):
+        """Count one play of a song (written on the next flush)"""
+        song_id = int(song_id)
+        with self._lock:
+            self._pending[song_id] = self._pending.get(song_id, 0) + 1
+            self.stats['plays'] += 1
+            self._ensure_worker()
+
+    def pending(self, song_id: int) -> int:
+        """Plays of a song not yet written to the database"""
+        with self._lock:
+            return self._pending.get(int(song_id), 0)
+
+    def display_count(self, song_id, cached_count) -> int:
+        """
+        Play count to show for a song
+
+        ``cached_count`` is the play_count of the (possibly stale) cached songs
+        row; the newest count the database returned on flush wins if higher.
+        """
+        try:
+            song_id = int(song_id)
+            cached_count = int(cached_count or 0)
+        except (TypeError, ValueError):
+            return 0
+        with self._lock:
+            stored = max(cached_count, self._confirmed.get(song_id, 0))
+            return stored + self._pending.get(song_id, 0) + self._in_flight.get(song_id, 0)
+
+    # ==================== FLUSHING ====================
+
+    def flush(self) -> bool:
+        """Write all pending plays in one batched increment"""
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, {}
+                self._in_flight = batch
+            if not batch:
+                return True
+
+            from services.database_service import db_service
+
+            try:
+                updated = db_service.increment_play_counts(batch)
+            except Exception as e:
+                logger.error(f"Error flushing play counts: {e}")
+                updated = {}
+
+            with self._lock:
+                self._in_flight = {}
+                self._confirmed.update(updated)
+                self.stats['flushes'] += 1
+                failed = {song_id: delta for song_id, delta in batch.items() if song_id not in updated}
+                for song_id, delta in failed.items():
+                    retries = self._retries.get(song_id, 0)
+                    if retries < self.max_retries:
+                        self._retries[song_id] = retries + 1
+                        self._pending[song_id] = self._pending.get(song_id, 0) + delta
+                    else:
+                        self._retries.pop(song_id, None)
+                        self.stats['failed_songs'] += 1
+                        logger.error(f"Dropping {delta} plays of song {song_id} after {retries} retries")
+                for song_id in updated:
+                    self._retries.pop(song_id, None)
+            return not failed
+
+    # ==================== BACKGROUND WORKER ====================
+
+    def _ensure_worker(self):
+        """Start the flush thread on first use (caller holds the lock)"""
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._run, name="play-count-writer", daemon=True)
+            self._worker.start()
+
+    def _run(self):
+        while True:
+            time.sleep(self.flush_interval_seconds)
+            self.flush()
+
+
+# Global instance
+play_count_service = PlayCountService()
+
+# Do not lose buffered plays when the server process stops
+atexit.register(play_count_service.flush)
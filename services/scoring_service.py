@@ -9,15 +9,22 @@ import pandas as pd
 import numpy as np
 from typing import Dict, List, Optional, Any, Tuple
 import re
+import hashlib
 import unicodedata
 import math
 from collections import Counter
 import logging
 
+from services.cache_service import process_cache
+from services.keyword_matcher import KeywordMatcher, KeywordHits, SUBSTRING, WORD_PREFIX
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Same freshness as the cached keywords table the theme matchers are built from
+THEME_MATCHER_TTL = 3600
+
 class ScoringService:
     """Centralized scoring service for all evaluation logic"""
     
@@ -70,6 +77,45 @@ class ScoringService:
             "selalu bersama selamanya", "tetap semangat", "kau kuatkanku", 
             "percaya saja", "kasih setiamu"
         ]
+
+        self.structure_tokens = ["reff", "refrein", "chorus", "verse", "bait"]
+        self.distraction_words = ["dunia maya", "medsos", "layar", "gawai", "sibuk", "sendiri", "jarak"]
+
+        self.lyrical_quality_words = {
+            "poetic": [
+                'indah', 'puitis', 'syair', 'sajak', 'bait', 'rima', 'irama', 'melodi',
+                'cantik', 'elok', 'molek', 'anggun', 'gemilang', 'cemerlang'
+            ],
+            "emotional": [
+                'hati', 'jiwa', 'rasa', 'perasaan', 'emosi', 'rindu', 'duka', 'suka',
+                'cinta', 'kasih', 'tulus', 'ikhlas', 'dalam', 'mendalam'
+            ],
+            "imagery": [
+                'seperti', 'bagaikan', 'laksana', 'ibarat', 'umpama', 'bagai', 'layaknya',
+                'cahaya', 'terang', 'sinar', 'harta', 'permata', 'mutiara', 'berlian'
+            ],
+            "spiritual": [
+                'makna', 'arti', 'hikmah', 'pelajaran', 'renungan', 'refleksi',
+                'berkat', 'syukur', 'tuhan', 'kudus', 'suci', 'sejati', 'nyata'
+            ]
+        }
+
+        # Every built-in word list, matched in a single pass per text
+        self.lexicon_matcher = self._build_lexicon_matcher()
+
+    def _build_lexicon_matcher(self) -> KeywordMatcher:
+        """Compile the built-in theme, imagery, cliché and quality word lists"""
+        matcher = KeywordMatcher()
+        for group, words in self.theme_keywords.items():
+            matcher.add(group, words)
+        matcher.add("imagery", self.imagery_words)
+        matcher.add("cliche", self.cliche_phrases)
+        matcher.add("structure", self.structure_tokens)
+        matcher.add("distraction", self.distraction_words)
+        matcher.add("distraction_solution", self.theme_keywords["iman"] + ["bersama", "dekat"])
+        for group, words in self.lyrical_quality_words.items():
+            matcher.add(f"quality_{group}", words)
+        return matcher.compile()
     
     # ==================== LYRICS SCORING ====================
     
@@ -87,24 +133,24 @@ class ScoringService:
             return 1
         
         normalized_text = self._normalize_text(text)
+        hits = self.lexicon_matcher.match(normalized_text)
         
         # 1. Theme depth (35% weight)
-        theme_score = sum(normalized_text.count(w) for w in self.theme_keywords["tema_dalam"])
+        theme_score = hits.count("tema_dalam")
         theme_score = min(theme_score, 8)  # Cap at 8 hits
         
         # 2. Family & faith elements (25% weight)
-        family_score = sum(normalized_text.count(w) for w in self.theme_keywords["keluarga"])
-        faith_score = sum(normalized_text.count(w) for w in self.theme_keywords["iman"])
+        family_score = hits.count("keluarga")
+        faith_score = hits.count("iman")
         relation_score = min(family_score + faith_score, 10)  # Cap at 10 total hits
         
         # 3. Poetic quality & imagery (20% weight)
-        imagery_score = sum(1 for kw in self.imagery_words if kw in normalized_text)
+        imagery_score = hits.distinct("imagery")
         imagery_score = min(imagery_score, 5)
         
         # 4. Song structure (20% weight)
         lines = [l.strip() for l in normalized_text.splitlines() if l.strip()]
-        section_tokens = sum(1 for tok in ["reff", "refrein", "chorus", "verse", "bait"] 
-                           if tok in normalized_text)
+        section_tokens = hits.distinct("structure")
         unique_lines = len(set(lines))
         varied_lines = (unique_lines / max(1, len(lines))) >= 0.7
         structure_score = (2 if section_tokens >= 1 else 0) + \
@@ -112,8 +158,8 @@ class ScoringService:
                          (1 if varied_lines else 0)
         
         # 5. Penalties for clichés and unsolved distractions
-        cliche_hits = sum(1 for c in self.cliche_phrases if c in normalized_text)
-        distraction_penalty = self._check_distraction_penalty(normalized_text)
+        cliche_hits = hits.distinct("cliche")
+        distraction_penalty = self._check_distraction_penalty(hits)
         penalty = min(2, cliche_hits) + (2 if distraction_penalty else 0)
         
         # Calculate final score (0-100)
@@ -128,15 +174,9 @@ class ScoringService:
         
         return self._map_score_to_scale(raw_score)
     
-    def _check_distraction_penalty(self, text: str) -> bool:
+    def _check_distraction_penalty(self, hits: KeywordHits) -> bool:
         """Check if text mentions distractions without offering solutions"""
-        distractions = ["dunia maya", "medsos", "layar", "gawai", "sibuk", "sendiri", "jarak"]
-        solutions = self.theme_keywords["iman"] + ["bersama", "dekat"]
-        
-        has_distractions = any(d in text for d in distractions)
-        has_solutions = any(s in text for s in solutions)
-        
-        return has_distractions and not has_solutions
+        return hits.found("distraction") and not hits.found("distraction_solution")
     
     # ==================== MUSIC SCORING ====================
     
@@ -241,19 +281,32 @@ class ScoringService:
             return 0.0
         
         normalized_text = self._normalize_text(text)
-        score = 0.0
-        
-        # Score phrases
-        for phrase, weight in phrases:
-            score += normalized_text.count(phrase.lower()) * float(weight)
-        
-        # Score keywords
-        for keyword, weight in keywords:
-            matches = len(re.findall(rf"\b{re.escape(keyword.lower())}\w*\b", normalized_text))
-            score += matches * float(weight)
+        hits = self.get_theme_matcher(keywords, phrases).match(normalized_text)
+        score = hits.weighted("phrase") + hits.weighted("keyword")
         
         return float(min(round(score, 2), 100.0))
 
+    def get_theme_matcher(self, keywords: List[Tuple[str, float]],
+                          phrases: List[Tuple[str, float]]) -> KeywordMatcher:
+        """
+        Compiled matcher for a keywords-table version
+
+        Shared through the process cache under the 'keywords' tag, so it is
+        rebuilt only when the keywords table changes.
+        """
+        terms = [(str(text), float(weight or 0)) for text, weight in keywords]
+        phrase_terms = [(str(text), float(weight or 0)) for text, weight in phrases]
+        version = hashlib.md5(repr((terms, phrase_terms)).encode()).hexdigest()
+
+        return process_cache.get_or_compute(
+            f"theme_matcher_{version}", THEME_MATCHER_TTL,
+            lambda: KeywordMatcher()
+                .add("phrase", phrase_terms, mode=SUBSTRING)
+                .add("keyword", terms, mode=WORD_PREFIX)
+                .compile(),
+            tags=['keywords']
+        )
+
     def score_lyrical_quality(self, text: str) -> float:
         """
         Score lyrical quality based on poetic elements, depth, and sophistication
@@ -268,38 +321,23 @@ class ScoringService:
             return 0.0
 
         normalized_text = self._normalize_text(text)
+        hits = self.lexicon_matcher.match(normalized_text)
         score = 0.0
 
         # 1. Poetic Quality Indicators (30 points max)
-        poetic_words = [
-            'indah', 'puitis', 'syair', 'sajak', 'bait', 'rima', 'irama', 'melodi',
-            'cantik', 'elok', 'molek', 'anggun', 'gemilang', 'cemerlang'
-        ]
-        poetic_matches = sum(1 for word in poetic_words if word in normalized_text)
+        poetic_matches = hits.distinct("quality_poetic")
         score += min(30, poetic_matches * 5)
 
         # 2. Emotional Depth (25 points max)
-        emotional_words = [
-            'hati', 'jiwa', 'rasa', 'perasaan', 'emosi', 'rindu', 'duka', 'suka',
-            'cinta', 'kasih', 'tulus', 'ikhlas', 'dalam', 'mendalam'
-        ]
-        emotional_matches = sum(1 for word in emotional_words if word in normalized_text)
+        emotional_matches = hits.distinct("quality_emotional")
         score += min(25, emotional_matches * 4)
 
         # 3. Imagery & Metaphors (25 points max) - CRITICAL for poetic quality!
-        imagery_words = [
-            'seperti', 'bagaikan', 'laksana', 'ibarat', 'umpama', 'bagai', 'layaknya',
-            'cahaya', 'terang', 'sinar', 'harta', 'permata', 'mutiara', 'berlian'
-        ]
-        imagery_matches = sum(1 for word in imagery_words if word in normalized_text)
+        imagery_matches = hits.distinct("quality_imagery")
         score += min(25, imagery_matches * 6)  # Higher weight for metaphors
 
         # 4. Spiritual & Meaningful Content (20 points max)
-        spiritual_words = [
-            'makna', 'arti', 'hikmah', 'pelajaran', 'renungan', 'refleksi',
-            'berkat', 'syukur', 'tuhan', 'kudus', 'suci', 'sejati', 'nyata'
-        ]
-        spiritual_matches = sum(1 for word in spiritual_words if word in normalized_text)
+        spiritual_matches = hits.distinct("quality_spiritual")
         score += min(20, spiritual_matches * 4)
 
         # 5. Length & Structure Bonus (bonus points for substantial lyrics)
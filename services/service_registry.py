@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+"""
+Service Registry - Lazy service loading and startup timing
+Heavy services (plotly, reportlab) are imported on first use instead of on app start
+"""
+
+import importlib
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Any, Optional
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class StartupTimer:
+    """
+    Named timings of the process cold start and of each script rerun
+
+    Cold-start stages (imports, lazy service loads, cache warm-up) happen once
+    per process; rerun stages are reset at the start of every rerun.
+    """
+
+    def __init__(self):
+        self.process_started = time.time()
+        self.cold_start: Dict[str, float] = {}
+        self.last_rerun: Dict[str, float] = {}
+        self.reruns = 0
+        self._lock = threading.Lock()
+
+    def record(self, stage: str, seconds: float, cold: bool = False):
+        with self._lock:
+            target = self.cold_start if cold else self.last_rerun
+            target[stage] = target.get(stage, 0.0) + seconds
+        if cold:
+            logger.info(f"Startup: {stage} took {seconds * 1000:.0f} ms")
+
+    def record_once(self, stage: str, seconds: float):
+        """Record a cold-start stage from code that also runs on later reruns; only the first counts"""
+        with self._lock:
+            if stage in self.cold_start:
+                return
+        self.record(stage, seconds, cold=True)
+
+    @contextmanager
+    def measure(self, stage: str, cold: bool = False):
+        """Time a block (also when it exits through st.rerun/st.stop)"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - started, cold)
+
+    @contextmanager
+    def rerun(self):
+        """Time one whole script run; clears the previous rerun's stages"""
+        with self._lock:
+            self.last_rerun = {}
+            self.reruns += 1
+        with self.measure("rerun total"):
+            yield
+
+    def report(self) -> List[Dict[str, Any]]:
+        """Rows of phase, stage and milliseconds, for display or logging"""
+        with self._lock:
+            rows = [{'phase': 'cold start', 'stage': stage, 'ms': round(seconds * 1000, 1)}
+                    for stage, seconds in self.cold_start.items()]
+            rows += [{'phase': f'rerun #{self.reruns}', 'stage': stage, 'ms': round(seconds * 1000, 1)}
+                     for stage, seconds in self.last_rerun.items()]
+        return rows
+
+
+class LazyService:
+    """Proxy that imports ``module`` and resolves ``attribute`` on first attribute access"""
+
+    def __init__(self, module: str, attribute: str, timer: StartupTimer):
+        self._module = module
+        self._attribute = attribute
+        self._timer = timer
+        self._instance: Optional[Any] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self) -> bool:
+        return self._instance is not None
+
+    def _load(self) -> Any:
+        if self._instance is None:
+            with self._lock:
+                if self._instance is None:
+                    with self._timer.measure(f"load {self._module}", cold=True):
+                        module = importlib.import_module(self._module)
+                    self._instance = getattr(module, self._attribute)
+        return self._instance
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._load(), name)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.loaded else "not loaded"
+        return f"<LazyService {self._module}.{self._attribute} ({state})>"
+
+
+class ServiceRegistry:
+    """Named lazy services shared by the app and its components"""
+
+    def __init__(self, timer: StartupTimer):
+        self.timer = timer
+        self._services: Dict[str, LazyService] = {}
+
+    def lazy(self, module: str, attribute: str) -> LazyService:
+        """Register (or reuse) a lazily imported service instance"""
+        service = self._services.get(attribute)
+        if service is None:
+            service = self._services[attribute] = LazyService(module, attribute, self.timer)
+        return service
+
+    def status(self) -> Dict[str, bool]:
+        """Which registered services have been imported so far"""
+        return {name: service.loaded for name, service in self._services.items()}
+
+
+# Global instances
+startup_timer = StartupTimer()
+registry = ServiceRegistry(startup_timer)
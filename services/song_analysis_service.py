@@ -0,0 +1,442 @@
+# -*- coding: utf-8 -*-
+"""
+Song Analysis Service - Memoized per-song lyric and chord analysis
+One analysis record per song content, shared by the scoring form, charts and PDF reports
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Any, Tuple
+
+import pandas as pd
+
+from services.cache_service import process_cache
+from services.scoring_service import scoring_service
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Records only change with the song content or the keywords table, both part of the key
+SONG_ANALYSIS_TTL = 24 * 3600
+
+# Same freshness as the cached keywords table
+KEYWORDS_VERSION_TTL = 3600
+
+# Bump when the analysis below changes, so stored records are recomputed
+ANALYSIS_VERSION = 1
+
+# Optional directory for a disk copy of the records (survives restarts)
+SONG_ANALYSIS_CACHE_DIR = os.environ.get('SONG_ANALYSIS_CACHE_DIR')
+
+# Below this many stale songs, process start-up costs more than it saves
+MIN_POOL_JOBS = 8
+
+DEFAULT_SUGGESTIONS = {'tema': 3, 'lirik': 3, 'musik': 3}
+
+MAJOR_KEYS = {
+    'C': ['C', 'Dm', 'Em', 'F', 'G', 'Am'],
+    'G': ['G', 'Am', 'Bm', 'C', 'D', 'Em'],
+    'D': ['D', 'Em', 'F#m', 'G', 'A', 'Bm'],
+    'A': ['A', 'Bm', 'C#m', 'D', 'E', 'F#m'],
+    'E': ['E', 'F#m', 'G#m', 'A', 'B', 'C#m'],
+    'F': ['F', 'Gm', 'Am', 'Bb', 'C', 'Dm']
+}
+
+
+class SongAnalysisService:
+    """
+    Computes each song's analysis once per content version
+
+    Records are keyed by a hash of title, lyrics_text, chords_list and the
+    keywords-table version, kept in the process cache (tagged 'keywords') and,
+    when ``disk_dir`` is set, as JSON files. Records are shared between
+    sessions: treat them as read-only.
+    """
+
+    def __init__(self, disk_dir: Optional[str] = SONG_ANALYSIS_CACHE_DIR):
+        self.disk_dir = disk_dir
+        if self.disk_dir:
+            os.makedirs(self.disk_dir, exist_ok=True)
+
+    # ==================== LOOKUP ====================
+
+    def analyze(self, song_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Analysis record for a song row (dict or Series)"""
+        title, lyrics_text, chords_text = self.song_content(song_data)
+        return self.analyze_content(title=title, lyrics_text=lyrics_text, chords_text=chords_text)
+
+    @staticmethod
+    def song_content(song_data: Dict[str, Any]) -> Tuple[str, str, str]:
+        """(title, lyrics_text, chords_list) of a song row; NULL columns become ''"""
+        def text(column: str) -> str:
+            value = song_data.get(column, '')
+            return value if isinstance(value, str) else ''
+
+        return text('title'), text('lyrics_text'), text('chords_list')
+
+    def analyze_content(self, title: str = '', lyrics_text: str = '',
+                        chords_text: str = '') -> Dict[str, Any]:
+        """Analysis record for the given song content, computed at most once"""
+        from services.database_service import db_service
+
+        keywords_df = db_service.get_keywords()
+        keywords_version = process_cache.get_or_compute(
+            "song_analysis_keywords_version", KEYWORDS_VERSION_TTL,
+            lambda: self.keywords_version(keywords_df), tags=['keywords']
+        )
+        content_hash = self.content_hash(title, lyrics_text, chords_text, keywords_version)
+
+        def compute():
+            record = self._precomputed().get(content_hash) or self._load_from_disk(content_hash)
+            if record is None:
+                record = self._compute(title, lyrics_text, chords_text, keywords_df)
+                record['content_hash'] = content_hash
+                self._save_to_disk(content_hash, record)
+            return record
+
+        return process_cache.get_or_compute(
+            f"song_analysis_{content_hash}", SONG_ANALYSIS_TTL, compute, tags=['keywords']
+        )
+
+    def _precomputed(self) -> Dict[str, Dict[str, Any]]:
+        """Records from the song_analysis table by content hash"""
+        from services.database_service import db_service
+
+        def load():
+            stored = db_service.get_song_analyses()
+            if stored.empty:
+                return {}
+            stored = stored[stored['analysis_version'] == ANALYSIS_VERSION]
+            return {
+                content_hash: json.loads(analysis) if isinstance(analysis, str) else analysis
+                for content_hash, analysis in zip(stored['content_hash'], stored['analysis'])
+            }
+
+        return process_cache.get_or_compute(
+            "song_analysis_precomputed", KEYWORDS_VERSION_TTL, load, tags=['song_analysis']
+        )
+
+    @staticmethod
+    def keywords_version(keywords_df: pd.DataFrame) -> str:
+        """Stable hash of the keyword columns used by theme scoring"""
+        if keywords_df.empty:
+            return "none"
+        columns = [c for c in ('keyword_text', 'keyword_type', 'weight') if c in keywords_df]
+        payload = keywords_df[columns].astype(str).sort_values(columns).to_csv(index=False)
+        return hashlib.md5(payload.encode()).hexdigest()
+
+    @staticmethod
+    def content_hash(title: str, lyrics_text: str, chords_text: str, keywords_version: str) -> str:
+        payload = "\0".join([str(ANALYSIS_VERSION), title, lyrics_text, chords_text, keywords_version])
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    # ==================== BATCH PRECOMPUTE ====================
+
+    def precompute_all(self, max_workers: Optional[int] = None, force: bool = False) -> Dict[str, Any]:
+        """
+        Analyze every active song whose content hash changed and store the records
+
+        Stale songs are analyzed across a process pool and upserted into the
+        song_analysis table; unchanged songs are skipped unless ``force``.
+        Returns counts of total, computed, unchanged and failed songs, and
+        whether the table write succeeded.
+        """
+        from services.database_service import db_service
+
+        songs_df = db_service.get_songs()
+        keywords_df = db_service.get_keywords()
+        keywords_version = self.keywords_version(keywords_df)
+        stored = db_service.get_song_analyses()
+        stored_hashes = (
+            {} if stored.empty or force
+            else dict(zip(stored['song_id'], stored['content_hash']))
+        )
+
+        jobs = []
+        for song in songs_df.to_dict('records'):
+            title, lyrics_text, chords_text = self.song_content(song)
+            content_hash = self.content_hash(title, lyrics_text, chords_text, keywords_version)
+            if stored_hashes.get(song['id']) != content_hash:
+                jobs.append((song['id'], content_hash, title, lyrics_text, chords_text))
+
+        results = self._run_batch(jobs, keywords_df, max_workers)
+
+        rows = []
+        for (song_id, content_hash, *_), record in zip(jobs, results):
+            if record is None:
+                continue
+            record['content_hash'] = content_hash
+            process_cache.set(f"song_analysis_{content_hash}", record, SONG_ANALYSIS_TTL, tags=['keywords'])
+            self._save_to_disk(content_hash, record)
+            rows.append({
+                'song_id': int(song_id),
+                'content_hash': content_hash,
+                'analysis_version': ANALYSIS_VERSION,
+                'analysis': record
+            })
+
+        summary = {
+            'total': len(songs_df),
+            'computed': len(rows),
+            'unchanged': len(songs_df) - len(jobs),
+            'failed': len(jobs) - len(rows),
+            'stored': db_service.upsert_song_analyses(rows)
+        }
+        logger.info(f"Song analysis precompute: {summary}")
+        return summary
+
+    def _run_batch(self, jobs: List[Tuple], keywords_df: pd.DataFrame,
+                   max_workers: Optional[int]) -> List[Optional[Dict[str, Any]]]:
+        """Analyze (song_id, hash, title, lyrics, chords) jobs; None where a song failed"""
+        contents = [job[2:] for job in jobs]
+        workers = max_workers or min(os.cpu_count() or 1, len(jobs))
+
+        if workers > 1 and len(jobs) >= MIN_POOL_JOBS:
+            try:
+                # spawn: the app process runs background threads, which fork does not copy safely
+                with ProcessPoolExecutor(max_workers=workers,
+                                         mp_context=multiprocessing.get_context('spawn'),
+                                         initializer=_init_worker,
+                                         initargs=(keywords_df,)) as pool:
+                    chunksize = max(1, math.ceil(len(jobs) / (workers * 4)))
+                    return list(pool.map(_analyze_in_worker, contents, chunksize=chunksize))
+            except Exception as e:
+                logger.warning(f"Process pool unavailable, analyzing in-process: {e}")
+
+        _init_worker(keywords_df)
+        return [_analyze_in_worker(content) for content in contents]
+
+    # ==================== DISK STORE ====================
+
+    def _disk_path(self, content_hash: str) -> str:
+        return os.path.join(self.disk_dir, f"{content_hash}.json")
+
+    def _load_from_disk(self, content_hash: str) -> Optional[Dict[str, Any]]:
+        if not self.disk_dir:
+            return None
+        try:
+            with open(self._disk_path(content_hash), encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable song analysis {content_hash}: {e}")
+            return None
+
+    def _save_to_disk(self, content_hash: str, record: Dict[str, Any]):
+        if not self.disk_dir:
+            return
+        path = self._disk_path(content_hash)
+        try:
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(record, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Could not store song analysis {content_hash}: {e}")
+
+    # ==================== ANALYSIS ====================
+
+    def _compute(self, title: str, lyrics_text: str, chords_text: str,
+                 keywords_df: pd.DataFrame) -> Dict[str, Any]:
+        """Full analysis of one song's content"""
+        chord_list = [chord.strip() for chord in chords_text.split() if chord.strip()]
+        unique_chords = list(dict.fromkeys(chord_list))
+
+        theme_relevance = None
+        if lyrics_text and not keywords_df.empty:
+            keywords, phrases = self.theme_terms(keywords_df)
+            theme_relevance = scoring_service.score_theme_relevance(lyrics_text, keywords, phrases)
+        lyrical_quality = scoring_service.score_lyrical_quality(lyrics_text) if lyrics_text else None
+        harmonic_richness = scoring_service.score_harmonic_richness(chord_list) if chord_list else None
+
+        record = {
+            'analysis_version': ANALYSIS_VERSION,
+            'title': title,
+            'normalized_text': scoring_service._normalize_text(lyrics_text) if lyrics_text else '',
+            'word_count': len(lyrics_text.split()),
+            'line_count': len(lyrics_text.split('\n')) if lyrics_text else 0,
+            'chord_list': chord_list,
+            'unique_chords': unique_chords,
+            'key': self.key_signature(unique_chords),
+            'genre': self.genre(unique_chords, chord_list),
+            'chord_stats': self.chord_stats(chord_list),
+            'theme_relevance': theme_relevance,
+            'lyrical_quality': lyrical_quality,
+            'harmonic_richness': harmonic_richness,
+            'found_theme_keywords': [
+                kw for kw in ['waktu', 'bersama', 'harta', 'berharga', 'keluarga']
+                if kw in lyrics_text.lower()
+            ]
+        }
+        record['suggestions'] = self._suggestions(record, lyrics_text, chords_text)
+        record['explanations'] = self._explanations(record, lyrics_text, chords_text)
+        return record
+
+    @staticmethod
+    def theme_terms(keywords_df: pd.DataFrame) -> Tuple[List[Tuple[str, float]], List[Tuple[str, float]]]:
+        """(keywords, phrases) as (text, weight) lists from the keywords table"""
+        rows = keywords_df[['keyword_text', 'weight', 'keyword_type']].itertuples(index=False)
+        keywords, phrases = [], []
+        for text, weight, keyword_type in rows:
+            if keyword_type == 'phrase':
+                phrases.append((text, weight))
+            elif keyword_type == 'keyword':
+                keywords.append((text, weight))
+        return keywords, phrases
+
+    def _suggestions(self, record: Dict[str, Any], lyrics_text: str, chords_text: str) -> Dict[str, int]:
+        """AI scores for the 3 analyzable rubrics (kreativ and jemaat are manual)"""
+        title = record['title']
+
+        # 1. TEMA - Kesesuaian Tema
+        if record['theme_relevance'] is not None:
+            relevance = record['theme_relevance']
+            tema_score = 5 if relevance >= 60 else 4 if relevance >= 40 else 3 if relevance >= 20 \
+                else 2 if relevance >= 10 else 1
+        elif lyrics_text:
+            # Fallback to simple keyword matching
+            theme_keywords = ['waktu', 'bersama', 'harta', 'berharga', 'keluarga', 'kasih', 'berkat']
+            matches = sum(1 for keyword in theme_keywords if keyword in lyrics_text.lower())
+            tema_score = min(5, max(1, matches + 1))
+        else:
+            # Analyze title only
+            theme_keywords = ['waktu', 'bersama', 'harta', 'berharga', 'keluarga']
+            matches = sum(1 for keyword in theme_keywords if keyword in title.lower())
+            tema_score = min(5, max(2, matches + 2))
+
+        # 2. LIRIK - Kekuatan Lirik
+        if record['lyrical_quality'] is not None:
+            quality = record['lyrical_quality']
+            lirik_score = 5 if quality >= 60 else 4 if quality >= 40 else 3 if quality >= 25 \
+                else 2 if quality >= 15 else 1
+        elif len(title) > 15 and any(word in title.lower() for word in ['kasih', 'berkat', 'bersama']):
+            lirik_score = 4
+        elif len(title) > 10:
+            lirik_score = 3
+        else:
+            lirik_score = 2
+
+        # 3. MUSIK - Kekayaan Musik (benefit of doubt for missing chord data)
+        musik_score = record['harmonic_richness'] if record['harmonic_richness'] is not None else 4
+
+        return {'tema': tema_score, 'lirik': lirik_score, 'musik': musik_score}
+
+    @staticmethod
+    def _explanations(record: Dict[str, Any], lyrics_text: str, chords_text: str) -> Dict[str, str]:
+        """Explanation text for each AI suggestion"""
+        suggestions = record['suggestions']
+        explanations = {}
+
+        if lyrics_text and record['found_theme_keywords']:
+            explanations['tema'] = f"Skor {suggestions['tema']}: Ditemukan kata kunci tema: {', '.join(record['found_theme_keywords'])}"
+        elif lyrics_text:
+            explanations['tema'] = f"Skor {suggestions['tema']}: Analisis semantik dari teks lirik"
+        else:
+            explanations['tema'] = f"Skor {suggestions['tema']}: Analisis dari judul '{record['title']}'"
+
+        if lyrics_text:
+            explanations['lirik'] = f"Skor {suggestions['lirik']}: Analisis {record['word_count']} kata, {record['line_count']} baris, struktur puitis"
+        else:
+            explanations['lirik'] = f"Skor {suggestions['lirik']}: Analisis dari struktur judul"
+
+        if chords_text:
+            explanations['musik'] = f"Skor {suggestions['musik']}: {len(record['unique_chords'])} chord unik, {record['chord_stats']['basic_extensions']} extended chord"
+        else:
+            explanations['musik'] = f"Skor {suggestions['musik']}: Estimasi berdasarkan informasi lagu"
+
+        return explanations
+
+    # ==================== CHORD ANALYSIS ====================
+
+    @staticmethod
+    def chord_stats(chord_list: List[str]) -> Dict[str, int]:
+        """Counts of extended, slash, diminished and augmented chords"""
+        return {
+            'extensions': sum(1 for chord in chord_list if any(ext in chord for ext in ['7', '9', '11', '13', 'sus', 'add'])),
+            'basic_extensions': sum(1 for chord in chord_list if any(ext in chord for ext in ['7', '9', 'sus', 'add'])),
+            'slash_chords': sum(1 for chord in chord_list if '/' in chord),
+            'diminished': sum(1 for chord in chord_list if 'dim' in chord.lower()),
+            'augmented': sum(1 for chord in chord_list if 'aug' in chord.lower())
+        }
+
+    @staticmethod
+    def key_signature(unique_chords: List[str]) -> Dict[str, Any]:
+        """Simplified key detection from the chords of each major key"""
+        key_scores = {}
+        for key, expected_chords in MAJOR_KEYS.items():
+            score = 0
+            for chord in unique_chords:
+                # Simple matching (ignoring extensions)
+                base_chord = chord.split('/')[0].replace('7', '').replace('sus', '').replace('add', '')
+                if base_chord in expected_chords:
+                    score += 1
+            key_scores[key] = score / max(1, len(unique_chords))
+
+        best_key = max(key_scores, key=key_scores.get)
+        return {'key': best_key, 'confidence': key_scores[best_key]}
+
+    @staticmethod
+    def genre(unique_chords: List[str], chord_list: List[str]) -> Dict[str, str]:
+        """Musical genre from chord characteristics"""
+        has_7th = any('7' in chord for chord in chord_list)
+        has_sus = any('sus' in chord for chord in chord_list)
+        has_slash = any('/' in chord for chord in chord_list)
+        has_extended = any(ext in chord for chord in chord_list for ext in ['9', '11', '13', 'add'])
+
+        chord_count = len(unique_chords)
+
+        if has_extended and has_7th and chord_count > 6:
+            return {'genre': 'Jazz/Contemporary Gospel', 'characteristics': 'Extended chords, complex harmony'}
+        elif has_7th and has_sus:
+            return {'genre': 'Contemporary Christian', 'characteristics': 'Modern harmony, worship style'}
+        elif chord_count <= 4 and not has_7th:
+            return {'genre': 'Folk/Traditional', 'characteristics': 'Simple, easy to sing'}
+        elif has_slash or has_sus:
+            return {'genre': 'Pop/Contemporary', 'characteristics': 'Modern progression, accessible'}
+        else:
+            return {'genre': 'Contemporary', 'characteristics': 'Balanced complexity'}
+
+
+# ==================== WORKER PROCESS ====================
+
+_worker_keywords: Optional[pd.DataFrame] = None
+
+
+def _init_worker(keywords_df: pd.DataFrame):
+    """Receive the keywords table once per worker instead of once per song"""
+    global _worker_keywords
+    _worker_keywords = keywords_df
+
+
+def _analyze_in_worker(content: Tuple[str, str, str]) -> Optional[Dict[str, Any]]:
+    """Analyze one song's (title, lyrics, chords); no database access"""
+    title, lyrics_text, chords_text = content
+    try:
+        return SongAnalysisService(disk_dir=None)._compute(title, lyrics_text, chords_text, _worker_keywords)
+    except Exception as e:
+        logger.error(f"Error analyzing song '{title}': {e}")
+        return None
+
+
+# Global instance
+song_analysis_service = SongAnalysisService()
+
+
+if __name__ == "__main__":
+    # python -m services.song_analysis_service [--force] [--workers N]
+    parser = argparse.ArgumentParser(description="Precompute AI analysis for all songs")
+    parser.add_argument('--force', action='store_true', help="recompute songs whose content is unchanged")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: CPU count)")
+    args = parser.parse_args()
+
+    # Import by module name so pool workers can unpickle the worker functions
+    from services.song_analysis_service import song_analysis_service as service
+    print(service.precompute_all(max_workers=args.workers, force=args.force))
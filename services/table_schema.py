@@ -0,0 +1,187 @@
+# -*- coding: utf-8 -*-
+"""
+Table Schema - Compact, typed frames for the cached contest tables
+Converts fetched rows to small dtypes once, at fetch time, and reports the memory saved per table
+"""
+
+import json
+import logging
+import threading
+import time
+from typing import Dict, List, Any, Optional
+
+import numpy as np
+import pandas as pd
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Column -> compact kind per table. Kinds: int32, bool, category (low-cardinality text),
+# datetime (naive UTC) and json (JSON strings decoded to dicts/lists). Scores and
+# weights stay float64: they are exported and aggregated as stored.
+TABLE_SCHEMAS: Dict[str, Dict[str, str]] = {
+    'songs': {
+        'id': 'int32', 'play_count': 'int32', 'is_active': 'bool',
+        'composer': 'category', 'key_signature': 'category',
+        'created_at': 'datetime', 'updated_at': 'datetime'
+    },
+    'judges': {
+        'id': 'int32', 'is_active': 'bool', 'role': 'category',
+        'created_at': 'datetime', 'updated_at': 'datetime'
+    },
+    'rubrics': {
+        'id': 'int32', 'is_ai_assisted': 'bool', 'is_active': 'bool',
+        'created_at': 'datetime', 'updated_at': 'datetime'
+    },
+    'evaluations': {
+        'id': 'int32', 'judge_id': 'int32', 'song_id': 'int32',
+        'is_final_submitted': 'bool', 'rubric_scores': 'json', 'final_submitted_at': 'datetime',
+        'created_at': 'datetime', 'updated_at': 'datetime'
+    },
+    'keywords': {
+        'id': 'int32', 'keyword_type': 'category', 'is_active': 'bool',
+        'created_at': 'datetime', 'updated_at': 'datetime'
+    },
+    'configuration': {
+        'id': 'int32', 'created_at': 'datetime', 'updated_at': 'datetime'
+    },
+    'song_analysis': {
+        'song_id': 'int32', 'analysis_version': 'int32', 'analysis': 'json',
+        'created_at': 'datetime', 'updated_at': 'datetime'
+    },
+}
+
+_INT32 = np.iinfo(np.int32)
+
+
+def _frame_bytes(df: pd.DataFrame) -> int:
+    try:
+        return int(df.memory_usage(deep=True).sum())
+    except Exception:
+        return 0
+
+
+class TableNormalizer:
+    """
+    Schema-driven dtype conversion for fetched table frames
+
+    ``normalize`` converts the columns listed in TABLE_SCHEMAS and leaves
+    a column as fetched when the conversion would lose information: ids,
+    counts, booleans and categories are only converted when the column has
+    no nulls, so ``row['composer'] or default`` style checks keep working.
+    Timestamps may hold NaT, like datetime64 columns already do; they
+    become naive UTC so frames stay comparable and exportable to Excel.
+
+    Each reported normalization records the frame's size before and after,
+    for the memory report in the admin panel.
+    """
+
+    def __init__(self, schemas: Dict[str, Dict[str, str]] = TABLE_SCHEMAS):
+        self.schemas = schemas
+        self._lock = threading.Lock()
+        self._report: Dict[str, Dict[str, Any]] = {}
+
+    def normalize(self, table: str, df: pd.DataFrame, label: Optional[str] = None,
+                  report: bool = True) -> pd.DataFrame:
+        """Compact copy of ``df``, a frame of ``table`` rows as fetched"""
+        schema = self.schemas.get(table)
+        if schema is None or df.empty:
+            return df
+
+        fetched_bytes = _frame_bytes(df) if report else 0
+        compact = df.copy()
+        converted = []
+        for column, kind in schema.items():
+            if column not in compact:
+                continue
+            try:
+                values = self._convert(compact[column], kind)
+            except Exception as e:
+                logger.debug(f"Keeping {table}.{column} as fetched: {e}")
+                continue
+            if values is not None:
+                compact[column] = values
+                converted.append(column)
+
+        if report:
+            compact_bytes = _frame_bytes(compact)
+            with self._lock:
+                self._report[label or table] = {
+                    'table': label or table,
+                    'rows': len(compact),
+                    'fetched_bytes': fetched_bytes,
+                    'compact_bytes': compact_bytes,
+                    'saved_pct': round(100 * (1 - compact_bytes / fetched_bytes), 1) if fetched_bytes else 0.0,
+                    'converted_columns': ', '.join(converted),
+                    'measured_at': time.time()
+                }
+        return compact
+
+    def normalize_record(self, table: str, record: Dict[str, Any]) -> Dict[str, Any]:
+        """One pushed row with the values a normalized frame of ``table`` would hold"""
+        if not record:
+            return record
+        row = self.normalize(table, pd.DataFrame([record]), report=False).iloc[0]
+        return {column: row[column] for column in record}
+
+    @staticmethod
+    def _convert(series: pd.Series, kind: str) -> Optional[pd.Series]:
+        """Converted series, or None when the column must stay as fetched"""
+        has_nulls = bool(series.isna().any())
+
+        if kind == 'int32':
+            if has_nulls or str(series.dtype) == 'int32':
+                return None
+            numbers = pd.to_numeric(series, errors='raise')
+            if (numbers % 1 != 0).any() or numbers.min() < _INT32.min or numbers.max() > _INT32.max:
+                return None
+            return numbers.astype('int32')
+
+        if kind == 'bool':
+            if has_nulls or series.dtype == bool:
+                return None
+            if not series.map(lambda value: isinstance(value, (bool, np.bool_))).all():
+                return None
+            return series.astype(bool)
+
+        if kind == 'category':
+            if has_nulls or isinstance(series.dtype, pd.CategoricalDtype):
+                return None
+            return series.astype('category')
+
+        if kind == 'datetime':
+            if pd.api.types.is_datetime64_any_dtype(series) and getattr(series.dt, 'tz', None) is None:
+                return None
+            parsed = pd.to_datetime(series, format='ISO8601', utc=True, errors='coerce')
+            if int(parsed.isna().sum()) != int(series.isna().sum()):
+                return None
+            return parsed.dt.tz_localize(None)
+
+        if kind == 'json':
+            if not series.map(lambda value: isinstance(value, str)).any():
+                return None
+            return series.map(_decode_json)
+
+        raise ValueError(f"Unknown column kind: {kind}")
+
+    # ==================== MEMORY REPORT ====================
+
+    def memory_report(self) -> List[Dict[str, Any]]:
+        """Bytes per cached table as fetched and after normalization, largest first"""
+        with self._lock:
+            rows = [dict(entry) for entry in self._report.values()]
+        return sorted(rows, key=lambda row: row['fetched_bytes'], reverse=True)
+
+
+def _decode_json(value: Any) -> Any:
+    if isinstance(value, str) and value:
+        try:
+            return json.loads(value)
+        except ValueError:
+            return value
+    return value
+
+
+# Global instance
+table_normalizer = TableNormalizer()
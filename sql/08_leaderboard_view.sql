@@ -0,0 +1,141 @@
+-- ==================== LEADERBOARD MATERIALIZED VIEW ====================
+-- Server-side leaderboard aggregates so the app no longer pulls every
+-- evaluation row to compute rankings.
+-- Run after 01-05. Safe to re-run.
+
+-- Per-song aggregates of evaluations.total_score (25-point scale)
+DROP MATERIALIZED VIEW IF EXISTS leaderboard_stats CASCADE;
+
+CREATE MATERIALIZED VIEW leaderboard_stats AS
+SELECT
+    s.id AS song_id,
+    s.title,
+    s.composer,
+    AVG(e.total_score)::DOUBLE PRECISION AS avg_score,
+    STDDEV_SAMP(e.total_score)::DOUBLE PRECISION AS score_std,
+    COUNT(e.id)::INTEGER AS total_evaluations,
+    MIN(e.total_score)::DOUBLE PRECISION AS min_score,
+    MAX(e.total_score)::DOUBLE PRECISION AS max_score,
+    COUNT(DISTINCT e.judge_id)::INTEGER AS unique_judges,
+    MAX(e.updated_at) AS last_evaluated_at
+FROM songs s
+JOIN evaluations e ON e.song_id = s.id
+WHERE s.is_active = TRUE
+GROUP BY s.id, s.title, s.composer;
+
+-- Required for REFRESH ... CONCURRENTLY (readers are never blocked)
+CREATE UNIQUE INDEX IF NOT EXISTS idx_leaderboard_stats_song ON leaderboard_stats(song_id);
+
+-- ==================== REFRESH ====================
+-- Writes to evaluations only bump a sequence (no locks, no aggregation);
+-- a pg_cron job refreshes the view when something changed. Judges'
+-- auto-saves therefore never wait on a refresh, and the leaderboard lags
+-- writes by at most about one job interval.
+
+CREATE SEQUENCE IF NOT EXISTS leaderboard_change_seq;
+
+-- Singleton bookkeeping row. refreshed_at changes on every refresh, so the
+-- app's change feed (sql/12) learns when fresh aggregates are available.
+CREATE TABLE IF NOT EXISTS leaderboard_refresh_state (
+    id BOOLEAN PRIMARY KEY DEFAULT TRUE CHECK (id),
+    seen_change BIGINT NOT NULL DEFAULT 0,
+    settled_change BIGINT NOT NULL DEFAULT 0,
+    refreshed_at TIMESTAMPTZ
+);
+INSERT INTO leaderboard_refresh_state (id) VALUES (TRUE) ON CONFLICT (id) DO NOTHING;
+
+DROP FUNCTION IF EXISTS refresh_leaderboard_stats();
+
+-- Refreshes when evaluations changed since the last settled refresh. A
+-- write still in flight while the view is rebuilt is covered by one
+-- trailing refresh on the next run (settled_change lags seen_change).
+-- Returns whether a refresh ran.
+CREATE FUNCTION refresh_leaderboard_stats()
+RETURNS BOOLEAN
+LANGUAGE plpgsql
+SECURITY DEFINER
+AS $$
+DECLARE
+    latest BIGINT;
+    state leaderboard_refresh_state%ROWTYPE;
+BEGIN
+    -- One refresh at a time; an overlapping run just skips
+    IF NOT pg_try_advisory_xact_lock(hashtext('refresh_leaderboard_stats')) THEN
+        RETURN FALSE;
+    END IF;
+
+    SELECT CASE WHEN is_called THEN last_value ELSE 0 END INTO latest FROM leaderboard_change_seq;
+    SELECT * INTO state FROM leaderboard_refresh_state WHERE id;
+    IF latest <= state.settled_change THEN
+        RETURN FALSE;
+    END IF;
+
+    REFRESH MATERIALIZED VIEW CONCURRENTLY leaderboard_stats;
+
+    UPDATE leaderboard_refresh_state
+    SET settled_change = state.seen_change,
+        seen_change = latest,
+        refreshed_at = NOW()
+    WHERE id;
+    RETURN TRUE;
+END;
+$$;
+
+CREATE OR REPLACE FUNCTION trg_refresh_leaderboard_stats()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+SECURITY DEFINER
+AS $$
+BEGIN
+    PERFORM nextval('leaderboard_change_seq');
+    RETURN NULL;
+END;
+$$;
+
+-- Statement-level: one bump per write statement, not per row
+DROP TRIGGER IF EXISTS evaluations_refresh_leaderboard ON evaluations;
+CREATE TRIGGER evaluations_refresh_leaderboard
+AFTER INSERT OR UPDATE OF total_score, song_id, judge_id OR DELETE ON evaluations
+FOR EACH STATEMENT
+EXECUTE FUNCTION trg_refresh_leaderboard_stats();
+
+-- Run the refresh every 30 seconds (pg_cron: Database > Extensions in the
+-- Supabase dashboard). Without pg_cron, schedule
+-- "SELECT refresh_leaderboard_stats()" from any job runner holding the
+-- service role key.
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_available_extensions WHERE name = 'pg_cron') THEN
+        CREATE EXTENSION IF NOT EXISTS pg_cron;
+        EXECUTE $job$SELECT cron.schedule('refresh-leaderboard-stats', '30 seconds',
+                                          'SELECT refresh_leaderboard_stats()')$job$;
+    ELSE
+        RAISE NOTICE 'pg_cron not available: schedule SELECT refresh_leaderboard_stats() externally';
+    END IF;
+END;
+$$;
+
+-- ==================== RPC ====================
+
+-- Called from DatabaseService.get_leaderboard via supabase.rpc('get_leaderboard')
+CREATE OR REPLACE FUNCTION get_leaderboard()
+RETURNS SETOF leaderboard_stats
+LANGUAGE sql
+STABLE
+SECURITY DEFINER
+AS $$
+    SELECT * FROM leaderboard_stats
+    ORDER BY avg_score DESC NULLS LAST, song_id;
+$$;
+
+GRANT SELECT ON leaderboard_stats TO anon, authenticated;
+GRANT SELECT ON leaderboard_refresh_state TO anon, authenticated;
+GRANT EXECUTE ON FUNCTION get_leaderboard() TO anon, authenticated;
+-- Full refreshes are for the scheduled job only, not for API clients
+REVOKE EXECUTE ON FUNCTION refresh_leaderboard_stats() FROM PUBLIC, anon, authenticated;
+
+COMMENT ON MATERIALIZED VIEW leaderboard_stats IS 'Per-song evaluation aggregates, refreshed by a pg_cron job after evaluations writes';
+
+-- Verification
+SELECT 'leaderboard_stats created!' as status;
+SELECT * FROM get_leaderboard() LIMIT 5;
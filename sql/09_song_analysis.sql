@@ -0,0 +1,24 @@
+-- ==================== SONG ANALYSIS ====================
+-- Precomputed AI analysis per song (see services/song_analysis_service.py)
+-- Filled by the batch precompute (admin button or
+-- `python -m services.song_analysis_service`), read by the scoring form.
+-- Run after 01-05. Safe to re-run.
+
+CREATE TABLE IF NOT EXISTS song_analysis (
+    song_id INTEGER PRIMARY KEY REFERENCES songs(id) ON DELETE CASCADE,
+    content_hash VARCHAR(64) NOT NULL,
+    analysis_version INTEGER NOT NULL,
+    analysis JSONB NOT NULL,
+    created_at TIMESTAMP DEFAULT NOW(),
+    updated_at TIMESTAMP DEFAULT NOW()
+);
+
+CREATE INDEX IF NOT EXISTS idx_song_analysis_hash ON song_analysis(content_hash);
+
+GRANT SELECT, INSERT, UPDATE, DELETE ON song_analysis TO anon, authenticated;
+
+COMMENT ON TABLE song_analysis IS 'Precomputed AI suggestions per song, keyed by a hash of the song content and keywords';
+
+-- Verification
+SELECT 'song_analysis created!' as status;
+SELECT COUNT(*) as precomputed_songs FROM song_analysis;
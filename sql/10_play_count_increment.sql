@@ -0,0 +1,28 @@
+-- ==================== PLAY COUNT INCREMENT ====================
+-- Atomic, batched play-count increments for the audio players.
+-- PlayCountService coalesces plays in the app process and calls this
+-- once per flush with {"<song_id>": <plays>, ...}.
+-- Run after 01-05. Safe to re-run.
+
+ALTER TABLE songs ADD COLUMN IF NOT EXISTS play_count INTEGER DEFAULT 0;
+
+CREATE OR REPLACE FUNCTION increment_play_counts(p_counts JSONB)
+RETURNS TABLE(song_id INTEGER, play_count INTEGER)
+LANGUAGE sql
+SECURITY DEFINER
+AS $$
+    -- Single UPDATE: each row is incremented under its row lock, no lost updates
+    UPDATE songs s
+    SET play_count = COALESCE(s.play_count, 0) + d.delta
+    FROM (
+        SELECT key::INTEGER AS id, value::INTEGER AS delta
+        FROM jsonb_each_text(p_counts)
+    ) d
+    WHERE s.id = d.id
+    RETURNING s.id, s.play_count;
+$$;
+
+GRANT EXECUTE ON FUNCTION increment_play_counts(JSONB) TO anon, authenticated;
+
+-- Verification
+SELECT 'increment_play_counts created!' as status;
@@ -0,0 +1,27 @@
+-- ==================== EVALUATIONS DELTA SYNC ====================
+-- Server-side updated_at for the incremental evaluations sync.
+-- EvaluationSync (services/evaluation_sync.py) keeps one evaluations frame
+-- per app process and only re-selects rows whose updated_at is newer than
+-- the last one it has seen, so updated_at must come from the database clock
+-- (the app sends its own local time) and be indexed.
+-- Run after 01-10. Safe to re-run.
+
+CREATE OR REPLACE FUNCTION stamp_evaluation_updated_at()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    NEW.updated_at := NOW();
+    RETURN NEW;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS evaluations_stamp_updated_at ON evaluations;
+CREATE TRIGGER evaluations_stamp_updated_at
+BEFORE INSERT OR UPDATE ON evaluations
+FOR EACH ROW EXECUTE FUNCTION stamp_evaluation_updated_at();
+
+CREATE INDEX IF NOT EXISTS idx_evaluations_updated_at ON evaluations(updated_at);
+
+-- Verification
+SELECT 'evaluations updated_at trigger created!' as status;
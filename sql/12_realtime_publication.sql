@@ -0,0 +1,29 @@
+-- ==================== REALTIME CHANGE FEED ====================
+-- Row-change notifications for the cache change feed
+-- (services/change_feed_service.py). The app subscribes to these tables
+-- through Supabase Realtime and patches or invalidates its process cache
+-- per changed row instead of waiting for TTLs.
+-- Run after 01-11. Safe to re-run.
+
+DO $$
+DECLARE
+    feed_table TEXT;
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_publication WHERE pubname = 'supabase_realtime') THEN
+        CREATE PUBLICATION supabase_realtime;
+    END IF;
+
+    FOREACH feed_table IN ARRAY ARRAY['evaluations', 'songs', 'configuration', 'keywords', 'rubrics', 'song_analysis',
+                                           'leaderboard_refresh_state', 'judges'] LOOP
+        IF NOT EXISTS (
+            SELECT 1 FROM pg_publication_tables
+            WHERE pubname = 'supabase_realtime' AND schemaname = 'public' AND tablename = feed_table
+        ) THEN
+            EXECUTE format('ALTER PUBLICATION supabase_realtime ADD TABLE public.%I', feed_table);
+        END IF;
+    END LOOP;
+END;
+$$;
+
+-- Verification
+SELECT tablename FROM pg_publication_tables WHERE pubname = 'supabase_realtime';
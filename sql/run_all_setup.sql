@@ -20,10 +20,25 @@
 -- 5. Winner display configuration
 \i 05_winner_display_config.sql
 
--- 6. Cleanup unused tables (optional)
+-- 6. Leaderboard materialized view, refresh trigger and RPC
+\i 08_leaderboard_view.sql
+
+-- 7. Precomputed song analysis
+\i 09_song_analysis.sql
+
+-- 8. Atomic batched play-count increments
+\i 10_play_count_increment.sql
+
+-- 9. Server-side updated_at for the evaluations delta sync
+\i 11_evaluations_sync.sql
+
+-- 10. Realtime publication for the cache change feed
+\i 12_realtime_publication.sql
+
+-- 11. Cleanup unused tables (optional)
 -- \i 06_cleanup_unused_tables.sql
 
--- 7. Cleanup meta table (optional)
+-- 12. Cleanup meta table (optional)
 -- \i 07_cleanup_meta_table.sql
 
 -- Final verification
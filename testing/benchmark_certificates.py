@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Benchmark direct certificate rendering (every layer drawn with reportlab)
+against templated rendering (text overlaid on a cached background page),
+and against one merged PDF whose pages share the background
+
+Usage:
+  python3 testing/benchmark_certificates.py            # 100 and 1,000 certificates
+  python3 testing/benchmark_certificates.py 100 250
+"""
+
+import os
+import sys
+import time
+import logging
+
+# Add the project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.chdir(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+logging.disable(logging.WARNING)
+
+from services.export_service import export_service, _load_pymupdf
+
+
+def certificate_args(count: int):
+    for i in range(count):
+        rank = i % 3 + 1 if i % 10 == 0 else None
+        yield f"Peserta Nomor {i}", f"Lagu Keluarga {i}", rank, rank is not None
+
+
+def run(count: int, templated: bool):
+    # Warm up: asset decoding and (templated) background pages are built once per process
+    export_service.render_certificate("Warm Up", "Lagu", 1, True, templated=templated)
+    export_service.render_certificate("Warm Up", "Lagu", None, False, templated=templated)
+
+    total_bytes = 0
+    started = time.perf_counter()
+    for name, title, rank, is_winner in certificate_args(count):
+        total_bytes += len(export_service.render_certificate(name, title, rank, is_winner,
+                                                             templated=templated))
+    return time.perf_counter() - started, total_bytes
+
+
+def run_merged(count: int):
+    pymupdf = _load_pymupdf()
+    started = time.perf_counter()
+    with pymupdf.open() as doc:
+        for name, title, rank, is_winner in certificate_args(count):
+            export_service._add_templated_page(doc, name, title, rank, is_winner)
+        total_bytes = len(doc.tobytes(garbage=3, deflate=True))
+    return time.perf_counter() - started, total_bytes
+
+
+def main():
+    counts = [int(arg) for arg in sys.argv[1:]] or [100, 1000]
+    merged = _load_pymupdf() is not None
+    if not merged:
+        print("pymupdf is not installed; templated rendering falls back to the direct path")
+
+    print(f"{'certificates':>12} {'mode':>10} {'seconds':>9} {'ms/cert':>8} {'KB/cert':>8}")
+    for count in counts:
+        for mode in ("direct", "templated", "merged"):
+            if mode == "merged":
+                if not merged:
+                    continue
+                seconds, total_bytes = run_merged(count)
+            else:
+                seconds, total_bytes = run(count, mode == "templated")
+            print(f"{count:>12} {mode:>10} {seconds:>9.2f} {seconds / count * 1000:>8.1f} "
+                  f"{total_bytes / count / 1024:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Check the auto-save write-behind buffer: rapid changes are coalesced into
+one write, failed writes back off before retrying, and writes that are
+given up on are reported for the judge
+
+Usage:
+  python3 testing/test_autosave.py
+  pytest testing/test_autosave.py
+"""
+
+import os
+import sys
+import time
+
+# Add the project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.autosave_service import AutoSaveService
+
+
+class RecordingAutoSave(AutoSaveService):
+    """AutoSaveService whose upserts are recorded instead of sent"""
+
+    def __init__(self, fail=False, **kwargs):
+        super().__init__(**kwargs)
+        self.fail = fail
+        self.writes = []
+
+    def _write(self, key, entry):
+        self.writes.append((key, dict(entry['rubric_scores']), entry['notes']))
+        return not self.fail
+
+
+def wait_for(condition, timeout=3.0):
+    deadline = time.time() + timeout
+    while time.time() < deadline and not condition():
+        time.sleep(0.02)
+    return condition()
+
+
+def test_rapid_changes_are_written_once():
+    service = RecordingAutoSave(debounce_seconds=0.2, max_delay_seconds=2.0)
+    service.queue_score(1, 7, 'tema', 3)
+    service.queue_score(1, 7, 'tema', 4)
+    service.queue_score(1, 7, 'lirik', 5)
+    service.queue_notes(1, 7, "Bagus")
+
+    # Pending changes are readable before they are written
+    assert service.pending_changes(1, 7)['rubric_scores'] == {'tema': 4, 'lirik': 5}
+    assert service.writes == []
+
+    assert wait_for(lambda: service.writes)
+    time.sleep(0.3)
+    assert service.writes == [((1, 7), {'tema': 4, 'lirik': 5}, "Bagus")]
+    assert not service.has_pending(1)
+
+
+def test_failed_writes_back_off_and_are_reported():
+    service = RecordingAutoSave(fail=True, debounce_seconds=0.05, max_delay_seconds=0.1,
+                                max_retries=2, retry_backoff_seconds=0.3)
+    service.queue_score(2, 9, 'tema', 5)
+
+    assert wait_for(lambda: len(service.writes) == 1)
+    # The retry waits for the backoff instead of firing on the next tick
+    time.sleep(0.15)
+    assert len(service.writes) == 1 and service.has_pending(2)
+
+    assert wait_for(lambda: service.stats['dropped'] == 1)
+    assert len(service.writes) == 3 and service.take_dropped(2) == [9]
+    assert not service.has_pending(2)
+    assert service.take_dropped(2) == []
+
+
+if __name__ == "__main__":
+    print("🔍 Checking the auto-save write-behind buffer...")
+    test_rapid_changes_are_written_once()
+    test_failed_writes_back_off_and_are_reported()
+    print("✅ Auto-saves are coalesced, retried with backoff and reported when dropped")
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Check the process-wide cache backend: LRU eviction, TTL expiry, one
+compute per key under concurrent misses, per-key locks released with
+their entries, session vs process scope and the hit/miss counters
+
+Usage:
+  python3 testing/test_cache_service.py
+  pytest testing/test_cache_service.py
+"""
+
+import os
+import sys
+import threading
+import time
+from collections import Counter
+
+import streamlit as st
+
+# Add the project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.cache_service import CacheService, ProcessCache, process_cache
+
+calls = Counter()
+
+
+@CacheService.cache_data(ttl=3600, key_prefix="test_cache_process", show_spinner=False)
+def read_shared(value):
+    calls['process'] += 1
+    return {'value': value}
+
+
+@CacheService.cache_data(ttl=3600, key_prefix="test_cache_session", show_spinner=False, scope="session")
+def read_per_user(value):
+    calls['session'] += 1
+    return {'value': value}
+
+
+def test_lru_eviction_and_ttl_expiry():
+    cache = ProcessCache(max_entries=2)
+    cache.set('a', 1, ttl=3600)
+    cache.set('b', 2, ttl=3600)
+    cache.get('a')
+    cache.set('c', 3, ttl=3600)
+
+    # 'b' was least recently used
+    assert cache.get('b', None) is None
+    assert cache.get('a') == 1 and cache.get('c') == 3
+    assert cache.stats['evictions'] == 1
+
+    cache.set('short', 4, ttl=0.05)
+    time.sleep(0.1)
+    assert cache.get('short', None) is None
+
+
+def test_concurrent_misses_compute_once():
+    cache = ProcessCache()
+    computed = Counter()
+
+    def compute():
+        computed['value'] += 1
+        time.sleep(0.1)
+        return 42
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get_or_compute('key', 3600, compute)))
+               for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [42] * 8 and computed['value'] == 1
+    assert cache.stats['misses'] == 1 and cache.stats['hits'] == 7
+    assert cache.snapshot()['hit_rate'] == 0.875
+
+
+def test_removed_entries_release_their_locks():
+    cache = ProcessCache()
+    for key in ('expiring', 'dropped', 'tagged'):
+        cache.get_or_compute(key, 0.05 if key == 'expiring' else 3600, lambda: key,
+                             tags=['songs'] if key == 'tagged' else ())
+    assert set(cache._key_locks) == {'expiring', 'dropped', 'tagged'}
+
+    time.sleep(0.1)
+    assert cache.get('expiring', None) is None
+    cache.invalidate('dropped')
+    cache.invalidate_tags(['songs'])
+    assert cache._key_locks == {}
+
+    cache.get_or_compute('patched', 3600, lambda: 1, tags=['songs'])
+    cache.patch_tagged('songs', lambda data: None)
+    assert cache._key_locks == {}
+
+
+def test_process_and_session_scope():
+    process_cache.invalidate()
+    CacheService.invalidate_cache()
+    calls.clear()
+
+    first = read_shared(1)
+    first['extra'] = True
+    # Shared across sessions, and callers get their own copy
+    assert read_shared(1) == {'value': 1} and calls['process'] == 1
+
+    read_per_user(1)
+    read_per_user(1)
+    assert calls['session'] == 1
+    assert any(key.startswith('test_cache_session') for key in st.session_state)
+    assert not any(key.startswith('test_cache_session') for key in process_cache._entries)
+
+    # Another user's session starts without the entry
+    for key in [k for k in st.session_state if k.startswith('test_cache_session')]:
+        del st.session_state[key]
+    read_per_user(1)
+    assert calls['session'] == 2 and calls['process'] == 1
+
+
+if __name__ == "__main__":
+    print("🔍 Checking the process cache...")
+    test_lru_eviction_and_ttl_expiry()
+    test_concurrent_misses_compute_once()
+    test_removed_entries_release_their_locks()
+    test_process_and_session_scope()
+    print("✅ Process cache evicts, expires and computes each key once")
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Check dependency-tagged invalidation: a write for one (judge, song) drops
+only the cached reads that could hold that row, offline against the local
+SQLite mirror
+
+Usage:
+  python3 testing/test_cache_tags.py
+  pytest testing/test_cache_tags.py
+"""
+
+import os
+import sys
+
+# Add the project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.cache_service import CacheService, process_cache
+from services.connection_service import connection_manager
+from services.local_mirror import SQLiteMirror
+
+
+def seeded_mirror():
+    mirror = SQLiteMirror(':memory:')
+    mirror.table('songs').insert([{'title': f"Lagu {i}"} for i in (1, 2)]).execute()
+    mirror.table('judges').insert([{'name': f"Juri {i}"} for i in (1, 2)]).execute()
+    mirror.table('rubrics').insert([
+        {'rubric_key': 'tema', 'aspect_name': 'Tema', 'weight': 50, 'max_score': 5},
+        {'rubric_key': 'lirik', 'aspect_name': 'Lirik', 'weight': 50, 'max_score': 5}
+    ]).execute()
+    mirror.table('evaluations').insert([
+        {'judge_id': judge_id, 'song_id': song_id, 'total_score': 20.0, 'rubric_scores': {'tema': 4}}
+        for judge_id in (1, 2) for song_id in (1, 2)
+    ]).execute()
+    return mirror
+
+
+def test_scoped_tags():
+    assert CacheService.scoped_tag('evaluations') == 'evaluations:all'
+    assert CacheService.scoped_tag('evaluations', song_id=7, judge_id=3) == 'evaluations:judge_id=3,song_id=7'
+    assert CacheService.read_tags('evaluations', 'songs', judge_id=3, song_id=None) == [
+        'evaluations', 'evaluations:judge_id=3', 'songs']
+
+
+def test_row_write_drops_only_reads_that_could_hold_the_row():
+    saved = connection_manager.backend, connection_manager._mirror
+    connection_manager.backend, connection_manager._mirror = 'sqlite', seeded_mirror()
+    try:
+        from services.database_service import db_service
+        db_service._client = None
+        process_cache.invalidate()
+
+        reads = {
+            'all': lambda: db_service.get_evaluations(),
+            'judge_1': lambda: db_service.get_evaluations(judge_id=1),
+            'judge_2': lambda: db_service.get_evaluations(judge_id=2),
+            'song_1': lambda: db_service.get_evaluations(song_id=1),
+            'song_2': lambda: db_service.get_evaluations(song_id=2),
+            'judge_1_song_1': lambda: db_service.get_evaluations(judge_id=1, song_id=1),
+            'judge_1_song_2': lambda: db_service.get_evaluations(judge_id=1, song_id=2),
+            'songs': lambda: db_service.get_songs(),
+            'rubrics': lambda: db_service.get_rubrics(),
+        }
+        for read in reads.values():
+            read()
+
+        assert db_service.save_evaluation(1, 1, {'tema': 5}, 25.0, "")
+
+        reloaded = set()
+        for name, read in reads.items():
+            misses = process_cache.stats['misses']
+            read()
+            if process_cache.stats['misses'] > misses:
+                reloaded.add(name)
+
+        assert reloaded == {'all', 'judge_1', 'song_1', 'judge_1_song_1'}
+        assert db_service.get_evaluations(judge_id=1, song_id=1).loc[0, 'total_score'] == 25.0
+    finally:
+        connection_manager.backend, connection_manager._mirror = saved
+        db_service._client = None
+        process_cache.invalidate()
+
+
+if __name__ == "__main__":
+    print("🔍 Checking tagged cache invalidation...")
+    test_scoped_tags()
+    test_row_write_drops_only_reads_that_could_hold_the_row()
+    print("✅ Row writes drop only the cached reads that can hold the row")
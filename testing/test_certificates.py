@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Check the certificate ZIP export offline against the local SQLite mirror:
+an incremental run reuses every certificate rendered before, a change in
+the leaderboard re-renders exactly the certificates whose rank changed,
+templated pages look like the directly drawn ones, and the merged PDF
+shares one background per variant across its pages
+
+Usage:
+  python3 testing/test_certificates.py
+  pytest testing/test_certificates.py
+"""
+
+import os
+import sys
+import tempfile
+import zipfile
+
+import pytest
+
+# Add the project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services import export_service as export_module
+from services.cache_service import process_cache
+from services.connection_service import connection_manager
+from services.export_service import _load_pymupdf, export_service
+from services.local_mirror import SQLiteMirror
+
+
+def contest_mirror(n_songs: int = 5):
+    """Songs 1..n, one judge; song n scores highest, so songs n, n-1, n-2 are the winners"""
+    mirror = SQLiteMirror(':memory:')
+    mirror.table('songs').insert([{'title': f"Lagu {i}", 'composer': f"Pencipta {i}"}
+                                  for i in range(1, n_songs + 1)]).execute()
+    mirror.table('judges').insert({'name': "Juri 1"}).execute()
+    mirror.table('evaluations').insert([{'judge_id': 1, 'song_id': i, 'total_score': 10.0 + i, 'rubric_scores': {}}
+                                        for i in range(1, n_songs + 1)]).execute()
+    return mirror
+
+
+def run_offline(test):
+    mirror = contest_mirror()
+    saved = (connection_manager.backend, connection_manager._mirror,
+             export_module.CERTIFICATE_CACHE_DIR, export_module.EXPORT_DIR)
+    connection_manager.backend, connection_manager._mirror = 'sqlite', mirror
+    export_module.CERTIFICATE_CACHE_DIR = tempfile.mkdtemp(prefix="lomba-test-certificates-")
+    export_module.EXPORT_DIR = tempfile.mkdtemp(prefix="lomba-test-exports-")
+    from services.database_service import db_service
+    db_service._client = None
+    process_cache.invalidate()
+
+    rendered = []
+    render_certificate = export_service.render_certificate
+
+    def counting_render(name, song_title, rank=None, is_winner=False, templated=None):
+        rendered.append((name, rank))
+        return render_certificate(name, song_title, rank, is_winner, templated)
+
+    export_service.render_certificate = counting_render
+    try:
+        test(mirror, rendered)
+    finally:
+        del export_service.render_certificate
+        connection_manager.backend, connection_manager._mirror = saved[:2]
+        export_module.CERTIFICATE_CACHE_DIR, export_module.EXPORT_DIR = saved[2:]
+        db_service._client = None
+        process_cache.invalidate()
+
+
+def zip_entries(path):
+    try:
+        with zipfile.ZipFile(path) as zip_file:
+            return {name: zip_file.read(name) for name in zip_file.namelist()}
+    finally:
+        export_service.discard_export_file(path)
+
+
+def test_incremental_run_reuses_certificates():
+    def check(mirror, rendered):
+        first = zip_entries(export_service.generate_all_certificates_file())
+        assert len(first) == 5 and len(rendered) == 5
+        assert all(cert.startswith(b"%PDF") for cert in first.values())
+
+        rendered.clear()
+        second = zip_entries(export_service.generate_all_certificates_file())
+        assert rendered == [] and second == first
+
+        # Without incremental, everything is rendered again
+        zip_entries(export_service.generate_all_certificates_file(incremental=False))
+        assert len(rendered) == 5
+
+    run_offline(check)
+
+
+def test_changed_rank_is_rendered_again():
+    def check(mirror, rendered):
+        first = zip_entries(export_service.generate_all_certificates_file())
+        ranks = {job['name']: job['rank'] for job in export_service.certificate_jobs()}
+        assert ranks == {'Pencipta 1': None, 'Pencipta 2': None, 'Pencipta 3': 3,
+                         'Pencipta 4': 2, 'Pencipta 5': 1}
+
+        # Song 1 takes the lead: songs 5 and 4 move down and song 3 drops out of the top 3
+        mirror.table('evaluations').update({'total_score': 24.0}).eq('song_id', 1).execute()
+        process_cache.invalidate()
+        rendered.clear()
+        second = zip_entries(export_service.generate_all_certificates_file())
+
+        assert sorted(rendered) == [('Pencipta 1', 1), ('Pencipta 3', None),
+                                    ('Pencipta 4', 3), ('Pencipta 5', 2)]
+        assert second.keys() == first.keys()
+        assert second['certificate/Pencipta 2 - Lagu 2.pdf'] == first['certificate/Pencipta 2 - Lagu 2.pdf']
+        assert second['certificate/Pencipta 1 - Lagu 1.pdf'] != first['certificate/Pencipta 1 - Lagu 1.pdf']
+
+    run_offline(check)
+
+
+def test_templated_page_matches_direct_page():
+    pymupdf = _load_pymupdf()
+    if pymupdf is None:
+        pytest.skip("pymupdf is not installed")
+
+    for rank in (None, 2):
+        pages = []
+        for templated in (True, False):
+            cert = export_service.render_certificate("Ani Wijaya", "Waktu Bersama", rank,
+                                                     rank is not None, templated=templated)
+            with pymupdf.open("pdf", cert) as doc:
+                assert doc.page_count == 1
+                page = doc[0]
+                pages.append((page.rect, page.get_text(), page.get_pixmap(dpi=36).samples))
+        templated_page, direct_page = pages
+        assert templated_page[0] == direct_page[0]
+        assert templated_page[1] == direct_page[1] and "Ani Wijaya" in templated_page[1]
+        assert templated_page[2] == direct_page[2]
+
+
+def test_merged_pages_share_the_background():
+    pymupdf = _load_pymupdf()
+    if pymupdf is None:
+        pytest.skip("pymupdf is not installed")
+
+    def check(mirror, rendered):
+        single = len(export_service.render_certificate("Pencipta 1", "Lagu 1"))
+        path = export_service.generate_merged_certificates_file()
+        try:
+            # Two backgrounds (winner and participant) are stored once each,
+            # not once per page as in five standalone certificates
+            assert os.path.getsize(path) < 2.5 * single
+            with pymupdf.open(path) as doc:
+                assert doc.page_count == 5
+                assert doc.get_toc() == [[1, f"Pencipta {i} - Lagu {i}", i] for i in range(1, 6)]
+                assert "JUARA 1" in doc[4].get_text() and "JUARA" not in doc[0].get_text()
+        finally:
+            export_service.discard_export_file(path)
+        assert not os.path.exists(path)
+
+    run_offline(check)
+
+
+if __name__ == "__main__":
+    print("🔍 Checking certificate exports...")
+    test_incremental_run_reuses_certificates()
+    test_changed_rank_is_rendered_again()
+    if _load_pymupdf() is not None:
+        test_templated_page_matches_direct_page()
+        test_merged_pages_share_the_background()
+    print("✅ Certificates are reused until their rank changes and templated pages match")
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Check that pushed row changes patch or invalidate exactly the affected
+process-cache entries, using the in-process LocalChangeFeed
+
+Usage:
+  python3 testing/test_change_feed.py
+  pytest testing/test_change_feed.py
+"""
+
+import os
+import sys
+import threading
+import time
+from collections import Counter
+
+import pandas as pd
+
+# Add the project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.cache_service import CacheService, process_cache
+from services.change_feed_service import LocalChangeFeed
+
+calls = Counter()
+
+
+@CacheService.cache_data(ttl=0.05, key_prefix="test_feed_config", show_spinner=False,
+                         tags=CacheService.read_tags('configuration'), live_ttl=3600)
+def read_config():
+    calls['config'] += 1
+    return {'SHOW_AUTHOR': 'True'}
+
+
+@CacheService.cache_data(ttl=3600, key_prefix="test_feed_songs", show_spinner=False,
+                         tags=CacheService.read_tags('songs'))
+def read_songs():
+    calls['songs'] += 1
+    return pd.DataFrame({'id': [1, 2], 'title': ['Lagu A', 'Lagu B'], 'play_count': [5, 9],
+                         'is_active': [True, True]})
+
+
+@CacheService.cache_data(ttl=3600, key_prefix="test_feed_evaluations", show_spinner=False,
+                         tags=lambda judge_id=None: CacheService.read_tags(
+                             'evaluations', 'judges', 'songs', judge_id=judge_id))
+def read_evaluations(judge_id=None):
+    calls[f"evaluations_{judge_id}"] += 1
+    return pd.DataFrame({'judge_id': [judge_id], 'song_id': [1]})
+
+
+@CacheService.cache_data(ttl=0.05, key_prefix="test_feed_keywords", show_spinner=False,
+                         tags=CacheService.read_tags('keywords'), live_ttl=3600)
+def read_keywords(fail=False):
+    # Like the DatabaseService fetchers: errors come back as an empty frame
+    calls['keywords'] += 1
+    return pd.DataFrame() if fail else pd.DataFrame({'keyword': ['kasih']})
+
+
+def fresh_feed():
+    process_cache.invalidate()
+    calls.clear()
+    return LocalChangeFeed()
+
+
+def test_live_feed_extends_ttl_until_a_change_arrives():
+    feed = fresh_feed()
+    feed.connect()
+    try:
+        read_config()
+        time.sleep(0.1)
+        read_config()
+        assert calls['config'] == 1
+
+        feed.publish('configuration', 'UPDATE', {'key': 'SHOW_AUTHOR', 'value': 'False'})
+        read_config()
+        assert calls['config'] == 2
+    finally:
+        feed.disconnect()
+
+
+def test_empty_results_keep_the_short_ttl():
+    feed = fresh_feed()
+    feed.connect()
+    try:
+        read_keywords(fail=True)
+        time.sleep(0.1)
+        read_keywords(fail=True)
+        assert calls['keywords'] == 2
+    finally:
+        feed.disconnect()
+
+
+def test_read_overlapping_a_change_is_not_cached():
+    feed = fresh_feed()
+    feed.connect()
+    started, release = threading.Event(), threading.Event()
+
+    @CacheService.cache_data(ttl=3600, key_prefix="test_feed_slow_config", show_spinner=False,
+                             tags=CacheService.read_tags('configuration'), live_ttl=3600)
+    def slow_config():
+        calls['slow_config'] += 1
+        started.set()
+        release.wait(2)
+        return {'SHOW_AUTHOR': 'True'}
+
+    try:
+        reader = threading.Thread(target=slow_config)
+        reader.start()
+        started.wait(2)
+        # The change lands while the read is still in flight
+        feed.publish('configuration', 'UPDATE', {'key': 'SHOW_AUTHOR', 'value': 'False'})
+        release.set()
+        reader.join()
+
+        slow_config()
+        assert calls['slow_config'] == 2
+        assert process_cache.stats['stale_computes'] >= 1
+    finally:
+        feed.disconnect()
+
+
+def test_evaluation_change_drops_only_affected_reads():
+    feed = fresh_feed()
+    read_evaluations(judge_id=1)
+    read_evaluations(judge_id=2)
+
+    feed.publish('evaluations', 'UPDATE', {'id': 10, 'judge_id': 1, 'song_id': 1})
+    read_evaluations(judge_id=1)
+    read_evaluations(judge_id=2)
+
+    assert calls['evaluations_1'] == 2
+    assert calls['evaluations_2'] == 1
+
+    # Evaluations embed judge names, so a pushed judge change drops them all
+    feed.publish('judges', 'UPDATE', {'id': 2, 'name': 'Juri Dua'})
+    read_evaluations(judge_id=1)
+    read_evaluations(judge_id=2)
+    assert calls['evaluations_1'] == 3 and calls['evaluations_2'] == 2
+
+
+def test_play_count_update_is_patched_in_place():
+    feed = fresh_feed()
+    before = read_songs()
+
+    feed.publish('songs', 'UPDATE', {'id': 2, 'title': 'Lagu B', 'play_count': 12, 'is_active': True})
+    patched = read_songs()
+
+    assert calls['songs'] == 1
+    assert patched.loc[patched['id'] == 2, 'play_count'].item() == 12
+    assert before.loc[before['id'] == 2, 'play_count'].item() == 9
+
+    feed.publish('songs', 'UPDATE', {'id': 1, 'title': 'Lagu A (revisi)', 'play_count': 5, 'is_active': True})
+    read_songs()
+    assert calls['songs'] == 2
+
+
+def test_disconnect_invalidates_fed_tables():
+    feed = fresh_feed()
+    feed.connect()
+    read_config()
+    read_songs()
+
+    feed.disconnect()
+    assert not process_cache.push_invalidation
+    read_config()
+    read_songs()
+
+    assert calls['config'] == 2 and calls['songs'] == 2
+
+
+if __name__ == "__main__":
+    print("🔍 Checking change feed cache refresh...")
+    test_live_feed_extends_ttl_until_a_change_arrives()
+    test_empty_results_keep_the_short_ttl()
+    test_read_overlapping_a_change_is_not_cached()
+    test_evaluation_change_drops_only_affected_reads()
+    test_play_count_update_is_patched_in_place()
+    test_disconnect_invalidates_fed_tables()
+    print("✅ Row changes patch or invalidate only the affected cache entries")
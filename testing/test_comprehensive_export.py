@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Check that the streamed comprehensive export round-trips in every format:
+each table comes back from the workbook sheet, CSV or Parquet file with
+its rows in order across chunk boundaries, nested values as JSON and
+missing values empty
+
+Usage:
+  python3 testing/test_comprehensive_export.py
+  pytest testing/test_comprehensive_export.py
+"""
+
+import io
+import json
+import os
+import sys
+import tempfile
+import zipfile
+from importlib.util import find_spec
+
+import pandas as pd
+import pytest
+
+# Add the project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services import export_service as export_module
+from services.export_service import export_service
+
+EVALUATIONS = pd.DataFrame({
+    'id': [1, 2, 3, 4, 5],
+    'song_id': [3, 1, 2, 3, 1],
+    'total_score': [21.5, None, 18.25, 24.0, 12.0],
+    'rubric_scores': [{'tema': 5, 'lirik': 4}, {}, {'tema': 3}, {'tema': 5, 'lirik': 5}, {'lirik': 2}],
+    'comments': ["Bagus", None, "Lirik \"kuat\", melodi sederhana", "Luar biasa", "Baris 1\nBaris 2"],
+    'created_at': pd.to_datetime(['2025-01-10 09:00', '2025-01-10 09:30', '2025-01-11 10:00',
+                                  '2025-01-11 10:15', '2025-01-12 08:45']),
+})
+SUMMARY = pd.DataFrame([{'Total Songs': 3, 'Total Evaluations': 5, 'Average Score': 18.94}])
+TABLES = [('Raw_Evaluations', EVALUATIONS), ('Summary', SUMMARY)]
+
+
+def comparable(df):
+    """Values as plain objects with None for missing, so string and numeric dtypes do not matter"""
+    df = df.copy()
+    if 'created_at' in df:
+        df['created_at'] = pd.to_datetime(df['created_at'])
+    return df.astype(object).where(df.notna(), None)
+
+
+def expected(df):
+    """The frame as an export stores it: nested values as JSON text"""
+    df = df.copy()
+    if 'rubric_scores' in df:
+        df['rubric_scores'] = [json.dumps(value, ensure_ascii=False) for value in df['rubric_scores']]
+    return comparable(df)
+
+
+def export(export_format):
+    """Export TABLES in ``export_format`` with two rows per chunk and return the file path"""
+    saved = export_module.EXPORT_DIR
+    export_module.EXPORT_DIR = tempfile.mkdtemp(prefix="lomba-test-exports-")
+    export_service._comprehensive_tables = lambda: TABLES
+    try:
+        path = export_service.export_comprehensive_file(export_format, chunk_rows=2)
+        assert os.path.dirname(path) == export_module.EXPORT_DIR
+        return path
+    finally:
+        del export_service._comprehensive_tables
+        export_module.EXPORT_DIR = saved
+
+
+def assert_round_trip(frames):
+    assert list(frames) == [name for name, _ in TABLES]
+    for name, df in TABLES:
+        pd.testing.assert_frame_equal(comparable(frames[name]), expected(df))
+
+
+def test_xlsx_round_trip():
+    path = export('xlsx')
+    try:
+        assert_round_trip(pd.read_excel(path, sheet_name=None))
+    finally:
+        export_service.discard_export_file(path)
+
+
+def test_csv_zip_round_trip():
+    path = export('csv_zip')
+    try:
+        with zipfile.ZipFile(path) as zip_file:
+            assert zip_file.namelist() == [f"{name}.csv" for name, _ in TABLES]
+            assert_round_trip({name[:-len(".csv")]: pd.read_csv(zip_file.open(name), encoding='utf-8-sig')
+                               for name in zip_file.namelist()})
+    finally:
+        export_service.discard_export_file(path)
+
+
+def test_parquet_zip_round_trip():
+    if find_spec("pyarrow") is None:
+        pytest.skip("pyarrow is not installed")
+    path = export('parquet_zip')
+    try:
+        with zipfile.ZipFile(path) as zip_file:
+            assert zip_file.namelist() == [f"{name}.parquet" for name, _ in TABLES]
+            assert_round_trip({name[:-len(".parquet")]: pd.read_parquet(io.BytesIO(zip_file.read(name)))
+                               for name in zip_file.namelist()})
+    finally:
+        export_service.discard_export_file(path)
+
+
+def test_unknown_format_is_rejected():
+    with pytest.raises(ValueError):
+        export_service.export_comprehensive_file('ods')
+
+
+if __name__ == "__main__":
+    print("🔍 Checking comprehensive export round trips...")
+    test_xlsx_round_trip()
+    test_csv_zip_round_trip()
+    if find_spec("pyarrow") is not None:
+        test_parquet_zip_round_trip()
+    test_unknown_format_is_rejected()
+    print("✅ Every export format returns the tables it was given")
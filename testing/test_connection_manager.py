@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Check the ConnectionManager's request plumbing without a network: REST and
+storage paths are classified for the metrics, failed connects are retried
+with backoff on the client's own httpx transport, and public storage
+downloads reuse the local copy while the object's ETag is unchanged
+
+Usage:
+  python3 testing/test_connection_manager.py
+  pytest testing/test_connection_manager.py
+"""
+
+import os
+import sys
+import tempfile
+from types import SimpleNamespace
+
+import pytest
+
+# Add the project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.connection_service import ConnectionManager
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+
+def offline_manager(**kwargs):
+    return ConnectionManager(backend='sqlite', backoff_seconds=0,
+                             cache_dir=tempfile.mkdtemp(prefix="lomba-test-storage-"), **kwargs)
+
+
+def test_paths_are_classified_per_table_rpc_and_bucket():
+    classify = ConnectionManager._classify
+    assert classify('/rest/v1/evaluations') == ('table', 'evaluations')
+    assert classify('/rest/v1/rpc/increment_play_counts') == ('rpc', 'increment_play_counts')
+    assert classify('/storage/v1/object/public/song-contest-files/certificates/a.pdf') == (
+        'storage', 'song-contest-files')
+    assert classify('/storage/v1/object/sign/song-contest-files/a.pdf') == ('storage', 'song-contest-files')
+    assert classify('/storage/v1/bucket') == ('storage', 'bucket')
+    assert classify('/auth/v1/token') == ('other', 'auth/v1')
+
+    manager = offline_manager()
+    manager.record('table', 'songs', 0.2)
+    manager.record('table', 'songs', 0.4, ok=False)
+    manager.record('rpc', 'increment_play_counts', 0.1)
+    songs = manager.metrics()[0]
+    assert songs == {'kind': 'table', 'name': 'songs', 'requests': 2, 'errors': 1,
+                     'avg_ms': 300.0, 'max_ms': 400.0}
+
+
+class FlakyTransport(httpx.BaseTransport if httpx else object):
+    """Fails the first ``failures`` connects, then answers 200 (or ``status``)"""
+
+    def __init__(self, failures, status=200):
+        self.failures = failures
+        self.status = status
+        self.attempts = 0
+
+    def handle_request(self, request):
+        self.attempts += 1
+        if self.attempts <= self.failures:
+            raise httpx.ConnectError("connection refused", request=request)
+        return httpx.Response(self.status, json=[], request=request)
+
+
+def instrumented_client(manager, transport):
+    http_client = httpx.Client(base_url="https://contest.supabase.co", transport=transport)
+    client = SimpleNamespace(postgrest=SimpleNamespace(session=http_client),
+                             storage=SimpleNamespace(_client=None))
+    manager._instrument(client)
+    return http_client
+
+
+def test_failed_connects_are_retried_and_timed():
+    if httpx is None:
+        pytest.skip("httpx is not installed")
+    manager = offline_manager(retries=2)
+
+    transport = FlakyTransport(failures=2)
+    http_client = instrumented_client(manager, transport)
+    assert http_client.get("/rest/v1/songs").status_code == 200
+    assert transport.attempts == 3
+
+    # Past the retry budget the connect error reaches the caller
+    transport = FlakyTransport(failures=3)
+    http_client = instrumented_client(manager, transport)
+    with pytest.raises(httpx.ConnectError):
+        http_client.get("/rest/v1/songs")
+    assert transport.attempts == 3
+
+    # Answered requests are counted per table; 4xx/5xx count as errors
+    instrumented_client(manager, FlakyTransport(failures=0, status=503)).get("/rest/v1/rpc/refresh")
+    metrics = {(row['kind'], row['name']): row for row in manager.metrics()}
+    assert metrics[('table', 'songs')]['requests'] == 1 and metrics[('table', 'songs')]['errors'] == 0
+    assert metrics[('rpc', 'refresh')]['errors'] == 1
+
+
+class FakeResponse:
+    def __init__(self, status_code, body=b"", etag=None):
+        self.status_code = status_code
+        self.headers = {'ETag': etag} if etag else {}
+        self.body = body
+
+    def iter_content(self, chunk_size):
+        for start in range(0, len(self.body), chunk_size):
+            yield self.body[start:start + chunk_size]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class FakeSession:
+    """Serves one storage object whose content and ETag the test can change"""
+
+    def __init__(self):
+        self.objects = {}
+        self.requests = []
+
+    def get(self, url, headers=None, stream=False, timeout=None):
+        headers = headers or {}
+        self.requests.append(headers)
+        name = url.rsplit('/', 1)[-1]
+        if name not in self.objects:
+            return FakeResponse(404)
+        body, etag = self.objects[name]
+        if headers.get('If-None-Match') == etag:
+            return FakeResponse(304)
+        return FakeResponse(200, body, etag)
+
+
+def test_unchanged_objects_are_revalidated_not_downloaded():
+    manager = offline_manager()
+    session = manager._session = FakeSession()
+    session.objects['a.pdf'] = (b"first version" * 10000, '"v1"')
+
+    first = manager.download_public_cached('song-contest-files', 'certificates/a.pdf')
+    with open(first, 'rb') as f:
+        assert f.read() == b"first version" * 10000
+    assert session.requests[-1] == {}
+
+    # Known ETag: one 304 and the same local copy
+    assert manager.download_public_cached('song-contest-files', 'certificates/a.pdf') == first
+    assert session.requests[-1] == {'If-None-Match': '"v1"'}
+
+    # A changed object replaces the old copy
+    session.objects['a.pdf'] = (b"second version", '"v2"')
+    second = manager.download_public_cached('song-contest-files', 'certificates/a.pdf')
+    with open(second, 'rb') as f:
+        assert f.read() == b"second version"
+    assert second != first and not os.path.exists(first)
+
+    assert manager.download_public_cached('song-contest-files', 'certificates/missing.pdf') is None
+    storage = manager.metrics()[0]
+    assert (storage['kind'], storage['name']) == ('storage', 'song-contest-files')
+    assert storage['requests'] == 4 and storage['errors'] == 1
+
+
+if __name__ == "__main__":
+    print("🔍 Checking connection manager retries, metrics and storage cache...")
+    test_paths_are_classified_per_table_rpc_and_bucket()
+    if httpx is not None:
+        test_failed_connects_are_retried_and_timed()
+    test_unchanged_objects_are_revalidated_not_downloaded()
+    print("✅ Requests are classified, retried and revalidated by ETag")
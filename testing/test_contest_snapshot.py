@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Check that a ContestSnapshot loads each table once, derives the same
+analytics as AnalyticsService, overlays pending auto-saves on a judge's
+evaluations and refuses to be modified
+
+Usage:
+  python3 testing/test_contest_snapshot.py
+  pytest testing/test_contest_snapshot.py
+"""
+
+import json
+import os
+import sys
+from collections import Counter
+
+import pandas as pd
+
+# Add the project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.analytics_service import analytics_service
+from services.autosave_service import AutoSaveService
+from services.contest_snapshot import ContestSnapshot
+from services.evaluation_scorer import evaluation_scorer
+from services.leaderboard import compute_leaderboard
+
+SONG_COLUMNS = ['audio_file_path', 'lyrics_text', 'full_score', 'chords_list', 'lyrics_with_chords',
+                'key_signature', 'notation_file_path', 'lyrics_file_path']
+
+
+class CountingLoader:
+    """In-memory stand-in for DatabaseService that counts table reads"""
+
+    def __init__(self):
+        self.calls = Counter()
+        self.songs = pd.DataFrame({
+            'id': [1, 2, 3],
+            'title': ['Lagu A', 'Lagu B', 'Lagu C'],
+            'composer': ['Pencipta A', 'Pencipta B', 'Pencipta C'],
+            **{column: [None] * 3 for column in SONG_COLUMNS}
+        })
+        self.judges = pd.DataFrame({'id': [1, 2], 'name': ['Juri 1', 'Juri 2']})
+        self.rubrics = pd.DataFrame({
+            'rubric_key': ['tema', 'lirik'],
+            'aspect_name': ['Tema', 'Lirik'],
+            'weight': [0.6, 0.4],
+            'max_score': [5, 5]
+        })
+        rows = []
+        for judge_id, offset in ((1, 0), (2, 1)):
+            for song_id in (1, 2, 3):
+                scores = {'tema': min(5, song_id + offset), 'lirik': 3}
+                rows.append({
+                    'id': len(rows) + 1, 'judge_id': judge_id, 'song_id': song_id,
+                    'rubric_scores': json.dumps(scores),
+                    'total_score': float(sum(scores.values()) * 2.5),
+                    'created_at': f"2025-01-0{song_id}T10:00:00"
+                })
+        self.evaluations = pd.DataFrame(rows)
+
+    def get_config(self):
+        self.calls['config'] += 1
+        return {'WINNERS_TOP_N': '3'}
+
+    def get_songs(self):
+        self.calls['songs'] += 1
+        return self.songs
+
+    def get_judges(self):
+        self.calls['judges'] += 1
+        return self.judges
+
+    def get_rubrics(self):
+        self.calls['rubrics'] += 1
+        return self.rubrics
+
+    def get_evaluations(self):
+        self.calls['evaluations'] += 1
+        return self.evaluations
+
+    def get_leaderboard(self):
+        self.calls['leaderboard'] += 1
+        return compute_leaderboard(self.evaluations, self.songs)
+
+
+def test_tables_load_once_and_analytics_are_memoized():
+    loader = CountingLoader()
+    snapshot = ContestSnapshot(loader)
+
+    # Every tab of a rerun asking for the same data
+    for _ in range(3):
+        leaderboard = snapshot.leaderboard
+        snapshot.judge_analytics
+        snapshot.rubric_analytics
+        snapshot.insights
+        snapshot.judge_progress(1)
+        snapshot.evaluations_for_judge(2)
+
+    assert set(loader.calls.values()) == {1}
+    assert snapshot.leaderboard is leaderboard
+    assert snapshot.judge_progress(1) is snapshot.judge_progress(1)
+
+
+def test_snapshot_matches_analytics_service():
+    loader = CountingLoader()
+    snapshot = ContestSnapshot(loader)
+
+    expected_leaderboard = analytics_service.build_global_leaderboard(
+        compute_leaderboard(loader.evaluations, loader.songs), loader.songs
+    )
+    pd.testing.assert_frame_equal(snapshot.leaderboard, expected_leaderboard)
+    assert list(snapshot.leaderboard['song_id']) == [3, 2, 1]
+
+    expected_rubrics = analytics_service.build_rubric_analytics(
+        evaluation_scorer.rubric_score_table(loader.evaluations), loader.rubrics
+    )
+    pd.testing.assert_frame_equal(snapshot.rubric_analytics, expected_rubrics)
+
+    judge_one = snapshot.evaluations_for_judge(1)
+    assert list(judge_one['song_id']) == [1, 2, 3]
+    assert (snapshot.judge_progress(1)['status'] == 'complete').all()
+    assert snapshot.insights['competition']['leader'] == 'Lagu C'
+
+
+def test_judge_views_include_pending_auto_saves():
+    loader = CountingLoader()
+    # Changes stay buffered for the whole test
+    pending = AutoSaveService(debounce_seconds=3600, max_delay_seconds=3600)
+    loader.evaluations = loader.evaluations[loader.evaluations['song_id'] != 3].reset_index(drop=True)
+    pending.queue_score(1, 1, 'tema', 5)
+    pending.queue_score(1, 3, 'tema', 4)
+    pending.queue_score(1, 3, 'lirik', 4)
+
+    snapshot = ContestSnapshot(loader, pending=pending)
+    judge_one = snapshot.evaluations_for_judge(1).set_index('song_id')
+
+    assert evaluation_scorer.parse_scores(judge_one.loc[1, 'rubric_scores']) == {'tema': 5, 'lirik': 3}
+    assert judge_one.loc[1, 'total_score'] == evaluation_scorer.total_for({'tema': 5, 'lirik': 3}, loader.rubrics)
+    # A song with only buffered changes has no stored id yet
+    assert pd.isna(judge_one.loc[3, 'id']) and judge_one.loc[3, 'rubric_scores'] == {'tema': 4, 'lirik': 4}
+    assert (snapshot.judge_progress(1)['status'] == 'complete').all()
+
+    # Other judges and the shared tables show only what is stored
+    assert len(snapshot.evaluations_for_judge(2)) == 2
+    assert len(snapshot.evaluations) == 4 and pending.has_pending(1)
+
+
+def test_snapshot_is_read_only():
+    snapshot = ContestSnapshot(CountingLoader())
+    columns_before = list(snapshot.leaderboard.columns)
+    snapshot.insights
+
+    # Insights must not add helper columns to the shared leaderboard
+    assert list(snapshot.leaderboard.columns) == columns_before
+
+    for action in (lambda: setattr(snapshot, 'songs', pd.DataFrame()),
+                   lambda: delattr(snapshot, 'songs')):
+        try:
+            action()
+        except AttributeError:
+            continue
+        raise AssertionError("ContestSnapshot accepted a modification")
+
+
+if __name__ == "__main__":
+    print("🔍 Checking contest snapshot...")
+    test_tables_load_once_and_analytics_are_memoized()
+    test_snapshot_matches_analytics_service()
+    test_judge_views_include_pending_auto_saves()
+    test_snapshot_is_read_only()
+    print("✅ Contest snapshot loads each table once and shares its analytics")
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+Check the vectorized EvaluationScorer against the per-row iterrows code it
+replaced, including missing rubric keys, unscored rubrics and zero weights,
+and the shared long rubric-score table against a per-row expansion
+
+Usage:
+  python3 testing/test_evaluation_scorer.py
+  pytest testing/test_evaluation_scorer.py
+"""
+
+import json
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+# Add the project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.cache_service import CacheService, process_cache
+from services.evaluation_scorer import evaluation_scorer
+
+RUBRICS = pd.DataFrame({
+    'rubric_key': ['tema', 'lirik', 'melodi', 'aransemen', 'bonus'],
+    'weight': [30, 25, 25, 20, 0],
+    'max_score': [5, 5, 5, 5, 5]
+})
+
+
+def sample_evaluations(n_rows=60, seed=7):
+    """Evaluations with some rubric keys missing, zero scores and JSON or dict scores"""
+    rng = np.random.default_rng(seed)
+    rows = []
+    for i in range(n_rows):
+        scores = {key: int(rng.integers(0, 6)) for key in RUBRICS['rubric_key'] if rng.random() > 0.2}
+        rows.append({
+            'id': i + 1, 'judge_id': i % 4 + 1, 'song_id': i % 15 + 1,
+            'rubric_scores': json.dumps(scores) if i % 2 else scores
+        })
+    return pd.DataFrame(rows)
+
+
+def iterrows_total(rubric_scores, rubrics_df):
+    """Weighted total as auto-save computed it before the scorer"""
+    total_weighted_score = 0
+    for _, rubric in rubrics_df.iterrows():
+        if rubric['rubric_key'] in rubric_scores:
+            rubric_score = rubric_scores[rubric['rubric_key']]
+            total_weighted_score += (rubric_score / rubric['max_score']) * (rubric['weight'] / 100) * 25
+    return total_weighted_score
+
+
+def iterrows_completed(rubric_scores):
+    """Completed rubric count as the history tab computed it before the scorer"""
+    return len([score for score in rubric_scores.values() if score and score > 0])
+
+
+def test_totals_and_completeness_match_iterrows():
+    evaluations = sample_evaluations()
+    frame = evaluation_scorer.score_frame(evaluations, RUBRICS)
+
+    for i, evaluation in evaluations.iterrows():
+        scores = evaluation['rubric_scores']
+        scores = json.loads(scores) if isinstance(scores, str) else scores
+
+        assert np.isclose(frame.loc[i, 'computed_total'], iterrows_total(scores, RUBRICS))
+        assert np.isclose(evaluation_scorer.total_for(scores, RUBRICS), iterrows_total(scores, RUBRICS))
+        assert frame.loc[i, 'completed_rubrics'] == iterrows_completed(scores)
+        assert frame.loc[i, 'is_complete'] == (iterrows_completed(scores) == len(RUBRICS))
+
+
+def test_missing_keys_and_zero_weights():
+    evaluations = pd.DataFrame({'id': [1, 2, 3], 'rubric_scores': [
+        {'tema': 5, 'lirik': 5, 'melodi': 5, 'aransemen': 5, 'bonus': 5},
+        {'tema': 5, 'unknown': 4},
+        None
+    ]})
+    frame = evaluation_scorer.score_frame(evaluations, RUBRICS)
+
+    # The zero-weight rubric counts for completeness but adds nothing
+    assert frame.loc[0, 'computed_total'] == 25.0 and frame.loc[0, 'is_complete']
+    # Keys that are not rubrics are ignored; missing rubrics score 0 and are incomplete
+    assert frame.loc[1, 'computed_total'] == 7.5 and frame.loc[1, 'completed_rubrics'] == 1
+    assert frame.loc[2, 'computed_total'] == 0.0 and not frame.loc[2, 'is_complete']
+    assert np.isnan(frame.loc[2, 'tema'])
+
+
+def per_row_expansion(evaluations):
+    """(evaluation, song, judge, rubric, score) rows built one evaluation at a time"""
+    rows = []
+    for _, evaluation in evaluations.iterrows():
+        for key, score in evaluation_scorer.parse_scores(evaluation['rubric_scores']).items():
+            rows.append((evaluation['id'], evaluation['song_id'], evaluation['judge_id'], key, float(score)))
+    return sorted(rows)
+
+
+def test_rubric_score_table_matches_per_row_expansion():
+    process_cache.invalidate()
+    evaluations = sample_evaluations()
+    table = evaluation_scorer.rubric_score_table(evaluations)
+
+    assert sorted(zip(table['evaluation_id'], table['song_id'], table['judge_id'],
+                      table['rubric_key'].astype(str), table['score'].astype(float))) == per_row_expansion(evaluations)
+
+    summary = evaluation_scorer.rubric_score_summary(table).set_index('rubric_key')
+    expected = pd.DataFrame(per_row_expansion(evaluations), columns=['id', 'song_id', 'judge_id', 'key', 'score'])
+    expected = expected[expected['score'] > 0].groupby('key')['score']
+    assert np.allclose(summary['avg_score'], expected.mean().loc[summary.index])
+    assert (summary['total_scores'] == expected.count().loc[summary.index]).all()
+
+
+def test_rubric_score_table_is_shared_until_evaluations_change():
+    process_cache.invalidate()
+    evaluations = sample_evaluations()
+
+    misses = process_cache.stats['misses']
+    evaluation_scorer.rubric_score_table(evaluations)
+    evaluation_scorer.rubric_score_table(evaluations.copy())
+    assert process_cache.stats['misses'] == misses + 1
+
+    # A write to evaluations drops the cached table
+    CacheService.invalidate_tables('evaluations')
+    evaluation_scorer.rubric_score_table(evaluations)
+    assert process_cache.stats['misses'] == misses + 2
+
+    # A different snapshot gets its own table
+    changed = evaluations.assign(rubric_scores=[{'tema': 1}] * len(evaluations))
+    table = evaluation_scorer.rubric_score_table(changed)
+    assert process_cache.stats['misses'] == misses + 3
+    assert set(table['rubric_key'].astype(str)) == {'tema'} and len(table) == len(evaluations)
+
+
+if __name__ == "__main__":
+    print("🔍 Checking vectorized evaluation scoring...")
+    test_totals_and_completeness_match_iterrows()
+    test_missing_keys_and_zero_weights()
+    test_rubric_score_table_matches_per_row_expansion()
+    test_rubric_score_table_is_shared_until_evaluations_change()
+    print("✅ Vectorized scoring and the rubric-score table match the per-row code")
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Check the incremental evaluations sync offline against an in-memory
+stand-in for the Supabase query builder
+
+Usage:
+  python3 testing/test_evaluation_sync.py
+  pytest testing/test_evaluation_sync.py
+"""
+
+import os
+import sys
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+# Add the project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.cache_service import CacheService, process_cache
+from services.evaluation_sync import EvaluationSync
+
+START = datetime(2025, 10, 1, 9, 0, 0)
+
+
+class FakeResponse:
+    def __init__(self, data):
+        self.data = data
+
+
+class FakeQuery:
+    """select / gte / in_ / execute over a list of row dicts"""
+
+    def __init__(self, table, columns):
+        self.table = table
+        self.columns = columns
+        self.filters = []
+
+    def gte(self, column, value):
+        self.filters.append(lambda row: row[column] >= value)
+        return self
+
+    def in_(self, column, values):
+        self.filters.append(lambda row: row[column] in set(values))
+        return self
+
+    def execute(self):
+        rows = [dict(row) for row in self.table.rows if all(f(row) for f in self.filters)]
+        if self.columns == 'id':
+            rows = [{'id': row['id']} for row in rows]
+        self.table.selects.append((self.columns, len(rows)))
+        return FakeResponse(rows)
+
+
+class FakeTable:
+    def __init__(self):
+        self.rows = []
+        self.selects = []
+        self.clock = START
+
+    def select(self, columns):
+        return FakeQuery(self, columns)
+
+    def write(self, row_id, judge_id, song_id, total_score):
+        """Insert or update a row, stamping updated_at like the server trigger"""
+        self.clock += timedelta(seconds=30)
+        self.rows = [row for row in self.rows if row['id'] != row_id]
+        self.rows.append({'id': row_id, 'judge_id': judge_id, 'song_id': song_id,
+                          'total_score': total_score, 'updated_at': self.clock.isoformat()})
+
+
+class FakeClient:
+    def __init__(self, table):
+        self._table = table
+
+    def table(self, name):
+        assert name == 'evaluations'
+        return self._table
+
+
+def seeded(n_rows=200):
+    table = FakeTable()
+    for row_id in range(1, n_rows + 1):
+        table.write(row_id, row_id % 5 + 1, row_id, 10.0)
+    return table, EvaluationSync(FakeClient(table), overlap_seconds=5, reconcile_seconds=3600)
+
+
+def test_refresh_fetches_only_changed_rows():
+    process_cache.invalidate()
+    table, sync = seeded()
+    assert len(sync.evaluations()) == 200
+
+    table.write(7, 3, 7, 22.5)
+    table.write(201, 1, 201, 18.0)
+    frame = sync.evaluations()
+
+    # The two changed rows plus the newest known one, inside the overlap window
+    columns, fetched = table.selects[-1]
+    assert columns != 'id' and fetched == 3
+    assert len(frame) == 201
+    assert frame.loc[frame['id'] == 7, 'total_score'].item() == 22.5
+    assert list(frame['id']) == sorted(frame['id'])
+    assert sync.sync_stats()['full_loads'] == 1
+
+
+def test_handed_out_frames_do_not_change():
+    process_cache.invalidate()
+    table, sync = seeded(10)
+    before = sync.evaluations()
+
+    table.write(3, 4, 3, 25.0)
+    after = sync.evaluations()
+
+    assert before.loc[before['id'] == 3, 'total_score'].item() == 10.0
+    assert after.loc[after['id'] == 3, 'total_score'].item() == 25.0
+
+
+def test_filters_and_reconcile_drop_deleted_rows():
+    process_cache.invalidate()
+    table, sync = seeded(20)
+    sync.evaluations()
+
+    judge_rows = sync.evaluations(judge_id=2)
+    assert set(judge_rows['judge_id']) == {2}
+    assert len(sync.evaluations(judge_id=2, song_id=6)) == 1
+
+    table.rows = [row for row in table.rows if row['id'] != 5]
+    sync.reconcile_seconds = 0
+    frame = sync.evaluations()
+
+    assert 5 not in set(frame['id'])
+    assert sync.sync_stats()['rows_deleted'] == 1
+
+
+def test_table_wide_invalidation_forces_full_reload():
+    process_cache.invalidate()
+    table, sync = seeded(10)
+    sync.evaluations()
+
+    # A judge rename changes the joined judge columns of every row
+    CacheService.invalidate_tables('judges')
+    sync.evaluations()
+    assert sync.sync_stats()['full_loads'] == 2
+
+    # A single-row write keeps the delta path
+    table.write(1, 1, 1, 12.0)
+    CacheService.invalidate_rows('evaluations', judge_id=1, song_id=1)
+    sync.evaluations()
+    assert sync.sync_stats()['full_loads'] == 2
+
+
+if __name__ == "__main__":
+    print("🔍 Checking incremental evaluations sync...")
+    test_refresh_fetches_only_changed_rows()
+    test_handed_out_frames_do_not_change()
+    test_filters_and_reconcile_drop_deleted_rows()
+    test_table_wide_invalidation_forces_full_reload()
+    print("✅ Evaluations sync fetches only changed rows")
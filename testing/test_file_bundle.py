@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Check bundle_public_files against a stubbed storage session: missing and
+failing objects are reported per file without failing the ZIP, unchanged
+objects are revalidated by ETag instead of downloaded again, and the
+returned archive is a plain file that is gone once closed
+
+Usage:
+  python3 testing/test_file_bundle.py
+  pytest testing/test_file_bundle.py
+"""
+
+import io
+import os
+import sys
+import tempfile
+import zipfile
+
+# Add the project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.connection_service import connection_manager
+
+
+class FakeResponse:
+    def __init__(self, status_code, body=b"", etag=None):
+        self.status_code = status_code
+        self.headers = {'ETag': etag} if etag else {}
+        self.body = body
+
+    def iter_content(self, chunk_size):
+        yield self.body
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class FakeStorage:
+    """Public objects by name; names in ``broken`` fail like a dropped connection"""
+
+    def __init__(self, objects, broken=()):
+        self.objects = dict(objects)
+        self.broken = set(broken)
+        self.downloads = []
+        self.revalidated = []
+
+    def get(self, url, headers=None, stream=False, timeout=None):
+        name = url.rsplit('/', 1)[-1]
+        if name in self.broken:
+            raise ConnectionError("connection reset")
+        if name not in self.objects:
+            return FakeResponse(404)
+        body, etag = self.objects[name]
+        if (headers or {}).get('If-None-Match') == etag:
+            self.revalidated.append(name)
+            return FakeResponse(304)
+        self.downloads.append(name)
+        return FakeResponse(200, body, etag)
+
+
+def run_offline(test):
+    saved = (connection_manager.backend, connection_manager._session, connection_manager.cache_dir)
+    connection_manager.backend = 'sqlite'
+    connection_manager.cache_dir = tempfile.mkdtemp(prefix="lomba-test-storage-")
+    try:
+        from services.file_service import file_service
+        test(file_service)
+    finally:
+        connection_manager.backend, connection_manager._session, connection_manager.cache_dir = saved
+
+
+FILES = [(f"certificates/{name}", f"Sertifikat/{name}") for name in ('a.pdf', 'b.pdf', 'missing.pdf', 'broken.pdf')]
+
+
+def test_failures_are_reported_per_file():
+    def check(file_service):
+        connection_manager._session = FakeStorage(
+            {'a.pdf': (b"A" * 1000, '"a1"'), 'b.pdf': (b"B", '"b1"'), 'broken.pdf': (b"X", '"x"')},
+            broken={'broken.pdf'})
+        progress = []
+        archive, results = file_service.bundle_public_files(
+            FILES, bucket='song-contest-files', max_workers=2,
+            on_progress=lambda done, total, result: progress.append((done, total)))
+
+        assert [(result['name'], result['ok'], result['error']) for result in results] == [
+            ('Sertifikat/a.pdf', True, None),
+            ('Sertifikat/b.pdf', True, None),
+            ('Sertifikat/missing.pdf', False, 'not found'),
+            ('Sertifikat/broken.pdf', False, 'connection reset'),
+        ]
+        assert sorted(progress) == [(done, 4) for done in range(1, 5)]
+
+        # A file object st.download_button accepts, removed from disk once closed
+        assert isinstance(archive, io.BufferedReader) and archive.tell() == 0
+        assert not os.path.exists(archive.name)
+        with archive, zipfile.ZipFile(archive) as zip_file:
+            assert sorted(zip_file.namelist()) == ['Sertifikat/a.pdf', 'Sertifikat/b.pdf']
+            assert zip_file.read('Sertifikat/a.pdf') == b"A" * 1000
+
+    run_offline(check)
+
+
+def test_unchanged_objects_are_not_downloaded_again():
+    def check(file_service):
+        storage = connection_manager._session = FakeStorage(
+            {'a.pdf': (b"A", '"a1"'), 'b.pdf': (b"B", '"b1"')})
+        files = FILES[:2]
+
+        file_service.bundle_public_files(files, bucket='song-contest-files')[0].close()
+        assert sorted(storage.downloads) == ['a.pdf', 'b.pdf']
+
+        storage.objects['b.pdf'] = (b"B revised", '"b2"')
+        archive, results = file_service.bundle_public_files(files, bucket='song-contest-files')
+        assert all(result['ok'] for result in results)
+        assert storage.revalidated == ['a.pdf'] and sorted(storage.downloads) == ['a.pdf', 'b.pdf', 'b.pdf']
+        with archive, zipfile.ZipFile(archive) as zip_file:
+            assert zip_file.read('Sertifikat/a.pdf') == b"A"
+            assert zip_file.read('Sertifikat/b.pdf') == b"B revised"
+
+    run_offline(check)
+
+
+if __name__ == "__main__":
+    print("🔍 Checking storage file bundles...")
+    test_failures_are_reported_per_file()
+    test_unchanged_objects_are_not_downloaded_again()
+    print("✅ Bundles report failures per file and reuse unchanged downloads")
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Check that the background JobRunner shares identical builds, serves finished
+artifacts from the process cache until a table or row they read changes,
+does not cache a build that a write overtook, removes file results once
+discarded or expired, and cancels queued jobs
+
+Usage:
+  python3 testing/test_job_runner.py
+  pytest testing/test_job_runner.py
+"""
+
+import os
+import sys
+import tempfile
+import threading
+
+# Add the project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.cache_service import CacheService, process_cache
+from services.job_service import JobRunner, remove_file, DONE, CANCELLED
+
+
+def wait_for(runner, job_id):
+    job = runner.get(job_id)
+    job.future.result(timeout=5)
+    return runner.get(job_id)
+
+
+def test_identical_requests_share_one_build():
+    process_cache.invalidate()
+    runner = JobRunner(max_workers=1)
+    release = threading.Event()
+    calls = []
+
+    def build(song_id):
+        calls.append(song_id)
+        release.wait(timeout=5)
+        return f"report {song_id}".encode()
+
+    first = runner.submit('song_report', build, 7)
+    second = runner.submit('song_report', build, 7)
+    release.set()
+
+    assert first == second
+    finished = wait_for(runner, first)
+    # The artifact is held by the process cache, not by the job record
+    assert runner.result(finished) == b"report 7" and finished.result is None
+
+    # A later request is served from the cache without building again
+    cached = runner.get(runner.submit('song_report', build, 7))
+    assert cached.status == DONE and cached.cached
+    assert calls == [7]
+
+
+def test_table_write_drops_cached_artifact():
+    process_cache.invalidate()
+    runner = JobRunner(max_workers=1)
+    calls = []
+
+    def build():
+        calls.append(1)
+        return b"winners"
+
+    wait_for(runner, runner.submit('winner_report', build, tags=['evaluations']))
+    process_cache.invalidate_tags(['evaluations'])
+    rebuilt = wait_for(runner, runner.submit('winner_report', build, tags=['evaluations']))
+
+    assert not rebuilt.cached
+    assert len(calls) == 2
+
+
+def test_row_write_drops_report_artifact():
+    process_cache.invalidate()
+    runner = JobRunner(max_workers=1)
+    calls = []
+
+    def build():
+        calls.append(1)
+        return b"leaderboard"
+
+    wait_for(runner, runner.submit('leaderboard_report', build))
+    assert runner.get(runner.submit('leaderboard_report', build)).cached
+
+    # One judge's save touches only scoped tags, which the default report tags include
+    CacheService.invalidate_rows('evaluations', judge_id=3, song_id=7)
+    rebuilt = wait_for(runner, runner.submit('leaderboard_report', build))
+    assert not rebuilt.cached and len(calls) == 2
+
+
+def test_write_during_build_is_not_cached():
+    process_cache.invalidate()
+    runner = JobRunner(max_workers=1)
+    started, release = threading.Event(), threading.Event()
+
+    def build(version):
+        started.set()
+        release.wait(timeout=5)
+        return version
+
+    job_id = runner.submit('winner_report', build, b"before")
+    started.wait(timeout=5)
+    CacheService.invalidate_tables('evaluations')
+    release.set()
+
+    # The caller still gets its build, but the next request rebuilds
+    job = wait_for(runner, job_id)
+    assert runner.result(job) == b"before"
+    assert process_cache.get(job.cache_key, None) is None
+    assert not runner.get(runner.submit('winner_report', build, b"before")).cached
+
+
+def test_file_results_are_not_cached_and_are_removed():
+    process_cache.invalidate()
+    runner = JobRunner(max_workers=1, result_ttl=3600)
+
+    def build():
+        fd, path = tempfile.mkstemp(suffix=".zip")
+        os.write(fd, b"archive")
+        os.close(fd)
+        return path
+
+    first = wait_for(runner, runner.submit('certificates', build, cache=False, cleanup=remove_file))
+    path = runner.result(first)
+    assert os.path.exists(path) and process_cache.get(first.cache_key, None) is None
+
+    # Each request writes its own file; a downloaded one is removed
+    second = wait_for(runner, runner.submit('certificates', build, cache=False, cleanup=remove_file))
+    assert not second.cached and runner.result(second) != path
+    runner.discard(first.id)
+    assert not os.path.exists(path) and runner.get(first.id) is None
+
+    # Files nobody downloaded are removed once older than result_ttl
+    runner.result_ttl = 0
+    third = runner.submit('certificates', build, cache=False, cleanup=remove_file)
+    assert not os.path.exists(runner.result(second)) and runner.get(second.id) is None
+    wait_for(runner, third)
+    runner.discard(third)
+
+
+def test_cancel_queued_job():
+    process_cache.invalidate()
+    runner = JobRunner(max_workers=1)
+    release = threading.Event()
+    calls = []
+
+    def build(name):
+        calls.append(name)
+        release.wait(timeout=5)
+        return name.encode()
+
+    running = runner.submit('export', build, 'first')
+    queued = runner.submit('export', build, 'second')
+
+    assert runner.cancel(queued)
+    assert runner.get(queued).status == CANCELLED
+    release.set()
+    wait_for(runner, running)
+
+    assert calls == ['first']
+    assert not runner.cancel(running)
+
+
+if __name__ == "__main__":
+    print("🔍 Checking background job runner...")
+    test_identical_requests_share_one_build()
+    test_table_write_drops_cached_artifact()
+    test_row_write_drops_report_artifact()
+    test_write_during_build_is_not_cached()
+    test_file_results_are_not_cached_and_are_removed()
+    test_cancel_queued_job()
+    print("✅ Job runner shares, caches and cancels jobs")
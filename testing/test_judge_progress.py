@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Check the judge progress table: per-song status, completed rubric counts
+and totals from one judge's evaluations, both from frames and offline
+against the local SQLite mirror
+
+Usage:
+  python3 testing/test_judge_progress.py
+  pytest testing/test_judge_progress.py
+"""
+
+import os
+import sys
+
+import pandas as pd
+
+# Add the project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.analytics_service import analytics_service
+from services.cache_service import process_cache
+from services.connection_service import connection_manager
+from services.local_mirror import SQLiteMirror
+
+SONGS = pd.DataFrame({'id': [3, 1, 2, 4], 'title': ['Lagu C', 'Lagu A', 'Lagu B', 'Lagu D'],
+                      'composer': ['Cici', 'Ani', 'Budi', 'Dodi']})
+RUBRICS = pd.DataFrame({'rubric_key': ['tema', 'lirik', 'melodi'], 'weight': [40, 30, 30],
+                        'max_score': [5, 5, 5]})
+
+
+def test_status_and_counts_per_song():
+    evaluations = pd.DataFrame([
+        {'id': 10, 'judge_id': 1, 'song_id': 1, 'total_score': 25.0,
+         'rubric_scores': {'tema': 5, 'lirik': 5, 'melodi': 5}},
+        # Keys that are not active rubrics, and zero scores, do not count
+        {'id': 11, 'judge_id': 1, 'song_id': 2, 'total_score': 9.0,
+         'rubric_scores': {'tema': 3, 'lirik': 0, 'retired': 4}},
+        # A saved row without any score is not started
+        {'id': 12, 'judge_id': 1, 'song_id': 3, 'total_score': 4.0, 'rubric_scores': {}},
+    ])
+    progress = analytics_service.build_judge_progress(SONGS, RUBRICS, evaluations)
+
+    assert progress['song_id'].tolist() == [1, 2, 3, 4]
+    assert progress['status'].tolist() == ['complete', 'partial', 'not_started', 'not_started']
+    assert progress['completed_rubrics'].tolist() == [3, 1, 0, 0]
+    assert (progress['total_rubrics'] == 3).all()
+    assert progress['completion_percentage'].round(1).tolist() == [100.0, 33.3, 0.0, 0.0]
+    assert progress['total_score'].tolist() == [25.0, 9.0, 0.0, 0.0]
+    assert progress['evaluation_id'].tolist()[:3] == [10, 11, 12] and pd.isna(progress.loc[3, 'evaluation_id'])
+
+
+def test_no_evaluations_and_no_songs():
+    progress = analytics_service.build_judge_progress(SONGS, RUBRICS, pd.DataFrame())
+    assert (progress['status'] == 'not_started').all() and (progress['completed_rubrics'] == 0).all()
+    assert progress['evaluation_id'].isna().all()
+
+    assert analytics_service.build_judge_progress(pd.DataFrame(), RUBRICS, pd.DataFrame()).empty
+
+
+def test_progress_reads_one_judges_evaluations():
+    mirror = SQLiteMirror(':memory:')
+    mirror.table('songs').insert([{'title': f"Lagu {i}"} for i in (1, 2, 3)]).execute()
+    mirror.table('judges').insert([{'name': f"Juri {i}"} for i in (1, 2)]).execute()
+    mirror.table('rubrics').insert([
+        {'rubric_key': 'tema', 'aspect_name': 'Tema', 'weight': 50, 'max_score': 5},
+        {'rubric_key': 'lirik', 'aspect_name': 'Lirik', 'weight': 50, 'max_score': 5}
+    ]).execute()
+    mirror.table('evaluations').insert([
+        {'judge_id': 1, 'song_id': 1, 'total_score': 25.0, 'rubric_scores': {'tema': 5, 'lirik': 5}},
+        {'judge_id': 1, 'song_id': 2, 'total_score': 10.0, 'rubric_scores': {'tema': 4}},
+        {'judge_id': 2, 'song_id': 3, 'total_score': 25.0, 'rubric_scores': {'tema': 5, 'lirik': 5}},
+    ]).execute()
+
+    saved = connection_manager.backend, connection_manager._mirror
+    connection_manager.backend, connection_manager._mirror = 'sqlite', mirror
+    from services.database_service import db_service
+    db_service._client = None
+    process_cache.invalidate()
+    try:
+        progress = analytics_service.get_judge_progress(1)
+        assert progress['status'].tolist() == ['complete', 'partial', 'not_started']
+        assert progress['total_score'].tolist() == [25.0, 10.0, 0.0]
+
+        # Judge 2's evaluation is not judge 1's progress
+        assert analytics_service.get_judge_progress(2)['status'].tolist() == [
+            'not_started', 'not_started', 'complete']
+    finally:
+        connection_manager.backend, connection_manager._mirror = saved
+        db_service._client = None
+        process_cache.invalidate()
+
+
+if __name__ == "__main__":
+    print("🔍 Checking judge progress...")
+    test_status_and_counts_per_song()
+    test_no_evaluations_and_no_songs()
+    test_progress_reads_one_judges_evaluations()
+    print("✅ Judge progress matches each judge's evaluations")
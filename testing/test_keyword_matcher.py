@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Check that the compiled KeywordMatcher counts exactly like the per-term
+scans it replaced in ScoringService (text.count, `in`, re.findall)
+
+Usage:
+  python3 testing/test_keyword_matcher.py
+  pytest testing/test_keyword_matcher.py
+"""
+
+import os
+import re
+import sys
+import random
+
+# Add the project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.keyword_matcher import KeywordMatcher, SUBSTRING, WORD_PREFIX
+from services.scoring_service import scoring_service
+
+KEYWORDS = [("waktu", 2.0), ("bersama", 2.0), ("harta", 2.0), ("berharga", 2.0),
+            ("kasih", 1.5), ("ber", 0.5), ("saat ini", 1.0), ("ibu", 1.0)]
+PHRASES = [("waktu bersama", 3.0), ("harta berharga", 3.0), ("kasih setia", 2.5),
+           ("aa", 1.0)]
+
+VOCABULARY = [
+    "waktu", "bersama", "harta", "berharga", "kasih", "setiamu", "kebersamaan", "ibunda",
+    "seribu", "saat", "ini", "cahaya", "bagaikan", "bagai", "dalam", "mendalam", "reff",
+    "bait", "medsos", "tuhan", "pasti", "memberkati", "aaa", "bera", "rumahku", "dekat",
+    "sendiri", "berkat", "it's", "waktunya", "hartaku"
+]
+
+
+def sample_texts(n: int = 300, seed: int = 2025):
+    rng = random.Random(seed)
+    texts = ["", "aaaa", "saat ini", "ber ber berber", "kasih setiamu kasih setia"]
+    for _ in range(n):
+        texts.append(" ".join(rng.choice(VOCABULARY) for _ in range(rng.randint(1, 60))))
+    return texts
+
+
+def reference_theme_score(text, keywords, phrases):
+    score = 0.0
+    for phrase, weight in phrases:
+        score += text.count(phrase.lower()) * float(weight)
+    for keyword, weight in keywords:
+        score += len(re.findall(rf"\b{re.escape(keyword.lower())}\w*\b", text)) * float(weight)
+    return score
+
+
+def test_counts_match_per_term_scans():
+    matcher = (KeywordMatcher()
+               .add("phrase", PHRASES, mode=SUBSTRING)
+               .add("keyword", KEYWORDS, mode=WORD_PREFIX)
+               .compile())
+    for text in sample_texts():
+        hits = matcher.match(text)
+        for i, term in enumerate(matcher.terms):
+            if matcher.modes[i] == SUBSTRING:
+                expected = text.count(term)
+            else:
+                expected = len(re.findall(rf"\b{re.escape(term)}\w*\b", text))
+            assert hits.counts[i] == expected, (text, term, hits.counts[i], expected)
+
+        expected_score = reference_theme_score(text, KEYWORDS, PHRASES)
+        assert abs(hits.weighted("phrase") + hits.weighted("keyword") - expected_score) < 1e-9
+
+
+def test_lexicon_groups_match_substring_checks():
+    for text in sample_texts():
+        hits = scoring_service.lexicon_matcher.match(text)
+        assert hits.count("tema_dalam") == sum(
+            text.count(w) for w in scoring_service.theme_keywords["tema_dalam"])
+        assert hits.distinct("imagery") == sum(
+            1 for w in scoring_service.imagery_words if w in text)
+        assert hits.distinct("cliche") == sum(
+            1 for c in scoring_service.cliche_phrases if c in text)
+        assert hits.distinct("quality_emotional") == sum(
+            1 for w in scoring_service.lyrical_quality_words["emotional"] if w in text)
+
+
+if __name__ == "__main__":
+    print("🔍 Comparing compiled keyword matcher with per-term scans...")
+    test_counts_match_per_term_scans()
+    test_lexicon_groups_match_substring_checks()
+    print("✅ Keyword counts match")
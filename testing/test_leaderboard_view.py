@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Check the leaderboard aggregates offline against the SQLite stand-in
+of the leaderboard_stats materialized view (sql/08_leaderboard_view.sql)
+
+Usage:
+  python3 testing/test_leaderboard_view.py
+  pytest testing/test_leaderboard_view.py
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+# Add the project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.leaderboard import (
+    LEADERBOARD_COLUMNS, SQLiteLeaderboard, compute_leaderboard, typed_leaderboard
+)
+
+
+def sample_data(n_songs: int = 11, n_judges: int = 7, seed: int = 2025):
+    """Songs and evaluations shaped like the Supabase tables"""
+    rng = np.random.default_rng(seed)
+    songs_df = pd.DataFrame({
+        'id': range(1, n_songs + 1),
+        'title': [f"Lagu {i}" for i in range(1, n_songs + 1)],
+        'composer': [f"Pencipta {i}" for i in range(1, n_songs + 1)],
+        'is_active': [True] * (n_songs - 1) + [False]
+    })
+    rows = [
+        {'judge_id': judge_id, 'song_id': song_id, 'total_score': round(float(rng.uniform(10, 25)), 2)}
+        for judge_id in range(1, n_judges + 1)
+        for song_id in range(1, n_songs + 1)
+        if rng.random() > 0.1
+    ]
+    evaluations_df = pd.DataFrame(rows)
+    evaluations_df.insert(0, 'id', range(1, len(evaluations_df) + 1))
+    return songs_df, evaluations_df
+
+
+def test_sqlite_matches_pandas_fallback():
+    songs_df, evaluations_df = sample_data()
+    active_songs = songs_df[songs_df['is_active']]
+
+    expected = compute_leaderboard(evaluations_df, active_songs)
+    actual = typed_leaderboard(SQLiteLeaderboard(songs_df, evaluations_df).get_leaderboard())
+
+    assert list(actual.columns) == list(LEADERBOARD_COLUMNS)
+    assert list(actual['song_id']) == list(expected['song_id'])
+    pd.testing.assert_frame_equal(actual, expected, check_exact=False, rtol=1e-9)
+
+
+def test_single_evaluation_has_no_std():
+    songs_df, _ = sample_data(n_songs=2)
+    evaluations_df = pd.DataFrame([
+        {'id': 1, 'judge_id': 1, 'song_id': 1, 'total_score': 20.0},
+        {'id': 2, 'judge_id': 1, 'song_id': 2, 'total_score': 18.0},
+        {'id': 3, 'judge_id': 2, 'song_id': 1, 'total_score': 22.0},
+    ])
+    songs_df['is_active'] = True
+
+    leaderboard = typed_leaderboard(SQLiteLeaderboard(songs_df, evaluations_df).get_leaderboard())
+
+    assert leaderboard.loc[0, 'song_id'] == 1
+    assert leaderboard.loc[0, 'unique_judges'] == 2
+    assert pd.isna(leaderboard.loc[1, 'score_std'])
+
+
+if __name__ == "__main__":
+    print("🔍 Comparing SQLite leaderboard stand-in with pandas fallback...")
+    test_sqlite_matches_pandas_fallback()
+    test_single_evaluation_has_no_std()
+    print("✅ Leaderboard aggregates match")
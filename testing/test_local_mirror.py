@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Check the local SQLite mirror offline: schema from sql/, the query-builder
+subset the services use, replication and the mirrored RPCs
+
+Usage:
+  python3 testing/test_local_mirror.py
+  pytest testing/test_local_mirror.py
+"""
+
+import os
+import sys
+
+import pandas as pd
+
+# Add the project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.cache_service import process_cache
+from services.connection_service import ConnectionManager
+from services.evaluation_sync import EvaluationSync
+from services.leaderboard import compute_leaderboard, typed_leaderboard
+from services.local_mirror import SQLiteMirror
+
+
+def seeded_mirror(n_songs=6, n_judges=3):
+    mirror = SQLiteMirror(':memory:')
+    mirror.table('songs').insert([
+        {'title': f"Lagu {i}", 'composer': f"Pencipta {i}", 'is_active': i != n_songs}
+        for i in range(1, n_songs + 1)
+    ]).execute()
+    mirror.table('judges').insert([{'name': f"Juri {i}"} for i in range(1, n_judges + 1)]).execute()
+    mirror.table('evaluations').insert([
+        {'judge_id': judge_id, 'song_id': song_id, 'total_score': float(10 + judge_id * 2 + song_id),
+         'rubric_scores': {'tema': judge_id, 'lirik': song_id}}
+        for judge_id in range(1, n_judges + 1)
+        for song_id in range(1, n_songs + 1)
+    ]).execute()
+    return mirror
+
+
+def test_schema_and_query_builder_follow_sql_files():
+    mirror = seeded_mirror()
+
+    songs = mirror.table('songs').select('*').eq('is_active', True).execute().data
+    assert len(songs) == 5
+    # play_count comes from sql/10, is_active from the documented schema drift
+    assert songs[0]['play_count'] == 0 and songs[0]['is_active'] is True
+    assert songs[0]['updated_at'] is not None
+
+    # Upsert on the evaluations UNIQUE(judge_id, song_id) constraint, JSONB round trip
+    mirror.table('evaluations').upsert(
+        {'judge_id': 1, 'song_id': 1, 'total_score': 24.0, 'rubric_scores': {'tema': 5}},
+        on_conflict='judge_id,song_id').execute()
+    row = mirror.table('evaluations').select('*, judge:judges(*), song:songs(*)') \
+        .eq('judge_id', 1).eq('song_id', 1).single().execute().data
+    assert row['total_score'] == 24.0 and row['rubric_scores'] == {'tema': 5}
+    assert row['judge']['name'] == "Juri 1" and row['song']['title'] == "Lagu 1"
+    assert len(mirror.table('evaluations').select('id').execute().data) == 18
+
+    played = mirror.rpc('increment_play_counts', {'p_counts': {'2': 3}}).execute().data
+    assert played == [{'song_id': 2, 'play_count': 3}]
+
+
+def test_replicate_copies_pages_and_widens_schema():
+    source = seeded_mirror()
+    # A column added to the live project but not to sql/
+    source.table('songs').update({'minus_one_file_path': 'minus/1.mp3'}).eq('id', 1).execute()
+
+    target = SQLiteMirror(':memory:')
+    copied = target.replicate(source, tables=['songs', 'judges', 'evaluations'], page_size=4)
+
+    assert copied == {'songs': 6, 'judges': 3, 'evaluations': 18}
+    song = target.table('songs').select('*').eq('id', 1).single().execute().data
+    assert song['minus_one_file_path'] == 'minus/1.mp3'
+    assert song['is_active'] is True
+
+    target.apply_change('songs', 'DELETE', old_record={'id': 6})
+    assert len(target.table('songs').select('id').execute().data) == 5
+
+
+def test_services_run_against_the_mirror():
+    process_cache.invalidate()
+    mirror = seeded_mirror()
+    sync = EvaluationSync(client=mirror, overlap_seconds=0, reconcile_seconds=3600)
+
+    frame = sync.evaluations()
+    assert len(frame) == 18 and frame.loc[0, 'judge']['name'] == "Juri 1"
+
+    mirror.table('evaluations').update({'total_score': 25.0}).eq('id', 5).execute()
+    frame = sync.evaluations()
+    assert frame.loc[frame['id'] == 5, 'total_score'].item() == 25.0
+    assert sync.sync_stats()['full_loads'] == 1
+
+    songs_df = pd.DataFrame(mirror.table('songs').select('*').eq('is_active', True).execute().data)
+    expected = compute_leaderboard(frame[['id', 'judge_id', 'song_id', 'total_score']], songs_df)
+    actual = typed_leaderboard(mirror.rpc('get_leaderboard').execute().data)
+    pd.testing.assert_frame_equal(actual, expected, check_exact=False, rtol=1e-9)
+
+
+def test_mirror_backend_serves_reads_only_while_the_feed_is_live():
+    source = seeded_mirror()
+    manager = ConnectionManager(backend='mirror', mirror_path=':memory:')
+    manager._client = source
+
+    # Before the feed connects the mirror may be stale: read from Supabase
+    assert manager.read_client('songs') is source
+
+    manager.feed_live_changed(True)
+    manager._resync_thread.join(5)
+    assert manager.read_client('songs') is manager.mirror
+    assert manager.read_client('evaluations') is source
+    assert len(manager.mirror.table('songs').select('id').execute().data) == 6
+
+    # Edits made while the feed is down never reach the mirror
+    manager.feed_live_changed(False)
+    source.table('songs').update({'title': "Lagu baru"}).eq('id', 1).execute()
+    assert manager.read_client('songs') is source
+
+    manager.feed_live_changed(True)
+    manager._resync_thread.join(5)
+    song = manager.mirror.table('songs').select('*').eq('id', 1).single().execute().data
+    assert song['title'] == "Lagu baru"
+
+
+if __name__ == "__main__":
+    print("🔍 Checking the local SQLite mirror...")
+    test_schema_and_query_builder_follow_sql_files()
+    test_replicate_copies_pages_and_widens_schema()
+    test_services_run_against_the_mirror()
+    test_mirror_backend_serves_reads_only_while_the_feed_is_live()
+    print("✅ Local mirror serves the contest tables offline")
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Check that plays are coalesced into one batched increment per flush, that
+songs whose increment failed are retried, and the displayed counts,
+offline against the local SQLite mirror
+
+Usage:
+  python3 testing/test_play_counts.py
+  pytest testing/test_play_counts.py
+"""
+
+import os
+import sys
+
+# Add the project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.connection_service import connection_manager
+from services.local_mirror import SQLiteMirror
+from services.play_count_service import PlayCountService
+
+
+class CountingMirror(SQLiteMirror):
+    """Mirror that records the increment_play_counts batches it receives"""
+
+    def __init__(self, path):
+        super().__init__(path)
+        self.batches = []
+
+    def _rpc_increment_play_counts(self, p_counts=None, **kwargs):
+        self.batches.append(dict(p_counts or {}))
+        return super()._rpc_increment_play_counts(p_counts=p_counts, **kwargs)
+
+
+def run_offline(test):
+    mirror = CountingMirror(':memory:')
+    mirror.table('songs').insert([{'title': f"Lagu {i}"} for i in (1, 2)]).execute()
+    saved = connection_manager.backend, connection_manager._mirror
+    connection_manager.backend, connection_manager._mirror = 'sqlite', mirror
+    from services.database_service import db_service
+    db_service._client = None
+    try:
+        test(mirror, PlayCountService(flush_interval_seconds=3600, max_retries=1))
+    finally:
+        connection_manager.backend, connection_manager._mirror = saved
+        db_service._client = None
+
+
+def stored_count(mirror, song_id):
+    return mirror.table('songs').select('play_count').eq('id', song_id).single().execute().data['play_count']
+
+
+def test_plays_are_coalesced_into_one_increment():
+    def check(mirror, plays):
+        for song_id in (1, 1, 1, 2):
+            plays.record_play(song_id)
+        # Shown immediately, written on the next flush
+        assert plays.display_count(1, 0) == 3 and plays.pending(1) == 3
+        assert mirror.batches == []
+
+        assert plays.flush()
+        assert mirror.batches == [{'1': 3, '2': 1}]
+        assert stored_count(mirror, 1) == 3 and plays.pending(1) == 0
+        # A stale cached row does not hide the confirmed count
+        assert plays.display_count(1, 0) == 3 and plays.display_count(1, 5) == 5
+        assert plays.display_count('not a song', 0) == 0
+
+        assert plays.flush() and len(mirror.batches) == 1
+
+    run_offline(check)
+
+
+def test_failed_increments_are_retried_then_dropped():
+    def check(mirror, plays):
+        plays.record_play(3)
+        plays.record_play(3)
+        plays.record_play(1)
+
+        # Song 3 does not exist yet: its plays stay pending for the next flush
+        assert not plays.flush()
+        assert plays.pending(3) == 2 and plays.pending(1) == 0
+        assert plays.display_count(3, 0) == 2
+
+        mirror.table('songs').insert({'title': "Lagu 3"}).execute()
+        plays.record_play(3)
+        assert plays.flush()
+        assert mirror.batches[-1] == {'3': 3} and stored_count(mirror, 3) == 3
+
+        # Past max_retries the plays are given up on
+        plays.record_play(99)
+        assert not plays.flush() and not plays.flush()
+        assert plays.pending(99) == 0 and plays.stats['failed_songs'] == 1
+
+    run_offline(check)
+
+
+if __name__ == "__main__":
+    print("🔍 Checking play count batching...")
+    test_plays_are_coalesced_into_one_increment()
+    test_failed_increments_are_retried_then_dropped()
+    print("✅ Plays are coalesced, retried and displayed without reloads")
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Check that song analysis records are memoized by content hash: the same
+title, lyrics, chords and keywords reuse one record, and a change to any
+of them computes a new one, offline against the local SQLite mirror
+
+Usage:
+  python3 testing/test_song_analysis.py
+  pytest testing/test_song_analysis.py
+"""
+
+import os
+import sys
+
+# Add the project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.cache_service import CacheService, process_cache
+from services.connection_service import connection_manager
+from services.local_mirror import SQLiteMirror
+from services.song_analysis_service import SongAnalysisService
+
+SONG = {
+    'title': "Waktu Bersama",
+    'lyrics_text': "Kasih keluarga adalah harta\nWaktu bersama tak ternilai",
+    'chords_list': "C G Am F C G C"
+}
+
+
+class CountingAnalysis(SongAnalysisService):
+    """Counts the analyses actually computed"""
+
+    def __init__(self):
+        super().__init__(disk_dir=None)
+        self.computed = []
+
+    def _compute(self, title, lyrics_text, chords_text, keywords_df):
+        self.computed.append((title, lyrics_text, chords_text))
+        return super()._compute(title, lyrics_text, chords_text, keywords_df)
+
+
+def run_offline(test):
+    mirror = SQLiteMirror(':memory:')
+    mirror.table('keywords').insert({'keyword_text': 'kasih', 'keyword_type': 'keyword', 'weight': 1.0}).execute()
+    saved = connection_manager.backend, connection_manager._mirror
+    connection_manager.backend, connection_manager._mirror = 'sqlite', mirror
+    from services.database_service import db_service
+    db_service._client = None
+    process_cache.invalidate()
+    try:
+        test(mirror, CountingAnalysis())
+    finally:
+        connection_manager.backend, connection_manager._mirror = saved
+        db_service._client = None
+        process_cache.invalidate()
+
+
+def analysis_keywords():
+    from services.database_service import db_service
+    return db_service.get_keywords()
+
+
+def test_same_content_is_analyzed_once():
+    def check(mirror, analysis):
+        first = analysis.analyze(SONG)
+        # Another row with the same content (e.g. a Series from another frame) shares the record
+        assert analysis.analyze(dict(SONG, id=99)) is first
+        assert len(analysis.computed) == 1
+        assert first['content_hash'] == analysis.content_hash(
+            SONG['title'], SONG['lyrics_text'], SONG['chords_list'],
+            analysis.keywords_version(analysis_keywords()))
+
+    run_offline(check)
+
+
+def test_changed_lyrics_chords_or_keywords_are_reanalyzed():
+    def check(mirror, analysis):
+        original = analysis.analyze(SONG)
+
+        lyrics = analysis.analyze(dict(SONG, lyrics_text=SONG['lyrics_text'] + "\nHaleluya"))
+        chords = analysis.analyze(dict(SONG, chords_list="D A Bm G"))
+        assert len(analysis.computed) == 3
+        assert len({original['content_hash'], lyrics['content_hash'], chords['content_hash']}) == 3
+
+        # NULL text columns hash like empty ones
+        assert analysis.analyze(dict(SONG, chords_list=None)) is analysis.analyze(dict(SONG, chords_list=''))
+        assert len(analysis.computed) == 4
+
+        # A keywords edit changes every hash, so the original content is analyzed again
+        mirror.table('keywords').insert({'keyword_text': 'harta', 'keyword_type': 'keyword', 'weight': 1.0}).execute()
+        CacheService.invalidate_tables('keywords')
+        rescored = analysis.analyze(SONG)
+        assert len(analysis.computed) == 5 and rescored['content_hash'] != original['content_hash']
+
+        # The new record is then reused
+        assert analysis.analyze(SONG) is rescored and len(analysis.computed) == 5
+
+    run_offline(check)
+
+
+if __name__ == "__main__":
+    print("🔍 Checking memoized song analysis...")
+    test_same_content_is_analyzed_once()
+    test_changed_lyrics_chords_or_keywords_are_reanalyzed()
+    print("✅ Song analyses are reused until lyrics, chords or keywords change")
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Check that song list reads leave out the large text columns and that
+per-song texts are fetched lazily and cached per song, offline against
+the local SQLite mirror
+
+Usage:
+  python3 testing/test_song_projection.py
+  pytest testing/test_song_projection.py
+"""
+
+import os
+import sys
+from contextlib import contextmanager
+
+# Add the project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.cache_service import CacheService, process_cache
+from services.connection_service import connection_manager
+from services.local_mirror import SQLiteMirror
+
+
+@contextmanager
+def offline_db(n_songs=4):
+    """db_service running on a seeded in-memory mirror (DATA_BACKEND=sqlite)"""
+    mirror = SQLiteMirror(':memory:')
+    mirror.table('songs').insert([
+        {'title': f"Lagu {i}", 'composer': f"Pencipta {i}", 'audio_file_path': f"audio/{i}.mp3",
+         'lyrics_text': f"Syair lagu {i} " * 200, 'chords_list': "C G Am F"}
+        for i in range(1, n_songs + 1)
+    ]).execute()
+
+    saved = connection_manager.backend, connection_manager._mirror
+    connection_manager.backend, connection_manager._mirror = 'sqlite', mirror
+    try:
+        from services.database_service import db_service
+        db_service._client = None
+        process_cache.invalidate()
+        yield db_service, mirror
+    finally:
+        connection_manager.backend, connection_manager._mirror = saved
+        db_service._client = None
+        process_cache.invalidate()
+
+
+def test_song_list_leaves_out_text_columns():
+    with offline_db() as (db, _):
+        songs = db.get_song_list()
+        assert len(songs) == 4
+        assert {'id', 'title', 'composer', 'audio_file_path', 'play_count'} <= set(songs.columns)
+        assert 'lyrics_text' not in songs and 'chords_list' not in songs
+        assert 'lyrics_text' in db.get_songs()
+
+
+def test_song_texts_are_fetched_per_song_and_cached():
+    with offline_db() as (db, mirror):
+        row = db.get_song_list().iloc[0]
+        song = db.with_song_texts(row)
+        assert song['title'] == "Lagu 1" and song['lyrics_text'].startswith("Syair lagu 1")
+
+        # Served from the per-song cache until that song's rows are invalidated
+        mirror.table('songs').update({'lyrics_text': "Syair baru"}).eq('id', 1).execute()
+        assert db.with_song_texts(row)['lyrics_text'].startswith("Syair lagu 1")
+        assert db.with_song_texts({'id': 2})['lyrics_text'].startswith("Syair lagu 2")
+
+        CacheService.invalidate_rows('songs', id=1)
+        assert db.with_song_texts(row)['lyrics_text'] == "Syair baru"
+        assert db.with_song_texts({'id': 2})['lyrics_text'].startswith("Syair lagu 2")
+
+
+if __name__ == "__main__":
+    print("🔍 Checking projected song reads...")
+    test_song_list_leaves_out_text_columns()
+    test_song_texts_are_fetched_per_song_and_cached()
+    print("✅ Song lists skip text columns; texts are fetched per song")
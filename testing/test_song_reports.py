@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Check the batch song reports offline against the local SQLite mirror: the
+ZIP holds one PDF per song (or per song and judge), and the merged PDF has
+one bookmark per report pointing at its first page
+
+app.py imports the Supabase client, so these checks are skipped when the
+supabase package is not installed.
+
+Usage:
+  python3 testing/test_song_reports.py
+  pytest testing/test_song_reports.py
+"""
+
+import io
+import os
+import sys
+import zipfile
+from importlib.util import find_spec
+
+import pytest
+
+# Add the project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.cache_service import process_cache
+from services.connection_service import connection_manager
+from services.local_mirror import SQLiteMirror
+
+
+def contest_mirror():
+    """Three songs; two judges evaluated song 1, one judge song 2, nobody song 3"""
+    mirror = SQLiteMirror(':memory:')
+    mirror.table('songs').insert([{'title': title, 'composer': f"Pencipta {i}"}
+                                  for i, title in enumerate(["Kasih Bapa", "Waktu Bersama", "Syukur"], 1)]).execute()
+    mirror.table('judges').insert([{'name': "Ani Wijaya"}, {'name': "Budi"}]).execute()
+    mirror.table('rubrics').insert([
+        {'rubric_key': 'tema', 'aspect_name': 'Tema', 'weight': 50, 'max_score': 5},
+        {'rubric_key': 'lirik', 'aspect_name': 'Lirik', 'weight': 50, 'max_score': 5}
+    ]).execute()
+    mirror.table('evaluations').insert([
+        {'judge_id': 1, 'song_id': 1, 'total_score': 22.5, 'rubric_scores': {'tema': 5, 'lirik': 4}},
+        {'judge_id': 2, 'song_id': 1, 'total_score': 17.5, 'rubric_scores': {'tema': 3, 'lirik': 4}},
+        {'judge_id': 2, 'song_id': 2, 'total_score': 20.0, 'rubric_scores': {'tema': 4, 'lirik': 4}},
+    ]).execute()
+    return mirror
+
+
+def run_offline(test):
+    if find_spec("supabase") is None:
+        pytest.skip("supabase is not installed")
+    saved = connection_manager.backend, connection_manager._mirror
+    connection_manager.backend, connection_manager._mirror = 'sqlite', contest_mirror()
+    from services.database_service import db_service
+    db_service._client = None
+    process_cache.invalidate()
+    try:
+        import app
+        test(app)
+    finally:
+        connection_manager.backend, connection_manager._mirror = saved
+        db_service._client = None
+        process_cache.invalidate()
+
+
+def test_zip_has_one_report_per_song():
+    def check(app):
+        batch = app.generate_song_reports_batch()
+        assert [(report['name'], report['error']) for report in batch['reports']] == [
+            ("001_Kasih_Bapa", None), ("002_Waktu_Bersama", None), ("003_Syukur", None)]
+        with zipfile.ZipFile(io.BytesIO(batch['data'])) as zip_file:
+            assert zip_file.namelist() == [f"{report['name']}.pdf" for report in batch['reports']]
+            assert all(zip_file.read(name).startswith(b"%PDF") for name in zip_file.namelist())
+
+        # Per judge: only the evaluations that exist
+        batch = app.generate_song_reports_batch(per_judge=True)
+        assert [report['name'] for report in batch['reports']] == [
+            "001_Kasih_Bapa_Ani_Wijaya", "001_Kasih_Bapa_Budi", "002_Waktu_Bersama_Budi"]
+
+    run_offline(check)
+
+
+def test_merged_pdf_has_a_bookmark_per_report():
+    if find_spec("pymupdf") is None and find_spec("fitz") is None:
+        pytest.skip("pymupdf is not installed")
+
+    def check(app):
+        from services.export_service import _load_pymupdf
+        pymupdf = _load_pymupdf()
+
+        zipped = app.generate_song_reports_batch(per_judge=True)
+        with zipfile.ZipFile(io.BytesIO(zipped['data'])) as zip_file:
+            page_counts = []
+            for name in zip_file.namelist():
+                with pymupdf.open("pdf", zip_file.read(name)) as report:
+                    page_counts.append(report.page_count)
+
+        merged = app.generate_song_reports_batch(per_judge=True, output='merged')
+        with pymupdf.open("pdf", merged['data']) as doc:
+            assert doc.page_count == sum(page_counts)
+            first_pages = [1 + sum(page_counts[:i]) for i in range(len(page_counts))]
+            assert doc.get_toc() == [
+                [1, "Kasih Bapa — Ani Wijaya", first_pages[0]],
+                [1, "Kasih Bapa — Budi", first_pages[1]],
+                [1, "Waktu Bersama — Budi", first_pages[2]],
+            ]
+            assert "Ani Wijaya" in doc[first_pages[0] - 1].get_text()
+
+        with pytest.raises(ValueError):
+            app.generate_song_reports_batch(output='docx')
+
+    run_offline(check)
+
+
+if __name__ == "__main__":
+    print("🔍 Checking batch song reports...")
+    if find_spec("supabase") is None:
+        print("⚠️ supabase is not installed; app.py cannot be imported")
+        sys.exit(0)
+    test_zip_has_one_report_per_song()
+    if find_spec("pymupdf") is not None or find_spec("fitz") is not None:
+        test_merged_pdf_has_a_bookmark_per_report()
+    print("✅ Batch reports cover every song and bookmark each report")
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Check that lazy services are imported on first use only, that the startup
+timer keeps cold-start and rerun stages apart, and that the cache warm-up
+counts as done only once it succeeded
+
+Usage:
+  python3 testing/test_startup.py
+  pytest testing/test_startup.py
+"""
+
+import os
+import sys
+
+# Add the project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.cache_service import CacheService
+from services.service_registry import ServiceRegistry, StartupTimer
+
+
+def test_lazy_service_imports_on_first_use():
+    sys.modules.pop('colorsys', None)
+    timer = StartupTimer()
+    registry = ServiceRegistry(timer)
+    colorsys = registry.lazy('colorsys', 'rgb_to_hsv')
+
+    # Registering imports nothing, and the same name shares one proxy
+    assert 'colorsys' not in sys.modules and not colorsys.loaded
+    assert registry.lazy('colorsys', 'rgb_to_hsv') is colorsys
+    assert registry.status() == {'rgb_to_hsv': False}
+
+    assert colorsys.__name__ == 'rgb_to_hsv'
+    assert 'colorsys' in sys.modules and registry.status() == {'rgb_to_hsv': True}
+    assert list(timer.cold_start) == ['load colorsys']
+
+
+def test_cold_start_and_rerun_stages():
+    timer = StartupTimer()
+    for seconds in (0.5, 0.01, 0.01):
+        # app.py runs on every rerun; only the first import is a cold start
+        timer.record_once("app imports", seconds)
+        with timer.rerun():
+            timer.record("render", 0.2)
+            timer.record("render", 0.1)
+
+    assert timer.cold_start == {"app imports": 0.5}
+    assert timer.reruns == 3 and round(timer.last_rerun["render"], 3) == 0.3
+    rows = {(row['phase'], row['stage']): row['ms'] for row in timer.report()}
+    assert rows[('cold start', "app imports")] == 500.0
+    assert rows[('rerun #3', "render")] == 300.0 and ('rerun #3', "rerun total") in rows
+
+
+def test_failed_warm_up_is_retried():
+    names = ['get_cached_config', 'get_cached_judges', 'get_cached_rubrics', 'get_cached_songs',
+             'get_cached_song_list', 'get_cached_evaluations']
+    saved = {name: CacheService.__dict__[name] for name in names}
+    calls = []
+
+    def fail():
+        raise ConnectionError("offline")
+
+    try:
+        for name in names:
+            setattr(CacheService, name, staticmethod(lambda name=name: calls.append(name)))
+        CacheService.get_cached_judges = staticmethod(fail)
+        CacheService._warmed = False
+
+        CacheService.warm_cache()
+        assert not CacheService._warmed
+
+        CacheService.get_cached_judges = staticmethod(lambda: calls.append('get_cached_judges'))
+        calls.clear()
+        CacheService.warm_cache()
+        assert CacheService._warmed and sorted(calls) == sorted(names)
+
+        # Later sessions skip it
+        calls.clear()
+        CacheService.warm_cache()
+        assert calls == []
+    finally:
+        for name, method in saved.items():
+            setattr(CacheService, name, method)
+        CacheService._warmed = False
+
+
+if __name__ == "__main__":
+    print("🔍 Checking lazy services and startup timing...")
+    test_lazy_service_imports_on_first_use()
+    test_cold_start_and_rerun_stages()
+    test_failed_warm_up_is_retried()
+    print("✅ Services load on first use and cold-start stages are counted once")
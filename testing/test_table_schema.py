@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Check that fetched table frames are converted to compact dtypes without
+losing values, and that the memory report records the saving
+
+Usage:
+  python3 testing/test_table_schema.py
+  pytest testing/test_table_schema.py
+"""
+
+import os
+import sys
+
+import pandas as pd
+
+# Add the project root to Python path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from services.cache_service import CacheService, process_cache
+from services.change_feed_service import LocalChangeFeed
+from services.table_schema import TableNormalizer, table_normalizer
+
+
+def fetched_evaluations(n_rows=300):
+    """Rows shaped like the Supabase response: decoded JSONB and ISO timestamp strings"""
+    return pd.DataFrame([{
+        'id': i,
+        'judge_id': i % 7 + 1,
+        'song_id': i % 40 + 1,
+        'total_score': 10 + (i % 31) / 2,
+        'rubric_scores': {'tema': i % 5 + 1, 'lirik': 3},
+        'is_final_submitted': i % 2 == 0,
+        'final_submitted_at': '2025-10-02T10:00:00+00:00' if i % 2 == 0 else None,
+        'notes': None,
+        'created_at': f'2025-10-01T09:{i % 60:02d}:00.123456+00:00',
+        'updated_at': f'2025-10-01T09:{i % 60:02d}:00.123456+00:00'
+    } for i in range(1, n_rows + 1)])
+
+
+def test_evaluations_become_compact_and_keep_values():
+    normalizer = TableNormalizer()
+    raw = fetched_evaluations()
+    compact = normalizer.normalize('evaluations', raw)
+
+    assert str(compact['id'].dtype) == 'int32' and str(compact['song_id'].dtype) == 'int32'
+    # Scores are exported and aggregated as stored
+    assert str(compact['total_score'].dtype) == 'float64'
+    assert compact['is_final_submitted'].dtype == bool
+    assert compact.loc[0, 'created_at'] == pd.Timestamp('2025-10-01 09:01:00.123456')
+    assert pd.isna(compact.loc[0, 'final_submitted_at'])
+    assert compact['total_score'].equals(raw['total_score'])
+    # The fetched frame is left untouched
+    assert isinstance(raw.loc[0, 'created_at'], str)
+
+    report = normalizer.memory_report()[0]
+    assert report['table'] == 'evaluations' and report['rows'] == 300
+    assert report['compact_bytes'] < report['fetched_bytes'] and report['saved_pct'] > 20
+
+
+def test_columns_with_nulls_stay_as_fetched():
+    songs = pd.DataFrame({
+        'id': [1, 2, 3],
+        'composer': ['Ani', None, 'Ani'],
+        'key_signature': ['C', 'G', 'C'],
+        'play_count': [3, None, 1]
+    })
+    compact = table_normalizer.normalize('songs', songs, report=False)
+    analyses = table_normalizer.normalize('song_analysis', pd.DataFrame({
+        'song_id': [1, 2, 3], 'analysis': ['{"tempo": 90}', None, '{"tempo": 120}']
+    }), report=False)
+
+    assert pd.isna(compact.loc[1, 'composer'])
+    assert not isinstance(compact['composer'].dtype, pd.CategoricalDtype)
+    assert isinstance(compact['key_signature'].dtype, pd.CategoricalDtype)
+    assert str(compact['play_count'].dtype) != 'int32'
+    # Legacy rows that stored JSON as text are decoded, missing ones kept
+    assert analyses.loc[2, 'analysis'] == {'tempo': 120} and pd.isna(analyses.loc[1, 'analysis'])
+
+
+def test_pushed_song_update_patches_a_normalized_frame():
+    process_cache.invalidate()
+    songs = table_normalizer.normalize('songs', pd.DataFrame({
+        'id': [1, 2], 'title': ['Lagu A', 'Lagu B'], 'composer': ['Ani', 'Budi'],
+        'play_count': [5, 9], 'is_active': [True, True],
+        'updated_at': ['2025-10-01T09:00:00+00:00', '2025-10-01T09:00:00+00:00']
+    }), report=False)
+    process_cache.set('test_schema_songs', songs, 3600, CacheService.read_tags('songs'))
+
+    LocalChangeFeed().publish('songs', 'UPDATE', {
+        'id': 2, 'title': 'Lagu B', 'composer': 'Budi', 'play_count': 12, 'is_active': True,
+        'updated_at': '2025-10-01T09:05:00+00:00'
+    })
+    patched = process_cache.get('test_schema_songs', None)
+
+    assert patched is not None
+    assert patched.loc[1, 'play_count'] == 12 and str(patched['play_count'].dtype) == 'int32'
+    assert patched.loc[1, 'updated_at'] == pd.Timestamp('2025-10-01 09:05:00')
+
+
+if __name__ == "__main__":
+    print("🔍 Checking compact table dtypes...")
+    test_evaluations_become_compact_and_keep_values()
+    test_columns_with_nulls_stay_as_fetched()
+    test_pushed_song_update_patches_a_normalized_frame()
+    print("✅ Cached tables are compact and keep their values")